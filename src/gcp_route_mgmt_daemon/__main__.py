@@ -1,10 +1,17 @@
 import sys, logging
 from .config import Config
-from .logging_setup import setup_logger
+from .logging_setup import setup_logger, add_log_handler, shutdown_logging
+from .cloud_logging import CloudLoggingExporter, detect_resource, set_cloud_logging_exporter
+from .circuit import CircuitBreaker
 from .daemon import startup, run_loop
 
 def main():
 
+    # "gcp-route-mgmt logs ..." queries the structured logs instead of running the daemon
+    if sys.argv[1:2] == ["logs"]:
+        from .log_index import main as logs_main
+        sys.exit(logs_main(sys.argv[2:]))
+
     cfg = Config()
     
     # Enhanced logger setup with structured logging support
@@ -17,25 +24,46 @@ def main():
         # Add the new structured logging parameters
         enable_structured_console=cfg.enable_structured_console,
         enable_structured_file=cfg.enable_structured_file,
-        structured_log_file=cfg.structured_log_file
+        structured_log_file=cfg.structured_log_file,
+        structured_log_format=cfg.structured_log_format,
+        async_logging=cfg.log_async,
+        queue_size=cfg.log_queue_size,
+        overflow=cfg.log_queue_overflow,
+        compression=cfg.log_compression
     )
 
     if cfg.enable_gcp_logging:
         try:
-            import google.cloud.logging
-            from google.cloud.logging.handlers import CloudLoggingHandler
-            client = google.cloud.logging.Client()
-            cloud_handler = CloudLoggingHandler(client, name="radius_healthcheck_daemon")
-            cloud_handler.setLevel(getattr(logging, cfg.log_level, logging.INFO))
-            logger.addHandler(cloud_handler)
-            logger.info("Google Cloud Logging handler enabled.")
+            resource = detect_resource(cfg.gcp_project,
+                                       instance_id=cfg.gcp_logging_instance_id,
+                                       zone=cfg.gcp_logging_zone)
+            cloud_handler = CloudLoggingExporter(
+                project=cfg.gcp_project,
+                log_name=cfg.gcp_logging_log_name,
+                resource=resource,
+                batch_size=cfg.gcp_logging_batch_size,
+                flush_interval=cfg.gcp_logging_flush_interval,
+                buffer_size=cfg.gcp_logging_buffer_size,
+                circuit_breaker=CircuitBreaker(
+                    threshold=cfg.cb_threshold,
+                    timeout=cfg.cb_timeout,
+                    service_name="cloud_logging"
+                ),
+                level=getattr(logging, cfg.log_level, logging.INFO)
+            )
+            add_log_handler(logger, cloud_handler)
+            set_cloud_logging_exporter(cloud_handler)
+            logger.info(f"Google Cloud Logging export enabled (resource: {resource['type']}, "
+                        f"batch size: {cfg.gcp_logging_batch_size}, "
+                        f"flush interval: {cfg.gcp_logging_flush_interval}s, "
+                        f"buffer: {cfg.gcp_logging_buffer_size})")
         except Exception as e:
             logger.warning(f"Could not enable Google Cloud Logging: {e}")
             
     exit_code = 0
     try:
-        compute = startup(cfg)
-        run_loop(cfg, compute)
+        compute, cf_client = startup(cfg)
+        run_loop(cfg, compute, cf_client)
     except SystemExit as e:
         exit_code = e.code if isinstance(e.code, int) else 1
     except KeyboardInterrupt:
@@ -45,11 +73,7 @@ def main():
         logger.critical(f"Fatal error: {e}", exc_info=True)
         exit_code = 1
     finally:
-        for h in logger.handlers:
-            try:
-                h.flush()
-            except Exception:
-                pass
+        shutdown_logging(logger.name)
         sys.exit(exit_code)
 
 if __name__ == "__main__":
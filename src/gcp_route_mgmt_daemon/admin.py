@@ -0,0 +1,176 @@
+"""
+Admin and Health HTTP Endpoint
+
+This module serves the live state of the daemon over HTTP so orchestrators
+and dashboards can poll it cheaply, without touching GCP or Cloudflare. The
+control loop publishes a snapshot after each cycle into a lock-protected
+DaemonStatus; requests only read the last snapshot.
+
+Endpoints:
+    - GET /healthz: liveness. 200 while the control loop keeps completing
+      iterations (successful or failed) within the stale timeout, 503 when it
+      has stopped or hung
+    - GET /readyz: readiness. 200 once a cycle has completed and the loop is
+      live and not shutting down, 503 otherwise
+    - GET /state: daemon.get_daemon_info() as JSON, including the last
+      snapshot: state code and time in state, verification counters,
+      hysteresis windows, circuit breaker states and the latency of the most
+      recent call of each API
+
+    Each health response is a small JSON object with the check result and
+    its reason, e.g. {"status": "ok", "last_cycle_age_seconds": 12.3}.
+
+    The routes are served by metrics.EndpointServer, the threaded HTTP
+    server that also serves /metrics.
+
+Staleness:
+    A loop that publishes nothing for ADMIN_STALE_AFTER_SECONDS (by default
+    three check intervals) is reported as not live. Before the first
+    iteration, the time since startup is used instead.
+
+Usage Example:
+    from . import admin
+
+    admin.STATUS.publish({"state_code": 1, "state_since": changed_at, ...})
+
+    server = admin.AdminServer("0.0.0.0", 8080, stale_after=180, info=get_daemon_info)
+    server.start()        # GET http://host:8080/healthz
+    ...
+    server.stop()
+
+Thread Safety:
+    publish() and record_error() swap references under a lock and the
+    snapshot is never modified after it is published, so requests served on
+    the server threads see a consistent cycle.
+
+Author: Nathan Bray
+Version: 1.0
+Last Modified: 2025
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from .metrics import EndpointServer, Response
+
+# Logger for admin endpoint operations - uses environment variable for consistency
+logger = logging.getLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
+
+# Content type of every admin response
+CONTENT_TYPE = "application/json"
+
+
+class DaemonStatus:
+    """
+    Last cycle snapshot published by the control loop.
+
+    Attributes:
+        started_at (float): Wall clock time the status was created or reset
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget published state (the daemon is starting)."""
+        with self._lock:
+            self.started_at = self._clock()
+            self._snapshot: Optional[Dict[str, Any]] = None
+            self._published_at: Optional[float] = None
+            self._heartbeat_at: Optional[float] = None
+            self._last_error: Optional[Dict[str, Any]] = None
+
+    def publish(self, snapshot: Dict[str, Any]) -> None:
+        """Publish the state of a completed cycle; the dict must not be modified afterwards."""
+        now = self._clock()
+        with self._lock:
+            self._snapshot = snapshot
+            self._published_at = now
+            self._heartbeat_at = now
+
+    def record_error(self, message: str, consecutive_errors: int) -> None:
+        """Record a failed loop iteration; the loop is still live, the last snapshot is kept."""
+        now = self._clock()
+        with self._lock:
+            self._heartbeat_at = now
+            self._last_error = {"message": message, "consecutive_errors": consecutive_errors, "timestamp": now}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Last published state with its age.
+
+        Returns:
+            dict: last_cycle (the published snapshot or None), last_cycle_age_seconds,
+                time_in_state_seconds (from the snapshot's state_since) and last_error
+        """
+        now = self._clock()
+        with self._lock:
+            snapshot, published_at, last_error = self._snapshot, self._published_at, self._last_error
+        state_since = snapshot.get("state_since") if snapshot else None
+        return {
+            "last_cycle": snapshot,
+            "last_cycle_age_seconds": round(now - published_at, 3) if published_at is not None else None,
+            "time_in_state_seconds": round(now - state_since, 3) if state_since is not None else None,
+            "last_error": last_error
+        }
+
+    def liveness(self, stale_after: float) -> Tuple[bool, Dict[str, Any]]:
+        """Whether the loop completed an iteration within stale_after seconds (or started that recently)."""
+        now = self._clock()
+        with self._lock:
+            heartbeat_at = self._heartbeat_at
+        since = heartbeat_at if heartbeat_at is not None else self.started_at
+        age = round(now - since, 3)
+        if age > stale_after:
+            return False, {"status": "stale", "reason": f"no loop iteration for {age:.0f}s (limit {stale_after:.0f}s)"}
+        key = "last_iteration_age_seconds" if heartbeat_at is not None else "starting_for_seconds"
+        return True, {"status": "ok", key: age}
+
+    def readiness(self, stale_after: float, shutting_down: bool = False) -> Tuple[bool, Dict[str, Any]]:
+        """Whether a cycle has completed, the loop is live and no shutdown is in progress."""
+        live, body = self.liveness(stale_after)
+        with self._lock:
+            snapshot, published_at = self._snapshot, self._published_at
+        if shutting_down:
+            return False, {"status": "shutting_down", "reason": "shutdown requested"}
+        if snapshot is None:
+            return False, {"status": "starting", "reason": "no health check cycle completed yet"}
+        if not live:
+            return False, body
+        return True, {"status": "ok", "state_code": snapshot.get("state_code"),
+                      "last_cycle_age_seconds": round(self._clock() - published_at, 3)}
+
+
+# Process-wide status published by daemon.run_loop
+STATUS = DaemonStatus()
+
+
+class AdminServer(EndpointServer):
+    """
+    Threaded HTTP server answering /healthz, /readyz and /state.
+
+    Attributes:
+        stale_after (float): Seconds without a loop iteration before the daemon is not live
+        status (DaemonStatus): Status the responses are read from
+    """
+
+    def __init__(self, host: str, port: int, stale_after: float,
+                 info: Callable[[], Dict[str, Any]],
+                 status: DaemonStatus = STATUS,
+                 shutting_down: Callable[[], bool] = lambda: False):
+        self.stale_after = stale_after
+        self.status = status
+        super().__init__(host, port, "admin", {
+            "/healthz": lambda: self._json(*self.status.liveness(self.stale_after)),
+            "/readyz": lambda: self._json(*self.status.readiness(self.stale_after, shutting_down())),
+            "/state": lambda: self._json(True, info())
+        })
+
+    @staticmethod
+    def _json(ok: bool, body: Dict[str, Any]) -> Response:
+        return 200 if ok else 503, CONTENT_TYPE, json.dumps(body, default=str).encode("utf-8")
@@ -0,0 +1,203 @@
+"""
+API Call Accounting and Quota Budgets
+
+This module counts every Compute and Cloudflare API request the daemon makes,
+per method over a sliding one-minute window, and compares the totals with
+per-minute budgets. The Compute API enforces per-project read and write
+quotas per minute, and a fleet of daemons polling services x backends can
+exhaust them. As usage approaches the budget the daemon backs off the reads
+it can do without, instead of running into 429 errors on the reads it needs.
+
+Quotas:
+    Each API name (as passed to metrics.time_api_call) is counted against one
+    quota:
+    - compute_read: every compute.* call except writes, e.g.
+      compute.regionBackendServices.getHealth, compute.routers.get,
+      compute.regionOperations.get
+    - compute_write: compute.* calls whose method changes a resource
+      (patch, insert, delete, update, ...)
+    - cloudflare: every cloudflare.* request
+    A batch request is counted as its sub-requests, which is how the Compute
+    API charges it against the quota.
+
+Budgets and Throttling:
+    COMPUTE_READ_BUDGET_PER_MINUTE, COMPUTE_WRITE_BUDGET_PER_MINUTE and
+    CLOUDFLARE_BUDGET_PER_MINUTE set this daemon's share of each quota
+    (0 = no budget). Once the read quotas (compute_read, cloudflare) reach
+    API_BUDGET_THROTTLE_PCT of their budget, throttle_factor() rises
+    linearly from 1 to MAX_THROTTLE_FACTOR at 100%. The daemon multiplies the
+    optional reads by it:
+    - the drift-check interval, so confirmed router and Cloudflare state is
+      read again less often
+    - the BGP operation poll interval
+    Health checks and route writes are never skipped; writes only count
+    toward the compute_write figures and its over-budget warning.
+
+Usage Example:
+    from .api_accounting import API_USAGE
+
+    API_USAGE.configure({"compute_read": 1200, "compute_write": 60}, throttle_pct=80)
+    API_USAGE.record("compute.routers.get")               # done by metrics.time_api_call
+    API_USAGE.record("compute.batch.getHealth", calls=40)
+    API_USAGE.throttle_factor()                           # 1.0 until 80% of a budget
+    API_USAGE.stats()                                     # added to the cycle details
+
+Thread Safety:
+    Calls are recorded from probe and worker threads; all methods are
+    protected by an internal lock.
+
+Author: Nathan Bray
+Version: 1.0
+Last Modified: 2025
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+# Quota names
+QUOTAS = ("compute_read", "compute_write", "cloudflare")
+
+# Quotas whose usage the optional reads can relieve
+READ_QUOTAS = ("compute_read", "cloudflare")
+
+# Compute methods counted against the write quota
+COMPUTE_WRITE_METHODS = frozenset(("patch", "insert", "delete", "update", "setLabels", "addPeer", "removePeer"))
+
+# Length of the accounting window (seconds) and the largest slowdown of optional reads
+WINDOW_SECONDS = 60
+MAX_THROTTLE_FACTOR = 4.0
+
+# Default share of a budget at which throttling starts (API_BUDGET_THROTTLE_PCT)
+DEFAULT_THROTTLE_PCT = 80
+
+
+def quota_for(api: str) -> str:
+    """Quota an API call counts against, e.g. "compute.routers.patch" -> "compute_write"."""
+    service = api.split(".", 1)[0]
+    if service == "compute":
+        return "compute_write" if api.rsplit(".", 1)[-1] in COMPUTE_WRITE_METHODS else "compute_read"
+    if service == "cloudflare":
+        return "cloudflare"
+    return "other"
+
+
+class ApiUsageTracker:
+    """
+    Counts API calls per method over a sliding window and checks them against budgets.
+
+    Attributes:
+        budgets (dict): Calls per minute allowed per quota (missing or 0 = no budget)
+        throttle_pct (float): Share of a read budget at which throttling starts
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.budgets: Dict[str, int] = {}
+        self.throttle_pct: float = DEFAULT_THROTTLE_PCT
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all recorded calls."""
+        with self._lock:
+            # One (second, {api: calls}) bucket per second that saw calls, oldest first
+            self._buckets: Deque[Tuple[int, Dict[str, int]]] = deque()
+            self._totals: Dict[str, int] = {}
+
+    def configure(self, budgets: Dict[str, int], throttle_pct: float = DEFAULT_THROTTLE_PCT) -> None:
+        """Set the per-minute budgets per quota and where throttling starts."""
+        with self._lock:
+            self.budgets = {quota: budget for quota, budget in budgets.items() if budget}
+            self.throttle_pct = throttle_pct
+
+    def record(self, api: str, calls: int = 1) -> None:
+        """Count calls to an API (a batch counts as its sub-requests)."""
+        second = int(self._clock())
+        with self._lock:
+            if not self._buckets or self._buckets[-1][0] != second:
+                self._buckets.append((second, {}))
+                self._expire(second)
+            counts = self._buckets[-1][1]
+            counts[api] = counts.get(api, 0) + calls
+            self._totals[api] = self._totals.get(api, 0) + calls
+
+    def _expire(self, now: int) -> None:
+        while self._buckets and self._buckets[0][0] <= now - WINDOW_SECONDS:
+            self._buckets.popleft()
+
+    def calls_per_minute(self) -> Dict[str, int]:
+        """Calls per API over the last minute."""
+        with self._lock:
+            self._expire(int(self._clock()))
+            per_api: Dict[str, int] = {}
+            for _, counts in self._buckets:
+                for api, calls in counts.items():
+                    per_api[api] = per_api.get(api, 0) + calls
+        return per_api
+
+    def quota_usage(self, per_api: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+        """Calls per quota over the last minute."""
+        usage = dict.fromkeys(QUOTAS, 0)
+        for api, calls in (per_api if per_api is not None else self.calls_per_minute()).items():
+            quota = quota_for(api)
+            usage[quota] = usage.get(quota, 0) + calls
+        return usage
+
+    def throttle_factor(self, usage: Optional[Dict[str, int]] = None) -> float:
+        """
+        Multiplier for the intervals of optional reads.
+
+        Returns:
+            float: 1.0 while every read quota is below throttle_pct of its budget,
+                rising linearly to MAX_THROTTLE_FACTOR at 100% and above
+        """
+        usage = usage if usage is not None else self.quota_usage()
+        start = self.throttle_pct / 100.0
+        factor = 1.0
+        for quota in READ_QUOTAS:
+            budget = self.budgets.get(quota)
+            if not budget:
+                continue
+            ratio = usage.get(quota, 0) / budget
+            if ratio >= start:
+                progress = 1.0 if start >= 1.0 else min(1.0, (ratio - start) / (1.0 - start))
+                factor = max(factor, 1.0 + (MAX_THROTTLE_FACTOR - 1.0) * progress)
+        return round(factor, 2)
+
+    def over_budget(self, usage: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+        """Quotas whose last-minute usage exceeds the budget, with that usage."""
+        usage = usage if usage is not None else self.quota_usage()
+        return {quota: calls for quota, calls in usage.items()
+                if self.budgets.get(quota) and calls > self.budgets[quota]}
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Usage figures for the cycle details.
+
+        Returns:
+            dict: calls_per_minute (per API), quotas (calls_per_minute, budget and
+                usage_pct per quota), throttle_factor and total_calls (per API since start)
+        """
+        per_api = self.calls_per_minute()
+        usage = self.quota_usage(per_api)
+        with self._lock:
+            totals = dict(self._totals)
+        return {
+            "calls_per_minute": dict(sorted(per_api.items())),
+            "quotas": {
+                quota: {
+                    "calls_per_minute": calls,
+                    "budget": self.budgets.get(quota),
+                    "usage_pct": round(100.0 * calls / self.budgets[quota], 1) if self.budgets.get(quota) else None
+                }
+                for quota, calls in usage.items()
+            },
+            "throttle_factor": self.throttle_factor(usage),
+            "total_calls": dict(sorted(totals.items()))
+        }
+
+
+# Process-wide tracker fed by metrics.time_api_call
+API_USAGE = ApiUsageTracker()
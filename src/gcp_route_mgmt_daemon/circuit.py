@@ -52,6 +52,7 @@ import time
 import logging
 import os
 from typing import Callable, Any, Optional
+from .metrics import BACKOFF_SLEEP, RETRIES
 from .structured_events import StructuredEventLogger
 
 # Setup logger for the circuit breaker module
@@ -250,8 +251,8 @@ class CircuitBreaker:
                 Used for structured logging and debugging.
                 
         Thread Safety:
-            This method modifies shared state and should be called with appropriate
-            locking. The call() method handles this automatically.
+            The counter update and threshold check run under the internal lock, so
+            concurrent probes sharing one breaker cannot lose failures.
             
         Side Effects:
             - Increments failure_count
@@ -264,38 +265,39 @@ class CircuitBreaker:
             # But can be used directly for manual failure recording
             cb.record_failure("Database connection timeout")
         """
-        old_state = self.state
-        self.failure_count += 1
-        self.last_failure = datetime.now()
+        with self.lock:
+            old_state = self.state
+            self.failure_count += 1
+            self.last_failure = datetime.now()
         
-        # Check if we should open the circuit
-        if self.failure_count >= self.threshold and self.state != "OPEN":
-            self.state = "OPEN"
+            # Check if we should open the circuit
+            if self.failure_count >= self.threshold and self.state != "OPEN":
+                self.state = "OPEN"
             
-            logger.warning(f"Circuit breaker OPEN for {self.service_name} after "
-                          f"{self.failure_count} failures")
+                logger.warning(f"Circuit breaker OPEN for {self.service_name} after "
+                              f"{self.failure_count} failures")
             
-            # Log circuit breaker opened event
-            if self.structured_logger:
-                self.structured_logger.log_circuit_breaker_event(
-                    service=self.service_name,
-                    event_name="opened",
-                    failure_count=self.failure_count,
-                    error_message=error_message
-                )
-        else:
-            # Failure recorded but threshold not reached
-            logger.debug(f"Circuit breaker failure recorded for {self.service_name} "
-                        f"({self.failure_count}/{self.threshold})")
+                # Log circuit breaker opened event
+                if self.structured_logger:
+                    self.structured_logger.log_circuit_breaker_event(
+                        service=self.service_name,
+                        event_name="opened",
+                        failure_count=self.failure_count,
+                        error_message=error_message
+                    )
+            else:
+                # Failure recorded but threshold not reached
+                logger.debug(f"Circuit breaker failure recorded for {self.service_name} "
+                            f"({self.failure_count}/{self.threshold})")
             
-            # Log failure recorded event
-            if self.structured_logger:
-                self.structured_logger.log_circuit_breaker_event(
-                    service=self.service_name,
-                    event_name="failure_recorded",
-                    failure_count=self.failure_count,
-                    error_message=error_message
-                )
+                # Log failure recorded event
+                if self.structured_logger:
+                    self.structured_logger.log_circuit_breaker_event(
+                        service=self.service_name,
+                        event_name="failure_recorded",
+                        failure_count=self.failure_count,
+                        error_message=error_message
+                    )
 
     def reset(self) -> None:
         """
@@ -309,8 +311,7 @@ class CircuitBreaker:
         4. Logs the recovery event
         
         Thread Safety:
-            This method modifies shared state and should be called with appropriate
-            locking. The call() method handles this automatically.
+            State is reset under the internal lock and is safe to call from any thread.
             
         Side Effects:
             - Resets failure_count to 0
@@ -328,23 +329,24 @@ class CircuitBreaker:
             cb.reset()
             print(f"Circuit breaker manually reset for {cb.service_name}")
         """
-        old_failure_count = self.failure_count
+        with self.lock:
+            old_failure_count = self.failure_count
         
-        # Reset circuit breaker state to healthy
-        self.failure_count = 0
-        self.last_failure = None
-        self.state = "CLOSED"
+            # Reset circuit breaker state to healthy
+            self.failure_count = 0
+            self.last_failure = None
+            self.state = "CLOSED"
         
-        logger.info(f"Circuit breaker CLOSED for {self.service_name} - service recovered "
-                   f"(was {old_failure_count} failures)")
+            logger.info(f"Circuit breaker CLOSED for {self.service_name} - service recovered "
+                       f"(was {old_failure_count} failures)")
         
-        # Log recovery event
-        if self.structured_logger:
-            self.structured_logger.log_circuit_breaker_event(
-                service=self.service_name,
-                event_name="closed",
-                failure_count=old_failure_count
-            )
+            # Log recovery event
+            if self.structured_logger:
+                self.structured_logger.log_circuit_breaker_event(
+                    service=self.service_name,
+                    event_name="closed",
+                    failure_count=old_failure_count
+                )
 
     def get_state(self) -> dict:
         """
@@ -397,7 +399,8 @@ def exponential_backoff_retry(func: Callable,
                             max_retries: int = 3,
                             initial_delay: float = 1.0,
                             max_delay: float = 60.0,
-                            backoff_factor: float = 2.0) -> Any:
+                            backoff_factor: float = 2.0,
+                            name: Optional[str] = None) -> Any:
     """
     Retry a function with exponential backoff on failure.
     
@@ -428,6 +431,9 @@ def exponential_backoff_retry(func: Callable,
             Must be >= initial_delay. Defaults to 60.0.
         backoff_factor (float, optional): Multiplier for delay calculation.
             Must be >= 1.0. Defaults to 2.0 (doubles delay each retry).
+        name (str, optional): Operation name used in log messages and in the
+            retry metrics (metrics.RETRIES, metrics.BACKOFF_SLEEP). Defaults to
+            the function's __name__.
             
     Returns:
         Any: The return value of the function if it eventually succeeds
@@ -503,7 +509,7 @@ def exponential_backoff_retry(func: Callable,
         raise ValueError("backoff_factor must be >= 1.0")
     
     last_exception = None
-    func_name = getattr(func, '__name__', 'anonymous_function')
+    func_name = name or getattr(func, '__name__', 'anonymous_function')
     
     # Main retry loop
     for attempt in range(max_retries + 1):  # +1 for initial attempt
@@ -529,7 +535,9 @@ def exponential_backoff_retry(func: Callable,
                           f"Retrying in {delay:.2f}s...")
             
             # Wait before next retry
+            RETRIES.labels(func_name).inc()
             time.sleep(delay)
+            BACKOFF_SLEEP.labels(func_name).inc(delay)
     
     # This should never be reached due to the raise in the exception handler,
     # but included for completeness
@@ -0,0 +1,208 @@
+"""
+Thread-Safe Compute Client Pool
+
+This module provides a bounded pool of GCP Compute Engine API clients for the
+concurrent parts of a health check cycle (the probe stage and the backend
+getHealth fan-out). A discovery Resource built on a single httplib2 transport
+must not be used by several threads at once; the pool hands each worker its own
+Resource for the duration of one API call chain and takes it back afterwards.
+
+Pool Semantics:
+    - Clients are created lazily by a factory, up to the configured size
+    - Every client shares one credentials object, so a token refreshed for one
+      worker is reused by all of them; the pool refreshes an expired token once,
+      under a lock, before handing out a client
+    - checkout() blocks when every client is in use and raises TimeoutError if
+      none is returned within the checkout timeout
+    - Idle clients are reused most-recently-returned first, keeping the hottest
+      HTTP connections busy and letting the rest go idle
+
+Metrics:
+    stats() returns checkout/return counters, the current and peak number of
+    clients in use, the number of checkouts that had to wait and the total wait
+    time. The daemon includes the snapshot in each cycle's structured event.
+
+Usage Example:
+    from .gcp import build_compute_client_pool, backend_services_healthy
+
+    pool = build_compute_client_pool('/path/to/key.json', size=8)
+    checker = backend_services_healthy('my-project', 'us-central1', pool)
+    healthy = checker()          # each getHealth call borrows a pooled client
+    print(pool.stats())
+
+    with pool.client() as compute:
+        compute.routers().get(project=..., region=..., router=...).execute()
+
+Thread Safety:
+    All methods are safe to call from any thread. A checked-out client must only
+    be used by the thread that checked it out, and must be returned exactly once.
+
+Author: Nathan Bray
+Version: 1.0
+Last Modified: 2025
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# Logger for client pool operations - uses environment variable for consistency
+logger = logging.getLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
+
+# Default pool configuration
+DEFAULT_POOL_SIZE = 8                 # Matches the default backend health fan-out
+DEFAULT_CHECKOUT_TIMEOUT = 30         # Seconds to wait for a free client
+
+
+class ComputeClientPool:
+    """
+    Bounded pool of Compute Engine API clients sharing one set of credentials.
+
+    Attributes:
+        size (int): Maximum number of clients the pool will create
+        checkout_timeout (float): Seconds checkout() waits for a free client
+        credentials: Shared google-auth credentials (optional); refreshed once
+            under the pool lock when expired
+    """
+
+    def __init__(self,
+                 factory: Callable[[], Any],
+                 size: int = DEFAULT_POOL_SIZE,
+                 credentials: Any = None,
+                 checkout_timeout: float = DEFAULT_CHECKOUT_TIMEOUT):
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        if checkout_timeout <= 0:
+            raise ValueError("checkout_timeout must be > 0")
+
+        self.size = size
+        self.checkout_timeout = checkout_timeout
+        self.credentials = credentials
+
+        self._factory = factory
+        self._idle: deque = deque()
+        self._condition = threading.Condition()
+        self._refresh_lock = threading.Lock()
+
+        self._created = 0
+        self._in_use = 0
+        self._peak_in_use = 0
+        self._checkouts = 0
+        self._returns = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._timeouts = 0
+
+    def _ensure_token(self) -> None:
+        """Refresh the shared token once if it has expired."""
+        if self.credentials is None or self.credentials.valid:
+            return
+        with self._refresh_lock:
+            # Another worker may have refreshed while we waited for the lock
+            if not self.credentials.valid:
+                from google.auth.transport.requests import Request
+                logger.debug("Refreshing shared GCP credentials for client pool")
+                self.credentials.refresh(Request())
+
+    def checkout(self, timeout: Optional[float] = None) -> Any:
+        """
+        Take a client from the pool, creating one if below size.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a free client.
+                Defaults to checkout_timeout.
+
+        Returns:
+            A Compute Engine client reserved for the calling thread
+
+        Raises:
+            TimeoutError: If no client became free within the timeout
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        create = False
+
+        with self._condition:
+            if not self._idle and self._created >= self.size:
+                self._waits += 1
+                wait_start = time.monotonic()
+                available = self._condition.wait_for(
+                    lambda: self._idle or self._created < self.size, timeout=timeout
+                )
+                self._wait_time += time.monotonic() - wait_start
+                if not available:
+                    self._timeouts += 1
+                    raise TimeoutError(f"No compute client available within {timeout}s "
+                                       f"(pool size {self.size}, all in use)")
+
+            if self._idle:
+                client = self._idle.pop()
+            else:
+                # Reserve the slot now; build outside the lock
+                self._created += 1
+                create = True
+
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+            self._checkouts += 1
+
+        if create:
+            try:
+                client = self._factory()
+            except Exception:
+                with self._condition:
+                    self._created -= 1
+                    self._in_use -= 1
+                    self._condition.notify()
+                raise
+            logger.debug(f"Created compute client {self._created}/{self.size} for pool")
+
+        try:
+            self._ensure_token()
+        except Exception:
+            # Keep the client and its slot; the next checkout retries the refresh
+            self.checkin(client)
+            raise
+        return client
+
+    def checkin(self, client: Any) -> None:
+        """Return a client previously obtained from checkout()."""
+        with self._condition:
+            self._idle.append(client)
+            self._in_use -= 1
+            self._returns += 1
+            self._condition.notify()
+
+    @contextmanager
+    def client(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """Context manager that checks a client out and always returns it."""
+        client = self.checkout(timeout=timeout)
+        try:
+            yield client
+        finally:
+            self.checkin(client)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of pool usage counters.
+
+        Returns:
+            Dict[str, Any]: size, created, in_use, idle, peak_in_use, checkouts,
+                returns, waits, wait_time_ms and timeouts
+        """
+        with self._condition:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "peak_in_use": self._peak_in_use,
+                "checkouts": self._checkouts,
+                "returns": self._returns,
+                "waits": self._waits,
+                "wait_time_ms": int(self._wait_time * 1000),
+                "timeouts": self._timeouts
+            }
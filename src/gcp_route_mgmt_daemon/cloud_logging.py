@@ -0,0 +1,373 @@
+"""
+Batched Export of Log Records to Google Cloud Logging
+
+This module provides CloudLoggingExporter, a logging handler that ships log
+records to the Cloud Logging API (entries.write) in batches from a background
+thread. Logging calls only append to a bounded in-memory buffer, so a slow or
+unavailable API never holds up the daemon or the log writer thread.
+
+Batching:
+    A batch is sent when `batch_size` records are buffered or every
+    `flush_interval` seconds, whichever comes first. Structured events are sent
+    as jsonPayload (their json_fields), other records as textPayload.
+
+    Entries are encoded with the encoding module when they are buffered, so
+    structured payloads carry the same static fields as the structured log
+    files and a batch body is joined from pre-encoded entries.
+
+Monitored Resource:
+    Entries are written against the monitored resource passed as `resource`.
+    detect_resource() returns the gce_instance resource of the host, from
+    configured labels or the GCE metadata server, and falls back to global
+    when the daemon does not run on Compute Engine.
+
+Backpressure:
+    The buffer holds at most `buffer_size` records. When it is full the oldest
+    record is dropped and counted, so the newest context is kept. Batches that
+    fail with a retryable error (connection error, timeout, 429 or 5xx) are put
+    back at the front of the buffer and retried on the next flush; batches the
+    API rejects as invalid (other 4xx) are dropped and counted.
+
+Circuit Breaker:
+    Sends go through a circuit.CircuitBreaker. After `threshold` consecutive
+    failures the circuit opens and no request is made until its timeout has
+    passed; records keep buffering (and the oldest are dropped) meanwhile.
+
+Usage Example:
+    from .cloud_logging import CloudLoggingExporter, detect_resource
+    from .circuit import CircuitBreaker
+
+    exporter = CloudLoggingExporter(
+        project="my-project", resource=detect_resource("my-project"), batch_size=100, flush_interval=5, buffer_size=10000,
+        circuit_breaker=CircuitBreaker(threshold=5, timeout=300, service_name="cloud_logging"))
+    add_log_handler(logger, exporter)
+    ...
+    exporter.stats()    # sent, dropped, rejected, failed_batches, buffered, ...
+
+Authentication:
+    Requests use Application Default Credentials (GOOGLE_APPLICATION_CREDENTIALS)
+    through google-auth's AuthorizedSession, created on the first send. Pass a
+    session (anything with requests.Session.post semantics) and an endpoint to
+    send elsewhere, e.g. a local fake API in tests.
+
+Author: Nathan Bray
+Version: 1.0
+Last Modified: 2025
+"""
+
+import logging
+import os
+import threading
+import time
+import urllib.request
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+from .circuit import CircuitBreaker
+from .encoding import encode_event, encode_json
+
+# Logger for exporter operations - uses environment variable for consistency
+logger = logging.getLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
+
+# Cloud Logging API
+DEFAULT_LOGGING_ENDPOINT = "https://logging.googleapis.com/v2/entries:write"
+LOGGING_WRITE_SCOPE = "https://www.googleapis.com/auth/logging.write"
+DEFAULT_LOG_NAME = "radius_healthcheck_daemon"
+
+# GCE metadata server, queried by detect_resource (GCE_METADATA_HOST overrides the host as in google-auth)
+METADATA_HOST = os.getenv("GCE_METADATA_HOST", "metadata.google.internal")
+METADATA_TIMEOUT = 1.0
+
+# Exporter defaults (GCP_LOGGING_BATCH_SIZE, GCP_LOGGING_FLUSH_INTERVAL, GCP_LOGGING_BUFFER_SIZE)
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 5.0
+DEFAULT_BUFFER_SIZE = 10000
+DEFAULT_REQUEST_TIMEOUT = 10.0
+
+# Cloud Logging severities by Python log level
+_SEVERITIES = {
+    logging.DEBUG: "DEBUG",
+    logging.INFO: "INFO",
+    logging.WARNING: "WARNING",
+    logging.ERROR: "ERROR",
+    logging.CRITICAL: "CRITICAL"
+}
+
+
+def _read_metadata(path: str, timeout: float) -> str:
+    request = urllib.request.Request(f"http://{METADATA_HOST}/computeMetadata/v1/{path}",
+                                     headers={"Metadata-Flavor": "Google"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read().decode("utf-8").strip()
+
+
+def detect_resource(project: str,
+                    instance_id: Optional[str] = None,
+                    zone: Optional[str] = None,
+                    timeout: float = METADATA_TIMEOUT) -> Dict[str, Any]:
+    """
+    Monitored resource the daemon's log entries are written against.
+
+    Args:
+        project (str): GCP project of the instance
+        instance_id (str, optional): Numeric instance ID; read from the metadata server if empty
+        zone (str, optional): Instance zone, e.g. us-central1-a; read from the metadata server if empty
+        timeout (float): Seconds to wait for each metadata request
+
+    Returns:
+        dict: A gce_instance resource with project_id, instance_id and zone
+            labels, or a global resource when they cannot be determined
+    """
+    try:
+        instance_id = instance_id or _read_metadata("instance/id", timeout)
+        zone = zone or _read_metadata("instance/zone", timeout).rsplit("/", 1)[-1]
+    except Exception as e:
+        logger.info(f"GCE metadata server not available ({e}); Cloud Logging resource is global")
+        return {"type": "global", "labels": {"project_id": project}}
+    return {"type": "gce_instance", "labels": {"project_id": project, "instance_id": instance_id, "zone": zone}}
+
+
+class CloudLoggingExportError(Exception):
+    """Retryable failure writing a batch (HTTP 429 or 5xx)."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"Cloud Logging write failed with HTTP {status_code}: {message}")
+        self.status_code = status_code
+
+
+class CloudLoggingExporter(logging.Handler):
+    """
+    Logging handler exporting records to Cloud Logging in batches.
+
+    Attributes:
+        project (str): GCP project the entries are written to
+        log_name (str): Log ID within the project
+        batch_size (int): Maximum entries per entries.write request
+        flush_interval (float): Seconds between flushes of a partial batch
+        buffer_size (int): Maximum buffered entries before the oldest are dropped
+        resource (dict): Monitored resource of the entries (default: global)
+        circuit_breaker (CircuitBreaker): Protects the API from repeated failing calls
+    """
+
+    def __init__(self,
+                 project: str,
+                 log_name: str = DEFAULT_LOG_NAME,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 endpoint: str = DEFAULT_LOGGING_ENDPOINT,
+                 session: Any = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 resource: Optional[Dict[str, Any]] = None,
+                 labels: Optional[Dict[str, str]] = None,
+                 timeout: float = DEFAULT_REQUEST_TIMEOUT,
+                 level: int = logging.NOTSET):
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if buffer_size < batch_size:
+            raise ValueError("buffer_size must be >= batch_size")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be > 0")
+        super().__init__(level)
+
+        self.project = project
+        self.log_name = log_name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        self.endpoint = endpoint
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(service_name="cloud_logging")
+        self.timeout = timeout
+        self._session = session
+        self.resource = resource or {"type": "global"}
+        # Request body up to the entries array, encoded once
+        self._body_prefix = encode_json({
+            "logName": f"projects/{project}/logs/{quote(log_name, safe='')}",
+            "resource": self.resource,
+            "labels": labels or {},
+            "partialSuccess": True
+        })[:-1] + ',"entries":['
+
+        self._buffer: deque = deque()
+        self._buffer_lock = threading.Lock()    # Buffer and counters
+        self._send_lock = threading.Lock()      # One batch in flight
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+
+        self._sent = 0
+        self._batches = 0
+        self._dropped = 0
+        self._rejected = 0
+        self._failed_batches = 0
+        self._last_error: Optional[str] = None
+
+        self._thread = threading.Thread(target=self._run, name="cloud-logging-exporter", daemon=True)
+        self._thread.start()
+
+    def _entry(self, record: logging.LogRecord) -> str:
+        """Encode a Cloud Logging LogEntry for a record."""
+        entry = {
+            "severity": _SEVERITIES.get(record.levelno, "DEFAULT"),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat().replace("+00:00", "Z")
+        }
+        fields = getattr(record, 'json_fields', None)
+        if not isinstance(fields, dict):
+            entry["textPayload"] = self.format(record)
+            return encode_json(entry)
+        # Structured events get the static event fields, as in the structured log files
+        return f'{encode_json(entry)[:-1]},"jsonPayload":{encode_event(fields)}}}'
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Buffer a record for the next batch; never waits on the API."""
+        try:
+            entry = self._entry(record)
+        except Exception:
+            self.handleError(record)
+            return
+        with self._buffer_lock:
+            if len(self._buffer) >= self.buffer_size:
+                self._buffer.popleft()
+                self._dropped += 1
+            self._buffer.append(entry)
+            batch_ready = len(self._buffer) >= self.batch_size
+        if batch_ready:
+            self._wakeup.set()
+
+    def _create_session(self):
+        import google.auth
+        from google.auth.transport.requests import AuthorizedSession
+
+        credentials, _ = google.auth.default(scopes=[LOGGING_WRITE_SCOPE])
+        return AuthorizedSession(credentials)
+
+    def _send(self, batch: List[str]) -> int:
+        """
+        Write one batch; returns the HTTP status.
+
+        Raises:
+            CloudLoggingExportError: On 429 and 5xx responses (retryable)
+            requests.RequestException: On connection errors and timeouts
+        """
+        if self._session is None:
+            self._session = self._create_session()
+        body = (self._body_prefix + ",".join(batch) + "]}").encode("utf-8")
+        response = self._session.post(self.endpoint, data=body, timeout=self.timeout,
+                                      headers={"Content-Type": "application/json"})
+        if response.status_code == 429 or response.status_code >= 500:
+            raise CloudLoggingExportError(response.status_code, response.text[:200])
+        return response.status_code
+
+    def _export_batch(self, full_only: bool = False) -> bool:
+        """
+        Send the oldest buffered entries as one batch.
+
+        Args:
+            full_only (bool): Only send if a full batch is buffered
+
+        Returns:
+            bool: True if a batch was sent or rejected, False if there was
+                nothing to send or the send failed (the batch is back in the buffer)
+        """
+        with self._buffer_lock:
+            if full_only and len(self._buffer) < self.batch_size:
+                return False
+            batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+        if not batch:
+            return False
+
+        try:
+            status = self.circuit_breaker.call(self._send, batch)
+        except Exception as e:
+            with self._buffer_lock:
+                self._failed_batches += 1
+                self._last_error = str(e)
+                # Retry later, ahead of newer records; overflow drops the oldest
+                self._buffer.extendleft(reversed(batch))
+                while len(self._buffer) > self.buffer_size:
+                    self._buffer.popleft()
+                    self._dropped += 1
+            return False
+
+        with self._buffer_lock:
+            self._batches += 1
+            if status >= 400:
+                self._rejected += len(batch)
+                self._last_error = f"HTTP {status}"
+            else:
+                self._sent += len(batch)
+        if status >= 400:
+            logger.warning(f"Cloud Logging rejected a batch of {len(batch)} entries with HTTP {status}")
+        return True
+
+    def _drain(self, deadline: Optional[float] = None, full_only: bool = False) -> bool:
+        """Send batches until the buffer is empty, a send fails or the deadline passes."""
+        with self._send_lock:
+            while deadline is None or time.monotonic() < deadline:
+                if not self._export_batch(full_only):
+                    break
+        with self._buffer_lock:
+            return not self._buffer
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            # Woken early by a full batch: send full batches only and keep the interval for the rest
+            interval_elapsed = not self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self._stopping.is_set():
+                break
+            try:
+                self._drain(full_only=not interval_elapsed)
+            except Exception as e:
+                logger.warning(f"Cloud Logging exporter error: {e}")
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Send everything buffered now, giving up after `timeout` seconds or on a failed send.
+
+        Returns:
+            bool: True if the buffer is empty
+        """
+        return self._drain(time.monotonic() + timeout)
+
+    def close(self) -> None:
+        """Stop the exporter thread and make a final attempt to send the buffer."""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.timeout)
+        try:
+            self.flush()
+        finally:
+            super().close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of exporter counters."""
+        with self._buffer_lock:
+            stats = {
+                "buffered": len(self._buffer),
+                "buffer_size": self.buffer_size,
+                "sent": self._sent,
+                "batches": self._batches,
+                "dropped": self._dropped,
+                "rejected": self._rejected,
+                "failed_batches": self._failed_batches,
+                "last_error": self._last_error
+            }
+        stats["circuit_breaker"] = self.circuit_breaker.state
+        return stats
+
+
+# Exporter installed by the entry point, reported in the cycle statistics
+_exporter: Optional[CloudLoggingExporter] = None
+
+
+def get_cloud_logging_exporter() -> Optional[CloudLoggingExporter]:
+    """Return the installed Cloud Logging exporter, if any."""
+    return _exporter
+
+
+def set_cloud_logging_exporter(exporter: Optional[CloudLoggingExporter]) -> None:
+    """Install (or with None, remove) the process-wide Cloud Logging exporter."""
+    global _exporter
+    _exporter = exporter
@@ -12,6 +12,7 @@ Magic Transit Overview:
     handled, including priority for failover scenarios.
 
 Key Features:
+    - Pooled keep-alive client (CloudflareClient) reused across health check cycles
     - Validates Cloudflare API connectivity and permissions
     - Bulk updates route priorities based on description matching
     - Comprehensive error handling with retry capabilities
@@ -68,7 +69,7 @@ Security Considerations:
     - Implement proper error handling to avoid token exposure in logs
 
 Author: Nathan Bray
-Version: 1.1
+Version: 1.2
 Last Modified: 2025
 Dependencies: requests, structured_events module
 """
@@ -76,8 +77,13 @@ Dependencies: requests, structured_events module
 import logging
 import requests
 import os
+import threading
 import time
 from typing import Optional, Dict, List, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .metrics import time_api_call
+from .reconcile import ReconciliationCache
 from .structured_events import StructuredEventLogger, ActionResult
 
 # Logger used for all Cloudflare-related operations
@@ -89,9 +95,154 @@ CLOUDFLARE_API_BASE = "https://api.cloudflare.com/client/v4"
 DEFAULT_REQUEST_TIMEOUT = 10  # seconds
 BULK_UPDATE_TIMEOUT = 60      # seconds for bulk operations
 MAX_ROUTES_PER_REQUEST = 1000 # Cloudflare API limit (approximate)
+USER_AGENT = "gcp-route-mgmt/1.0"  # Identify our application
 
+# Connection pool and adapter retry defaults for CloudflareClient
+DEFAULT_POOL_MAXSIZE = 4              # Keep-alive connections kept per host
+DEFAULT_HTTP_RETRIES = 0              # Adapter retries; callers already use exponential_backoff_retry
+DEFAULT_HTTP_BACKOFF_FACTOR = 0.5     # urllib3 backoff between adapter retries (seconds)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
 
-def validate_cloudflare_connectivity(account_id: str, token: str, timeout: int = DEFAULT_REQUEST_TIMEOUT) -> None:
+
+def _timed(api: str, send, *args, **kwargs) -> requests.Response:
+    """Send a request, recording its latency; 4xx/5xx responses count as errors."""
+    with time_api_call(api) as timer:
+        response = send(*args, **kwargs)
+        timer.failed = not response.ok
+    return response
+
+
+def _build_headers(token: str) -> Dict[str, str]:
+    """Build the standard request headers for Cloudflare API calls."""
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+        "User-Agent": USER_AGENT
+    }
+
+
+class CloudflareClient:
+    """
+    Pooled, keep-alive HTTP client for the Cloudflare API.
+
+    The module-level functions fall back to one-shot requests.get/put calls,
+    which open a new TCP connection and TLS session for every request. A
+    CloudflareClient owns a requests.Session with prebuilt auth headers and a
+    mounted HTTPAdapter, so connections to api.cloudflare.com are reused from
+    one health check cycle to the next and the handshake is paid once.
+
+    Create one client at daemon startup, pass it to the module functions via
+    their `client` argument every cycle, and close it on shutdown.
+
+    Adapter Retry Policy:
+        Retries configured here happen inside the connection layer, below the
+        circuit breaker and exponential_backoff_retry wrappers. They default to
+        0 so the two layers do not multiply; when enabled, only connection
+        errors and 429/5xx responses on idempotent methods (GET, PUT) are
+        retried, honouring Retry-After. Once retries are exhausted the last
+        response is returned, so raise_for_status() reports it as before.
+
+    Attributes:
+        base_url (str): Cloudflare API base URL used to build request URLs
+        session (requests.Session): Shared session carrying auth headers
+
+    Thread Safety:
+        requests.Session is not documented as thread-safe; requests are
+        serialised with an internal lock. The daemon issues Cloudflare calls
+        from its single control thread, so the lock is uncontended.
+
+    Example:
+        client = CloudflareClient(token, pool_maxsize=4, max_retries=0)
+        try:
+            update_routes_by_description_bulk(account_id, token, "primary-dc",
+                                              100, client=client)
+        finally:
+            client.close()
+    """
+
+    def __init__(self,
+                 token: str,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 max_retries: int = DEFAULT_HTTP_RETRIES,
+                 backoff_factor: float = DEFAULT_HTTP_BACKOFF_FACTOR,
+                 base_url: str = CLOUDFLARE_API_BASE):
+        if not token or not isinstance(token, str):
+            raise ValueError("token must be a non-empty string")
+        if pool_maxsize < 1:
+            raise ValueError("pool_maxsize must be >= 1")
+        if max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
+        if backoff_factor < 0:
+            raise ValueError("backoff_factor must be >= 0")
+
+        self.base_url = base_url.rstrip('/')
+        self._lock = threading.Lock()
+
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "PUT"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.headers.update(_build_headers(token))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        logger.debug(f"Cloudflare client created: pool_maxsize={pool_maxsize}, "
+                    f"adapter_retries={max_retries}, backoff_factor={backoff_factor}")
+
+    def get(self, url: str, timeout: float = DEFAULT_REQUEST_TIMEOUT) -> requests.Response:
+        """Issue a GET over the pooled session."""
+        with self._lock:
+            return _timed("cloudflare.get", self.session.get, url, timeout=timeout)
+
+    def put(self, url: str, json: Any = None, timeout: float = BULK_UPDATE_TIMEOUT) -> requests.Response:
+        """Issue a PUT with a JSON body over the pooled session."""
+        with self._lock:
+            return _timed("cloudflare.put", self.session.put, url, json=json, timeout=timeout)
+
+    def close(self) -> None:
+        """Close pooled connections. The client must not be used afterwards."""
+        self.session.close()
+
+    def __enter__(self) -> "CloudflareClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class _UnpooledTransport:
+    """One-shot requests.get/put transport used when no CloudflareClient is given."""
+
+    def __init__(self, token: str):
+        self.base_url = CLOUDFLARE_API_BASE
+        self.headers = _build_headers(token)
+
+    def get(self, url: str, timeout: float = DEFAULT_REQUEST_TIMEOUT) -> requests.Response:
+        return _timed("cloudflare.get", requests.get, url, headers=self.headers, timeout=timeout)
+
+    def put(self, url: str, json: Any = None, timeout: float = BULK_UPDATE_TIMEOUT) -> requests.Response:
+        return _timed("cloudflare.put", requests.put, url, headers=self.headers, json=json, timeout=timeout)
+
+
+def _transport(client: Optional[CloudflareClient], token: str):
+    """Return the pooled client if provided, otherwise a one-shot transport."""
+    return client if client is not None else _UnpooledTransport(token)
+
+
+def validate_cloudflare_connectivity(account_id: str,
+                                     token: str,
+                                     timeout: int = DEFAULT_REQUEST_TIMEOUT,
+                                     client: Optional[CloudflareClient] = None) -> None:
     """
     Validates Cloudflare API connectivity and permissions for Magic Transit operations.
 
@@ -110,6 +261,8 @@ def validate_cloudflare_connectivity(account_id: str, token: str, timeout: int =
         token (str): Cloudflare API token with Magic Transit permissions.
             Should have Account:Read and Zone:Zone Settings:Edit permissions.
         timeout (int, optional): Request timeout in seconds. Defaults to DEFAULT_REQUEST_TIMEOUT.
+        client (CloudflareClient, optional): Pooled client to send requests
+            through. When omitted, each request opens a new connection.
             
     Raises:
         requests.exceptions.HTTPError: If HTTP request fails (4xx/5xx status codes)
@@ -165,21 +318,17 @@ def validate_cloudflare_connectivity(account_id: str, token: str, timeout: int =
     if not token or not isinstance(token, str):
         raise ValueError("token must be a non-empty string")
     
-    # Prepare headers for API requests
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "User-Agent": "gcp-route-mgmt/1.0"  # Identify our application
-    }
+    # Use the pooled session if provided, otherwise one-shot requests
+    http = _transport(client, token)
 
     logger.debug(f"Validating Cloudflare connectivity for account {account_id}")
 
     try:
         # Step 1: Validate token itself
-        verify_url = f"{CLOUDFLARE_API_BASE}/accounts/{account_id}/tokens/verify"
+        verify_url = f"{http.base_url}/accounts/{account_id}/tokens/verify"
         logger.debug(f"Verifying token at: {verify_url}")
         
-        r = requests.get(verify_url, headers=headers, timeout=timeout)
+        r = http.get(verify_url, timeout=timeout)
         r.raise_for_status()  # Raises HTTPError for 4xx/5xx responses
         
         # Parse and validate token verification response
@@ -191,10 +340,10 @@ def validate_cloudflare_connectivity(account_id: str, token: str, timeout: int =
         logger.debug("Token verification successful")
 
         # Step 2: Validate access to Magic Transit routes
-        list_url = f"{CLOUDFLARE_API_BASE}/accounts/{account_id}/magic/routes"
+        list_url = f"{http.base_url}/accounts/{account_id}/magic/routes"
         logger.debug(f"Testing route access at: {list_url}")
         
-        r2 = requests.get(list_url, headers=headers, timeout=timeout)
+        r2 = http.get(list_url, timeout=timeout)
         r2.raise_for_status()  # Raises HTTPError for 4xx/5xx responses
         
         # Parse and validate routes list response
@@ -237,7 +386,9 @@ def update_routes_by_description_bulk(account_id: str,
                                     desired_priority: int,
                                     structured_logger: Optional[StructuredEventLogger] = None,
                                     timeout: int = DEFAULT_REQUEST_TIMEOUT,
-                                    bulk_timeout: int = BULK_UPDATE_TIMEOUT) -> bool:
+                                    bulk_timeout: int = BULK_UPDATE_TIMEOUT,
+                                    client: Optional[CloudflareClient] = None,
+                                    cache: Optional[ReconciliationCache] = None) -> bool:
     """
     Bulk update Magic Transit route priorities for routes matching a description pattern.
     
@@ -277,6 +428,14 @@ def update_routes_by_description_bulk(account_id: str,
             Defaults to DEFAULT_REQUEST_TIMEOUT.
         bulk_timeout (int, optional): Request timeout in seconds for bulk update operations.
             Defaults to BULK_UPDATE_TIMEOUT.
+        client (CloudflareClient, optional): Pooled client to send requests through.
+            The daemon passes the client created at startup so every cycle reuses
+            the same keep-alive connection. When omitted, each request opens a new
+            connection.
+        cache (ReconciliationCache, optional): Confirmed-state cache. When the
+            matching routes were last read at desired_priority within the
+            drift-check interval, the route list GET is skipped and NO_CHANGE
+            is logged. A bulk update or failure clears the confirmation.
             
     Returns:
         bool: True if operation completed successfully (including no-change scenarios),
@@ -371,12 +530,29 @@ def update_routes_by_description_bulk(account_id: str,
     if not isinstance(desired_priority, int) or desired_priority < 1 or desired_priority > 1000:
         raise ValueError("desired_priority must be an integer between 1 and 1000")
     
+    # Skip the route list read when this priority was confirmed within the drift-check interval
+    cache_key = f"cloudflare:{account_id}:{desc_substring}"
+    if cache is not None and cache.should_skip(cache_key, desired_priority):
+        logger.debug(f"Routes matching '{desc_substring}' confirmed at priority {desired_priority}, "
+                    f"skipping read until next drift check")
+        if structured_logger:
+            structured_logger.log_cloudflare_update(
+                account_id=account_id,
+                description_filter=desc_substring,
+                desired_priority=desired_priority,
+                routes_modified=0,
+                result=ActionResult.NO_CHANGE,
+                duration_ms=0
+            )
+        return True
+
     # Initialize operation tracking variables
     start_time = time.time()
     success = False
     routes_modified = 0
     error_message = None
     result = ActionResult.FAILURE
+    confirmed_priorities: Dict[str, Any] = {}  # route id -> priority observed for matching routes
     operation_details = {
         "total_routes": 0,
         "matching_routes": 0,
@@ -384,22 +560,18 @@ def update_routes_by_description_bulk(account_id: str,
         "api_calls_made": 0
     }
     
-    # Prepare headers for API requests
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "User-Agent": "gcp-route-mgmt/1.0"
-    }
+    # Use the pooled session if provided, otherwise one-shot requests
+    http = _transport(client, token)
 
     logger.debug(f"Starting bulk route update: account={account_id}, "
                 f"filter='{desc_substring}', priority={desired_priority}")
 
     try:
         # Step 1: Retrieve all routes for the account
-        list_url = f"{CLOUDFLARE_API_BASE}/accounts/{account_id}/magic/routes"
+        list_url = f"{http.base_url}/accounts/{account_id}/magic/routes"
         logger.debug(f"Fetching routes from: {list_url}")
         
-        r = requests.get(list_url, headers=headers, timeout=timeout)
+        r = http.get(list_url, timeout=timeout)
         operation_details["api_calls_made"] += 1
         r.raise_for_status()
         
@@ -429,6 +601,7 @@ def update_routes_by_description_bulk(account_id: str,
                 
                 logger.debug(f"Route {route_id} matches filter: desc='{route_desc}', "
                            f"current_priority={current_priority}")
+                confirmed_priorities[route_id] = current_priority
                 
                 # Check if priority update is needed
                 if current_priority != desired_priority:
@@ -455,6 +628,11 @@ def update_routes_by_description_bulk(account_id: str,
         operation_details["matching_routes"] = matching_routes
         operation_details["routes_needing_update"] = len(updates)
 
+        if updates and cache is not None and cache.was_confirmed(cache_key, desired_priority):
+            logger.warning(f"Out-of-band change detected: {len(updates)} routes matching "
+                          f"'{desc_substring}' drifted from confirmed priority {desired_priority}")
+            cache.record_drift(cache_key)
+
         # Step 3: Determine operation result based on what we found
         if not updates:
             if matching_routes > 0:
@@ -483,8 +661,7 @@ def update_routes_by_description_bulk(account_id: str,
             payload = {"routes": updates}
             
             logger.debug(f"Sending bulk update request with {len(updates)} route changes")
-            put_resp = requests.put(list_url, headers=headers, json=payload,
-                                  timeout=bulk_timeout)
+            put_resp = http.put(list_url, json=payload, timeout=bulk_timeout)
             operation_details["api_calls_made"] += 1
             put_resp.raise_for_status()
             
@@ -534,6 +711,15 @@ def update_routes_by_description_bulk(account_id: str,
         logger.exception(f"Unexpected error in Cloudflare route update: {e}")
     
     finally:
+        # Only a read that found every matching route at the desired priority
+        # confirms the state; updates and failures force a read next time
+        if cache is not None:
+            if success and routes_modified == 0 and operation_details["matching_routes"] > 0 \
+                    and operation_details["routes_needing_update"] == 0:
+                cache.confirm(cache_key, desired_priority, observed=confirmed_priorities)
+            else:
+                cache.invalidate(cache_key)
+
         # Step 5: Log structured event with comprehensive operation details
         operation_duration_ms = int((time.time() - start_time) * 1000)
         
@@ -568,7 +754,8 @@ def update_routes_by_description_bulk(account_id: str,
 def get_routes_by_description(account_id: str,
                             token: str,
                             desc_substring: str,
-                            timeout: int = DEFAULT_REQUEST_TIMEOUT) -> List[Dict[str, Any]]:
+                            timeout: int = DEFAULT_REQUEST_TIMEOUT,
+                            client: Optional[CloudflareClient] = None) -> List[Dict[str, Any]]:
     """
     Retrieve Magic Transit routes that match a specific description pattern.
 
@@ -580,6 +767,7 @@ def get_routes_by_description(account_id: str,
         token (str): Cloudflare API token with read permissions
         desc_substring (str): Substring to search for in route descriptions
         timeout (int, optional): Request timeout in seconds. Defaults to DEFAULT_REQUEST_TIMEOUT.
+        client (CloudflareClient, optional): Pooled client to send requests through.
         
     Returns:
         List[Dict[str, Any]]: List of route objects matching the description filter
@@ -596,14 +784,10 @@ def get_routes_by_description(account_id: str,
     if not desc_substring:
         return []
         
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "User-Agent": "gcp-route-mgmt/1.0"
-    }
+    http = _transport(client, token)
     
-    list_url = f"{CLOUDFLARE_API_BASE}/accounts/{account_id}/magic/routes"
-    r = requests.get(list_url, headers=headers, timeout=timeout)
+    list_url = f"{http.base_url}/accounts/{account_id}/magic/routes"
+    r = http.get(list_url, timeout=timeout)
     r.raise_for_status()
     
     data = r.json()
@@ -22,9 +22,22 @@ class Config:
             - log_max_bytes: Log file size before rotation.
             - log_backup_count: Number of rotated backups to retain.
             - enable_gcp_logging: Enable/disable Stackdriver logging.
+            - gcp_logging_batch_size: Log entries per Cloud Logging write request.
+            - gcp_logging_flush_interval: Seconds between sends of a partial batch.
+            - gcp_logging_buffer_size: Entries buffered for Cloud Logging before the oldest are dropped.
+            - gcp_logging_log_name: Cloud Logging log ID.
+            - gcp_logging_instance_id: Instance ID of the gce_instance log resource (empty: from the metadata server).
+            - gcp_logging_zone: Zone of the gce_instance log resource (empty: from the metadata server).
             - enable_structured_console: Output JSON to console for structured events.
             - enable_structured_file: Output JSON to separate structured log file.
             - structured_log_file: Path to structured JSON log file.
+            - structured_log_format: Structured log file format, "array" (JSON array) or "jsonl" (one event per line).
+            - log_async: Run log handlers on a dedicated writer thread behind a bounded queue.
+            - log_queue_size: Maximum log records waiting for the writer thread.
+            - log_queue_overflow: Full-queue policy, "drop-debug" (drop DEBUG records) or "block".
+            - log_compression: Compress rotated log backups on a background thread, "none" (default), "gzip" or "zstd".
+            - flight_recorder_size: Recent structured events kept in memory at any level (0 disables).
+            - flight_recorder_dump_file: Path prefix of flight recorder dumps written on SIGUSR1.
 
         GCP & Regions:
             - gcp_project: GCP project ID.
@@ -68,9 +81,53 @@ class Config:
         API Timeouts:
             - gcp_api_timeout: General GCP API call timeout.
             - gcp_backend_health_timeout: Backend health check timeout.
-            - gcp_bgp_operation_timeout: BGP advertisement update timeout.
+            - gcp_bgp_operation_timeout: Seconds a router patch operation is polled before it is reported as timed out.
             - cloudflare_api_timeout: Cloudflare API request timeout.
             - cloudflare_bulk_timeout: Cloudflare bulk update timeout.
+
+        Probe Stage:
+            - probe_max_workers: Worker threads used to run the health probes concurrently.
+            - probe_timeout: Per-probe deadline in seconds, below check_interval; a probe that misses it is reported as unknown.
+            - backend_health_fetch_mode: How getHealth is fetched per region ("sequential", "concurrent" or "batch").
+            - backend_health_max_concurrency: Maximum getHealth calls in flight in concurrent mode.
+            - backend_health_batch_size: Maximum getHealth calls per Compute API batch request in batch mode.
+            - backend_unhealthy_log_mode: "per_instance" (default, one warning and entry per instance) or "summary" (counts per service/backend/state, warnings on change).
+            - backend_unhealthy_sample_size: Sample instance names kept per summary entry.
+
+        Reconciliation:
+            - drift_check_interval: Seconds a confirmed router/Cloudflare state is trusted before it is read again (0 reads every cycle).
+
+        BGP Operation Tracking:
+            - gcp_operation_poll_interval: Seconds between background polls of a pending router patch operation.
+
+        GCP Client Pool:
+            - gcp_client_pool_size: Compute clients pooled for concurrent GCP calls (0 shares a single client).
+
+        Cloudflare HTTP Session:
+            - cloudflare_pool_maxsize: Keep-alive connections kept open to the Cloudflare API.
+            - cloudflare_http_retries: Adapter-level retries for connection errors and 429/5xx responses.
+            - cloudflare_http_backoff_factor: Backoff factor between adapter-level retries.
+
+        Metrics:
+            - metrics_port: Port of the Prometheus /metrics endpoint (0 disables).
+            - metrics_bind_address: Address the metrics endpoint listens on.
+
+        Admin Endpoint:
+            - admin_port: Port of the /healthz, /readyz and /state endpoint (0 disables).
+            - admin_bind_address: Address the admin endpoint listens on.
+            - admin_stale_after: Seconds without a loop iteration before /healthz fails (0 uses three check intervals).
+
+        API Budgets:
+            - compute_read_budget_per_minute: Compute read requests per minute this daemon may use (0 = no budget).
+            - compute_write_budget_per_minute: Compute write requests per minute this daemon may use (0 = no budget).
+            - cloudflare_budget_per_minute: Cloudflare API requests per minute this daemon may use (0 = no budget).
+            - api_budget_throttle_pct: Share of a read budget at which drift checks and operation polls back off.
+
+        Profiling:
+            - profile_every_n_cycles: Run every Nth cycle under cProfile and write a .pstats file (0 disables).
+            - tracemalloc_every_n_cycles: Write the top allocation growth every Nth cycle (0 disables).
+            - profile_dir: Directory profiles and allocation reports are written to (also used by SIGUSR2).
+            - profile_keep: Newest reports kept per kind; older ones are deleted.
     """
     # Logging
     logger_name: str = os.getenv('LOGGER_NAME', 'HEALTH_CHECK_DAEMON').upper()
@@ -79,11 +136,30 @@ class Config:
     log_max_bytes: int = int(os.getenv('LOG_MAX_BYTES', 10 * 1024 * 1024))
     log_backup_count: int = int(os.getenv('LOG_BACKUP_COUNT', 5))
     enable_gcp_logging: bool = os.getenv('ENABLE_GCP_LOGGING', 'false').lower() == 'true'
+
+    # Cloud Logging export - batched, bounded buffer, behind a circuit breaker
+    gcp_logging_batch_size: int = int(os.getenv('GCP_LOGGING_BATCH_SIZE', 100))
+    gcp_logging_flush_interval: int = int(os.getenv('GCP_LOGGING_FLUSH_INTERVAL', 5))
+    gcp_logging_buffer_size: int = int(os.getenv('GCP_LOGGING_BUFFER_SIZE', 10000))
+    gcp_logging_log_name: str = os.getenv('GCP_LOGGING_LOG_NAME', 'radius_healthcheck_daemon')
+    gcp_logging_instance_id: str = os.getenv('GCP_LOGGING_INSTANCE_ID', '')
+    gcp_logging_zone: str = os.getenv('GCP_LOGGING_ZONE', '')
     
     # NEW: Structured logging options
     enable_structured_console: bool = os.getenv('ENABLE_STRUCTURED_CONSOLE', 'false').lower() == 'true'
     enable_structured_file: bool = os.getenv('ENABLE_STRUCTURED_FILE', 'true').lower() == 'true'  # Default to true
     structured_log_file: str | None = os.getenv('STRUCTURED_LOG_FILE', '/var/log/radius_healthcheck_daemon_structured.json')
+    structured_log_format: str = os.getenv('STRUCTURED_LOG_FORMAT', 'array').lower()
+
+    # Asynchronous logging pipeline - file and network writes off the control loop
+    log_async: bool = os.getenv('LOG_ASYNC', 'true').lower() == 'true'
+    log_queue_size: int = int(os.getenv('LOG_QUEUE_SIZE', 10000))
+    log_queue_overflow: str = os.getenv('LOG_QUEUE_OVERFLOW', 'drop-debug').lower()
+    log_compression: str = os.getenv('LOG_COMPRESSION', 'none').lower()
+
+    # Flight recorder - last N structured events in memory, dumped on SIGUSR1
+    flight_recorder_size: int = int(os.getenv('FLIGHT_RECORDER_SIZE', 1000))
+    flight_recorder_dump_file: str = os.getenv('FLIGHT_RECORDER_DUMP_FILE', '/var/log/radius_healthcheck_daemon_flight.jsonl')
 
     # GCP and routing regions
     gcp_project: str | None = os.getenv('GCP_PROJECT')
@@ -151,6 +227,67 @@ class Config:
     cloudflare_api_timeout: int = int(os.getenv('CLOUDFLARE_API_TIMEOUT', 10))
     cloudflare_bulk_timeout: int = int(os.getenv('CLOUDFLARE_BULK_TIMEOUT', 60))
 
+    # Probe stage - local, remote and BGP checks run concurrently with a deadline
+    probe_max_workers: int = int(os.getenv('PROBE_MAX_WORKERS', 3))
+    probe_timeout: int = int(os.getenv('PROBE_TIMEOUT_SECONDS', 50))
+
+    # Backend health fan-out - how per-backend getHealth calls are issued
+    backend_health_fetch_mode: str = os.getenv('BACKEND_HEALTH_FETCH_MODE', 'concurrent').lower()
+    backend_health_max_concurrency: int = int(os.getenv('BACKEND_HEALTH_MAX_CONCURRENCY', 8))
+    backend_health_batch_size: int = int(os.getenv('BACKEND_HEALTH_BATCH_SIZE', 100))
+    backend_unhealthy_log_mode: str = os.getenv('BACKEND_UNHEALTHY_LOG_MODE', 'per_instance').lower()
+    backend_unhealthy_sample_size: int = int(os.getenv('BACKEND_UNHEALTHY_SAMPLE_SIZE', 5))
+
+    # Reconciliation cache - skip steady-state reads, re-check for drift on this interval
+    drift_check_interval: int = int(os.getenv('DRIFT_CHECK_INTERVAL_SECONDS', 300))
+
+    # BGP operation tracking - router patch operations are polled in the background
+    gcp_operation_poll_interval: int = int(os.getenv('GCP_OPERATION_POLL_INTERVAL', 5))
+
+    # GCP client pool - per-worker Compute clients sharing one credentials object
+    gcp_client_pool_size: int = int(os.getenv('GCP_CLIENT_POOL_SIZE', 8))
+
+    # Cloudflare HTTP session - pooled keep-alive client reused across cycles
+    cloudflare_pool_maxsize: int = int(os.getenv('CLOUDFLARE_POOL_MAXSIZE', 4))
+    cloudflare_http_retries: int = int(os.getenv('CLOUDFLARE_HTTP_RETRIES', 0))
+    cloudflare_http_backoff_factor: float = float(os.getenv('CLOUDFLARE_HTTP_BACKOFF_FACTOR', 0.5))
+
+    # Prometheus metrics endpoint - cycle and API latency histograms, breaker and state gauges
+    metrics_port: int = int(os.getenv('METRICS_PORT', 0))
+    metrics_bind_address: str = os.getenv('METRICS_BIND_ADDRESS', '0.0.0.0')
+
+    # Admin endpoint - liveness, readiness and the last published cycle
+    admin_port: int = int(os.getenv('ADMIN_PORT', 0))
+    admin_bind_address: str = os.getenv('ADMIN_BIND_ADDRESS', '0.0.0.0')
+    admin_stale_after: int = int(os.getenv('ADMIN_STALE_AFTER_SECONDS', 0))
+
+    # API budgets - per-minute share of the Compute and Cloudflare quotas, optional reads back off near them
+    compute_read_budget_per_minute: int = int(os.getenv('COMPUTE_READ_BUDGET_PER_MINUTE', 0))
+    compute_write_budget_per_minute: int = int(os.getenv('COMPUTE_WRITE_BUDGET_PER_MINUTE', 0))
+    cloudflare_budget_per_minute: int = int(os.getenv('CLOUDFLARE_BUDGET_PER_MINUTE', 0))
+    api_budget_throttle_pct: int = int(os.getenv('API_BUDGET_THROTTLE_PCT', 80))
+
+    # Profiling - opt-in cProfile and tracemalloc sampling of cycles, rotated in profile_dir
+    profile_every_n_cycles: int = int(os.getenv('PROFILE_EVERY_N_CYCLES', 0))
+    tracemalloc_every_n_cycles: int = int(os.getenv('TRACEMALLOC_EVERY_N_CYCLES', 0))
+    profile_dir: str = os.getenv('PROFILE_DIR', '/var/log/radius_healthcheck_daemon_profiles')
+    profile_keep: int = int(os.getenv('PROFILE_KEEP', 10))
+
+
+# Supported BACKEND_HEALTH_FETCH_MODE values (mirrors gcp.BACKEND_HEALTH_FETCH_MODES)
+BACKEND_HEALTH_FETCH_MODES = ('sequential', 'concurrent', 'batch')
+
+# Supported BACKEND_UNHEALTHY_LOG_MODE values (mirrors gcp.UNHEALTHY_LOG_MODES)
+BACKEND_UNHEALTHY_LOG_MODES = ('per_instance', 'summary')
+
+# Supported STRUCTURED_LOG_FORMAT values (mirrors logging_setup.STRUCTURED_LOG_FORMATS)
+STRUCTURED_LOG_FORMATS = ('array', 'jsonl')
+
+# Supported LOG_QUEUE_OVERFLOW values (mirrors logging_setup.LOG_OVERFLOW_POLICIES)
+LOG_OVERFLOW_POLICIES = ('drop-debug', 'block')
+
+# Supported LOG_COMPRESSION values (mirrors log_compression.LOG_COMPRESSION_CODECS)
+LOG_COMPRESSION_CODECS = ('none', 'gzip', 'zstd')
 
 # List of required environment variables (presence-only validation)
 REQUIRED_VARS = [
@@ -218,6 +355,11 @@ def validate_configuration(cfg: Config) -> list[str]:
         'CIRCUIT_BREAKER_TIMEOUT_SECONDS': (30, 3600),
         'LOG_MAX_BYTES': (1024, 1073741824),  # 1 KB to 1 GB
         'LOG_BACKUP_COUNT': (1, 100),
+        'LOG_QUEUE_SIZE': (100, 1000000),
+        'FLIGHT_RECORDER_SIZE': (0, 100000),  # 0 disables the recorder
+        'GCP_LOGGING_BATCH_SIZE': (1, 1000),
+        'GCP_LOGGING_FLUSH_INTERVAL': (1, 300),
+        'GCP_LOGGING_BUFFER_SIZE': (100, 1000000),
         'STATE_2_VERIFICATION_THRESHOLD': (1, 10),
         'STATE_3_VERIFICATION_THRESHOLD': (1, 10),
         'STATE_4_VERIFICATION_THRESHOLD': (1, 10),
@@ -229,6 +371,27 @@ def validate_configuration(cfg: Config) -> list[str]:
         'GCP_BGP_OPERATION_TIMEOUT': (5, 300),
         'CLOUDFLARE_API_TIMEOUT': (5, 300),
         'CLOUDFLARE_BULK_TIMEOUT': (5, 300),
+        'PROBE_MAX_WORKERS': (1, 16),
+        'PROBE_TIMEOUT_SECONDS': (1, 3600),
+        'BACKEND_HEALTH_MAX_CONCURRENCY': (1, 64),
+        'BACKEND_HEALTH_BATCH_SIZE': (1, 1000),  # Google API limit per batch request
+        'BACKEND_UNHEALTHY_SAMPLE_SIZE': (1, 100),
+        'DRIFT_CHECK_INTERVAL_SECONDS': (0, 86400),  # 0 disables read skipping
+        'GCP_OPERATION_POLL_INTERVAL': (1, 60),
+        'GCP_CLIENT_POOL_SIZE': (0, 64),  # 0 disables the pool
+        'CLOUDFLARE_POOL_MAXSIZE': (1, 64),
+        'CLOUDFLARE_HTTP_RETRIES': (0, 10),
+        'CLOUDFLARE_HTTP_BACKOFF_FACTOR': (0, 30),
+        'METRICS_PORT': (0, 65535),  # 0 disables the endpoint
+        'ADMIN_PORT': (0, 65535),  # 0 disables the endpoint
+        'ADMIN_STALE_AFTER_SECONDS': (0, 86400),  # 0 uses three check intervals
+        'COMPUTE_READ_BUDGET_PER_MINUTE': (0, 1000000),  # 0 disables the budget
+        'COMPUTE_WRITE_BUDGET_PER_MINUTE': (0, 1000000),  # 0 disables the budget
+        'CLOUDFLARE_BUDGET_PER_MINUTE': (0, 1000000),  # 0 disables the budget
+        'API_BUDGET_THROTTLE_PCT': (1, 100),
+        'PROFILE_EVERY_N_CYCLES': (0, 1000000),  # 0 disables cycle profiling
+        'TRACEMALLOC_EVERY_N_CYCLES': (0, 1000000),  # 0 disables allocation reports
+        'PROFILE_KEEP': (1, 1000),
     }
 
     for var, (mn, mx) in numeric_ranges.items():
@@ -246,6 +409,41 @@ def validate_configuration(cfg: Config) -> list[str]:
         errors.append(f"HEALTH_CHECK_THRESHOLD ({cfg.health_check_threshold}) must be less than "
                      f"HEALTH_CHECK_WINDOW ({cfg.health_check_window})")
 
+    # Validate backend health fetch mode
+    if cfg.backend_health_fetch_mode not in BACKEND_HEALTH_FETCH_MODES:
+        errors.append(f"BACKEND_HEALTH_FETCH_MODE must be one of {', '.join(BACKEND_HEALTH_FETCH_MODES)}, "
+                     f"got '{cfg.backend_health_fetch_mode}'")
+
+    # Validate unhealthy instance logging mode
+    if cfg.backend_unhealthy_log_mode not in BACKEND_UNHEALTHY_LOG_MODES:
+        errors.append(f"BACKEND_UNHEALTHY_LOG_MODE must be one of {', '.join(BACKEND_UNHEALTHY_LOG_MODES)}, "
+                     f"got '{cfg.backend_unhealthy_log_mode}'")
+
+    # Validate structured log file format
+    if cfg.structured_log_format not in STRUCTURED_LOG_FORMATS:
+        errors.append(f"STRUCTURED_LOG_FORMAT must be one of {', '.join(STRUCTURED_LOG_FORMATS)}, "
+                     f"got '{cfg.structured_log_format}'")
+
+    # Validate asynchronous logging overflow policy
+    if cfg.log_queue_overflow not in LOG_OVERFLOW_POLICIES:
+        errors.append(f"LOG_QUEUE_OVERFLOW must be one of {', '.join(LOG_OVERFLOW_POLICIES)}, "
+                     f"got '{cfg.log_queue_overflow}'")
+
+    # Probes must give up before the next cycle is due
+    if cfg.probe_timeout >= cfg.check_interval:
+        errors.append(f"PROBE_TIMEOUT_SECONDS ({cfg.probe_timeout}) must be less than "
+                     f"CHECK_INTERVAL_SECONDS ({cfg.check_interval})")
+
+    # The Cloud Logging buffer must hold at least one batch
+    if cfg.gcp_logging_buffer_size < cfg.gcp_logging_batch_size:
+        errors.append(f"GCP_LOGGING_BUFFER_SIZE ({cfg.gcp_logging_buffer_size}) must be at least "
+                     f"GCP_LOGGING_BATCH_SIZE ({cfg.gcp_logging_batch_size})")
+
+    # Validate rotated log compression codec
+    if cfg.log_compression not in LOG_COMPRESSION_CODECS:
+        errors.append(f"LOG_COMPRESSION must be one of {', '.join(LOG_COMPRESSION_CODECS)}, "
+                     f"got '{cfg.log_compression}'")
+
     # GCP credential file existence & readability
     creds = cfg.gcp_credentials
     if creds and not os.path.isfile(creds):
@@ -71,7 +71,9 @@ Signal Handling:
 
 Threading:
     - Main loop runs in a single thread
-    - Thread-safe circuit breakers allow for future multi-threading
+    - Health probes (local, remote, BGP) run concurrently on a bounded pool
+      with a per-probe deadline (see probes.py)
+    - Circuit breakers lock their failure accounting so probes can share them
     - Signal handlers work across threads
 
 Usage:
@@ -79,8 +81,8 @@ Usage:
     from .config import Config
     
     cfg = Config()
-    compute = startup(cfg)  # Initialize and validate
-    run_loop(cfg, compute)  # Main daemon loop
+    compute, cf_client = startup(cfg)  # Initialize and validate
+    run_loop(cfg, compute, cf_client)  # Main daemon loop
 
 Production Considerations:
     - Monitor structured logs for health trends and failures
@@ -103,8 +105,19 @@ import sys
 import uuid
 from typing import Optional, Dict, Any
 from .config import Config, validate_configuration
-from .logging_setup import setup_logger
+from .logging_setup import setup_logger, get_log_pipeline
+from .log_compression import get_log_compressor
+from .cloud_logging import get_cloud_logging_exporter
 from .circuit import CircuitBreaker, exponential_backoff_retry
+from .probes import ProbeRunner
+from .reconcile import ReconciliationCache
+from .encoding import set_static_fields
+from .flight_recorder import FlightRecorder, get_flight_recorder, set_flight_recorder, dump_flight_recorder
+from . import metrics
+from . import admin
+from .api_accounting import API_USAGE
+from .phases import PhaseTimer
+from .profiling import CycleProfiler, request_profile
 from .structured_events import StructuredEventLogger, EventType, ActionResult
 from . import gcp as gcp_mod
 from . import cloudflare as cf_mod
@@ -173,7 +186,7 @@ def signal_handler(signum: int, frame) -> None:
     shutdown_event.set()
 
 
-def setup_signal_handlers() -> None:
+def setup_signal_handlers(flight_recorder_dump_file: Optional[str] = None) -> None:
     """
     Register signal handlers for graceful daemon shutdown.
     
@@ -181,9 +194,15 @@ def setup_signal_handlers() -> None:
     ensuring that the daemon can clean up resources and complete in-flight
     operations before exiting.
     
+    Args:
+        flight_recorder_dump_file (str, optional): When set, SIGUSR1 dumps the
+            flight recorder to this path plus a timestamp suffix
+    
     Signals Handled:
         - SIGTERM: Standard termination signal used by process managers
         - SIGINT: Interrupt signal (Ctrl+C) for interactive shutdown
+        - SIGUSR1: Flight recorder dump (only with flight_recorder_dump_file)
+        - SIGUSR2: Profile the next health check cycle into PROFILE_DIR
         
     Side Effects:
         - Registers signal_handler function for SIGTERM and SIGINT
@@ -208,6 +227,16 @@ def setup_signal_handlers() -> None:
     try:
         signal.signal(signal.SIGTERM, signal_handler)
         signal.signal(signal.SIGINT, signal_handler)
+
+        if flight_recorder_dump_file and hasattr(signal, "SIGUSR1"):
+            def flight_recorder_handler(signum: int, frame) -> None:
+                # Dump from a helper thread: the interrupted code may hold the recorder lock
+                threading.Thread(target=dump_flight_recorder, args=(flight_recorder_dump_file,),
+                                 name="flight-recorder-dump", daemon=True).start()
+            signal.signal(signal.SIGUSR1, flight_recorder_handler)
+
+        if hasattr(signal, "SIGUSR2"):
+            signal.signal(signal.SIGUSR2, lambda signum, frame: request_profile())
         
         logger = logging.getLogger("healthcheck-daemon")
         logger.debug("Signal handlers registered for SIGTERM and SIGINT")
@@ -217,7 +246,123 @@ def setup_signal_handlers() -> None:
         logger.warning(f"Failed to register signal handlers: {e}")
 
 
-def run_loop(cfg: Config, compute) -> None:
+def build_cloudflare_client(cfg: Config) -> cf_mod.CloudflareClient:
+    """
+    Create the pooled Cloudflare API client from configuration.
+
+    Args:
+        cfg (Config): Configuration with Cloudflare token and HTTP session settings
+
+    Returns:
+        CloudflareClient: Client holding a keep-alive session for reuse across cycles
+    """
+    return cf_mod.CloudflareClient(
+        cfg.cf_api_token,
+        pool_maxsize=cfg.cloudflare_pool_maxsize,
+        max_retries=cfg.cloudflare_http_retries,
+        backoff_factor=cfg.cloudflare_http_backoff_factor
+    )
+
+
+def set_static_event_fields(cfg: Config) -> None:
+    """
+    Pre-serialize the fields that are the same on every structured event.
+
+    The "daemon" object (version, project, regions, router) is encoded once
+    and appended to each structured log record by the formatters.
+
+    Args:
+        cfg (Config): Daemon configuration
+    """
+    set_static_fields({
+        "daemon": {
+            "version": DAEMON_VERSION,
+            "gcp_project": cfg.gcp_project,
+            "local_region": cfg.local_region,
+            "remote_region": cfg.remote_region,
+            "local_bgp_router": cfg.local_bgp_router
+        }
+    })
+
+
+def install_flight_recorder(cfg: Config) -> Optional[FlightRecorder]:
+    """
+    Install the process-wide flight recorder sized from configuration.
+
+    Every StructuredEventLogger records into it, whatever the log level. An
+    already installed recorder of the same size is kept, so events recorded
+    during startup survive into the main loop.
+
+    Args:
+        cfg (Config): Configuration with flight_recorder_size (0 disables)
+
+    Returns:
+        FlightRecorder: The installed recorder, or None when disabled
+    """
+    recorder = get_flight_recorder()
+    if not cfg.flight_recorder_size:
+        set_flight_recorder(None)
+        return None
+    if recorder is None or recorder.capacity != cfg.flight_recorder_size:
+        recorder = FlightRecorder(cfg.flight_recorder_size)
+        set_flight_recorder(recorder)
+    return recorder
+
+
+def start_metrics_server(cfg: Config) -> Optional[metrics.MetricsServer]:
+    """
+    Serve Prometheus metrics on METRICS_PORT when it is set.
+
+    A port that cannot be bound is logged and the daemon runs without the
+    endpoint; metrics are still recorded in memory.
+
+    Args:
+        cfg (Config): Configuration with metrics_port (0 disables) and metrics_bind_address
+
+    Returns:
+        MetricsServer: The running server, or None when disabled or not bound
+    """
+    if not cfg.metrics_port:
+        return None
+    logger = logging.getLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
+    try:
+        server = metrics.MetricsServer(cfg.metrics_bind_address, cfg.metrics_port)
+    except OSError as e:
+        logger.error(f"Cannot serve metrics on {cfg.metrics_bind_address}:{cfg.metrics_port}: {e}")
+        return None
+    server.start()
+    return server
+
+
+def start_admin_server(cfg: Config) -> Optional[admin.AdminServer]:
+    """
+    Serve /healthz, /readyz and /state on ADMIN_PORT when it is set.
+
+    A port that cannot be bound is logged and the daemon runs without the
+    endpoint.
+
+    Args:
+        cfg (Config): Configuration with admin_port (0 disables), admin_bind_address
+            and admin_stale_after (0 means three check intervals)
+
+    Returns:
+        AdminServer: The running server, or None when disabled or not bound
+    """
+    if not cfg.admin_port:
+        return None
+    logger = logging.getLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
+    stale_after = cfg.admin_stale_after or 3 * cfg.check_interval
+    try:
+        server = admin.AdminServer(cfg.admin_bind_address, cfg.admin_port, stale_after,
+                                   info=get_daemon_info, shutting_down=shutdown_event.is_set)
+    except OSError as e:
+        logger.error(f"Cannot serve the admin endpoint on {cfg.admin_bind_address}:{cfg.admin_port}: {e}")
+        return None
+    server.start()
+    return server
+
+
+def run_loop(cfg: Config, compute, cf_client: Optional[cf_mod.CloudflareClient] = None) -> None:
     """
     Main daemon control loop with comprehensive health checking and route management.
     
@@ -229,13 +374,20 @@ def run_loop(cfg: Config, compute) -> None:
     
     Control Loop Flow:
         1. Generate correlation ID for traceability
-        2. Check GCP backend service health (local and remote regions)
-        3. Check BGP session status in remote region
+        2. Probe stage: check GCP backend service health (local and remote
+           regions) and BGP session status in the remote region concurrently
+        3. Apply health check hysteresis to the probe results
         4. Determine routing state based on health combination
         5. Update BGP advertisements in LOCAL GCP router only
         6. Update Cloudflare route priorities based on local health
         7. Log cycle completion and performance metrics
         8. Sleep until next check interval
+
+    Probe Deadlines:
+        Each probe must finish within cfg.probe_timeout seconds. A probe that
+        misses the deadline is treated as unknown health (State 0) and its
+        late structured events keep the correlation ID of the cycle that
+        started it.
         
     Health Check Logic:
         - Local/Remote Backend Services: Queries GCP backend service health
@@ -259,7 +411,12 @@ def run_loop(cfg: Config, compute) -> None:
         
     Args:
         cfg (Config): Validated configuration object containing all daemon settings
-        compute: Initialized and validated GCP Compute Engine client
+        compute: Initialized and validated GCP Compute Engine client, or a
+            ComputeClientPool; every gcp function accepts either
+        cf_client (CloudflareClient, optional): Pooled Cloudflare client created by
+            startup(). Reused by every cycle so the TCP/TLS handshake to the
+            Cloudflare API is not paid per update. Built from cfg if omitted.
+            Closed when the loop exits.
         
     Side Effects:
         - Makes API calls to GCP Compute Engine
@@ -301,6 +458,11 @@ def run_loop(cfg: Config, compute) -> None:
     # Initialize logging for the daemon loop
     logger = logging.getLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
     structured_logger = StructuredEventLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
+    set_static_event_fields(cfg)
+    flight_recorder = install_flight_recorder(cfg)
+    metrics_server = start_metrics_server(cfg)
+    admin.STATUS.reset()
+    admin_server = start_admin_server(cfg)
     
     # Log daemon startup information
     logger.info(f"Daemon main loop starting with {cfg.check_interval}s check interval")
@@ -339,6 +501,128 @@ def run_loop(cfg: Config, compute) -> None:
         ),
     }
 
+    # Breaker states are read when the metrics endpoint is scraped
+    metrics.CIRCUIT_BREAKER_STATE.set_callback(lambda: {
+        (cb.service_name,): metrics.CIRCUIT_BREAKER_STATE_VALUES.get(cb.get_state()["state"], 0)
+        for cb in circuit_breakers.values()
+    })
+
+    # Build the health probes once; the probe stage runs them concurrently each cycle
+    # Each probe keeps its own circuit breaker + retry wrapper for resilience
+    local_health_check = gcp_mod.backend_services_healthy(
+        cfg.gcp_project, cfg.local_region, compute, structured_logger,
+        fetch_mode=cfg.backend_health_fetch_mode,
+        max_concurrency=cfg.backend_health_max_concurrency,
+        batch_size=cfg.backend_health_batch_size,
+        unhealthy_log_mode=cfg.backend_unhealthy_log_mode,
+        unhealthy_sample_size=cfg.backend_unhealthy_sample_size
+    )
+    remote_health_check = gcp_mod.backend_services_healthy(
+        cfg.gcp_project, cfg.remote_region, compute, structured_logger,
+        fetch_mode=cfg.backend_health_fetch_mode,
+        max_concurrency=cfg.backend_health_max_concurrency,
+        batch_size=cfg.backend_health_batch_size,
+        unhealthy_log_mode=cfg.backend_unhealthy_log_mode,
+        unhealthy_sample_size=cfg.backend_unhealthy_sample_size
+    )
+    remote_bgp_check = gcp_mod.router_bgp_sessions_healthy(
+        cfg.bgp_peer_project, cfg.remote_bgp_region, cfg.remote_bgp_router, compute, structured_logger
+    )
+
+    health_probes = {
+        "local_health": lambda: circuit_breakers['gcp_health'].call(
+            lambda: exponential_backoff_retry(
+                local_health_check,
+                max_retries=cfg.max_retries_health_check,
+                initial_delay=cfg.initial_backoff,
+                max_delay=cfg.max_backoff,
+                name="probe_local"
+            )
+        ),
+        "remote_health": lambda: circuit_breakers['gcp_health'].call(
+            lambda: exponential_backoff_retry(
+                remote_health_check,
+                max_retries=cfg.max_retries_health_check,
+                initial_delay=cfg.initial_backoff,
+                max_delay=cfg.max_backoff,
+                name="probe_remote"
+            )
+        ),
+        # Returns tuple: (any_peer_up: bool, peer_statuses: dict)
+        "remote_bgp": lambda: circuit_breakers['gcp_bgp'].call(
+            lambda: exponential_backoff_retry(
+                remote_bgp_check,
+                max_retries=cfg.max_retries_bgp_check,
+                initial_delay=cfg.initial_backoff,
+                max_delay=cfg.max_backoff,
+                name="probe_bgp"
+            )
+        ),
+    }
+
+    # Phase (and backoff retry) name of each probe in the cycle timing breakdown
+    probe_phases = {
+        "local_health": "probe_local",
+        "remote_health": "probe_remote",
+        "remote_bgp": "probe_bgp",
+    }
+
+    # Region and service type reported for each probe (used for timeout events)
+    probe_targets = {
+        "local_health": (cfg.local_region, "backend_services"),
+        "remote_health": (cfg.remote_region, "backend_services"),
+        "remote_bgp": (cfg.remote_bgp_region, "bgp_sessions"),
+    }
+
+    probe_runner = ProbeRunner(
+        max_workers=cfg.probe_max_workers,
+        timeout=cfg.probe_timeout,
+        structured_logger=structured_logger
+    )
+
+    # Pooled Cloudflare client - one keep-alive session reused by every cycle
+    if cf_client is None:
+        cf_client = build_cloudflare_client(cfg)
+
+    # Confirmed desired state for the local router and Cloudflare routes; steady-state
+    # cycles skip their reads until the drift-check interval elapses
+    reconciliation_cache = ReconciliationCache(drift_check_interval=cfg.drift_check_interval)
+
+    # Router patch operations are followed to completion in the background; their
+    # outcome is reported at the start of the next cycle
+    operation_tracker = gcp_mod.OperationTracker(
+        compute,
+        poll_interval=cfg.gcp_operation_poll_interval,
+        timeout=cfg.gcp_bgp_operation_timeout
+    )
+
+    # API quota budgets: optional reads (drift checks, operation polls) back off
+    # by the throttle factor as usage nears a budget
+    API_USAGE.configure({
+        "compute_read": cfg.compute_read_budget_per_minute,
+        "compute_write": cfg.compute_write_budget_per_minute,
+        "cloudflare": cfg.cloudflare_budget_per_minute
+    }, throttle_pct=cfg.api_budget_throttle_pct)
+    api_throttle_factor = 1.0
+    api_over_budget = set()
+
+    # Asynchronous logging pipeline (None when LOG_ASYNC=false); flushed at shutdown
+    log_pipeline = get_log_pipeline(cfg.logger_name)
+    log_compressor = get_log_compressor()
+    cloud_exporter = get_cloud_logging_exporter()
+
+    # Splits each cycle into phases accounted against the check interval
+    phase_timer = PhaseTimer(budget_seconds=cfg.check_interval)
+
+    # Opt-in cProfile/tracemalloc sampling of cycles (SIGUSR2 profiles the next one)
+    cycle_profiler = CycleProfiler(
+        cfg.profile_dir,
+        profile_every=cfg.profile_every_n_cycles,
+        tracemalloc_every=cfg.tracemalloc_every_n_cycles,
+        keep=cfg.profile_keep
+    )
+    cycle_number = 0
+
     # Error tracking for daemon stability
     consecutive_errors = 0
     max_consecutive_errors = 10
@@ -384,6 +668,32 @@ def run_loop(cfg: Config, compute) -> None:
         "state_dwell_time": {
             "minimum_seconds": cfg.min_state_dwell_time,
             "exception_states": cfg.dwell_time_exception_states
+        },
+        "probe_stage": {
+            "max_workers": cfg.probe_max_workers,
+            "timeout_seconds": cfg.probe_timeout
+        },
+        "backend_health_fetch": {
+            "mode": cfg.backend_health_fetch_mode,
+            "max_concurrency": cfg.backend_health_max_concurrency,
+            "batch_size": cfg.backend_health_batch_size,
+            "unhealthy_log_mode": cfg.backend_unhealthy_log_mode
+        },
+        "reconciliation": {
+            "drift_check_interval_seconds": cfg.drift_check_interval
+        },
+        "bgp_operation_tracking": {
+            "poll_interval_seconds": cfg.gcp_operation_poll_interval,
+            "timeout_seconds": cfg.gcp_bgp_operation_timeout
+        },
+        "gcp_client_pool": {
+            "enabled": cfg.gcp_client_pool_size > 0,
+            "size": cfg.gcp_client_pool_size
+        },
+        "cloudflare_http_session": {
+            "pool_maxsize": cfg.cloudflare_pool_maxsize,
+            "adapter_retries": cfg.cloudflare_http_retries,
+            "backoff_factor": cfg.cloudflare_http_backoff_factor
         }
     }
     
@@ -400,6 +710,10 @@ def run_loop(cfg: Config, compute) -> None:
     while not shutdown_event.is_set():
         try:
             loop_start = time.time()
+            cycle_number += 1
+            cycle_profiler.start_cycle(cycle_number)
+            phase_timer.reset()
+            phase_timer.begin("bgp_operation_results")
             
             # Generate unique correlation ID for this health check cycle
             # Format: hc-{unix_timestamp}-{short_uuid}
@@ -408,50 +722,88 @@ def run_loop(cfg: Config, compute) -> None:
             
             logger.info(f"Starting health check cycle {correlation_id}")
 
+            # Report router operations that completed, failed or timed out since
+            # the previous cycle (submitted by an earlier cycle's patch)
+            for op_result in operation_tracker.drain():
+                structured_logger.log_bgp_operation_result(
+                    project=op_result.project,
+                    region=op_result.region,
+                    router=op_result.resource,
+                    operation_id=op_result.operation_id,
+                    status=op_result.status,
+                    prefixes=op_result.prefixes,
+                    propagation_ms=op_result.propagation_ms,
+                    operation_duration_ms=op_result.operation_duration_ms,
+                    polls=op_result.polls,
+                    submitted_correlation_id=op_result.correlation_id,
+                    error_message=op_result.error_message
+                )
+
+            # Adapt optional reads to API usage over the last minute
+            quota_usage = API_USAGE.quota_usage()
+            throttle_factor = API_USAGE.throttle_factor(quota_usage)
+            if throttle_factor != api_throttle_factor:
+                log = logger.warning if throttle_factor > api_throttle_factor else logger.info
+                log(f"[{correlation_id}] API usage {quota_usage} against budgets {API_USAGE.budgets}: "
+                    f"optional reads throttled x{throttle_factor} (was x{api_throttle_factor})")
+                api_throttle_factor = throttle_factor
+                reconciliation_cache.drift_check_interval = cfg.drift_check_interval * throttle_factor
+                operation_tracker.poll_interval = cfg.gcp_operation_poll_interval * throttle_factor
+            over_budget = API_USAGE.over_budget(quota_usage)
+            if set(over_budget) - api_over_budget:
+                logger.warning(f"[{correlation_id}] API calls over budget in the last minute: "
+                               + ", ".join(f"{quota} {calls}/{API_USAGE.budgets[quota]}"
+                                           for quota, calls in over_budget.items()))
+            api_over_budget = set(over_budget)
+
             # ═══════════════════════════════════════════════════════════════════════════
-            # PHASE 1: GCP Backend Service Health Checks
+            # PHASE 1: Concurrent Health Probes (backend services and BGP sessions)
             # ═══════════════════════════════════════════════════════════════════════════
             
-            logger.debug(f"[{correlation_id}] Checking GCP backend service health")
+            logger.debug(f"[{correlation_id}] Running health probes concurrently")
+            
+            phase_timer.begin("probe_stage")
+            probe_outcomes = probe_runner.run(health_probes)
+            for probe_name, phase_name in probe_phases.items():
+                phase_timer.record_probe(phase_name, probe_outcomes[probe_name].duration_ms)
+            
+            # Re-raise probe errors in probe order, as the sequential checks did
+            raw_local_healthy = probe_outcomes["local_health"].result()
+            raw_remote_healthy = probe_outcomes["remote_health"].result()
+            remote_bgp_up, remote_peer_statuses = probe_outcomes["remote_bgp"].result(default=(None, {}))
+            
+            # Timed-out probes never reached their own structured logging, so
+            # record them here as unknown health for this cycle
+            for probe_name, (probe_region, service_type) in probe_targets.items():
+                outcome = probe_outcomes[probe_name]
+                if outcome.timed_out or outcome.skipped:
+                    structured_logger.log_health_check(
+                        region=probe_region,
+                        service_type=service_type,
+                        healthy=None,
+                        details={
+                            "monitoring_unavailable": True,
+                            "probe_timed_out": outcome.timed_out,
+                            "probe_still_running": outcome.skipped,
+                            "probe_timeout_seconds": cfg.probe_timeout
+                        },
+                        duration_ms=outcome.duration_ms
+                    )
             
-            # Check local region backend service health
-            # Uses circuit breaker + retry for resilience
-            raw_local_healthy = circuit_breakers['gcp_health'].call(
-                lambda: exponential_backoff_retry(
-                    gcp_mod.backend_services_healthy(
-                        cfg.gcp_project,
-                        cfg.local_region,
-                        compute,
-                        structured_logger
-                    ),
-                    max_retries=cfg.max_retries_health_check,
-                    initial_delay=cfg.initial_backoff,
-                    max_delay=cfg.max_backoff
-                )
-            )
-
-            # Check remote region backend service health
-            raw_remote_healthy = circuit_breakers['gcp_health'].call(
-                lambda: exponential_backoff_retry(
-                    gcp_mod.backend_services_healthy(
-                        cfg.gcp_project,
-                        cfg.remote_region,
-                        compute,
-                        structured_logger
-                    ),
-                    max_retries=cfg.max_retries_health_check,
-                    initial_delay=cfg.initial_backoff,
-                    max_delay=cfg.max_backoff
-                )
-            )
-
             # Apply health check hysteresis to smooth out transient failures
-            # Add raw results to history
-            local_health_history.append(raw_local_healthy)
-            remote_health_history.append(raw_remote_healthy)
+            phase_timer.begin("state_evaluation")
+            # Add raw results to history (unknown results carry no health signal)
+            if raw_local_healthy is not None:
+                local_health_history.append(raw_local_healthy)
+            if raw_remote_healthy is not None:
+                remote_health_history.append(raw_remote_healthy)
 
             # Apply hysteresis logic if we have enough history
-            if len(local_health_history) >= cfg.health_check_window:
+            if raw_local_healthy is None:
+                # Monitoring unavailable or probe timed out -> unknown health (State 0)
+                local_healthy = None
+                logger.debug(f"[{correlation_id}] Local health unknown for this cycle")
+            elif len(local_health_history) >= cfg.health_check_window:
                 healthy_count = sum(local_health_history)
 
                 if cfg.asymmetric_hysteresis:
@@ -476,7 +828,10 @@ def run_loop(cfg: Config, compute) -> None:
                            f"(insufficient history: {len(local_health_history)}/{cfg.health_check_window})")
 
             # Apply same hysteresis logic for remote
-            if len(remote_health_history) >= cfg.health_check_window:
+            if raw_remote_healthy is None:
+                remote_healthy = None
+                logger.debug(f"[{correlation_id}] Remote health unknown for this cycle")
+            elif len(remote_health_history) >= cfg.health_check_window:
                 healthy_count = sum(remote_health_history)
 
                 if cfg.asymmetric_hysteresis:
@@ -496,29 +851,6 @@ def run_loop(cfg: Config, compute) -> None:
                 logger.debug(f"[{correlation_id}] Remote health: {remote_healthy} "
                            f"(insufficient history: {len(remote_health_history)}/{cfg.health_check_window})")
 
-            # ═══════════════════════════════════════════════════════════════════════════
-            # PHASE 2: BGP Session Health Check
-            # ═══════════════════════════════════════════════════════════════════════════
-            
-            logger.debug(f"[{correlation_id}] Checking BGP session health")
-            
-            # Check BGP session status on remote region router
-            # Returns tuple: (any_peer_up: bool, peer_statuses: dict)
-            remote_bgp_up, remote_peer_statuses = circuit_breakers['gcp_bgp'].call(
-                lambda: exponential_backoff_retry(
-                    gcp_mod.router_bgp_sessions_healthy(
-                        cfg.bgp_peer_project,
-                        cfg.remote_bgp_region,
-                        cfg.remote_bgp_router,
-                        compute,
-                        structured_logger
-                    ),
-                    max_retries=cfg.max_retries_bgp_check,
-                    initial_delay=cfg.initial_backoff,
-                    max_delay=cfg.max_backoff
-                )
-            )
-
             # Log health check results summary
             logger.info(f"Health Status [{correlation_id}] - "
                        f"Local: {local_healthy}, Remote: {remote_healthy}, "
@@ -528,7 +860,7 @@ def run_loop(cfg: Config, compute) -> None:
                 logger.debug(f"BGP peer details [{correlation_id}]: {remote_peer_statuses}")
 
             # ═══════════════════════════════════════════════════════════════════════════
-            # PHASE 3: Routing State Determination
+            # PHASE 2: Routing State Determination
             # ═══════════════════════════════════════════════════════════════════════════
             
             # Use state machine to determine routing actions based on health combination
@@ -711,10 +1043,11 @@ def run_loop(cfg: Config, compute) -> None:
                            f"Local BGP Secondary ({cfg.secondary_prefix}): {advertise_secondary}")
 
             # ═══════════════════════════════════════════════════════════════════════════
-            # PHASE 4: LOCAL BGP Route Advertisement Updates (PRIMARY AND SECONDARY)
+            # PHASE 3: LOCAL BGP Route Advertisement Updates (PRIMARY AND SECONDARY)
             # ═══════════════════════════════════════════════════════════════════════════
 
             # Skip BGP updates if verification pending or passive mode
+            phase_timer.begin("bgp_actuation")
             if skip_updates:
                 reason = verification_reason or "Verification pending"
                 logger.info(f"[{correlation_id}] Skipping LOCAL BGP route advertisement updates ({reason})")
@@ -723,51 +1056,44 @@ def run_loop(cfg: Config, compute) -> None:
             else:
                 logger.debug(f"[{correlation_id}] Updating LOCAL BGP route advertisements")
                 
-                # Update primary prefix advertisement on local router
-                primary_success = circuit_breakers['gcp_local_advertisement'].call(
+                # Reconcile primary and secondary prefixes on the local router with a
+                # single router read and at most one patch
+                local_bgp_success = circuit_breakers['gcp_local_advertisement'].call(
                     lambda: exponential_backoff_retry(
-                        gcp_mod.update_bgp_advertisement(
+                        gcp_mod.reconcile_bgp_advertisements(
                             project=cfg.bgp_peer_project,
                             region=cfg.local_bgp_region,
                             router=cfg.local_bgp_router,
-                            prefix=cfg.primary_prefix,
+                            desired={
+                                cfg.primary_prefix: advertise_primary,
+                                cfg.secondary_prefix: advertise_secondary
+                            },
                             compute_client=compute,
-                            advertise=advertise_primary,
-                            structured_logger=structured_logger
+                            structured_logger=structured_logger,
+                            cache=reconciliation_cache,
+                            operation_tracker=operation_tracker
                         ),
                         max_retries=cfg.max_retries_bgp_update,
                         initial_delay=cfg.initial_backoff,
-                        max_delay=cfg.max_backoff
+                        max_delay=cfg.max_backoff,
+                        name="bgp_actuation"
                     )
                 )
 
-                # Update secondary prefix advertisement on local router
-                secondary_success = circuit_breakers['gcp_local_advertisement'].call(
-                    lambda: exponential_backoff_retry(
-                        gcp_mod.update_bgp_advertisement(
-                            project=cfg.bgp_peer_project,
-                            region=cfg.local_bgp_region,  # Same local router
-                            router=cfg.local_bgp_router,   # Same local router
-                            prefix=cfg.secondary_prefix,   # But secondary prefix
-                            compute_client=compute,
-                            advertise=advertise_secondary,  # Based on state logic
-                            structured_logger=structured_logger
-                        ),
-                        max_retries=cfg.max_retries_bgp_update,
-                        initial_delay=cfg.initial_backoff,
-                        max_delay=cfg.max_backoff
-                    )
-                )
+                # Both prefixes are applied by the same patch, so they share an outcome
+                primary_success = local_bgp_success
+                secondary_success = local_bgp_success
 
                 logger.info(f"[{correlation_id}] Local BGP updates completed - "
                            f"Primary ({cfg.primary_prefix}): {advertise_primary}, "
                            f"Secondary ({cfg.secondary_prefix}): {advertise_secondary}")
 
             # ═══════════════════════════════════════════════════════════════════════════
-            # PHASE 5: Cloudflare Route Priority Updates
+            # PHASE 4: Cloudflare Route Priority Updates
             # ═══════════════════════════════════════════════════════════════════════════
             
             # Skip Cloudflare updates if we're in passive mode or State 4 verification mode
+            phase_timer.begin("cloudflare_actuation")
             if skip_updates:
                 reason = "Passive mode" if cfg.run_passive else "State 4 verification pending"
                 logger.info(f"[{correlation_id}] Skipping Cloudflare route priority updates ({reason})")
@@ -794,16 +1120,19 @@ def run_loop(cfg: Config, compute) -> None:
                             desired_priority=desired_priority,
                             structured_logger=structured_logger,
                             timeout=cfg.cloudflare_api_timeout,
-                            bulk_timeout=cfg.cloudflare_bulk_timeout
+                            bulk_timeout=cfg.cloudflare_bulk_timeout,
+                            client=cf_client,
+                            cache=reconciliation_cache
                         ),
                         max_retries=cfg.max_retries_cloudflare,
                         initial_delay=cfg.initial_backoff,
-                        max_delay=cfg.max_backoff
+                        max_delay=cfg.max_backoff,
+                        name="cloudflare_actuation"
                     )
                 )
 
             # ═══════════════════════════════════════════════════════════════════════════
-            # PHASE 6: Cycle Completion and Status Logging
+            # PHASE 5: Cycle Completion and Status Logging
             # ═══════════════════════════════════════════════════════════════════════════
 
             # Determine overall cycle success (both local prefix operations matter now)
@@ -838,42 +1167,133 @@ def run_loop(cfg: Config, compute) -> None:
                 consecutive_errors += 1
 
             # Calculate cycle performance metrics
+            phase_timer.stop()
+            cycle_profiler.end_cycle()
             loop_duration = time.time() - loop_start
+            phase_timings = phase_timer.breakdown()
+            metrics.CYCLE_DURATION.observe(loop_duration)
+            metrics.CYCLES.labels(cycle_result.value).inc()
+            metrics.STATE_CODE.set(new_state_code)
+            
+            # Log comprehensive cycle completion event; the details are only built
+            # when a handler will write the event or the flight recorder keeps it
+            # (see StructuredEventLogger.log_event)
+            def cycle_details():
+                return {
+                    "correlation_id": correlation_id,
+                    "cycle_duration_ms": int(loop_duration * 1000),
+                    "state_code": new_state_code,
+                    "time_in_state_seconds": time_in_current_state,
+                    "local_router_only_mode": True,  # Flag for monitoring
+                    "state_verification": {
+                        "state_2": {
+                            "pending": state_2_pending_verification,
+                            "consecutive_count": state_2_consecutive_count,
+                            "threshold": cfg.state_2_verification_threshold
+                        } if new_state_code == 2 or state_2_consecutive_count > 0 else None,
+                        "state_3": {
+                            "pending": state_3_pending_verification,
+                            "consecutive_count": state_3_consecutive_count,
+                            "threshold": cfg.state_3_verification_threshold
+                        } if new_state_code == 3 or state_3_consecutive_count > 0 else None,
+                        "state_4": {
+                            "pending": state_4_pending_verification,
+                            "consecutive_count": state_4_consecutive_count,
+                            "threshold": cfg.state_4_verification_threshold
+                        } if new_state_code == 4 or state_4_consecutive_count > 0 else None,
+                        "updates_skipped": skip_updates,
+                        "skip_reason": verification_reason
+                    },
+                    "health_check_hysteresis": {
+                        "local_history_size": len(local_health_history),
+                        "local_healthy_count": sum(local_health_history) if local_health_history else 0,
+                        "remote_history_size": len(remote_health_history),
+                        "remote_healthy_count": sum(remote_health_history) if remote_health_history else 0,
+                        "window_size": cfg.health_check_window,
+                        "threshold": cfg.health_check_threshold,
+                        "asymmetric": cfg.asymmetric_hysteresis
+                    },
+                    "health_status": {
+                        "local_healthy": local_healthy,
+                        "remote_healthy": remote_healthy,
+                        "remote_bgp_up": remote_bgp_up,
+                        "raw_local_healthy": raw_local_healthy,
+                        "raw_remote_healthy": raw_remote_healthy
+                    },
+                    "phase_timings": phase_timings,
+                    "probe_stage": {
+                        name: {
+                            "duration_ms": outcome.duration_ms,
+                            "timed_out": outcome.timed_out,
+                            "still_running": outcome.skipped
+                        }
+                        for name, outcome in probe_outcomes.items()
+                    },
+                    "gcp_client_pool": compute.stats() if isinstance(compute, gcp_mod.ComputeClientPool) else None,
+                    "reconciliation_cache": reconciliation_cache.stats(),
+                    "bgp_operations": operation_tracker.stats(),
+                    "log_pipeline": log_pipeline.stats() if log_pipeline else None,
+                    "log_compression": log_compressor.stats(),
+                    "cloud_logging": cloud_exporter.stats() if cloud_exporter else None,
+                    "flight_recorder": flight_recorder.stats() if flight_recorder else None,
+                    "profiling": cycle_profiler.stats(),
+                    "api_usage": API_USAGE.stats(),
+                    "operation_results": {
+                        "local_primary_advertisement_success": primary_success,
+                        "local_secondary_advertisement_success": secondary_success,
+                        "cloudflare_update_success": cloudflare_success,
+                        "remote_advertisement_skipped": True,
+                        "bgp_updates_skipped": skip_updates,  # Flag for State 0
+                        "cloudflare_updates_skipped": skip_updates  # Flag for State 0
+                    },
+                    "error_tracking": {
+                        "consecutive_errors": consecutive_errors,
+                        "max_consecutive_errors": max_consecutive_errors
+                    },
+                    "configuration": {
+                        "desired_cloudflare_priority": desired_priority if desired_priority is not None else "no_change",
+                        "planned_primary_advertisement": advertise_primary if advertise_primary is not None else "no_change",
+                        "planned_secondary_advertisement": advertise_secondary if advertise_secondary is not None else "no_change",
+                        "local_router_manages_both_prefixes": True,
+                        "remote_advertisement_managed": False
+                    }
+                }
             
-            # Log comprehensive cycle completion event
-            cycle_details = {
+            structured_logger.log_event({
+                "event_type": "health_check_cycle",
+                "timestamp": time.time(),
+                "result": cycle_result.value,
+                "component": "daemon",
+                "operation": "health_check_cycle",
+                "details": cycle_details,
+                "duration_ms": int(loop_duration * 1000)
+            })
+
+            # Publish the cycle to the admin endpoint (/healthz, /readyz, /state)
+            admin.STATUS.publish({
                 "correlation_id": correlation_id,
-                "cycle_duration_ms": int(loop_duration * 1000),
+                "cycle_number": cycle_number,
+                "completed_at": time.time(),
+                "result": cycle_result.value,
+                "duration_ms": int(loop_duration * 1000),
                 "state_code": new_state_code,
-                "time_in_state_seconds": time_in_current_state,
-                "local_router_only_mode": True,  # Flag for monitoring
+                "state_since": last_state_change_time,
+                "passive_mode": cfg.run_passive,
                 "state_verification": {
-                    "state_2": {
-                        "pending": state_2_pending_verification,
-                        "consecutive_count": state_2_consecutive_count,
-                        "threshold": cfg.state_2_verification_threshold
-                    } if new_state_code == 2 or state_2_consecutive_count > 0 else None,
-                    "state_3": {
-                        "pending": state_3_pending_verification,
-                        "consecutive_count": state_3_consecutive_count,
-                        "threshold": cfg.state_3_verification_threshold
-                    } if new_state_code == 3 or state_3_consecutive_count > 0 else None,
-                    "state_4": {
-                        "pending": state_4_pending_verification,
-                        "consecutive_count": state_4_consecutive_count,
-                        "threshold": cfg.state_4_verification_threshold
-                    } if new_state_code == 4 or state_4_consecutive_count > 0 else None,
-                    "updates_skipped": skip_updates,
-                    "skip_reason": verification_reason
+                    f"state_{code}": {"pending": pending, "consecutive_count": count, "threshold": threshold}
+                    for code, pending, count, threshold in (
+                        (2, state_2_pending_verification, state_2_consecutive_count, cfg.state_2_verification_threshold),
+                        (3, state_3_pending_verification, state_3_consecutive_count, cfg.state_3_verification_threshold),
+                        (4, state_4_pending_verification, state_4_consecutive_count, cfg.state_4_verification_threshold)
+                    )
                 },
+                "updates_skipped": skip_updates,
+                "skip_reason": verification_reason,
                 "health_check_hysteresis": {
-                    "local_history_size": len(local_health_history),
-                    "local_healthy_count": sum(local_health_history) if local_health_history else 0,
-                    "remote_history_size": len(remote_health_history),
-                    "remote_healthy_count": sum(remote_health_history) if remote_health_history else 0,
+                    "local_window": list(local_health_history),
+                    "remote_window": list(remote_health_history),
                     "window_size": cfg.health_check_window,
-                    "threshold": cfg.health_check_threshold,
-                    "asymmetric": cfg.asymmetric_hysteresis
+                    "threshold": cfg.health_check_threshold
                 },
                 "health_status": {
                     "local_healthy": local_healthy,
@@ -882,39 +1302,13 @@ def run_loop(cfg: Config, compute) -> None:
                     "raw_local_healthy": raw_local_healthy,
                     "raw_remote_healthy": raw_remote_healthy
                 },
-                "operation_results": {
-                    "local_primary_advertisement_success": primary_success,
-                    "local_secondary_advertisement_success": secondary_success,
-                    "cloudflare_update_success": cloudflare_success,
-                    "remote_advertisement_skipped": True,
-                    "bgp_updates_skipped": skip_updates,  # Flag for State 0
-                    "cloudflare_updates_skipped": skip_updates  # Flag for State 0
-                },
-                "error_tracking": {
-                    "consecutive_errors": consecutive_errors,
-                    "max_consecutive_errors": max_consecutive_errors
-                },
-                "configuration": {
-                    "desired_cloudflare_priority": desired_priority if desired_priority is not None else "no_change",
-                    "planned_primary_advertisement": advertise_primary if advertise_primary is not None else "no_change",
-                    "planned_secondary_advertisement": advertise_secondary if advertise_secondary is not None else "no_change",
-                    "local_router_manages_both_prefixes": True,
-                    "remote_advertisement_managed": False
-                }
-            }
-            
-            structured_logger.log_event({
-                "event_type": "health_check_cycle",
-                "timestamp": time.time(),
-                "result": cycle_result.value,
-                "component": "daemon",
-                "operation": "health_check_cycle",
-                "details": cycle_details,
-                "duration_ms": int(loop_duration * 1000)
+                "circuit_breakers": {name: cb.get_state() for name, cb in circuit_breakers.items()},
+                "api_latency": metrics.last_api_calls(),
+                "phase_timings": phase_timings
             })
 
             # ═══════════════════════════════════════════════════════════════════════════
-            # PHASE 7: Sleep Until Next Check Interval
+            # PHASE 6: Sleep Until Next Check Interval
             # ═══════════════════════════════════════════════════════════════════════════
             
             # Calculate sleep time, accounting for cycle duration
@@ -925,7 +1319,8 @@ def run_loop(cfg: Config, compute) -> None:
                            f"sleeping {sleep_time:.2f}s until next check")
             else:
                 logger.warning(f"[{correlation_id}] Cycle took {loop_duration:.2f}s, "
-                             f"longer than check interval {cfg.check_interval}s")
+                             f"longer than check interval {cfg.check_interval}s; "
+                             f"most time spent in {phase_timer.describe_slowest()}")
             
             # Wait for next check interval or shutdown signal
             if shutdown_event.wait(sleep_time):
@@ -934,6 +1329,8 @@ def run_loop(cfg: Config, compute) -> None:
 
         except Exception as e:
             consecutive_errors += 1
+            cycle_profiler.end_cycle()
+            admin.STATUS.record_error(str(e), consecutive_errors)
             
             logger.exception(f"Unexpected error in main loop "
                            f"(consecutive error {consecutive_errors}/{max_consecutive_errors}): {e}")
@@ -942,7 +1339,7 @@ def run_loop(cfg: Config, compute) -> None:
             error_details = {
                 "consecutive_errors": consecutive_errors,
                 "max_consecutive_errors": max_consecutive_errors,
-                "loop_phase": "unknown",  # Could be enhanced to track current phase
+                "loop_phase": phase_timer.current_phase or "unknown",
                 "correlation_id": correlation_id if 'correlation_id' in locals() else None,
                 "local_router_only_mode": True
             }
@@ -975,6 +1372,25 @@ def run_loop(cfg: Config, compute) -> None:
     # DAEMON SHUTDOWN SEQUENCE
     # ═══════════════════════════════════════════════════════════════════════════════
     
+    # Stop the probe pool; probes still in flight finish in the background
+    probe_runner.shutdown(wait=False)
+
+    # Release pooled Cloudflare connections
+    cf_client.close()
+
+    # Stop polling router operations; any still pending are logged as abandoned
+    operation_tracker.close(timeout=5)
+
+    # Release the metrics port
+    metrics.CIRCUIT_BREAKER_STATE.set_callback(None)
+    if metrics_server:
+        metrics_server.stop()
+    if admin_server:
+        admin_server.stop()
+
+    # Stop tracemalloc if profiling started it
+    cycle_profiler.close()
+    
     # Log daemon shutdown with final state information
     shutdown_details = {
         "reason": "graceful_shutdown" if not consecutive_errors >= max_consecutive_errors else "max_errors_exceeded",
@@ -995,6 +1411,10 @@ def run_loop(cfg: Config, compute) -> None:
     
     logger.info("Main daemon loop exited. Cleanup completed successfully.")
 
+    # Write out everything still queued for the log writer thread
+    if log_pipeline and not log_pipeline.flush(timeout=5):
+        print("Warning: log queue not fully drained at shutdown", file=sys.stderr)
+
 
 def startup(cfg: Config):
     """
@@ -1022,9 +1442,13 @@ def startup(cfg: Config):
             Must pass validate_configuration() checks.
             
     Returns:
-        compute: Initialized and validated GCP Compute Engine client.
-            This client is authenticated and confirmed to have access to
-            the required GCP projects and regions.
+        Tuple[compute, CloudflareClient]:
+            - compute: Initialized and validated GCP Compute Engine client, or a
+              ComputeClientPool when GCP_CLIENT_POOL_SIZE > 0.
+              This client is authenticated and confirmed to have access to
+              the required GCP projects and regions.
+            - cf_client: Pooled Cloudflare API client whose connection was
+              opened during validation and is reused by run_loop() every cycle.
             
     Raises:
         SystemExit: If any critical validation step fails. Exit codes:
@@ -1079,9 +1503,9 @@ def startup(cfg: Config):
     Example:
         try:
             cfg = Config()
-            compute = startup(cfg)
+            compute, cf_client = startup(cfg)
             print("Startup successful, beginning main loop")
-            run_loop(cfg, compute)
+            run_loop(cfg, compute, cf_client)
         except SystemExit as e:
             print(f"Startup failed with exit code {e.code}")
             
@@ -1094,6 +1518,8 @@ def startup(cfg: Config):
     # Initialize logging for startup process
     logger = logging.getLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
     structured_logger = StructuredEventLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
+    set_static_event_fields(cfg)
+    install_flight_recorder(cfg)
 
     logger.info("Daemon startup initiated - beginning validation sequence")
 
@@ -1138,9 +1564,15 @@ def startup(cfg: Config):
     logger.info("Phase 2: Initializing GCP Compute Engine client and testing connectivity")
     
     try:
-        # Build authenticated GCP Compute Engine client
+        # Build authenticated GCP Compute Engine client, or a pool of them for
+        # concurrent probes and getHealth fan-out (GCP_CLIENT_POOL_SIZE=0 disables)
         logger.debug(f"Building GCP client with credentials: {cfg.gcp_credentials}")
-        compute = gcp_mod.build_compute_client(cfg.gcp_credentials, timeout=cfg.gcp_api_timeout)
+        if cfg.gcp_client_pool_size > 0:
+            compute = gcp_mod.build_compute_client_pool(cfg.gcp_credentials,
+                                                        size=cfg.gcp_client_pool_size,
+                                                        timeout=cfg.gcp_api_timeout)
+        else:
+            compute = gcp_mod.build_compute_client(cfg.gcp_credentials, timeout=cfg.gcp_api_timeout)
         
         # Test connectivity and permissions
         logger.debug(f"Testing GCP connectivity for project: {cfg.gcp_project}")
@@ -1222,10 +1654,16 @@ def startup(cfg: Config):
     
     logger.info("Phase 3: Validating Cloudflare API credentials and permissions")
     
+    # Pooled client created once here and reused by every health check cycle;
+    # the connection opened by validation stays in the pool for the first cycle
+    cf_client = build_cloudflare_client(cfg)
+    
     try:
         # Test Cloudflare API connectivity and permissions
         logger.debug(f"Testing Cloudflare connectivity for account: {cfg.cf_account_id}")
-        cf_mod.validate_cloudflare_connectivity(cfg.cf_account_id, cfg.cf_api_token, timeout=cfg.cloudflare_api_timeout)
+        cf_mod.validate_cloudflare_connectivity(cfg.cf_account_id, cfg.cf_api_token,
+                                                timeout=cfg.cloudflare_api_timeout,
+                                                client=cf_client)
         
         # Log successful Cloudflare connectivity
         cf_details = {
@@ -1270,6 +1708,7 @@ def startup(cfg: Config):
         })
         
         logger.critical("Cannot start daemon without Cloudflare connectivity")
+        cf_client.close()
         raise SystemExit(1)
 
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -1279,8 +1718,11 @@ def startup(cfg: Config):
     logger.info("Phase 4: Setting up signal handlers for graceful shutdown")
     
     try:
-        setup_signal_handlers()
-        logger.info("✓ Signal handlers registered successfully (SIGTERM, SIGINT)")
+        setup_signal_handlers(cfg.flight_recorder_dump_file if cfg.flight_recorder_size else None)
+        if cfg.flight_recorder_size:
+            logger.info("✓ Signal handlers registered successfully (SIGTERM, SIGINT, SIGUSR1 flight recorder dump, SIGUSR2 profile next cycle)")
+        else:
+            logger.info("✓ Signal handlers registered successfully (SIGTERM, SIGINT, SIGUSR2 profile next cycle)")
     except Exception as e:
         logger.warning(f"Failed to register signal handlers: {e}")
         logger.warning("Daemon will still function but may not shutdown gracefully")
@@ -1340,7 +1782,7 @@ def startup(cfg: Config):
         logger.info(f"NOTE: This daemon will only manage BGP advertisements on {cfg.local_bgp_router}")
         logger.info(f"      Remote router {cfg.remote_bgp_router} will be monitored but not modified")
 
-    return compute
+    return compute, cf_client
 
 
 # Module-level constants and configuration
@@ -1373,10 +1815,11 @@ def get_daemon_info() -> Dict[str, Any]:
         Dict[str, Any]: Dictionary containing:
             - version: Daemon version string
             - name: Human-readable daemon name  
-            - uptime_seconds: How long daemon has been running (if available)
+            - uptime_seconds: How long the control loop has been running
             - shutdown_requested: Whether shutdown has been requested
             - constants: Key daemon constants and limits
             - local_router_only: Flag indicating local-only mode
+            - status: Last cycle published by the control loop (see admin.DaemonStatus.snapshot)
             
     Example:
         info = get_daemon_info()
@@ -1389,6 +1832,7 @@ def get_daemon_info() -> Dict[str, Any]:
     return {
         "name": DAEMON_NAME,
         "version": DAEMON_VERSION,
+        "uptime_seconds": round(time.time() - admin.STATUS.started_at, 3),
         "shutdown_requested": shutdown_event.is_set(),
         "local_router_only": True,  # Flag for monitoring systems
         "constants": {
@@ -1397,7 +1841,8 @@ def get_daemon_info() -> Dict[str, Any]:
             "default_check_interval": DEFAULT_CHECK_INTERVAL,
             "default_max_consecutive_errors": DEFAULT_MAX_CONSECUTIVE_ERRORS,
             "correlation_id_prefix": CORRELATION_ID_PREFIX
-        }
+        },
+        "status": admin.STATUS.snapshot()
     }
 
 
@@ -1467,7 +1912,11 @@ if __name__ == "__main__":
             level=cfg.log_level,
             log_file=cfg.log_file,
             max_bytes=cfg.log_max_bytes,
-            backup_count=cfg.log_backup_count
+            backup_count=cfg.log_backup_count,
+            async_logging=cfg.log_async,
+            queue_size=cfg.log_queue_size,
+            overflow=cfg.log_queue_overflow,
+            compression=cfg.log_compression
         )
         
         print("Configuration loaded successfully")
@@ -1478,14 +1927,14 @@ if __name__ == "__main__":
         
         # Perform startup validation
         print("Performing startup validation...")
-        compute = startup(cfg)
+        compute, cf_client = startup(cfg)
         
         print("✓ Startup validation completed successfully")
         print("Starting main daemon loop...")
         print("Press Ctrl+C to shutdown gracefully")
         
         # Start main daemon loop
-        run_loop(cfg, compute)
+        run_loop(cfg, compute, cf_client)
         
         print("Daemon exited gracefully")
         sys.exit(0)
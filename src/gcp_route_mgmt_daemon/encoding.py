@@ -0,0 +1,173 @@
+"""
+JSON Encoding for Structured Log Events
+
+This module serializes structured event payloads for the structured log
+formatters. It uses orjson when it is installed and the standard library json
+module otherwise; both produce the same JSON, so the choice only affects speed.
+
+Encoders:
+    - orjson (optional dependency, `pip install orjson`): several times faster
+      than the standard library on typical event payloads
+    - json (standard library): always available; also used for any payload
+      orjson rejects (e.g. integers wider than 64 bits)
+
+Static Fields:
+    Fields that are identical on every event (daemon version, project, regions)
+    are serialized once with set_static_fields() and appended to each encoded
+    event as a prebuilt fragment instead of being re-encoded per record. An
+    event that carries a key of its own with the same name is encoded whole,
+    so event data always wins.
+
+Usage Example:
+    from .encoding import set_static_fields, encode_event
+
+    set_static_fields({"daemon": {"version": "0.5.1", "local_region": "us-central1"}})
+    line = encode_event(record.json_fields)               # compact, one line
+    block = encode_event(record.json_fields, pretty=True) # two-space indent
+    body = encode_json({"entries": [...]})                # any other JSON, no static fields
+
+Thread Safety:
+    encode_event() may be called from any thread. set_static_fields() replaces
+    the fragment atomically; events encoded concurrently use either the old or
+    the new fields.
+
+Author: Nathan Bray
+Version: 1.0
+Last Modified: 2025
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+# Encoder names reported by encoder_name()
+ENCODER_ORJSON = "orjson"
+ENCODER_STDLIB = "json"
+
+
+class JSONEncoder:
+    """
+    Compact and indented JSON serialization of event payloads.
+
+    Compact output matches json.dumps(obj, separators=(',', ':')); pretty
+    output matches json.dumps(obj, indent=2, separators=(',', ': ')).
+    """
+
+    name = ENCODER_STDLIB
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
+    def dumps_pretty(self, obj: Any) -> str:
+        return json.dumps(obj, indent=2, separators=(',', ': '))
+
+
+class OrjsonEncoder(JSONEncoder):
+    """orjson-backed encoder, falling back to the standard library on payloads orjson rejects."""
+
+    name = ENCODER_ORJSON
+
+    def __init__(self):
+        self._options = orjson.OPT_NON_STR_KEYS
+        self._pretty_options = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+
+    def dumps(self, obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=self._options).decode()
+        except TypeError:
+            return super().dumps(obj)
+
+    def dumps_pretty(self, obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=self._pretty_options).decode()
+        except TypeError:
+            return super().dumps_pretty(obj)
+
+
+def build_encoder(prefer_orjson: bool = True) -> JSONEncoder:
+    """Return the fastest available encoder (orjson if installed and preferred)."""
+    if prefer_orjson and orjson is not None:
+        return OrjsonEncoder()
+    return JSONEncoder()
+
+
+class _StaticFragment:
+    """Pre-encoded static fields in compact and pretty form."""
+
+    def __init__(self, encoder: JSONEncoder, fields: Dict[str, Any]):
+        self.fields = fields
+        self.keys = frozenset(fields)
+        # Encode the fields as an object once and keep the members without the braces
+        self.compact = encoder.dumps(fields)[1:-1]
+        self.pretty = encoder.dumps_pretty(fields)[2:-2]
+
+
+_encoder: JSONEncoder = build_encoder()
+_static: Optional[_StaticFragment] = None
+
+
+def encoder_name() -> str:
+    """Name of the encoder in use ("orjson" or "json")."""
+    return _encoder.name
+
+
+def set_encoder(encoder: JSONEncoder) -> None:
+    """Replace the module encoder (re-encodes the static fields with it)."""
+    global _encoder, _static
+    _encoder = encoder
+    if _static is not None:
+        _static = _StaticFragment(encoder, _static.fields)
+
+
+def set_static_fields(fields: Optional[Dict[str, Any]]) -> None:
+    """
+    Serialize fields added to every encoded event.
+
+    Args:
+        fields (Dict[str, Any], optional): Values that do not change while the
+            daemon runs; None or an empty dict removes the static fields
+    """
+    global _static
+    _static = _StaticFragment(_encoder, dict(fields)) if fields else None
+
+
+def encode_json(obj: Any) -> str:
+    """Serialize any JSON value compactly with the module encoder, without static fields."""
+    return _encoder.dumps(obj)
+
+
+def encode_event(fields: Dict[str, Any], pretty: bool = False) -> str:
+    """
+    Serialize an event payload with the static fields spliced in.
+
+    Args:
+        fields (Dict[str, Any]): Event payload (record.json_fields)
+        pretty (bool): Two-space indented output instead of one compact line
+
+    Returns:
+        str: JSON object text
+    """
+    static = _static
+    if static is None:
+        return _encoder.dumps_pretty(fields) if pretty else _encoder.dumps(fields)
+
+    if not static.keys.isdisjoint(fields):
+        # The event sets one of the static keys itself; encode the merged object
+        merged = {**static.fields, **fields}
+        return _encoder.dumps_pretty(merged) if pretty else _encoder.dumps(merged)
+
+    # Append the prebuilt members before the closing brace
+    if pretty:
+        body = _encoder.dumps_pretty(fields)
+        if body == "{}":
+            return "{\n" + static.pretty + "\n}"
+        return body[:-2] + ",\n" + static.pretty + "\n}"
+
+    body = _encoder.dumps(fields)
+    if body == "{}":
+        return "{" + static.compact + "}"
+    return body[:-1] + "," + static.compact + "}"
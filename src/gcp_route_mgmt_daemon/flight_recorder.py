@@ -0,0 +1,211 @@
+"""
+In-Memory Flight Recorder for Structured Events
+
+This module keeps the most recent structured events in a fixed-size ring
+buffer, whatever the configured log level. Production can run file logging at
+WARNING for low I/O and still recover the DEBUG-level context (including
+no_change events) of the minutes before an incident by dumping the recorder.
+
+Recording:
+    StructuredEventLogger.log_event() records every event into the installed
+    recorder before the level check, so events that are not written to any log
+    are still captured. Each event is stored as a FlightRecord (__slots__, no
+    per-record dict); details are kept by reference, not copied. Once the
+    buffer is full the oldest event is overwritten.
+
+Lazy Details:
+    Details passed as a zero-argument callable (the daemon's cycle_details)
+    are built when the event is recorded, so each record keeps the health
+    histories and component stats of its own cycle. StructuredEventLogger
+    hands the same dict to the log handlers, so an event is never built
+    twice. Without a recorder, lazy details of disabled events are still
+    never built.
+
+Dumping:
+    dump(path) writes the buffered events oldest first as JSON Lines (the same
+    shape as the structured log, readable with log_reader.iter_file_events).
+    The daemon dumps on SIGUSR1:
+
+        kill -USR1 $(pidof python)      # -> FLIGHT_RECORDER_DUMP_FILE.<timestamp>
+
+Usage Example:
+    from .flight_recorder import FlightRecorder, set_flight_recorder
+
+    recorder = FlightRecorder(capacity=1000)
+    set_flight_recorder(recorder)        # every StructuredEventLogger records into it
+    ...
+    recorder.dump('/var/log/daemon_flight.jsonl')
+
+Thread Safety:
+    record(), snapshot() and dump() may be called from any thread. The file is
+    written outside the buffer lock, so logging never waits on a dump.
+
+Author: Nathan Bray
+Version: 1.0
+Last Modified: 2025
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from .encoding import encode_event
+
+# Logger for flight recorder operations - uses environment variable for consistency
+logger = logging.getLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
+
+# Default number of events kept (FLIGHT_RECORDER_SIZE)
+DEFAULT_FLIGHT_RECORDER_SIZE = 1000
+
+
+class FlightRecord:
+    """One recorded structured event"""
+    __slots__ = ('timestamp', 'level', 'event_type', 'result', 'component', 'operation',
+                 'details', 'duration_ms', 'error_message', 'correlation_id')
+
+    def __init__(self, timestamp, level, event_type, result, component, operation,
+                 details, duration_ms=None, error_message=None, correlation_id=None):
+        self.timestamp = timestamp
+        self.level = level
+        self.event_type = event_type
+        self.result = result
+        self.component = component
+        self.operation = operation
+        self.details = details
+        self.duration_ms = duration_ms
+        self.error_message = error_message
+        self.correlation_id = correlation_id
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Event in the structured log schema, plus the level it was logged at."""
+        return {
+            "structured_event": True,
+            "event_type": self.event_type,
+            "timestamp": self.timestamp,
+            "result": self.result,
+            "component": self.component,
+            "operation": self.operation,
+            "details": self.details,
+            "duration_ms": self.duration_ms,
+            "error_message": self.error_message,
+            "correlation_id": self.correlation_id,
+            "level": logging.getLevelName(self.level)
+        }
+
+
+class FlightRecorder:
+    """
+    Fixed-size ring buffer of the most recent structured events.
+
+    Attributes:
+        capacity (int): Maximum number of events kept
+    """
+
+    def __init__(self, capacity: int = DEFAULT_FLIGHT_RECORDER_SIZE):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self._buffer: List[Optional[FlightRecord]] = [None] * capacity
+        self._next = 0          # Slot the next record is written to
+        self._recorded = 0      # Events recorded since creation (or clear)
+        self._dumps = 0
+        self._lock = threading.Lock()
+
+    def record(self, record: FlightRecord) -> None:
+        """Store an event, overwriting the oldest once the buffer is full."""
+        with self._lock:
+            self._buffer[self._next] = record
+            self._next = (self._next + 1) % self.capacity
+            self._recorded += 1
+
+    def snapshot(self) -> List[FlightRecord]:
+        """Buffered events, oldest first."""
+        with self._lock:
+            if self._recorded < self.capacity:
+                return self._buffer[:self._next]
+            return self._buffer[self._next:] + self._buffer[:self._next]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return min(self._recorded, self.capacity)
+
+    def clear(self) -> None:
+        """Discard every buffered event."""
+        with self._lock:
+            self._buffer = [None] * self.capacity
+            self._next = 0
+            self._recorded = 0
+
+    def dump(self, path: str) -> int:
+        """
+        Write the buffered events to a JSON Lines file, oldest first.
+
+        The file is written next to its final path and renamed into place, so
+        readers never see a partial dump.
+
+        Args:
+            path (str): Destination file
+
+        Returns:
+            int: Number of events written
+        """
+        records = self.snapshot()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(encode_event(record.to_dict()))
+                f.write("\n")
+        os.replace(temp_path, path)
+        with self._lock:
+            self._dumps += 1
+        logger.info(f"Flight recorder dumped {len(records)} events to {path}")
+        return len(records)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of recorder counters."""
+        with self._lock:
+            return {
+                "capacity": self.capacity,
+                "buffered": min(self._recorded, self.capacity),
+                "recorded": self._recorded,
+                "overwritten": max(0, self._recorded - self.capacity),
+                "dumps": self._dumps
+            }
+
+
+# Process-wide recorder used by every StructuredEventLogger (None = disabled)
+_flight_recorder: Optional[FlightRecorder] = None
+
+
+def get_flight_recorder() -> Optional[FlightRecorder]:
+    """Return the installed flight recorder, if any."""
+    return _flight_recorder
+
+
+def set_flight_recorder(recorder: Optional[FlightRecorder]) -> None:
+    """Install (or with None, remove) the process-wide flight recorder."""
+    global _flight_recorder
+    _flight_recorder = recorder
+
+
+def dump_flight_recorder(base_path: str) -> Optional[str]:
+    """
+    Dump the installed recorder to a timestamped file.
+
+    Args:
+        base_path (str): Dump file prefix; ".<YYYYmmdd-HHMMSS>" is appended
+
+    Returns:
+        str: Path written, or None when no recorder is installed
+    """
+    recorder = _flight_recorder
+    if recorder is None:
+        logger.warning("Flight recorder dump requested but the recorder is disabled")
+        return None
+    path = f"{base_path}.{time.strftime('%Y%m%d-%H%M%S')}"
+    recorder.dump(path)
+    return path
@@ -52,6 +52,7 @@ Authentication and Permissions:
 Performance Considerations:
     - API calls are cached where possible to reduce latency
     - Backend health checks scale with the number of backend services and instances
+    - Backend service listing follows every page and requests only the fields it uses
     - BGP operations are typically fast (< 1 second) but may have propagation delays
     - Router status queries include all BGP peers, so response time scales with peer count
 
@@ -111,10 +112,22 @@ Dependencies: google-cloud-compute, google-auth, googleapiclient
 import os
 import logging
 import time
-from typing import Optional, Dict, List, Any, Tuple, Callable
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Optional, Dict, List, Any, Tuple, Callable, Iterator
+import httplib2
+import google_auth_httplib2
+from google.auth.credentials import with_scopes_if_required
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+from .client_pool import ComputeClientPool, DEFAULT_POOL_SIZE
+from .metrics import time_api_call
+from .operations import OperationTracker
+from .profiling import run_profiled
+from .reconcile import ReconciliationCache
 from .structured_events import StructuredEventLogger, ActionResult
 
 # Logger for all GCP operations - uses environment variable for consistency
@@ -136,6 +149,94 @@ UNHEALTHY_STATES = [                      # All possible unhealthy states
 PERMANENT_HTTP_ERRORS = [403, 404]        # Errors that indicate configuration issues
 TRANSIENT_HTTP_ERRORS = [429, 500, 502, 503, 504]  # Errors that may be retried
 
+# Backend health fetch strategies for backend_services_healthy
+FETCH_MODE_SEQUENTIAL = "sequential"      # One getHealth call at a time
+FETCH_MODE_CONCURRENT = "concurrent"      # Bounded thread pool fan-out
+FETCH_MODE_BATCH = "batch"                # Compute API batch requests
+BACKEND_HEALTH_FETCH_MODES = (FETCH_MODE_SEQUENTIAL, FETCH_MODE_CONCURRENT, FETCH_MODE_BATCH)
+DEFAULT_HEALTH_MAX_CONCURRENCY = 8        # Max getHealth calls in flight (concurrent mode)
+DEFAULT_HEALTH_BATCH_SIZE = 100           # getHealth requests per batch (batch mode)
+MAX_HEALTH_BATCH_SIZE = 1000              # Google API limit on calls per batch request
+
+# How unhealthy instances are logged and reported by backend_services_healthy
+UNHEALTHY_LOG_PER_INSTANCE = "per_instance"   # One warning and one details entry per instance
+UNHEALTHY_LOG_SUMMARY = "summary"             # One entry per (service, backend, state), warnings on change
+UNHEALTHY_LOG_MODES = (UNHEALTHY_LOG_PER_INSTANCE, UNHEALTHY_LOG_SUMMARY)
+DEFAULT_UNHEALTHY_SAMPLE_SIZE = 5             # Sample instance names kept per summary entry
+
+# Partial response projection for regionBackendServices.list - only the fields the
+# health check and summary read (service name and backend instance groups)
+BACKEND_SERVICE_LIST_FIELDS = "items(name,backends/group),nextPageToken"
+
+# OAuth scope requested for the service account used by the compute client
+COMPUTE_AUTH_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+
+
+def _thread_local_request_builder(credentials, timeout: int) -> Callable[..., HttpRequest]:
+    """
+    Build a googleapiclient requestBuilder that gives every thread its own transport.
+
+    httplib2.Http objects are not thread-safe, and the discovery client shares a
+    single instance between all requests by default. The daemon runs its health
+    probes concurrently, so each worker thread lazily creates its own
+    AuthorizedHttp on first use and reuses it for every later request.
+
+    Args:
+        credentials: Scoped google-auth credentials shared by all transports
+        timeout (int): Socket timeout in seconds for each per-thread transport
+
+    Returns:
+        Callable: Function with the HttpRequest constructor signature
+    """
+    local = threading.local()
+
+    def build_request(http, *args, **kwargs):
+        authed_http = getattr(local, "http", None)
+        if authed_http is None:
+            authed_http = google_auth_httplib2.AuthorizedHttp(
+                credentials, http=httplib2.Http(timeout=timeout)
+            )
+            local.http = authed_http
+        return HttpRequest(authed_http, *args, **kwargs)
+
+    return build_request
+
+
+@contextmanager
+def _borrow(compute_client) -> Iterator[Any]:
+    """
+    Yield a client for one API call chain.
+
+    Functions in this module accept either a bare Compute Engine client or a
+    ComputeClientPool. A pool hands the calling thread its own client for the
+    duration of the block; a bare client is yielded as-is.
+    """
+    if isinstance(compute_client, ComputeClientPool):
+        with compute_client.client() as client:
+            yield client
+    else:
+        yield compute_client
+
+
+def _load_credentials(creds_path: str):
+    """Load and scope service account credentials, validating the key file first."""
+    if not os.path.exists(creds_path):
+        error_msg = f"GCP credentials file not found: {creds_path}"
+        logger.error(error_msg)
+        raise FileNotFoundError(error_msg)
+    
+    if not os.access(creds_path, os.R_OK):
+        error_msg = f"GCP credentials file not readable: {creds_path}"
+        logger.error(error_msg)
+        raise PermissionError(error_msg)
+
+    logger.debug(f"Loading GCP service account credentials from: {creds_path}")
+
+    # Load service account credentials from JSON key file
+    creds = service_account.Credentials.from_service_account_file(creds_path)
+
+    return with_scopes_if_required(creds, COMPUTE_AUTH_SCOPES)
+
 
 def build_compute_client(creds_path: str, timeout: int = DEFAULT_API_TIMEOUT):
     """
@@ -159,15 +260,18 @@ def build_compute_client(creds_path: str, timeout: int = DEFAULT_API_TIMEOUT):
         creds_path (str): Absolute or relative path to the service account JSON key file.
             The file must be readable by the current process and contain valid
             service account credentials.
-        timeout (int, optional): [Deprecated/Unused] HTTP request timeout parameter.
-            Kept for backward compatibility but no longer used in Python 3.12+.
-            The modern google-api-python-client handles timeouts internally.
-            Defaults to DEFAULT_API_TIMEOUT.
+        timeout (int, optional): Socket timeout in seconds applied to each
+            per-thread HTTP transport. Defaults to DEFAULT_API_TIMEOUT.
 
     Returns:
         googleapiclient.discovery.Resource: Authenticated Compute Engine API client
             configured for version v1. The client includes built-in retry logic
             and connection pooling for optimal performance.
+
+    Thread Safety:
+        Requests built by the client use a per-thread AuthorizedHttp transport
+        (see _thread_local_request_builder), so the same client can be shared
+        by concurrently running health probes.
             
     Raises:
         FileNotFoundError: If the credentials file does not exist or is not readable.
@@ -224,30 +328,19 @@ def build_compute_client(creds_path: str, timeout: int = DEFAULT_API_TIMEOUT):
         - compute.projects.get
     """
     # Validate credentials file exists and is readable
-    if not os.path.exists(creds_path):
-        error_msg = f"GCP credentials file not found: {creds_path}"
-        logger.error(error_msg)
-        raise FileNotFoundError(error_msg)
-    
-    if not os.access(creds_path, os.R_OK):
-        error_msg = f"GCP credentials file not readable: {creds_path}"
-        logger.error(error_msg)
-        raise PermissionError(error_msg)
+    creds = _load_credentials(creds_path)
     
     try:
-        logger.debug(f"Loading GCP service account credentials from: {creds_path}")
-
-        # Load service account credentials from JSON key file
-        creds = service_account.Credentials.from_service_account_file(creds_path)
-
         # Build Compute Engine API client with credentials
         # Python 3.12+ compatible: pass credentials directly instead of using authorize()
         # cache_discovery=False prevents caching discovery documents to disk
+        # requestBuilder gives each thread its own transport (httplib2 is not thread-safe)
         compute = build(
             serviceName='compute',
             version=GCP_API_VERSION,
             credentials=creds,
-            cache_discovery=False
+            cache_discovery=False,
+            requestBuilder=_thread_local_request_builder(creds, timeout)
         )
         
         logger.debug("GCP Compute Engine client initialized successfully")
@@ -259,6 +352,57 @@ def build_compute_client(creds_path: str, timeout: int = DEFAULT_API_TIMEOUT):
         raise
 
 
+def build_compute_client_pool(creds_path: str,
+                              size: int = DEFAULT_POOL_SIZE,
+                              timeout: int = DEFAULT_API_TIMEOUT) -> ComputeClientPool:
+    """
+    Create a pool of Compute Engine clients that share one set of credentials.
+
+    Each pooled client is a discovery Resource with its own AuthorizedHttp
+    transport, so a worker that checks a client out has exclusive use of its
+    connection. All transports wrap the same credentials object, so the OAuth
+    token is refreshed once (by the pool, under a lock) and reused everywhere.
+
+    The pool can be passed anywhere a compute client is accepted in this
+    module; each API call chain borrows a client and returns it afterwards.
+
+    Args:
+        creds_path (str): Path to the service account JSON key file
+        size (int, optional): Maximum number of pooled clients. Defaults to
+            DEFAULT_POOL_SIZE.
+        timeout (int, optional): Socket timeout in seconds for each client's
+            transport. Defaults to DEFAULT_API_TIMEOUT.
+
+    Returns:
+        ComputeClientPool: Pool that builds clients lazily up to size
+
+    Raises:
+        FileNotFoundError: If the credentials file does not exist
+        PermissionError: If the credentials file is not readable
+        google.auth.exceptions.GoogleAuthError: If the credentials are invalid
+
+    Example:
+        pool = build_compute_client_pool('/path/to/key.json', size=8)
+        checker = backend_services_healthy('my-project', 'us-central1', pool,
+                                           fetch_mode='concurrent')
+        healthy = checker()
+    """
+    creds = _load_credentials(creds_path)
+
+    def _factory():
+        # Dedicated transport per client; the pool guarantees one user at a time
+        authed_http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http(timeout=timeout))
+        return build(
+            serviceName='compute',
+            version=GCP_API_VERSION,
+            http=authed_http,
+            cache_discovery=False
+        )
+
+    logger.debug(f"GCP Compute Engine client pool created (size={size})")
+    return ComputeClientPool(_factory, size=size, credentials=creds)
+
+
 def validate_gcp_connectivity(project: str, regions: List[str], compute) -> None:
     """
     Validate GCP API connectivity and permissions by testing access to required resources.
@@ -280,7 +424,8 @@ def validate_gcp_connectivity(project: str, regions: List[str], compute) -> None
             that the service account has permissions to access.
         regions (List[str]): List of GCP region names to validate access to.
             Each region must exist and be accessible with current credentials.
-        compute: Authenticated GCP Compute Engine client from build_compute_client().
+        compute: Authenticated GCP Compute Engine client from build_compute_client(),
+            or a ComputeClientPool from build_compute_client_pool().
         
     Raises:
         HttpError: If API calls fail due to authentication or permission issues.
@@ -337,7 +482,8 @@ def validate_gcp_connectivity(project: str, regions: List[str], compute) -> None
     try:
         # Step 1: Validate project access
         logger.debug(f"Validating access to GCP project: {project}")
-        resp = compute.projects().get(project=project).execute()
+        with _borrow(compute) as client:
+            resp = client.projects().get(project=project).execute()
         project_name = resp.get('name', project)
         
         logger.info(f"✓ GCP project access validated: {project_name}")
@@ -346,7 +492,8 @@ def validate_gcp_connectivity(project: str, regions: List[str], compute) -> None
         logger.debug(f"Validating access to regions: {regions}")
         for region in regions:
             try:
-                region_resp = compute.regions().get(project=project, region=region).execute()
+                with _borrow(compute) as client:
+                    region_resp = client.regions().get(project=project, region=region).execute()
                 logger.debug(f"✓ Region access validated: {region}")
             except HttpError as e:
                 if e.resp.status == 404:
@@ -384,7 +531,12 @@ def validate_gcp_connectivity(project: str, regions: List[str], compute) -> None
 def backend_services_healthy(project: str,
                            region: str,
                            compute_client,
-                           structured_logger: Optional[StructuredEventLogger] = None) -> Callable[[], bool]:
+                           structured_logger: Optional[StructuredEventLogger] = None,
+                           fetch_mode: str = FETCH_MODE_SEQUENTIAL,
+                           max_concurrency: int = DEFAULT_HEALTH_MAX_CONCURRENCY,
+                           batch_size: int = DEFAULT_HEALTH_BATCH_SIZE,
+                           unhealthy_log_mode: str = UNHEALTHY_LOG_PER_INSTANCE,
+                           unhealthy_sample_size: int = DEFAULT_UNHEALTHY_SAMPLE_SIZE) -> Callable[[], bool]:
     """
     Create a function that checks the health of all backend services in a GCP region.
     
@@ -413,11 +565,58 @@ def backend_services_healthy(project: str,
         - Network errors: Treated as transient, return False
         - Incomplete API responses: Treated as unhealthy, logged as warnings
     
+    Fetch Modes:
+        The check lists the region's backend services page by page, expands
+        each page into one work item per (service, backend group), fetches
+        getHealth for every item using the selected strategy, then evaluates
+        the responses in service order so `details` is identical across modes.
+        - sequential: One getHealth call at a time (original behaviour)
+        - concurrent: Up to max_concurrency getHealth calls in flight on a
+          thread pool owned by the returned closure
+        - batch: getHealth calls packed into Compute API batch requests of up
+          to batch_size calls, one HTTP exchange per batch. A per-request
+          HttpError inside a batch is handled like a list failure: permanent
+          errors (403, 404) are re-raised, transient/unknown codes make the
+          region's health unknown (None). Incomplete or missing responses
+          count as unhealthy.
+    
+    Pagination:
+        Backend services are enumerated with iter_region_backend_service_pages,
+        which follows nextPageToken and requests only BACKEND_SERVICE_LIST_FIELDS.
+        Each page's getHealth work is started as soon as the page arrives and
+        the page is evaluated after the next page has been requested, so in
+        concurrent mode getHealth calls for earlier pages overlap with listing
+        later ones and at most two pages are held in memory.
+    
+    Unhealthy Instance Logging:
+        - per_instance: One warning and one details["unhealthy_backends"] entry
+          per unhealthy instance, every cycle (original behaviour)
+        - summary: Unhealthy instances are aggregated into one entry per
+          (service, backend, health state) carrying the same keys as a
+          per-instance entry ("instance" is the first sample) plus
+          "instance_count" and up to unhealthy_sample_size "sample_instances".
+          One warning per entry is logged only when the set of unhealthy
+          instances differs from the previous cycle; an unchanged set is
+          logged at DEBUG. details gains "unhealthy_instances" (total) and
+          "unhealthy_set_changed".
+        Backend-level failures (API errors, incomplete or empty responses) are
+        reported per backend in both modes.
+    
     Args:
         project (str): GCP project ID containing the backend services
         region (str): GCP region name to check (e.g., 'us-central1')
-        compute_client: Authenticated GCP Compute Engine client
+        compute_client: Authenticated GCP Compute Engine client or ComputeClientPool
         structured_logger (StructuredEventLogger, optional): Logger for structured events
+        fetch_mode (str, optional): getHealth fetch strategy, one of
+            BACKEND_HEALTH_FETCH_MODES. Defaults to "sequential".
+        max_concurrency (int, optional): Maximum getHealth calls in flight in
+            concurrent mode. Defaults to DEFAULT_HEALTH_MAX_CONCURRENCY.
+        batch_size (int, optional): Maximum getHealth calls per batch request in
+            batch mode (1-1000). Defaults to DEFAULT_HEALTH_BATCH_SIZE.
+        unhealthy_log_mode (str, optional): One of UNHEALTHY_LOG_MODES.
+            Defaults to "per_instance".
+        unhealthy_sample_size (int, optional): Sample instances kept per
+            summary entry. Defaults to DEFAULT_UNHEALTHY_SAMPLE_SIZE.
         
     Returns:
         Callable[[], bool]: Function that returns True if all backends are healthy,
@@ -425,6 +624,8 @@ def backend_services_healthy(project: str,
             
     Performance Characteristics:
         - API calls scale with number of backend services and backends
+        - Sequential wall time grows linearly with backend count; concurrent
+          mode divides it by roughly max_concurrency
         - Typical response time: 500ms - 3s depending on service count
         - Large regions with many services may take longer
         - Results are not cached - each call makes fresh API requests
@@ -463,6 +664,84 @@ def backend_services_healthy(project: str,
         raise ValueError("Project ID cannot be empty")
     if not region:
         raise ValueError("Region cannot be empty")
+    if fetch_mode not in BACKEND_HEALTH_FETCH_MODES:
+        raise ValueError(f"Unknown backend health fetch mode: {fetch_mode}")
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+    if not 1 <= batch_size <= MAX_HEALTH_BATCH_SIZE:
+        raise ValueError(f"batch_size must be between 1 and {MAX_HEALTH_BATCH_SIZE}")
+    if unhealthy_log_mode not in UNHEALTHY_LOG_MODES:
+        raise ValueError(f"Unknown unhealthy log mode: {unhealthy_log_mode}")
+    if unhealthy_sample_size < 1:
+        raise ValueError("unhealthy_sample_size must be >= 1")
+
+    # Signature of the previous cycle's unhealthy instance set (summary mode)
+    last_unhealthy = {"signature": hash(frozenset())}
+
+    # Thread pool for concurrent fan-out, created once per closure so worker
+    # threads (and their per-thread HTTP transports) are reused across cycles
+    executor = None
+    if fetch_mode == FETCH_MODE_CONCURRENT:
+        executor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                      thread_name_prefix=f"health-{region}")
+
+    def _start_fetch(work_items: List[Tuple[str, str]]) -> Callable[[], List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]]:
+        """
+        Start fetching getHealth for every work item using the configured strategy.
+
+        Returns a callable that yields the results in work item order. In
+        concurrent mode the calls are submitted to the executor and keep running
+        while the caller lists the next page; the other modes fetch immediately.
+        """
+        if fetch_mode == FETCH_MODE_CONCURRENT:
+            futures = _submit_backend_health_concurrent(compute_client, project, region, work_items, executor)
+            return lambda: [future.result() for future in futures]
+        if fetch_mode == FETCH_MODE_BATCH:
+            results = _fetch_backend_health_batch(compute_client, project, region, work_items, batch_size)
+        else:
+            results = _fetch_backend_health_sequential(compute_client, project, region, work_items)
+        return lambda: results
+
+    def _evaluate_page(backend_services: List[Dict[str, Any]],
+                       collect: Callable[[], List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]],
+                       details: Dict[str, Any],
+                       summary: Optional["_UnhealthySummary"]) -> bool:
+        """Evaluate one page of backend services against its fetched getHealth results."""
+        page_healthy = True
+        results = iter(collect())
+        
+        for service in backend_services:
+            service_name = service['name']
+            service_healthy = True
+            service_backend_count = 0
+            
+            logger.debug(f"Checking backends for service: {service_name}")
+            
+            # Evaluate each backend within the service
+            for backend in service.get('backends', []):
+                service_backend_count += 1
+                details["total_backends"] += 1
+                health_response, error = next(results)
+                
+                backend_healthy = _evaluate_backend_health(
+                    project, region, service_name, backend['group'],
+                    health_response, error, details, summary
+                )
+                if not backend_healthy:
+                    page_healthy = False
+                    service_healthy = False
+            
+            # Track services with issues for debugging
+            if not service_healthy:
+                details["services_with_issues"].append({
+                    "service": service_name,
+                    "backend_count": service_backend_count
+                })
+                logger.debug(f"Service {service_name} has unhealthy backends")
+            else:
+                logger.debug(f"Service {service_name} is healthy ({service_backend_count} backends)")
+        
+        return page_healthy
     
     def _check() -> bool:
         """
@@ -484,148 +763,59 @@ def backend_services_healthy(project: str,
             "project": project,
             "region": region,
             "backend_services_checked": 0,
+            "backend_service_pages": 0,
             "total_backends": 0,
             "healthy_backends": 0,
             "unhealthy_backends": [],
-            "services_with_issues": []
+            "services_with_issues": [],
+            "fetch_mode": fetch_mode
         }
         
+        summary = None
+        if unhealthy_log_mode == UNHEALTHY_LOG_SUMMARY:
+            summary = _UnhealthySummary(details["unhealthy_backends"], unhealthy_sample_size)
+        
         logger.debug(f"Starting backend service health check for {project}/{region}")
         
         try:
-            # Query all regional backend services
+            # Query all regional backend services page by page. Each page's
+            # getHealth fetch is started immediately and the page is evaluated
+            # once the next page has been requested, so fetches overlap listing.
             logger.debug(f"Listing backend services in {project}/{region}")
-            request = compute_client.regionBackendServices().list(
-                project=project,
-                region=region
-            )
-            response = request.execute()
+            healthy = True  # Assume healthy until proven otherwise
+            previous_page = None
+            
+            for backend_services in iter_region_backend_service_pages(project, region, compute_client):
+                details["backend_service_pages"] += 1
+                details["backend_services_checked"] += len(backend_services)
+                
+                # Expand services into (service, backend group) work items and fetch
+                # their health using the configured strategy (sequential/concurrent/batch)
+                work_items = [
+                    (service['name'], backend['group'])
+                    for service in backend_services
+                    for backend in service.get('backends', [])
+                ]
+                current_page = (backend_services, _start_fetch(work_items))
+                
+                if previous_page is not None and not _evaluate_page(*previous_page, details, summary):
+                    healthy = False
+                previous_page = current_page
+            
+            if previous_page is not None and not _evaluate_page(*previous_page, details, summary):
+                healthy = False
             
-            backend_services = response.get('items', [])
-            details["backend_services_checked"] = len(backend_services)
+            if summary is not None:
+                signature = summary.signature()
+                details["unhealthy_instances"] = summary.instance_count
+                details["unhealthy_set_changed"] = signature != last_unhealthy["signature"]
+                last_unhealthy["signature"] = signature
+                summary.log(project, region, details["unhealthy_set_changed"])
             
-            if not backend_services:
+            if not details["backend_services_checked"]:
                 # No backend services found - consider this healthy
                 logger.info(f"No backend services found in {project}/{region} - considering healthy")
-                healthy = True
             else:
-                # Check health of all backend services
-                logger.debug(f"Found {len(backend_services)} backend services to check")
-                healthy = True  # Assume healthy until proven otherwise
-                
-                for service in backend_services:
-                    service_name = service['name']
-                    service_healthy = True
-                    service_backend_count = 0
-                    
-                    logger.debug(f"Checking backends for service: {service_name}")
-                    
-                    # Check each backend within the service
-                    for backend in service.get('backends', []):
-                        service_backend_count += 1
-                        details["total_backends"] += 1
-                        backend_group = backend['group']
-                        
-                        try:
-                            # Get health status for this backend group
-                            health_request = compute_client.regionBackendServices().getHealth(
-                                project=project,
-                                region=region,
-                                backendService=service_name,
-                                body={"group": backend_group}
-                            )
-                            health_response = health_request.execute()
-                            
-                            # Check for incomplete health response
-                            if health_response == {"kind": "compute#backendServiceGroupHealth"}:
-                                logger.warning(f"Incomplete health response for backend {backend_group} "
-                                             f"in service {service_name} ({project}/{region})")
-                                healthy = False
-                                service_healthy = False
-                                details["unhealthy_backends"].append({
-                                    "service": service_name,
-                                    "backend": backend_group,
-                                    "reason": "incomplete_health_response",
-                                    "health_state": "UNKNOWN"
-                                })
-                                continue
-                            
-                            # Check individual instance health within the backend
-                            health_statuses = health_response.get('healthStatus', [])
-                            
-                            if not health_statuses:
-                                logger.warning(f"No health status returned for backend {backend_group} "
-                                             f"in service {service_name}")
-                                healthy = False
-                                service_healthy = False
-                                details["unhealthy_backends"].append({
-                                    "service": service_name,
-                                    "backend": backend_group,
-                                    "reason": "no_health_status",
-                                    "health_state": "UNKNOWN"
-                                })
-                                continue
-                            
-                            # Evaluate health of all instances in this backend
-                            backend_healthy = True
-                            for health_status in health_statuses:
-                                instance_health = health_status.get('healthState')
-                                instance = health_status.get('instance', 'unknown')
-                                
-                                if instance_health != HEALTHY_STATE:
-                                    logger.warning(f"Unhealthy instance {instance} in backend {backend_group} "
-                                                 f"of service {service_name} ({project}/{region}): {instance_health}")
-                                    
-                                    healthy = False
-                                    service_healthy = False
-                                    backend_healthy = False
-                                    
-                                    details["unhealthy_backends"].append({
-                                        "service": service_name,
-                                        "backend": backend_group,
-                                        "instance": instance,
-                                        "health_state": instance_health,
-                                        "reason": "unhealthy_instance"
-                                    })
-                            
-                            if backend_healthy:
-                                details["healthy_backends"] += 1
-                                logger.debug(f"Backend {backend_group} in service {service_name} is healthy")
-                            
-                        except HttpError as e:
-                            logger.warning(f"HTTP error getting health for backend {backend_group} "
-                                         f"in service {service_name}: {e}")
-                            healthy = False
-                            service_healthy = False
-                            details["unhealthy_backends"].append({
-                                "service": service_name,
-                                "backend": backend_group,
-                                "reason": f"api_error_http_{e.resp.status}",
-                                "error_message": str(e)
-                            })
-                        
-                        except Exception as e:
-                            logger.warning(f"Unexpected error getting health for backend {backend_group} "
-                                         f"in service {service_name}: {e}")
-                            healthy = False
-                            service_healthy = False
-                            details["unhealthy_backends"].append({
-                                "service": service_name,
-                                "backend": backend_group,
-                                "reason": "unexpected_error",
-                                "error_message": str(e)
-                            })
-                    
-                    # Track services with issues for debugging
-                    if not service_healthy:
-                        details["services_with_issues"].append({
-                            "service": service_name,
-                            "backend_count": service_backend_count
-                        })
-                        logger.debug(f"Service {service_name} has unhealthy backends")
-                    else:
-                        logger.debug(f"Service {service_name} is healthy ({service_backend_count} backends)")
-                
                 # Log final health status
                 if healthy:
                     logger.info(f"All backend services healthy in {project}/{region} "
@@ -633,6 +823,9 @@ def backend_services_healthy(project: str,
                               f"{details['backend_services_checked']} services)")
                 else:
                     unhealthy_count = len(details["unhealthy_backends"])
+                    if summary is not None:
+                        unhealthy_count = (summary.instance_count + unhealthy_count
+                                           - len(summary.entries))
                     logger.warning(f"Backend services unhealthy in {project}/{region}: "
                                  f"{unhealthy_count} unhealthy backends out of {details['total_backends']}")
                         
@@ -681,6 +874,318 @@ def backend_services_healthy(project: str,
     return _check
 
 
+def iter_region_backend_service_pages(project: str,
+                                      region: str,
+                                      compute_client,
+                                      fields: Optional[str] = BACKEND_SERVICE_LIST_FIELDS,
+                                      max_results: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield the regional backend services of a region one list page at a time.
+    
+    Follows nextPageToken until the last page, borrowing a client for each
+    page request only, so the caller can start work on a page (and use a
+    pooled client for it) before the next page is requested. Pages that come
+    back without items yield an empty list.
+    
+    Args:
+        project (str): GCP project ID
+        region (str): GCP region name
+        compute_client: Authenticated GCP Compute Engine client or ComputeClientPool
+        fields (str, optional): Partial response projection. Must keep
+            nextPageToken for pagination to work. Defaults to
+            BACKEND_SERVICE_LIST_FIELDS (service name and backend groups);
+            None requests full resources.
+        max_results (int, optional): Page size (maxResults, 1-500). Defaults
+            to the API default of 500.
+    
+    Yields:
+        List[Dict[str, Any]]: Backend services on the page
+    
+    Raises:
+        HttpError: If a page request fails; pages already yielded stay valid
+    """
+    page_token = None
+    
+    while True:
+        params: Dict[str, Any] = {'project': project, 'region': region}
+        if fields:
+            params['fields'] = fields
+        if max_results:
+            params['maxResults'] = max_results
+        if page_token:
+            params['pageToken'] = page_token
+        
+        with _borrow(compute_client) as compute, time_api_call("compute.regionBackendServices.list"):
+            response = compute.regionBackendServices().list(**params).execute()
+        
+        yield response.get('items', [])
+        
+        page_token = response.get('nextPageToken')
+        if not page_token:
+            return
+
+
+def _fetch_backend_health_sequential(compute_client,
+                                     project: str,
+                                     region: str,
+                                     work_items: List[Tuple[str, str]]) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    Fetch backend group health one request at a time.
+
+    Returns:
+        List of (health_response, error) tuples aligned with work_items. Exactly
+        one of the two values is set for each item.
+    """
+    results = []
+    for service_name, backend_group in work_items:
+        results.append(_get_backend_health(compute_client, project, region, service_name, backend_group))
+    return results
+
+
+def _submit_backend_health_concurrent(compute_client,
+                                      project: str,
+                                      region: str,
+                                      work_items: List[Tuple[str, str]],
+                                      executor: ThreadPoolExecutor) -> List[Future]:
+    """
+    Submit getHealth for every work item without waiting.
+
+    The executor's worker count is the max-in-flight limit. Futures are
+    returned in work item order regardless of completion order.
+    """
+    return [
+        executor.submit(run_profiled, _get_backend_health, compute_client, project, region, service_name, backend_group)
+        for service_name, backend_group in work_items
+    ]
+
+
+def _fetch_backend_health_batch(compute_client,
+                                project: str,
+                                region: str,
+                                work_items: List[Tuple[str, str]],
+                                batch_size: int) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    Fetch backend group health using Compute API batch requests.
+
+    Work items are split into chunks of batch_size and each chunk is sent as a
+    single BatchHttpRequest. Per-request results are collected through the
+    batch callback.
+
+    Raises:
+        HttpError: The first per-request HttpError, permanent codes taking
+            precedence, so the caller's existing handling applies (permanent
+            errors re-raised, transient/unknown codes -> unknown health)
+    """
+    results: List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]] = [
+        (None, RuntimeError("No response for request in batch")) for _ in work_items
+    ]
+    http_errors: List[HttpError] = []
+
+    def _on_response(request_id, response, exception):
+        index = int(request_id)
+        if isinstance(exception, HttpError):
+            http_errors.append(exception)
+        results[index] = (response, exception)
+
+    for chunk_start in range(0, len(work_items), batch_size):
+        chunk = work_items[chunk_start:chunk_start + batch_size]
+
+        with _borrow(compute_client) as compute:
+            batch = compute.new_batch_http_request(callback=_on_response)
+
+            for offset, (service_name, backend_group) in enumerate(chunk):
+                batch.add(
+                    compute.regionBackendServices().getHealth(
+                        project=project,
+                        region=region,
+                        backendService=service_name,
+                        body={"group": backend_group}
+                    ),
+                    request_id=str(chunk_start + offset)
+                )
+
+            logger.debug(f"Executing getHealth batch of {len(chunk)} requests for {project}/{region}")
+            with time_api_call("compute.batch.getHealth", calls=len(chunk)):
+                batch.execute()
+
+    if http_errors:
+        permanent = [e for e in http_errors if e.resp.status in PERMANENT_HTTP_ERRORS]
+        raise (permanent or http_errors)[0]
+
+    return results
+
+
+def _get_backend_health(compute_client,
+                        project: str,
+                        region: str,
+                        service_name: str,
+                        backend_group: str) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+    """Call getHealth for one backend group, capturing any error instead of raising."""
+    try:
+        with _borrow(compute_client) as compute:
+            health_request = compute.regionBackendServices().getHealth(
+                project=project,
+                region=region,
+                backendService=service_name,
+                body={"group": backend_group}
+            )
+            with time_api_call("compute.regionBackendServices.getHealth"):
+                return health_request.execute(), None
+    except Exception as e:
+        return None, e
+
+
+def _evaluate_backend_health(project: str,
+                             region: str,
+                             service_name: str,
+                             backend_group: str,
+                             health_response: Optional[Dict[str, Any]],
+                             error: Optional[Exception],
+                             details: Dict[str, Any],
+                             summary: Optional["_UnhealthySummary"] = None) -> bool:
+    """
+    Evaluate one getHealth result and merge it into the health check details.
+
+    Shared by every fetch strategy so that `details` (unhealthy_backends,
+    healthy_backends) has the same shape regardless of how results were fetched.
+    With a summary, unhealthy instances are aggregated into it instead of being
+    logged and listed one by one.
+
+    Returns:
+        bool: True if the backend group and all of its instances are healthy
+    """
+    if error is not None:
+        if isinstance(error, HttpError):
+            logger.warning(f"HTTP error getting health for backend {backend_group} "
+                         f"in service {service_name}: {error}")
+            details["unhealthy_backends"].append({
+                "service": service_name,
+                "backend": backend_group,
+                "reason": f"api_error_http_{error.resp.status}",
+                "error_message": str(error)
+            })
+        else:
+            logger.warning(f"Unexpected error getting health for backend {backend_group} "
+                         f"in service {service_name}: {error}")
+            details["unhealthy_backends"].append({
+                "service": service_name,
+                "backend": backend_group,
+                "reason": "unexpected_error",
+                "error_message": str(error)
+            })
+        return False
+
+    # Check for incomplete health response
+    if health_response == {"kind": "compute#backendServiceGroupHealth"}:
+        logger.warning(f"Incomplete health response for backend {backend_group} "
+                     f"in service {service_name} ({project}/{region})")
+        details["unhealthy_backends"].append({
+            "service": service_name,
+            "backend": backend_group,
+            "reason": "incomplete_health_response",
+            "health_state": "UNKNOWN"
+        })
+        return False
+
+    # Check individual instance health within the backend
+    health_statuses = health_response.get('healthStatus', [])
+
+    if not health_statuses:
+        logger.warning(f"No health status returned for backend {backend_group} "
+                     f"in service {service_name}")
+        details["unhealthy_backends"].append({
+            "service": service_name,
+            "backend": backend_group,
+            "reason": "no_health_status",
+            "health_state": "UNKNOWN"
+        })
+        return False
+
+    # Evaluate health of all instances in this backend
+    backend_healthy = True
+    for health_status in health_statuses:
+        instance_health = health_status.get('healthState')
+        instance = health_status.get('instance', 'unknown')
+
+        if instance_health != HEALTHY_STATE:
+            backend_healthy = False
+            if summary is not None:
+                summary.add(service_name, backend_group, instance, instance_health)
+                continue
+            logger.warning(f"Unhealthy instance {instance} in backend {backend_group} "
+                         f"of service {service_name} ({project}/{region}): {instance_health}")
+            details["unhealthy_backends"].append({
+                "service": service_name,
+                "backend": backend_group,
+                "instance": instance,
+                "health_state": instance_health,
+                "reason": "unhealthy_instance"
+            })
+
+    if backend_healthy:
+        details["healthy_backends"] += 1
+        logger.debug(f"Backend {backend_group} in service {service_name} is healthy")
+
+    return backend_healthy
+
+
+class _UnhealthySummary:
+    """
+    Aggregates unhealthy instances per (service, backend, health state).
+
+    Entries are appended to the health check's unhealthy_backends list when
+    first seen, so they keep the per-instance entry keys and list position.
+    """
+
+    def __init__(self, unhealthy_backends: List[Dict[str, Any]], sample_size: int):
+        self.unhealthy_backends = unhealthy_backends
+        self.sample_size = sample_size
+        self.entries: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self.instance_count = 0
+        self._instances = set()
+
+    def add(self, service_name: str, backend_group: str, instance: str, health_state: str) -> None:
+        key = (service_name, backend_group, health_state)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = {
+                "service": service_name,
+                "backend": backend_group,
+                "instance": instance,
+                "health_state": health_state,
+                "reason": "unhealthy_instance",
+                "instance_count": 0,
+                "sample_instances": []
+            }
+            self.entries[key] = entry
+            self.unhealthy_backends.append(entry)
+        entry["instance_count"] += 1
+        if len(entry["sample_instances"]) < self.sample_size:
+            entry["sample_instances"].append(instance)
+        self.instance_count += 1
+        self._instances.add((service_name, backend_group, instance, health_state))
+
+    def signature(self) -> int:
+        """Order-independent identity of the unhealthy instance set."""
+        return hash(frozenset(self._instances))
+
+    def log(self, project: str, region: str, changed: bool) -> None:
+        """One warning per entry when the set changed, otherwise a DEBUG note."""
+        if not self.entries:
+            if changed:
+                logger.info(f"No unhealthy instances remain in {project}/{region}")
+            return
+        if not changed:
+            logger.debug(f"Unhealthy instance set unchanged in {project}/{region} "
+                         f"({self.instance_count} instances)")
+            return
+        for entry in self.entries.values():
+            more = entry["instance_count"] - len(entry["sample_instances"])
+            samples = ", ".join(entry["sample_instances"]) + (f" and {more} more" if more else "")
+            logger.warning(f"{entry['instance_count']} {entry['health_state']} instances in backend "
+                           f"{entry['backend']} of service {entry['service']} ({project}/{region}): {samples}")
+
+
 def router_bgp_sessions_healthy(project: str,
                               region: str,
                               router: str,
@@ -718,7 +1223,7 @@ def router_bgp_sessions_healthy(project: str,
         project (str): GCP project ID containing the Cloud Router
         region (str): GCP region where the router is located
         router (str): Name of the Cloud Router to monitor
-        compute_client: Authenticated GCP Compute Engine client
+        compute_client: Authenticated GCP Compute Engine client or ComputeClientPool
         structured_logger (StructuredEventLogger, optional): Logger for structured events
         
     Returns:
@@ -804,12 +1309,14 @@ def router_bgp_sessions_healthy(project: str,
         try:
             # Query Cloud Router status including BGP peer information
             logger.debug(f"Getting router status for {router}")
-            status_request = compute_client.routers().getRouterStatus(
-                project=project,
-                region=region,
-                router=router
-            )
-            status_response = status_request.execute()
+            with _borrow(compute_client) as compute:
+                status_request = compute.routers().getRouterStatus(
+                    project=project,
+                    region=region,
+                    router=router
+                )
+                with time_api_call("compute.routers.getRouterStatus"):
+                    status_response = status_request.execute()
             
             # Extract BGP peer status from router status response
             result = status_response.get('result', {})
@@ -906,7 +1413,8 @@ def update_bgp_advertisement(project: str,
                            prefix: str,
                            compute_client,
                            advertise: bool = True,
-                           structured_logger: Optional[StructuredEventLogger] = None) -> Callable[[], bool]:
+                           structured_logger: Optional[StructuredEventLogger] = None,
+                           operation_tracker: Optional[OperationTracker] = None) -> Callable[[], bool]:
     """
     Create a function that manages BGP route advertisements on a Cloud Router.
     
@@ -934,15 +1442,23 @@ def update_bgp_advertisement(project: str,
         3. If change needed, update advertised IP ranges list
         4. Apply changes via router patch operation
         5. Log operation with tracking ID for audit
+
+    Multiple Prefixes:
+        This is a single-prefix wrapper around reconcile_bgp_advertisements().
+        When several prefixes on the same router change together, call
+        reconcile_bgp_advertisements() directly so the router is read once
+        and patched at most once.
     
     Args:
         project (str): GCP project ID containing the Cloud Router
         region (str): GCP region where the router is located
         router (str): Name of the Cloud Router to modify
         prefix (str): IP prefix to advertise or withdraw (CIDR notation, e.g., '10.0.0.0/24')
-        compute_client: Authenticated GCP Compute Engine client
+        compute_client: Authenticated GCP Compute Engine client or ComputeClientPool
         advertise (bool): True to advertise the prefix, False to withdraw it
         structured_logger (StructuredEventLogger, optional): Logger for structured events
+        operation_tracker (OperationTracker, optional): Follows the patch
+            operation to completion in the background
         
     Returns:
         Callable[[], bool]: Function that returns True if operation succeeded,
@@ -999,7 +1515,10 @@ def update_bgp_advertisement(project: str,
         - Insufficient permissions: Permanent error, re-raised
         
     BGP Propagation:
-        - Local router update: Immediate (operation completion)
+        - Local router update: When the patch operation reaches DONE. The
+          closure returns once the patch is submitted; pass an
+          OperationTracker to learn the real outcome and propagation time
+          on a later cycle
         - BGP peer propagation: Seconds to minutes depending on network
         - Global route table update: Minutes depending on internet routing
         - Monitor BGP session status to confirm propagation
@@ -1025,162 +1544,312 @@ def update_bgp_advertisement(project: str,
         raise ValueError("Router name cannot be empty")
     if not prefix:
         raise ValueError("IP prefix cannot be empty")
-    
-    # Validate IP prefix format (basic validation)
-    if '/' not in prefix:
-        raise ValueError(f"IP prefix must be in CIDR format (e.g., '10.0.0.0/24'), got: {prefix}")
-    
-    def _update() -> bool:
+
+    # Single-prefix update is a reconcile with a one-entry desired map
+    return reconcile_bgp_advertisements(
+        project=project,
+        region=region,
+        router=router,
+        desired={prefix: advertise},
+        compute_client=compute_client,
+        structured_logger=structured_logger,
+        operation_tracker=operation_tracker
+    )
+
+
+def reconcile_bgp_advertisements(project: str,
+                                 region: str,
+                                 router: str,
+                                 desired: Dict[str, Optional[bool]],
+                                 compute_client,
+                                 structured_logger: Optional[StructuredEventLogger] = None,
+                                 cache: Optional[ReconciliationCache] = None,
+                                 operation_tracker: Optional[OperationTracker] = None) -> Callable[[], bool]:
+    """
+    Create a function that reconciles several BGP prefix advertisements on one Cloud Router.
+
+    Applying prefixes one at a time costs a get and a patch per prefix, and two
+    back-to-back patches race each other (the second read may not see the
+    first write). This function reads the router once, computes the combined
+    diff for every prefix in `desired`, and applies it with at most one patch.
+
+    Desired State:
+        - True: Prefix must be in the router's advertisedIpRanges
+        - False: Prefix must not be advertised
+        - None: No change requested for this prefix (State 0 behaviour); it is
+          ignored and, if every entry is None, no API calls are made
+
+    Operation Flow:
+        1. Get current router configuration (one call)
+        2. Compute per-prefix actions against the current advertised ranges
+        3. If any prefix needs a change, patch the router once with the
+           combined advertised IP ranges
+        4. Log one BGP advertisement event per prefix (SUCCESS for changed
+           prefixes, NO_CHANGE for prefixes already in the desired state,
+           FAILURE for every prefix if the reconcile failed)
+
+    Reconciliation Cache:
+        With a ReconciliationCache, a read that finds the router already in the
+        desired state is recorded as confirmed (along with the advertised
+        ranges observed; the Router resource has no fingerprint). Later calls
+        with the same desired state skip the router read and log NO_CHANGE
+        until the confirmation is older than the drift-check interval. A
+        patch or failure clears the confirmation, so the next call reads again.
+
+    Operation Tracking:
+        A patch returns a regional operation that completes asynchronously;
+        success here means the patch was accepted. With an OperationTracker
+        the operation is handed off after submission and polled in the
+        background, so the caller is not blocked. Its completed, failed or
+        timed-out outcome is collected with OperationTracker.drain() and
+        carries the submitting cycle's correlation ID.
+
+    Args:
+        project (str): GCP project ID containing the Cloud Router
+        region (str): GCP region where the router is located
+        router (str): Name of the Cloud Router to modify
+        desired (Dict[str, Optional[bool]]): Desired advertisement per prefix
+            (CIDR notation), e.g. {'10.0.0.0/24': True, '10.0.1.0/24': False}
+        compute_client: Authenticated GCP Compute Engine client or ComputeClientPool
+        structured_logger (StructuredEventLogger, optional): Logger for structured events
+        cache (ReconciliationCache, optional): Confirmed-state cache used to skip
+            redundant router reads in steady state
+        operation_tracker (OperationTracker, optional): Follows the patch
+            operation to completion in the background
+
+    Returns:
+        Callable[[], bool]: Function that returns True if the router is in the
+            desired state (changed or already correct), False on failure
+
+    Raises:
+        HttpError: For permanent API errors (403, 404) that indicate configuration issues
+        ValueError: For invalid input parameters
+
+    Example:
+        reconciler = reconcile_bgp_advertisements(
+            'my-project', 'us-central1', 'my-router',
+            {'10.0.0.0/24': True, '10.0.1.0/24': False}, compute
+        )
+        success = reconciler()
+    """
+    if not project:
+        raise ValueError("Project ID cannot be empty")
+    if not region:
+        raise ValueError("Region cannot be empty")
+    if not router:
+        raise ValueError("Router name cannot be empty")
+    if not desired:
+        raise ValueError("Desired prefix map cannot be empty")
+
+    for prefix in desired:
+        if not prefix:
+            raise ValueError("IP prefix cannot be empty")
+        # Validate IP prefix format (basic validation)
+        if '/' not in prefix:
+            raise ValueError(f"IP prefix must be in CIDR format (e.g., '10.0.0.0/24'), got: {prefix}")
+
+    def _reconcile() -> bool:
         """
-        Internal BGP advertisement update function that performs the router modification.
+        Internal reconcile function that performs the single read-modify-write.
 
         Returns:
-            bool: True if operation succeeded or no change was needed,
-                  False if operation failed
+            bool: True if the operation succeeded or no change was needed,
+                  False if the operation failed
         """
-        # Handle None (no change requested) - State 0 failsafe behavior
-        # None means "maintain current state" - no BGP updates should be performed
-        if advertise is None:
-            logger.debug(f"No BGP advertisement change requested for {prefix} on router {router} "
-                        f"(advertise=None indicates State 0 or no-change scenario)")
+        # Prefixes with None are "maintain current state" - State 0 failsafe behavior
+        requested = {prefix: advertise for prefix, advertise in desired.items() if advertise is not None}
+        for prefix, advertise in desired.items():
+            if advertise is None:
+                logger.debug(f"No BGP advertisement change requested for {prefix} on router {router} "
+                            f"(advertise=None indicates State 0 or no-change scenario)")
+        if not requested:
             return True  # No-op is considered success
 
+        cache_key = f"bgp:{project}/{region}/{router}"
+        desired_state = tuple(sorted(requested.items()))
+
+        # Skip the read when this exact state was confirmed within the drift-check interval
+        if cache is not None and cache.should_skip(cache_key, desired_state):
+            logger.debug(f"Router {router} confirmed in desired state, skipping read until next drift check")
+            if structured_logger:
+                for prefix, advertise in requested.items():
+                    structured_logger.log_bgp_advertisement(
+                        project=project,
+                        region=region,
+                        router=router,
+                        prefix=prefix,
+                        action="advertise" if advertise else "withdraw",
+                        result=ActionResult.NO_CHANGE,
+                        duration_ms=0
+                    )
+            return True
+
         start_time = time.time()
         success = False
         operation_id = None
         error_message = None
-        action = "advertise" if advertise else "withdraw"
-        action_needed = False
+        changed_prefixes: List[str] = []
+        current_prefixes = set()
+
+        logger.debug(f"Starting BGP advertisement reconcile on router {router}: "
+                    + ", ".join(f"{'advertise' if adv else 'withdraw'} {p}" for p, adv in requested.items()))
 
-        logger.debug(f"Starting BGP advertisement update: {action} {prefix} on router {router}")
-        
         try:
-            # Step 1: Get current router configuration
+            # Step 1: Get current router configuration (single read)
             logger.debug(f"Getting current configuration for router {router}")
-            router_request = compute_client.routers().get(
-                project=project,
-                region=region,
-                router=router
-            )
-            router_data = router_request.execute()
-            
+            with _borrow(compute_client) as compute:
+                router_request = compute.routers().get(
+                    project=project,
+                    region=region,
+                    router=router
+                )
+                with time_api_call("compute.routers.get"):
+                    router_data = router_request.execute()
+
             # Extract current advertised IP ranges
             bgp_config = router_data.get('bgp', {})
             current_ranges = bgp_config.get('advertisedIpRanges', [])
-            
-            # Check if prefix is already in the current configuration
-            prefix_exists = any(ip_range.get('range') == prefix for ip_range in current_ranges)
-            
-            logger.debug(f"Router {router} currently advertises {len(current_ranges)} prefixes, "
-                        f"target prefix {prefix} {'exists' if prefix_exists else 'does not exist'}")
-            
-            # Step 2: Determine if action is needed
-            if advertise and not prefix_exists:
-                # Need to add prefix
-                new_ranges = current_ranges + [{'range': prefix}]
-                action_needed = True
-                logger.info(f"Adding BGP advertisement for prefix {prefix} on router {router}")
-                
-            elif not advertise and prefix_exists:
-                # Need to remove prefix
-                new_ranges = [r for r in current_ranges if r.get('range') != prefix]
-                action_needed = True
-                logger.info(f"Removing BGP advertisement for prefix {prefix} on router {router}")
-                
-            else:
-                # No action needed - prefix already in desired state
-                if advertise:
+            current_prefixes = {ip_range.get('range') for ip_range in current_ranges}
+
+            logger.debug(f"Router {router} currently advertises {len(current_ranges)} prefixes")
+
+            # Step 2: Compute the combined diff for all requested prefixes
+            to_add = []
+            to_remove = set()
+            for prefix, advertise in requested.items():
+                prefix_exists = prefix in current_prefixes
+
+                if advertise and not prefix_exists:
+                    to_add.append({'range': prefix})
+                    changed_prefixes.append(prefix)
+                    logger.info(f"Adding BGP advertisement for prefix {prefix} on router {router}")
+
+                elif not advertise and prefix_exists:
+                    to_remove.add(prefix)
+                    changed_prefixes.append(prefix)
+                    logger.info(f"Removing BGP advertisement for prefix {prefix} on router {router}")
+
+                elif advertise:
                     logger.debug(f"Prefix {prefix} already advertised on router {router} - no change needed")
                 else:
                     logger.debug(f"Prefix {prefix} not advertised on router {router} - no change needed")
-                success = True
-                action_needed = False
 
-            # Step 3: Apply changes if needed
-            if action_needed:
+            if changed_prefixes and cache is not None and cache.was_confirmed(cache_key, desired_state):
+                logger.warning(f"Out-of-band change detected on router {router}: previously confirmed "
+                              f"advertisements drifted ({', '.join(changed_prefixes)})")
+                cache.record_drift(cache_key)
+
+            # Step 3: Apply all changes with a single patch
+            if changed_prefixes:
+                new_ranges = [r for r in current_ranges if r.get('range') not in to_remove] + to_add
+
                 # Prepare router patch body with updated advertised IP ranges
                 patch_body = {
                     'bgp': {
                         'advertisedIpRanges': new_ranges
                     }
                 }
-                
-                logger.debug(f"Updating router {router} with {len(new_ranges)} advertised prefixes")
-                
+
+                logger.debug(f"Updating router {router} with {len(new_ranges)} advertised prefixes "
+                            f"({len(changed_prefixes)} changed)")
+
                 # Apply the router configuration update
-                patch_request = compute_client.routers().patch(
-                    project=project,
-                    region=region,
-                    router=router,
-                    body=patch_body
-                )
-                operation_response = patch_request.execute()
-                
+                with _borrow(compute_client) as compute:
+                    patch_request = compute.routers().patch(
+                        project=project,
+                        region=region,
+                        router=router,
+                        body=patch_body
+                    )
+                    with time_api_call("compute.routers.patch"):
+                        operation_response = patch_request.execute()
+
                 # Extract operation ID for tracking
                 operation_id = operation_response.get('name', 'unknown')
                 operation_status = operation_response.get('status', 'unknown')
-                
-                logger.info(f"BGP advertisement update initiated: {action} prefix {prefix} "
-                           f"on router {router} [{project}/{region}] (operation: {operation_id})")
-                
-                # Operation submitted successfully
-                success = True
-                
+
+                for prefix in changed_prefixes:
+                    action = "advertise" if requested[prefix] else "withdraw"
+                    logger.info(f"BGP advertisement update initiated: {action} prefix {prefix} "
+                               f"on router {router} [{project}/{region}] (operation: {operation_id})")
+
                 # Log operation details for debugging
                 logger.debug(f"Operation {operation_id} status: {operation_status}")
                 if 'warnings' in operation_response:
                     for warning in operation_response['warnings']:
                         logger.warning(f"GCP operation warning: {warning}")
-                
-            else:
-                # No operation needed
-                success = True
-                
+
+                # Follow the operation to completion without blocking this cycle
+                if operation_tracker is not None:
+                    operation_tracker.track(
+                        project=project,
+                        region=region,
+                        operation=operation_response,
+                        resource=router,
+                        prefixes=tuple(changed_prefixes),
+                        correlation_id=structured_logger.current_correlation_id() if structured_logger else None
+                    )
+
+            # Operation submitted successfully (or no change needed)
+            success = True
+
         except HttpError as e:
             error_message = str(e)
-            
+
             # Handle different types of HTTP errors
             if e.resp.status in PERMANENT_HTTP_ERRORS:
-                logger.error(f"Permanent error updating BGP advertisement for prefix {prefix} "
-                           f"on router {router} in {project}/{region}: {e}")
+                logger.error(f"Permanent error updating BGP advertisements "
+                           f"({', '.join(requested)}) on router {router} in {project}/{region}: {e}")
                 raise  # Re-raise permanent errors for immediate attention
             else:
-                logger.warning(f"Transient HTTP error updating BGP advertisement for prefix {prefix} "
-                             f"on router {router} in {project}/{region}: {e}")
-                
+                logger.warning(f"Transient HTTP error updating BGP advertisements "
+                             f"({', '.join(requested)}) on router {router} in {project}/{region}: {e}")
+
         except Exception as e:
             error_message = str(e)
-            logger.exception(f"Unexpected error updating BGP advertisement for prefix {prefix} "
-                           f"on router {router} in {project}/{region}: {e}")
-        
+            logger.exception(f"Unexpected error updating BGP advertisements "
+                           f"({', '.join(requested)}) on router {router} in {project}/{region}: {e}")
+
         finally:
-            # Always log structured event for audit trail and monitoring
+            # Only a read that found nothing to change confirms the state; after a
+            # patch or failure the next call reads the router again
+            if cache is not None:
+                if success and not changed_prefixes:
+                    cache.confirm(cache_key, desired_state,
+                                  observed=tuple(sorted(p for p in current_prefixes if p)))
+                else:
+                    cache.invalidate(cache_key)
+
+            # Always log one structured event per prefix for audit trail and monitoring
             if structured_logger:
                 duration_ms = int((time.time() - start_time) * 1000)
-                
-                # Determine result status for structured logging
-                if success and action_needed:
-                    result = ActionResult.SUCCESS
-                elif success and not action_needed:
-                    result = ActionResult.NO_CHANGE
-                else:
-                    result = ActionResult.FAILURE
-                
-                structured_logger.log_bgp_advertisement(
-                    project=project,
-                    region=region,
-                    router=router,
-                    prefix=prefix,
-                    action=action,
-                    result=result,
-                    duration_ms=duration_ms,
-                    operation_id=operation_id,
-                    error_message=error_message
-                )
-        
+
+                for prefix, advertise in requested.items():
+                    action_needed = prefix in changed_prefixes
+
+                    # Determine result status for structured logging
+                    if success and action_needed:
+                        result = ActionResult.SUCCESS
+                    elif success and not action_needed:
+                        result = ActionResult.NO_CHANGE
+                    else:
+                        result = ActionResult.FAILURE
+
+                    structured_logger.log_bgp_advertisement(
+                        project=project,
+                        region=region,
+                        router=router,
+                        prefix=prefix,
+                        action="advertise" if advertise else "withdraw",
+                        result=result,
+                        duration_ms=duration_ms,
+                        operation_id=operation_id if action_needed else None,
+                        error_message=error_message
+                    )
+
         return success
-    
-    return _update
+
+    return _reconcile
 
 
 # Utility functions for common GCP operations and validation
@@ -1215,7 +1884,7 @@ def get_router_advertised_prefixes(project: str, region: str, router: str, compu
         project (str): GCP project ID
         region (str): GCP region name
         router (str): Cloud Router name
-        compute_client: Authenticated GCP Compute Engine client
+        compute_client: Authenticated GCP Compute Engine client or ComputeClientPool
         
     Returns:
         List[str]: List of currently advertised IP prefixes
@@ -1228,9 +1897,10 @@ def get_router_advertised_prefixes(project: str, region: str, router: str, compu
         print(f"Currently advertising: {prefixes}")
     """
     try:
-        router_data = compute_client.routers().get(
-            project=project, region=region, router=router
-        ).execute()
+        with _borrow(compute_client) as compute, time_api_call("compute.routers.get"):
+            router_data = compute.routers().get(
+                project=project, region=region, router=router
+            ).execute()
         
         advertised_ranges = router_data.get('bgp', {}).get('advertisedIpRanges', [])
         return [ip_range.get('range') for ip_range in advertised_ranges if ip_range.get('range')]
@@ -1247,7 +1917,7 @@ def get_backend_service_summary(project: str, region: str, compute_client) -> Di
     Args:
         project (str): GCP project ID  
         region (str): GCP region name
-        compute_client: Authenticated GCP Compute Engine client
+        compute_client: Authenticated GCP Compute Engine client or ComputeClientPool
         
     Returns:
         Dict[str, Any]: Summary containing service count, backend count, etc.
@@ -1257,17 +1927,17 @@ def get_backend_service_summary(project: str, region: str, compute_client) -> Di
         print(f"Found {summary['service_count']} backend services")
     """
     try:
-        response = compute_client.regionBackendServices().list(
-            project=project, region=region
-        ).execute()
+        service_names = []
+        total_backends = 0
         
-        services = response.get('items', [])
-        total_backends = sum(len(service.get('backends', [])) for service in services)
+        for services in iter_region_backend_service_pages(project, region, compute_client):
+            service_names.extend(service['name'] for service in services)
+            total_backends += sum(len(service.get('backends', [])) for service in services)
         
         return {
-            'service_count': len(services),
+            'service_count': len(service_names),
             'total_backends': total_backends,
-            'services': [service['name'] for service in services]
+            'services': service_names
         }
         
     except Exception as e:
@@ -1276,7 +1946,6 @@ def get_backend_service_summary(project: str, region: str, compute_client) -> Di
 
 
 # Module constants for configuration and limits
-GCP_OPERATION_POLL_INTERVAL = 5          # Seconds between operation status polls
 MAX_ADVERTISED_PREFIXES = 100            # Practical limit for advertised prefixes
 DEFAULT_BGP_PEER_TIMEOUT = 30             # Seconds to wait for BGP peer status
 
@@ -0,0 +1,221 @@
+"""
+Background Compression of Rotated Log Files
+
+This module compresses rotated log segments on a background thread so that
+long log histories fit on small disks without the logging path ever waiting
+on a compressor. It provides the codecs (gzip, and zstd when the optional
+zstandard package is installed) and the shared compressor thread used by the
+rotating handlers in logging_setup.
+
+Codecs:
+    - gzip (standard library): always available, files end in .gz
+    - zstd (optional dependency, `pip install zstandard`): faster and smaller,
+      files end in .zst; falls back to gzip when zstandard is missing
+
+    Compression is opt-in: LOG_COMPRESSION defaults to none, which keeps the
+    plain rotation of logging.handlers. Set it to gzip or zstd to enable it.
+
+Compression Lifecycle:
+    1. The handler rotates as usual: backups are shifted and the live file is
+       renamed to <file>.1 (plain renames, so rotation stays atomic)
+    2. A job is queued for the compressor thread; emit() returns immediately
+    3. The compressor writes <file>.<n>.<ext>.tmp from the rotated segment and
+       renames it into place, then removes the uncompressed segment
+
+    A segment that is shifted or deleted by a later rotation while it is being
+    compressed is detected by the handler (see logging_setup) and the partial
+    output is discarded. Readers always see either the complete uncompressed
+    segment or the complete compressed one; log_reader prefers the
+    uncompressed file if both briefly exist.
+
+Usage Example:
+    from .log_compression import get_log_compressor, open_log_binary, open_log_text
+
+    get_log_compressor().submit(job)          # job() runs on the compressor thread
+    with open_log_text('/var/log/daemon.json.2.gz') as f:
+        ...
+    with open_log_binary('/var/log/daemon.json.2.gz') as f:
+        f.seek(offset)                         # offset into the decompressed content
+
+Thread Safety:
+    submit() may be called from any thread and never blocks. Jobs run one at a
+    time on a single daemon thread shared by every handler in the process.
+
+Author: Nathan Bray
+Version: 1.0
+Last Modified: 2025
+"""
+
+import gzip
+import io
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from typing import IO, Any, Callable, Dict, Optional
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency
+    zstandard = None
+
+# Logger for compression operations - uses environment variable for consistency
+logger = logging.getLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
+
+# Rotated log compression codecs (LOG_COMPRESSION)
+LOG_COMPRESSION_NONE = 'none'
+LOG_COMPRESSION_GZIP = 'gzip'
+LOG_COMPRESSION_ZSTD = 'zstd'
+LOG_COMPRESSION_CODECS = (LOG_COMPRESSION_NONE, LOG_COMPRESSION_GZIP, LOG_COMPRESSION_ZSTD)
+
+# File extension written by each codec
+COMPRESSED_EXTENSIONS = {LOG_COMPRESSION_GZIP: '.gz', LOG_COMPRESSION_ZSTD: '.zst'}
+
+# Bytes copied per read while compressing
+COPY_CHUNK_SIZE = 256 * 1024
+
+
+def resolve_codec(codec: str) -> str:
+    """
+    Return the codec that will actually be used.
+
+    zstd falls back to gzip when the zstandard package is not installed.
+    """
+    if codec == LOG_COMPRESSION_ZSTD and zstandard is None:
+        logger.warning("LOG_COMPRESSION=zstd requires the zstandard package; using gzip")
+        return LOG_COMPRESSION_GZIP
+    if codec not in LOG_COMPRESSION_CODECS:
+        raise ValueError(f"Unknown log compression codec: {codec}")
+    return codec
+
+
+def compress_stream(source: IO[bytes], destination: str, codec: str) -> None:
+    """
+    Compress an open binary stream into a file.
+
+    Args:
+        source (IO[bytes]): Uncompressed data, read to the end
+        destination (str): Compressed output file
+        codec (str): "gzip" or "zstd"
+    """
+    if codec == LOG_COMPRESSION_ZSTD:
+        with open(destination, 'wb') as out:
+            zstandard.ZstdCompressor().copy_stream(source, out, read_size=COPY_CHUNK_SIZE)
+    else:
+        with gzip.open(destination, 'wb', compresslevel=6) as out:
+            shutil.copyfileobj(source, out, COPY_CHUNK_SIZE)
+
+
+def is_compressed(path: str) -> bool:
+    """True for .gz and .zst files."""
+    return path.endswith(tuple(COMPRESSED_EXTENSIONS.values()))
+
+
+def open_log_binary(path: str) -> IO[bytes]:
+    """
+    Open a log file for binary reading, transparently decompressing .gz and .zst files.
+
+    Offsets and seek() on compressed files refer to the decompressed content.
+    """
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    if path.endswith('.zst'):
+        if zstandard is None:
+            raise OSError(f"Cannot read {path}: the zstandard package is not installed")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+    return open(path, 'rb')
+
+
+def open_log_text(path: str) -> IO[str]:
+    """Open a log file for text reading, transparently decompressing .gz and .zst files."""
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    if path.endswith('.zst'):
+        return io.TextIOWrapper(open_log_binary(path), encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+class BackgroundCompressor:
+    """
+    Single worker thread running compression jobs in submission order.
+
+    Jobs are plain callables; failures are logged and counted, never raised
+    into the submitting thread.
+    """
+
+    def __init__(self):
+        self._queue: "queue.Queue[Optional[Callable[[], Any]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._busy_time = 0.0
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="log-compressor", daemon=True)
+                self._thread.start()
+
+    def submit(self, job: Callable[[], Any]) -> None:
+        """Queue a job without waiting for it."""
+        self._ensure_started()
+        with self._lock:
+            self._submitted += 1
+        self._queue.put(job)
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                start = time.monotonic()
+                try:
+                    job()
+                    with self._lock:
+                        self._completed += 1
+                except Exception as e:
+                    with self._lock:
+                        self._failed += 1
+                    logger.warning(f"Log compression failed: {e}")
+                with self._lock:
+                    self._busy_time += time.monotonic() - start
+            finally:
+                self._queue.task_done()
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """
+        Wait until every submitted job has run.
+
+        Returns:
+            bool: True if the queue drained within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of compressor counters."""
+        with self._lock:
+            return {
+                "pending": self._submitted - self._completed - self._failed,
+                "completed": self._completed,
+                "failed": self._failed,
+                "busy_time_ms": int(self._busy_time * 1000)
+            }
+
+
+# Process-wide compressor shared by every rotating handler
+_compressor = BackgroundCompressor()
+
+
+def get_log_compressor() -> BackgroundCompressor:
+    """Return the process-wide background compressor."""
+    return _compressor
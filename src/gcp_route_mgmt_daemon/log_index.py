@@ -0,0 +1,444 @@
+"""
+Sidecar Index for Structured Event Logs
+
+This module answers "what happened in cycle hc-..." without scanning the whole
+structured log history. It keeps a sidecar index next to the structured log
+(<file>.idx) that maps correlation IDs, event types and time buckets to the
+byte offsets of the matching events in every segment (the live file and its
+rotated, possibly compressed backups). Queries read only the matching events:
+uncompressed segments are memory-mapped and sliced at the recorded offsets,
+compressed segments are decompressed forward to each offset.
+
+Segments:
+    Rotation renames segments (file -> file.1 -> file.2 ...) and background
+    compression replaces them (file.1 -> file.1.gz), so index entries are keyed
+    by a fingerprint of the segment's first bytes (up to 4 KiB of decompressed
+    content) rather than by file name. Offsets refer to the decompressed
+    content and stay valid across renames and compression.
+
+Incremental Updates:
+    Each entry records how many bytes of its segment have been indexed. An
+    update indexes only the bytes appended since (the live file) and segments
+    it has not seen; entries of segments that rotated out are dropped. An
+    incomplete last event is left for the next update.
+
+Supported Files:
+    JSON Lines (STRUCTURED_LOG_FORMAT=jsonl, flight recorder dumps) and the
+    indented JSON array written by StructuredArrayHandler, optionally .gz/.zst.
+
+Usage Example:
+    from .log_index import LogIndex
+
+    index = LogIndex('/var/log/radius_healthcheck_daemon_structured.json')
+    for event in index.query(correlation_id='hc-1761998400-3f2a9c1e'):
+        print(event['event_type'], event['result'])
+
+Command Line:
+    gcp-route-mgmt logs [FILE] [--correlation-id ID] [--event-type TYPE]
+                        [--since TS] [--until TS] [--tail N] [--rebuild] [--stats]
+    prints matching events as JSON Lines (updating the index first).
+
+Author: Nathan Bray
+Version: 1.0
+Last Modified: 2025
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import mmap
+import os
+import sys
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from .log_compression import is_compressed, open_log_binary
+from .log_reader import rotated_log_files
+
+# Logger for log index operations - uses environment variable for consistency
+logger = logging.getLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
+
+# Sidecar index file: <structured log file><INDEX_SUFFIX>
+INDEX_SUFFIX = '.idx'
+INDEX_VERSION = 1
+
+# Decompressed bytes at the start of a segment used to recognise it after rotation
+FINGERPRINT_BYTES = 4096
+
+# Width of the time buckets used for --since/--until lookups
+DEFAULT_TIME_BUCKET_SECONDS = 300
+
+# Bytes read per chunk when scanning compressed segments
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Segment formats, detected from the first non-whitespace byte
+_FORMAT_ARRAY = 'array'
+_FORMAT_JSONL = 'jsonl'
+
+
+def _fingerprint(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+def _read_prefix(path: str, length: int) -> bytes:
+    """First `length` decompressed bytes of a segment (fewer if it is shorter)."""
+    parts = []
+    remaining = length
+    with open_log_binary(path) as f:
+        while remaining > 0:
+            chunk = f.read(remaining)
+            if not chunk:
+                break
+            parts.append(chunk)
+            remaining -= len(chunk)
+    return b''.join(parts)
+
+
+def _mapped_lines(mm: mmap.mmap, start: int) -> Iterator[Tuple[int, bytes, bool]]:
+    """Yield (offset, line, terminated) from a memory-mapped segment."""
+    size = len(mm)
+    pos = start
+    while pos < size:
+        end = mm.find(b'\n', pos)
+        if end < 0:
+            yield pos, mm[pos:size], False
+            return
+        yield pos, mm[pos:end + 1], True
+        pos = end + 1
+
+
+def _stream_lines(f, start: int) -> Iterator[Tuple[int, bytes, bool]]:
+    """Yield (offset, line, terminated) from a decompressing stream."""
+    if start:
+        f.seek(start)
+    pos = start
+    pending = b''
+    while True:
+        chunk = f.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        lines = (pending + chunk).split(b'\n')
+        pending = lines.pop()
+        for line in lines:
+            yield pos, line + b'\n', True
+            pos += len(line) + 1
+    if pending:
+        yield pos, pending, False
+
+
+def _scan_events(lines: Iterable[Tuple[int, bytes, bool]],
+                 fmt: str) -> Iterator[Tuple[int, int, int, Dict[str, Any]]]:
+    """
+    Yield (offset, length, end, event) for each complete event.
+
+    `end` is where indexing resumes after the event. Damaged JSON Lines are
+    skipped; scanning stops at an incomplete event at the end of the data.
+    """
+    if fmt == _FORMAT_JSONL:
+        for pos, line, terminated in lines:
+            body = line.strip()
+            if not body.startswith(b'{'):
+                continue
+            try:
+                event = json.loads(body)
+            except ValueError:
+                if not terminated:
+                    return
+                continue
+            yield pos + line.index(b'{'), len(body), pos + len(line), event
+        return
+
+    # JSON array: an event starts on a line beginning with "{" and, when indented,
+    # ends on the next line beginning with "}" (nested lines are always indented)
+    start = None
+    parts: List[bytes] = []
+    for pos, line, terminated in lines:
+        if start is None:
+            stripped = line.lstrip()
+            if not stripped.startswith(b'{'):
+                continue
+            start = pos + len(line) - len(stripped)
+            parts = [stripped]
+            closes = stripped.rstrip().rstrip(b',').endswith(b'}')
+        else:
+            parts.append(line)
+            closes = line.startswith(b'}')
+        if not closes:
+            continue
+        body = b''.join(parts).rstrip().rstrip(b',')
+        try:
+            event = json.loads(body)
+        except ValueError:
+            if not terminated:
+                return
+            start = None
+            continue
+        yield start, len(body), start + len(body), event
+        start = None
+
+
+class LogIndex:
+    """
+    Sidecar index over a structured log and its rotated backups.
+
+    Attributes:
+        path (str): Live structured log file
+        index_path (str): Sidecar index file
+        bucket_seconds (int): Width of the time buckets
+    """
+
+    def __init__(self, path: str, index_path: Optional[str] = None,
+                 bucket_seconds: int = DEFAULT_TIME_BUCKET_SECONDS):
+        if bucket_seconds < 1:
+            raise ValueError("bucket_seconds must be >= 1")
+        self.path = path
+        self.index_path = index_path or f"{path}{INDEX_SUFFIX}"
+        self.bucket_seconds = bucket_seconds
+        self._entries: List[Dict[str, Any]] = self._load()
+        self._segments: List[Tuple[str, Dict[str, Any]]] = []
+
+    def _load(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable log index {self.index_path}: {e}")
+            return []
+        if data.get('version') != INDEX_VERSION or data.get('bucket_seconds') != self.bucket_seconds:
+            return []
+        return data.get('segments', [])
+
+    def _save(self) -> None:
+        data = {"version": INDEX_VERSION, "bucket_seconds": self.bucket_seconds, "segments": self._entries}
+        temp_path = f"{self.index_path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Could not write log index {self.index_path}: {e}")
+
+    def _match_entry(self, prefix: bytes) -> Optional[Dict[str, Any]]:
+        """Entry whose fingerprint matches the segment prefix (longest fingerprint wins)."""
+        best = None
+        for entry in self._entries:
+            length = entry['fingerprint_bytes']
+            if (length <= len(prefix) and _fingerprint(prefix[:length]) == entry['fingerprint']
+                    and (best is None or length > best['fingerprint_bytes'])):
+                best = entry
+        return best
+
+    def _new_entry(self) -> Dict[str, Any]:
+        return {"fingerprint": None, "fingerprint_bytes": 0, "format": None, "indexed_bytes": 0,
+                "events": [], "correlation_id": {}, "event_type": {}, "time_bucket": {}}
+
+    def _add_event(self, entry: Dict[str, Any], offset: int, length: int, event: Dict[str, Any]) -> None:
+        number = len(entry['events'])
+        timestamp = event.get('timestamp')
+        if not isinstance(timestamp, (int, float)):
+            timestamp = None
+        entry['events'].append([offset, length, timestamp])
+
+        correlation_id = event.get('correlation_id')
+        details = event.get('details')
+        if not correlation_id and isinstance(details, dict):
+            correlation_id = details.get('correlation_id')
+        if correlation_id:
+            entry['correlation_id'].setdefault(str(correlation_id), []).append(number)
+        if event.get('event_type'):
+            entry['event_type'].setdefault(str(event['event_type']), []).append(number)
+        if timestamp is not None:
+            bucket = str(int(timestamp // self.bucket_seconds))
+            entry['time_bucket'].setdefault(bucket, []).append(number)
+
+    def _index_segment(self, path: str, entry: Dict[str, Any]) -> int:
+        """Index the bytes of a segment beyond entry['indexed_bytes']; returns events added."""
+        start = entry['indexed_bytes']
+        added = 0
+        if is_compressed(path):
+            with open_log_binary(path) as f:
+                for offset, length, end, event in _scan_events(_stream_lines(f, start), entry['format']):
+                    self._add_event(entry, offset, length, event)
+                    entry['indexed_bytes'] = end
+                    added += 1
+            return added
+
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size <= start:
+                return 0
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for offset, length, end, event in _scan_events(_mapped_lines(mm, start), entry['format']):
+                    self._add_event(entry, offset, length, event)
+                    entry['indexed_bytes'] = end
+                    added += 1
+        return added
+
+    def update(self) -> Dict[str, int]:
+        """
+        Bring the index up to date with the log and save it.
+
+        Returns:
+            Dict[str, int]: segments, events_added and segments_dropped
+        """
+        segments = []
+        events_added = 0
+        for path in rotated_log_files(self.path):
+            try:
+                prefix = _read_prefix(path, FINGERPRINT_BYTES)
+                if not prefix.strip():
+                    continue
+                entry = self._match_entry(prefix)
+                if entry is None:
+                    entry = self._new_entry()
+                if entry['format'] is None:
+                    entry['format'] = _FORMAT_ARRAY if prefix.lstrip().startswith(b'[') else _FORMAT_JSONL
+                events_added += self._index_segment(path, entry)
+            except (OSError, EOFError, ValueError) as e:
+                logger.warning(f"Could not index {path}: {e}")
+                continue
+            if not entry['indexed_bytes']:
+                continue
+            # Fingerprint only indexed content, which later appends never change
+            length = min(FINGERPRINT_BYTES, entry['indexed_bytes'], len(prefix))
+            entry['fingerprint'] = _fingerprint(prefix[:length])
+            entry['fingerprint_bytes'] = length
+            segments.append((path, entry))
+
+        kept = [entry for _, entry in segments]
+        dropped = len([entry for entry in self._entries if all(entry is not k for k in kept)])
+        self._entries = kept
+        self._segments = segments
+        self._save()
+        return {"segments": len(segments), "events_added": events_added, "segments_dropped": dropped}
+
+    def _select(self, entry: Dict[str, Any], correlation_id: Optional[str], event_type: Optional[str],
+                since: Optional[float], until: Optional[float]) -> List[int]:
+        """Event numbers of a segment matching every given filter, in write order."""
+        candidates = None
+        if correlation_id is not None:
+            candidates = set(entry['correlation_id'].get(correlation_id, ()))
+        if event_type is not None:
+            matches = set(entry['event_type'].get(event_type, ()))
+            candidates = matches if candidates is None else candidates & matches
+        if since is not None or until is not None:
+            first = None if since is None else int(since // self.bucket_seconds)
+            last = None if until is None else int(until // self.bucket_seconds)
+            matches = set()
+            for bucket, numbers in entry['time_bucket'].items():
+                bucket = int(bucket)
+                if (first is None or bucket >= first) and (last is None or bucket <= last):
+                    matches.update(numbers)
+            candidates = matches if candidates is None else candidates & matches
+
+        numbers = range(len(entry['events'])) if candidates is None else sorted(candidates)
+        events = entry['events']
+        return [n for n in numbers
+                if (since is None or events[n][2] >= since) and (until is None or events[n][2] < until)]
+
+    def _read_events(self, path: str, entry: Dict[str, Any], numbers: List[int]) -> Iterator[Dict[str, Any]]:
+        """Read the given events from a segment by offset."""
+        if not numbers:
+            return
+        events = entry['events']
+        if is_compressed(path):
+            with open_log_binary(path) as f:
+                for n in numbers:
+                    offset, length, _ = events[n]
+                    f.seek(offset)
+                    yield json.loads(f.read(length))
+            return
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for n in numbers:
+                offset, length, _ = events[n]
+                yield json.loads(mm[offset:offset + length])
+
+    def query(self, correlation_id: Optional[str] = None, event_type: Optional[str] = None,
+              since: Optional[float] = None, until: Optional[float] = None,
+              update: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Yield matching events across all segments in write order.
+
+        Args:
+            correlation_id (str, optional): Only events of this correlation ID
+            event_type (str, optional): Only events with this event_type
+            since (float, optional): Only events with timestamp >= since (Unix time)
+            until (float, optional): Only events with timestamp < until (Unix time)
+            update (bool): Index new log data first; without it only the segments
+                found by the last update() are queried
+
+        Yields:
+            Dict[str, Any]: Matching events, one at a time
+        """
+        if update or not self._segments:
+            self.update()
+        for path, entry in self._segments:
+            numbers = self._select(entry, correlation_id, event_type, since, until)
+            try:
+                yield from self._read_events(path, entry, numbers)
+            except (OSError, ValueError) as e:
+                # Segment rotated or rewritten since the update
+                logger.warning(f"Could not read indexed events from {path}: {e}")
+
+    def rebuild(self) -> Dict[str, int]:
+        """Discard the index and index every segment from the start."""
+        self._entries = []
+        return self.update()
+
+    def stats(self) -> Dict[str, Any]:
+        """Summary of the indexed segments as of the last update()."""
+        event_types: Dict[str, int] = {}
+        correlation_ids = set()
+        for _, entry in self._segments:
+            for event_type, numbers in entry['event_type'].items():
+                event_types[event_type] = event_types.get(event_type, 0) + len(numbers)
+            correlation_ids.update(entry['correlation_id'])
+        return {
+            "index_file": self.index_path,
+            "segments": [{"path": path, "events": len(entry['events']), "indexed_bytes": entry['indexed_bytes']}
+                         for path, entry in self._segments],
+            "events": sum(len(entry['events']) for _, entry in self._segments),
+            "correlation_ids": len(correlation_ids),
+            "event_types": event_types
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of `gcp-route-mgmt logs`."""
+    parser = argparse.ArgumentParser(prog="gcp-route-mgmt logs",
+                                     description="Query structured daemon events through a sidecar index")
+    parser.add_argument("path", nargs="?",
+                        default=os.getenv('STRUCTURED_LOG_FILE', '/var/log/radius_healthcheck_daemon_structured.json'),
+                        help="Structured log file (rotated backups are indexed too)")
+    parser.add_argument("--correlation-id", help="Only events of this correlation ID (e.g. hc-...)")
+    parser.add_argument("--event-type", help="Only events of this type")
+    parser.add_argument("--since", type=float, help="Only events at or after this Unix timestamp")
+    parser.add_argument("--until", type=float, help="Only events before this Unix timestamp")
+    parser.add_argument("--tail", type=int, help="Only the last N matching events")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the index from scratch")
+    parser.add_argument("--stats", action="store_true", help="Print index statistics instead of events")
+    args = parser.parse_args(argv)
+
+    index = LogIndex(args.path)
+    if args.rebuild:
+        index.rebuild()
+    if args.stats:
+        index.update()
+        sys.stdout.write(json.dumps(index.stats(), indent=2) + "\n")
+        return 0
+
+    events = index.query(correlation_id=args.correlation_id, event_type=args.event_type,
+                         since=args.since, until=args.until, update=not args.rebuild)
+    if args.tail:
+        events = deque(events, maxlen=args.tail)
+    try:
+        for event in events:
+            sys.stdout.write(json.dumps(event, separators=(',', ':')) + "\n")
+    except BrokenPipeError:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""
+Streaming Reader for Structured Event Logs
+
+This module iterates the structured events written by the daemon's structured
+log file handlers one event at a time, across the live file and its rotated
+backups, without loading any file into memory. Tools can filter or tail
+multi-GB histories in constant memory instead of json.load()-ing a whole array.
+
+Supported Files:
+    - JSON Lines (STRUCTURED_LOG_FORMAT=jsonl): one event per line; a damaged
+      line (e.g. cut short by a crash) is skipped and counted
+    - JSON array (STRUCTURED_LOG_FORMAT=array): decoded incrementally; an
+      array missing its closing bracket (daemon still running or killed) is
+      read up to its last complete event
+    - gzip (*.gz) or zstd (*.zst, needs zstandard) compressed files in either
+      format, as written by LOG_COMPRESSION
+    The format is detected per file from its first non-whitespace character.
+
+File Order:
+    iter_events() reads the rotated backups oldest first (path.N ... path.1,
+    each optionally .gz/.zst) followed by the live file, so events come out in
+    the order they were written. While a backup is being compressed in the
+    background both forms may briefly exist; the uncompressed one is read.
+
+Usage Example:
+    from .log_reader import iter_events, tail_events
+
+    for event in iter_events('/var/log/daemon_structured.jsonl',
+                             event_type='bgp_operation_result', since=time.time() - 3600):
+        print(event['details']['status'], event['duration_ms'])
+
+    for event in tail_events('/var/log/daemon_structured.jsonl', 20):
+        print(event['event_type'])
+
+Command Line:
+    python -m gcp_route_mgmt_daemon.log_reader FILE [--event-type TYPE] [--tail N]
+    prints matching events as JSON Lines.
+
+Author: Nathan Bray
+Version: 1.0
+Last Modified: 2025
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import re
+import sys
+from collections import deque
+from typing import Any, Callable, Dict, IO, Iterator, List, Optional
+from .log_compression import open_log_text
+
+# Logger for log reader operations - uses environment variable for consistency
+logger = logging.getLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
+
+# Characters read per chunk when decoding JSON array files
+READ_CHUNK_SIZE = 64 * 1024
+
+# Rotated backup suffix: .1, .2, ... optionally followed by .gz or .zst
+_ROTATED_SUFFIX = re.compile(r'^\.(\d+)(\.gz|\.zst)?$')
+
+
+def rotated_log_files(path: str, include_rotated: bool = True) -> List[str]:
+    """
+    List the files of a rotated log, oldest first.
+
+    Args:
+        path (str): Live log file path
+        include_rotated (bool): Include rotated backups (path.N, path.N.gz, path.N.zst)
+
+    Returns:
+        List[str]: Existing files ordered path.N ... path.1, path
+    """
+    files = []
+    if include_rotated:
+        backups = {}
+        for candidate in glob.glob(f"{glob.escape(path)}.*"):
+            match = _ROTATED_SUFFIX.match(candidate[len(path):])
+            if match:
+                index = int(match.group(1))
+                # Prefer the uncompressed backup while its compressed copy is being finished
+                if index not in backups or not match.group(2):
+                    backups[index] = candidate
+        files.extend(backups[index] for index in sorted(backups, reverse=True))
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def _open_text(path: str) -> IO[str]:
+    """Open a log file for text reading, transparently decompressing .gz and .zst files."""
+    return open_log_text(path)
+
+
+def _iter_json_lines(f: IO[str], path: str) -> Iterator[Dict[str, Any]]:
+    """Yield one event per non-empty line, skipping lines that are not valid JSON."""
+    skipped = 0
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            skipped += 1
+    if skipped:
+        logger.warning(f"Skipped {skipped} damaged lines in {path}")
+
+
+def _iter_json_array(f: IO[str], path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the elements of a JSON array incrementally, tolerating a missing closing bracket."""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    started = False
+    eof = False
+
+    while True:
+        # Skip separators between events (and the opening bracket once)
+        index = 0
+        while index < len(buffer) and (buffer[index].isspace() or buffer[index] == ','
+                                       or (buffer[index] == '[' and not started)):
+            started = started or buffer[index] == '['
+            index += 1
+        buffer = buffer[index:]
+
+        if buffer.startswith(']'):
+            return
+        if buffer:
+            try:
+                event, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    logger.warning(f"Incomplete trailing event in {path} ignored")
+                    return
+            else:
+                buffer = buffer[end:]
+                yield event
+                continue
+        elif eof:
+            return
+
+        chunk = f.read(READ_CHUNK_SIZE)
+        if not chunk:
+            eof = True
+        buffer += chunk
+
+
+def iter_file_events(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the events of a single structured log file lazily.
+
+    Args:
+        path (str): JSON Lines or JSON array file, optionally gzip/zstd-compressed
+
+    Yields:
+        Dict[str, Any]: One structured event at a time
+    """
+    with _open_text(path) as f:
+        first = ''
+        while True:
+            first = f.read(1)
+            if not first or not first.isspace():
+                break
+        if not first:
+            return
+        f.seek(0)
+        if first == '[':
+            yield from _iter_json_array(f, path)
+        else:
+            yield from _iter_json_lines(f, path)
+
+
+def iter_events(path: str,
+                include_rotated: bool = True,
+                event_type: Optional[str] = None,
+                since: Optional[float] = None,
+                until: Optional[float] = None,
+                predicate: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield structured events from a log and its rotated backups in write order.
+
+    Args:
+        path (str): Live structured log file path
+        include_rotated (bool): Also read rotated backups, oldest first
+        event_type (str, optional): Only events with this event_type
+        since (float, optional): Only events with timestamp >= since (Unix time)
+        until (float, optional): Only events with timestamp < until (Unix time)
+        predicate (Callable, optional): Additional filter applied last
+
+    Yields:
+        Dict[str, Any]: Matching events, one at a time
+    """
+    for file_path in rotated_log_files(path, include_rotated):
+        for event in iter_file_events(file_path):
+            if event_type is not None and event.get('event_type') != event_type:
+                continue
+            timestamp = event.get('timestamp')
+            if since is not None and (timestamp is None or timestamp < since):
+                continue
+            if until is not None and (timestamp is None or timestamp >= until):
+                continue
+            if predicate is not None and not predicate(event):
+                continue
+            yield event
+
+
+def tail_events(path: str, count: int, **filters: Any) -> List[Dict[str, Any]]:
+    """
+    Return the last `count` matching events, holding at most `count` in memory.
+
+    Args:
+        path (str): Live structured log file path
+        count (int): Number of events to return
+        **filters: Passed to iter_events()
+
+    Returns:
+        List[Dict[str, Any]]: Up to `count` events, oldest first
+    """
+    return list(deque(iter_events(path, **filters), maxlen=count))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream structured daemon events as JSON Lines")
+    parser.add_argument("path", help="Structured log file (rotated backups are read too)")
+    parser.add_argument("--event-type", help="Only events of this type")
+    parser.add_argument("--since", type=float, help="Only events at or after this Unix timestamp")
+    parser.add_argument("--tail", type=int, help="Only the last N matching events")
+    parser.add_argument("--no-rotated", action="store_true", help="Read the live file only")
+    args = parser.parse_args()
+
+    filters = dict(include_rotated=not args.no_rotated, event_type=args.event_type, since=args.since)
+    events = tail_events(args.path, args.tail, **filters) if args.tail else iter_events(args.path, **filters)
+    try:
+        for event in events:
+            sys.stdout.write(json.dumps(event, separators=(',', ':')) + "\n")
+    except BrokenPipeError:
+        pass
@@ -1,7 +1,33 @@
 import os
-import json
+import time
+import queue
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from .encoding import encode_event
+from .log_compression import (
+    LOG_COMPRESSION_NONE,
+    COMPRESSED_EXTENSIONS,
+    compress_stream,
+    get_log_compressor,
+    resolve_codec
+)
+
+# Structured log file formats (STRUCTURED_LOG_FORMAT)
+STRUCTURED_LOG_FORMAT_ARRAY = 'array'     # One JSON array per file (StructuredArrayHandler)
+STRUCTURED_LOG_FORMAT_JSONL = 'jsonl'     # One compact JSON event per line (JsonLinesHandler)
+STRUCTURED_LOG_FORMATS = (STRUCTURED_LOG_FORMAT_ARRAY, STRUCTURED_LOG_FORMAT_JSONL)
+
+# Asynchronous logging pipeline queue overflow policies (LOG_QUEUE_OVERFLOW)
+LOG_OVERFLOW_DROP_DEBUG = 'drop-debug'    # Full queue: drop DEBUG records, wait for space for the rest
+LOG_OVERFLOW_BLOCK = 'block'              # Full queue: every record waits for space
+LOG_OVERFLOW_POLICIES = (LOG_OVERFLOW_DROP_DEBUG, LOG_OVERFLOW_BLOCK)
+DEFAULT_LOG_QUEUE_SIZE = 10000
+
+# Active pipelines by logger name (see get_log_pipeline)
+_pipelines = {}
+_pipelines_lock = threading.Lock()
 
 class StructuredFormatter(logging.Formatter):
     """
@@ -10,8 +36,8 @@ class StructuredFormatter(logging.Formatter):
     def format(self, record):
         # Check if this is a structured log entry
         if hasattr(record, 'json_fields') and record.json_fields.get('structured_event'):
-            # Output pure JSON for structured events
-            return json.dumps(record.json_fields, separators=(',', ':'))
+            # Output pure JSON for structured events (orjson when installed, see encoding.py)
+            return encode_event(record.json_fields)
         else:
             # Use standard formatting for regular log messages
             return super().format(record)
@@ -24,98 +50,253 @@ class StructuredJSONFormatter(logging.Formatter):
         # Check if this is a structured log entry
         if hasattr(record, 'json_fields') and record.json_fields.get('structured_event'):
             # Output JSON with proper formatting and indentation
-            return json.dumps(record.json_fields, indent=2, separators=(',', ': '))
+            return encode_event(record.json_fields, pretty=True)
         else:
             # Use standard formatting for regular log messages
             return super().format(record)
 
-class StructuredArrayHandler(RotatingFileHandler):
+class CompressingRotatingFileHandler(RotatingFileHandler):
     """
-    Custom handler that maintains a proper JSON array structure in the log file.
+    RotatingFileHandler that compresses rotated backups on a background thread.
+
+    Rotation itself is unchanged and atomic: backups are shifted by renames
+    (compressed and not yet compressed ones alike) and the live file becomes
+    <file>.1. Compression of the new backup is then queued on the shared
+    compressor thread, so emit() never waits for it. The compressor writes to
+    a temporary file and renames it into place under the rotation lock; a
+    backup that was shifted or deleted by a later rotation in the meantime is
+    recognised by its file identity and left uncompressed.
     """
-    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None, delay=False):
+
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None, delay=False,
+                 compression=LOG_COMPRESSION_NONE, compressor=None):
+        self.compression = resolve_codec(compression)
+        self.compressor = compressor or get_log_compressor()
+        self._rotation_lock = threading.Lock()
+        self._rotations = 0  # Rotations performed; locates a backup after later shifts
         super().__init__(filename, mode, maxBytes, backupCount, encoding, delay)
+
+    def _backup_name(self, index, compressed=False):
+        suffix = COMPRESSED_EXTENSIONS[self.compression] if compressed else ''
+        return f"{self.baseFilename}.{index}{suffix}"
+
+    def doRollover(self):
+        """Rotate by renames only, then queue compression of the new backup."""
+        if self.compression == LOG_COMPRESSION_NONE or self.backupCount <= 0:
+            super().doRollover()
+            return
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        with self._rotation_lock:
+            for index in range(self.backupCount, 0, -1):
+                for compressed in (False, True):
+                    source = self._backup_name(index, compressed)
+                    if not os.path.exists(source):
+                        continue
+                    if index == self.backupCount:
+                        os.remove(source)
+                    else:
+                        os.replace(source, self._backup_name(index + 1, compressed))
+            if os.path.exists(self.baseFilename):
+                os.replace(self.baseFilename, self._backup_name(1))
+            self._rotations += 1
+            rotation = self._rotations
+        self.compressor.submit(lambda: self._compress_backup(rotation))
+        if not self.delay:
+            self.stream = self._open()
+
+    def _compress_backup(self, rotation):
+        """Compressor thread: compress the backup created by the given rotation."""
+        with self._rotation_lock:
+            index = 1 + self._rotations - rotation
+            source = self._backup_name(index)
+            if index > self.backupCount or not os.path.exists(source):
+                return
+            source_file = open(source, 'rb')
+        temp_path = f"{self.baseFilename}.compress-{rotation}.tmp"
+        try:
+            with source_file:
+                identity = os.fstat(source_file.fileno())
+                compress_stream(source_file, temp_path, self.compression)
+            with self._rotation_lock:
+                index = 1 + self._rotations - rotation
+                source = self._backup_name(index)
+                if (index <= self.backupCount and os.path.exists(source)
+                        and os.path.samestat(identity, os.stat(source))):
+                    os.replace(temp_path, self._backup_name(index, compressed=True))
+                    os.remove(source)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+class StructuredArrayHandler(CompressingRotatingFileHandler):
+    """
+    Custom handler that maintains a proper JSON array structure in the log file.
+
+    The file is opened once and kept open. Whether the next record needs a
+    leading comma is tracked in memory, so each record costs one write no
+    matter how large the file has grown. The array is closed with "]" on
+    rotation and shutdown; when an existing closed array is reopened, the
+    closing bracket is truncated at its offset and appending continues.
+    """
+    ARRAY_OPEN = '[\n'
+    ARRAY_CLOSE = '\n]'
+    TAIL_BYTES = 64  # Bytes read from the end of an existing file on open
+
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None, delay=False,
+                 compression=LOG_COMPRESSION_NONE, compressor=None):
+        # State used by _open(), which the base class may call during __init__
         self.first_record = True
-        self._initialize_file()
-    
-    def _initialize_file(self):
-        """Initialize the file with proper JSON array structure if it's empty."""
+        self._array_open = False
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay, compression, compressor)
+
+    def _prepare_file(self):
+        """
+        Make the file an open JSON array ready for appending.
+
+        Only the first and last bytes of an existing file are inspected. A
+        closed array has its closing bracket truncated; a file that is not a
+        JSON array is moved aside to <file>.backup and a new array started.
+        """
+        size = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+        if size:
+            with open(self.baseFilename, 'rb+') as f:
+                head = f.read(1)
+                while head.isspace():
+                    head = f.read(1)
+                if head == b'[':
+                    tail_start = max(0, size - self.TAIL_BYTES)
+                    f.seek(tail_start)
+                    tail = f.read()
+                    stripped = tail.rstrip()
+                    if stripped.endswith(b']'):
+                        # Closed array: reopen it by cutting the bracket at its offset
+                        stripped = stripped[:-1].rstrip()
+                    f.truncate(tail_start + len(stripped))
+                    # Records end with "}", so a trailing "[" means the array is still empty
+                    self.first_record = stripped.endswith(b'[')
+                    return
+            if head:
+                # File has content but isn't a JSON array, backup and restart
+                os.replace(self.baseFilename, f"{self.baseFilename}.backup")
+
+        with open(self.baseFilename, 'w', encoding=self.encoding) as f:
+            f.write(self.ARRAY_OPEN)
+        self.first_record = True
+
+    def _open(self):
+        """Open the stream in append mode after preparing the JSON array."""
         try:
-            # Check if file exists and has content
-            if os.path.exists(self.baseFilename):
-                with open(self.baseFilename, 'r') as f:
-                    content = f.read().strip()
-                    if content and not content.startswith('['):
-                        # File has content but isn't a JSON array, backup and restart
-                        backup_name = f"{self.baseFilename}.backup"
-                        os.rename(self.baseFilename, backup_name)
-                        self.first_record = True
-                    elif content.startswith('['):
-                        # File is already a JSON array, we'll append to it
-                        self.first_record = False
-                    else:
-                        # File is empty
-                        self.first_record = True
-            else:
-                self.first_record = True
-                
-            # If this is a new file, start the JSON array
-            if self.first_record:
-                with open(self.baseFilename, 'w') as f:
-                    f.write('[\n')
-                    
-        except Exception:
-            # If anything goes wrong, start fresh
+            self._prepare_file()
+        except OSError:
+            # Unreadable or damaged file - start a fresh array
+            with open(self.baseFilename, 'w', encoding=self.encoding) as f:
+                f.write(self.ARRAY_OPEN)
             self.first_record = True
-            try:
-                with open(self.baseFilename, 'w') as f:
-                    f.write('[\n')
-            except Exception:
-                pass
-    
+        stream = super()._open()
+        self._array_open = True
+        return stream
+
+    def _close_array(self):
+        """Terminate the JSON array on the open stream."""
+        if self.stream and self._array_open:
+            self.stream.write(self.ARRAY_CLOSE)
+            self.stream.flush()
+        self._array_open = False
+
+    def shouldRollover(self, record):
+        """Rollover decision is made in emit() from the already-formatted record."""
+        return False
+
+    def doRollover(self):
+        """Close the current array, rotate, and start a new array in the fresh file."""
+        self._close_array()
+        super().doRollover()
+
     def emit(self, record):
         """Emit a record, maintaining proper JSON array structure."""
         try:
-            if self.shouldRollover(record):
-                self.doRollover()
-            
             # Format the record
             msg = self.format(record)
-            
+
             # Only process if it's actually a JSON message
-            if msg and msg.startswith('{'):
-                # Read current file content
-                current_content = ''
-                try:
-                    with open(self.baseFilename, 'r') as f:
-                        current_content = f.read().strip()
-                except Exception:
-                    current_content = ''
-                
-                # Determine if we need to add a comma
-                if current_content and not current_content.endswith('['):
-                    prefix = ',\n'
-                else:
-                    prefix = ''
-                
-                # Write the new record
-                with open(self.baseFilename, 'a') as f:
-                    f.write(f"{prefix}{msg}")
-                    f.flush()
-                    
+            if not msg or not msg.startswith('{'):
+                return
+
+            if self.stream is None:
+                self.stream = self._open()
+
+            data = msg if self.first_record else f",\n{msg}"
+
+            # Rotate before the record (plus the closing bracket) would exceed maxBytes;
+            # a record is always written to a file holding no records yet
+            if (self.maxBytes > 0 and not self.first_record
+                    and self.stream.tell() + len(data) + len(self.ARRAY_CLOSE) >= self.maxBytes):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+                data = msg
+
+            self.stream.write(data)
+            self.stream.flush()
+            self.first_record = False
+
         except Exception:
             self.handleError(record)
-    
+
     def close(self):
         """Close the handler and properly terminate the JSON array."""
+        self.acquire()
         try:
-            # Close the JSON array
-            with open(self.baseFilename, 'a') as f:
-                f.write('\n]')
-                f.flush()
-        except Exception:
+            try:
+                self._close_array()
+            except Exception:
+                pass
+            super().close()
+        finally:
+            self.release()
+
+class JsonLinesHandler(CompressingRotatingFileHandler):
+    """
+    Handler that writes one compact JSON event per line (JSON Lines).
+
+    Records are only ever appended, so nothing is read back or repaired on
+    rotation and shutdown, and every rotated file is valid on its own. If the
+    process died mid-write, the partial last line is terminated when the file
+    is reopened so that the next event starts on a line of its own; readers
+    skip the damaged line.
+    """
+
+    def _open(self):
+        """Open the stream in append mode, terminating a partial last line first."""
+        try:
+            if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename):
+                with open(self.baseFilename, 'rb+') as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        f.write(b'\n')
+        except OSError:
             pass
-        super().close()
+        return super()._open()
+
+    def emit(self, record):
+        """Emit a record as a single line; non-JSON messages are ignored."""
+        try:
+            msg = self.format(record)
+            if not msg or not msg.startswith('{'):
+                return
+            if self.stream is None:
+                self.stream = self._open()
+            line = f"{msg}\n"
+            if self.maxBytes > 0 and self.stream.tell() and self.stream.tell() + len(line) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(line)
+            self.stream.flush()
+        except Exception:
+            self.handleError(record)
 
 class StructuredFilter(logging.Filter):
     """
@@ -135,9 +316,193 @@ class NonStructuredFilter(logging.Filter):
         return not (hasattr(record, 'json_fields') and
                    record.json_fields.get('structured_event', False))
 
+def accepts_structured_events(logger, level=logging.INFO):
+    """
+    Whether any handler reachable from the logger would output a structured event.
+
+    Handlers carrying a NonStructuredFilter (the human-readable console and
+    file handlers) or set above the level are skipped; handlers behind an
+    AsyncLogPipeline are inspected through its queue handler. Callers use this
+    to avoid building event payloads nobody will format. Anything that is not
+    a plain Logger, or a logger without handlers, is assumed to accept.
+    """
+    if not isinstance(logger, logging.Logger):
+        return True
+    found = False
+    current = logger
+    while current:
+        for handler in current.handlers:
+            found = True
+            targets = handler.listener.handlers if getattr(handler, 'listener', None) else (handler,)
+            for target in targets:
+                if level < target.level:
+                    continue
+                if any(isinstance(f, NonStructuredFilter) for f in target.filters):
+                    continue
+                return True
+        if not current.propagate:
+            break
+        current = current.parent
+    return not found
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler for a bounded queue with an overflow policy.
+
+    With "drop-debug", a DEBUG record that finds the queue full is dropped and
+    counted; records of INFO and above (including every structured event)
+    wait for space. With "block", every record waits. Time spent waiting is
+    recorded so a stalled writer shows up in the pipeline statistics.
+    """
+    def __init__(self, log_queue, overflow=LOG_OVERFLOW_DROP_DEBUG):
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.listener = None      # Set by AsyncLogPipeline; its handlers do the writing
+        self.dropped = 0
+        self.blocked = 0
+        self.blocked_time = 0.0
+        self.max_depth = 0
+        self._stats_lock = threading.Lock()
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow == LOG_OVERFLOW_DROP_DEBUG and record.levelno <= logging.DEBUG:
+                with self._stats_lock:
+                    self.dropped += 1
+                return
+            start = time.monotonic()
+            self.queue.put(record)
+            with self._stats_lock:
+                self.blocked += 1
+                self.blocked_time += time.monotonic() - start
+        depth = self.queue.qsize()
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+class AsyncLogPipeline:
+    """
+    Queue-based logging pipeline with one dedicated writer thread.
+
+    The logger gets a single BoundedQueueHandler, so the calling thread only
+    formats the message and enqueues the record. A QueueListener thread runs
+    the real handlers (console, rotating files, structured file, Cloud
+    Logging), so file flushes and network calls never run on the control
+    loop. stop() drains every queued record before returning.
+    """
+    def __init__(self, handlers, queue_size=DEFAULT_LOG_QUEUE_SIZE, overflow=LOG_OVERFLOW_DROP_DEBUG):
+        if overflow not in LOG_OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {', '.join(LOG_OVERFLOW_POLICIES)}")
+        if queue_size < 1:
+            raise ValueError("queue_size must be >= 1")
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.handler = BoundedQueueHandler(self.queue, overflow)
+        self.listener = QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.handler.listener = self.listener
+        self._started = False
+        self._lock = threading.Lock()
+
+    @property
+    def handlers(self):
+        return self.listener.handlers
+
+    def start(self):
+        with self._lock:
+            if not self._started:
+                self.listener.start()
+                self._started = True
+                atexit.register(self.stop)
+
+    def add_handler(self, handler):
+        """Attach another handler to the writer thread (e.g. Cloud Logging)."""
+        self.listener.handlers = self.listener.handlers + (handler,)
+
+    def flush(self, timeout=5.0):
+        """
+        Wait until every record queued so far has been handled, then flush handlers.
+
+        Returns:
+            bool: True if the queue drained within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._started:
+                    break
+                self.queue.all_tasks_done.wait(remaining)
+            drained = not self.queue.unfinished_tasks
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except Exception:
+                pass
+        return drained
+
+    def stop(self):
+        """Drain the queue, stop the writer thread and close the handlers."""
+        with self._lock:
+            if not self._started:
+                return
+            self._started = False
+        self.listener.stop()
+        for handler in self.handlers:
+            try:
+                handler.flush()
+                handler.close()
+            except Exception:
+                pass
+
+    def stats(self):
+        """Snapshot of queue depth, drops and time callers spent blocked."""
+        return {
+            "queue_size": self.queue.maxsize,
+            "depth": self.queue.qsize(),
+            "max_depth": self.handler.max_depth,
+            "overflow_policy": self.handler.overflow,
+            "dropped": self.handler.dropped,
+            "blocked": self.handler.blocked,
+            "blocked_time_ms": int(self.handler.blocked_time * 1000)
+        }
+
+def get_log_pipeline(name=None):
+    """Return the asynchronous pipeline installed on the named logger, if any."""
+    logger_name = name or os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON")
+    with _pipelines_lock:
+        return _pipelines.get(logger_name)
+
+def add_log_handler(logger, handler):
+    """Add a handler behind the logger's pipeline if it has one, otherwise directly."""
+    pipeline = get_log_pipeline(logger.name)
+    if pipeline:
+        pipeline.add_handler(handler)
+    else:
+        logger.addHandler(handler)
+
+def shutdown_logging(name=None, timeout=5.0):
+    """Flush and stop the named logger's pipeline; plain handlers are flushed and pending compression finished."""
+    logger_name = name or os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON")
+    with _pipelines_lock:
+        pipeline = _pipelines.pop(logger_name, None)
+    if pipeline:
+        pipeline.flush(timeout)
+        pipeline.stop()
+        logging.getLogger(logger_name).removeHandler(pipeline.handler)
+    for handler in logging.getLogger(logger_name).handlers:
+        try:
+            handler.flush()
+        except Exception:
+            pass
+    get_log_compressor().flush(timeout)
+
 def setup_logger(name: str, level: str, log_file: str | None, max_bytes: int, backup_count: int,
                 enable_structured_console: bool = False, enable_structured_file: bool = False,
-                structured_log_file: str | None = None):
+                structured_log_file: str | None = None,
+                structured_log_format: str = STRUCTURED_LOG_FORMAT_ARRAY,
+                async_logging: bool = False, queue_size: int = DEFAULT_LOG_QUEUE_SIZE,
+                overflow: str = LOG_OVERFLOW_DROP_DEBUG,
+                compression: str = LOG_COMPRESSION_NONE):
     """
     Enhanced logger setup with structured logging options and proper JSON formatting.
     
@@ -145,6 +510,15 @@ def setup_logger(name: str, level: str, log_file: str | None, max_bytes: int, ba
         enable_structured_console (bool): Output JSON to console for structured events
         enable_structured_file (bool): Output JSON to separate structured log file
         structured_log_file (str): Path to structured JSON log file
+        structured_log_format (str): "array" (JSON array per file) or "jsonl"
+            (one event per line); read either with log_reader.iter_events()
+        async_logging (bool): Run every handler on one writer thread behind a
+            bounded queue (see AsyncLogPipeline); add more handlers later with
+            add_log_handler() and flush with shutdown_logging()
+        queue_size (int): Maximum records waiting for the writer thread
+        overflow (str): Full-queue policy, "drop-debug" or "block"
+        compression (str): Compress rotated backups of both log files on a
+            background thread, "none", "gzip" or "zstd" (see log_compression)
     """
     
     # Create or retrieve a logger instance by name
@@ -152,6 +526,11 @@ def setup_logger(name: str, level: str, log_file: str | None, max_bytes: int, ba
     logger = logging.getLogger(logger_name)
     logger.setLevel(getattr(logging, level, logging.INFO))
 
+    # A repeated setup replaces the previous pipeline, draining it first
+    if get_log_pipeline(logger_name):
+        shutdown_logging(logger_name)
+    handlers = []
+
     # Regular formatter for human-readable logs
     regular_formatter = logging.Formatter('%(asctime)s %(levelname)s [%(name)s] %(message)s')
     
@@ -174,16 +553,19 @@ def setup_logger(name: str, level: str, log_file: str | None, max_bytes: int, ba
         ch.addFilter(NonStructuredFilter())
     
     logger.addHandler(ch)
+    handlers.append(ch)
 
     # Set up regular file logging (non-structured events only)
     if log_file:
         try:
             os.makedirs(os.path.dirname(log_file), exist_ok=True)
-            fh = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
+            fh = CompressingRotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count,
+                                                compression=compression)
             fh.setLevel(getattr(logging, level, logging.INFO))
             fh.setFormatter(regular_formatter)
             fh.addFilter(NonStructuredFilter())  # Only non-structured events
             logger.addHandler(fh)
+            handlers.append(fh)
             logger.info(f"Regular file logging enabled: {log_file}")
         except Exception as e:
             logger.warning(f"Could not setup regular file logging at {log_file}: {e}")
@@ -192,13 +574,32 @@ def setup_logger(name: str, level: str, log_file: str | None, max_bytes: int, ba
     if enable_structured_file and structured_log_file:
         try:
             os.makedirs(os.path.dirname(structured_log_file), exist_ok=True)
-            sfh = StructuredArrayHandler(structured_log_file, maxBytes=max_bytes, backupCount=backup_count)
+            if structured_log_format == STRUCTURED_LOG_FORMAT_JSONL:
+                sfh = JsonLinesHandler(structured_log_file, maxBytes=max_bytes, backupCount=backup_count,
+                                       compression=compression)
+                sfh.setFormatter(structured_formatter)  # Compact JSON, one line per event
+            else:
+                sfh = StructuredArrayHandler(structured_log_file, maxBytes=max_bytes, backupCount=backup_count,
+                                             compression=compression)
+                sfh.setFormatter(structured_json_formatter)
             sfh.setLevel(getattr(logging, level, logging.INFO))
-            sfh.setFormatter(structured_json_formatter)
             sfh.addFilter(StructuredFilter())  # Only structured events
             logger.addHandler(sfh)
-            logger.info(f"Structured JSON file logging enabled: {structured_log_file}")
+            handlers.append(sfh)
+            logger.info(f"Structured JSON file logging enabled: {structured_log_file} "
+                        f"(format: {structured_log_format})")
         except Exception as e:
             logger.warning(f"Could not setup structured file logging at {structured_log_file}: {e}")
 
+    # Move the handlers behind one queue so callers never wait on file or network I/O
+    if async_logging:
+        pipeline = AsyncLogPipeline(handlers, queue_size=queue_size, overflow=overflow)
+        for handler in handlers:
+            logger.removeHandler(handler)
+        pipeline.start()
+        logger.addHandler(pipeline.handler)
+        with _pipelines_lock:
+            _pipelines[logger_name] = pipeline
+        logger.info(f"Asynchronous logging enabled (queue size: {queue_size}, overflow: {overflow})")
+
     return logger
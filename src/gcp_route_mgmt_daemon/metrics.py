@@ -0,0 +1,454 @@
+"""
+Prometheus Metrics for the Health Check Daemon
+
+This module keeps in-process counters, gauges and histograms for the control
+loop and the APIs it calls, and serves them in the Prometheus text exposition
+format from an embedded HTTP endpoint. Alerting on p99 API latency or cycle
+duration then needs no log parsing.
+
+Published Metrics:
+    - gcp_route_mgmt_cycle_duration_seconds (histogram): health check cycle duration
+    - gcp_route_mgmt_cycles_total{result} (counter): completed cycles by result
+    - gcp_route_mgmt_cycle_phase_duration_seconds{phase} (histogram): time
+      spent in each phase of a cycle (see phases.PhaseTimer)
+    - gcp_route_mgmt_api_request_duration_seconds{api, outcome} (histogram):
+      latency of every Compute and Cloudflare API call, e.g.
+      api="compute.regionBackendServices.getHealth", api="cloudflare.put"
+    - gcp_route_mgmt_retries_total{operation} (counter): retries made by
+      circuit.exponential_backoff_retry
+    - gcp_route_mgmt_backoff_sleep_seconds_total{operation} (counter): time
+      exponential_backoff_retry slept before those retries
+    - gcp_route_mgmt_circuit_breaker_state{service} (gauge): 0 closed,
+      1 half-open, 2 open, read from CircuitBreaker.get_state at scrape time
+    - gcp_route_mgmt_state_code (gauge): current routing state code
+    - gcp_route_mgmt_api_calls_total{api, quota} (counter): API requests as
+      charged against the quota (a batch counts as its sub-requests)
+    - gcp_route_mgmt_api_quota_calls_per_minute{quota} and
+      gcp_route_mgmt_api_quota_budget_per_minute{quota} (gauges): usage over
+      the last minute and the configured budget (see api_accounting)
+    - gcp_route_mgmt_api_throttle_factor (gauge): slowdown of optional reads
+
+Cost on the Control Loop:
+    Recording a value is a bisect over the bucket bounds and a few integer
+    updates under an uncontended lock; label children are cached after the
+    first use. All formatting happens on the HTTP server thread when the
+    endpoint is scraped.
+
+Usage Example:
+    from . import metrics
+
+    with metrics.time_api_call("compute.routers.get"):
+        router = request.execute()
+    metrics.CYCLE_DURATION.observe(loop_duration)
+
+    server = metrics.MetricsServer("0.0.0.0", 9464)
+    server.start()        # GET http://host:9464/metrics
+    ...
+    server.stop()
+
+Thread Safety:
+    Every metric may be updated from any thread. The server handles each
+    scrape on its own thread.
+
+HTTP Endpoints:
+    EndpointServer is the threaded HTTP server shared by the daemon's
+    endpoints: MetricsServer here and admin.AdminServer both declare their
+    paths as a route map on top of it.
+
+Author: Nathan Bray
+Version: 1.0
+Last Modified: 2025
+"""
+
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from .api_accounting import API_USAGE, quota_for
+
+# Logger for metrics operations - uses environment variable for consistency
+logger = logging.getLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
+
+# Prefix of every metric name
+METRIC_PREFIX = "gcp_route_mgmt"
+
+# Histogram bucket upper bounds (seconds)
+API_LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+CYCLE_DURATION_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0, 30.0, 60.0, 120.0)
+
+# Value of the circuit breaker state gauge for each CircuitBreaker state
+CIRCUIT_BREAKER_STATE_VALUES = {"CLOSED": 0, "HALF_OPEN": 1, "OPEN": 2}
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """Base for metrics with optional labels; one child per label value tuple."""
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        """Return the child for these label values, creating it on first use."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def clear(self) -> None:
+        """Drop every recorded value."""
+        with self._lock:
+            self._children = {}
+
+    def _samples(self) -> Iterable[Tuple[str, str, float]]:
+        """Yield (suffix, label string, value) for every sample."""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        """Exposition lines for this metric."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        for suffix, labels, value in self._samples():
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+
+class _CounterChild:
+    __slots__ = ('value', '_lock')
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+    metric_type = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1) -> None:
+        """Increment the unlabelled counter."""
+        self.labels().inc(amount)
+
+    def values(self) -> Dict[Tuple[str, ...], float]:
+        """Current value for every label value tuple."""
+        return {labels: child.value for labels, child in list(self._children.items())}
+
+    def _samples(self):
+        for values, child in list(self._children.items()):
+            yield "", _format_labels(self.labelnames, values), child.value
+
+
+class _GaugeChild:
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Gauge(_Metric):
+    """
+    Value that can go up and down.
+
+    Set directly, or give it a callback returning {label values: value}
+    that is read at scrape time.
+    """
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._callback: Optional[Callable[[], Dict[Tuple[str, ...], float]]] = None
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        """Set the unlabelled gauge."""
+        self.labels().set(value)
+
+    def set_callback(self, callback: Optional[Callable[[], Dict[Tuple[str, ...], float]]]) -> None:
+        """Read the gauge values from a callback when scraped (None removes it)."""
+        self._callback = callback
+
+    def _samples(self):
+        values = {key: child.value for key, child in list(self._children.items())}
+        callback = self._callback
+        if callback is not None:
+            try:
+                values.update(callback())
+            except Exception as e:
+                logger.warning(f"Metrics callback for {self.name} failed: {e}")
+        for key, value in values.items():
+            yield "", _format_labels(self.labelnames, key), value
+
+
+class _HistogramChild:
+    __slots__ = ('_bounds', 'counts', 'sum', '_lock')
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)    # Last slot: above the highest bound
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = API_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record a value in the unlabelled histogram."""
+        self.labels().observe(value)
+
+    def _samples(self):
+        for values, child in list(self._children.items()):
+            with child._lock:
+                counts = list(child.counts)
+                total = child.sum
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                yield "_bucket", _format_labels(self.labelnames, values, f'le="{_format_value(bound)}"'), cumulative
+            labels = _format_labels(self.labelnames, values)
+            yield "_sum", labels, total
+            yield "_count", labels, cumulative
+
+
+class MetricsRegistry:
+    """Set of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Add a metric; returns it for assignment at definition."""
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry served by MetricsServer
+REGISTRY = MetricsRegistry()
+
+CYCLE_DURATION = REGISTRY.register(Histogram(
+    f"{METRIC_PREFIX}_cycle_duration_seconds", "Duration of health check cycles.",
+    buckets=CYCLE_DURATION_BUCKETS))
+CYCLE_PHASE_DURATION = REGISTRY.register(Histogram(
+    f"{METRIC_PREFIX}_cycle_phase_duration_seconds", "Time spent in each phase of a health check cycle.",
+    ("phase",), CYCLE_DURATION_BUCKETS))
+CYCLES = REGISTRY.register(Counter(
+    f"{METRIC_PREFIX}_cycles_total", "Completed health check cycles by result.", ("result",)))
+API_LATENCY = REGISTRY.register(Histogram(
+    f"{METRIC_PREFIX}_api_request_duration_seconds", "Latency of Compute and Cloudflare API calls.",
+    ("api", "outcome"), API_LATENCY_BUCKETS))
+RETRIES = REGISTRY.register(Counter(
+    f"{METRIC_PREFIX}_retries_total", "Retries made after a failed attempt, by operation.", ("operation",)))
+BACKOFF_SLEEP = REGISTRY.register(Counter(
+    f"{METRIC_PREFIX}_backoff_sleep_seconds_total", "Time slept before retries, by operation.", ("operation",)))
+CIRCUIT_BREAKER_STATE = REGISTRY.register(Gauge(
+    f"{METRIC_PREFIX}_circuit_breaker_state", "Circuit breaker state (0 closed, 1 half-open, 2 open).",
+    ("service",)))
+STATE_CODE = REGISTRY.register(Gauge(
+    f"{METRIC_PREFIX}_state_code", "Current routing state code."))
+API_CALLS = REGISTRY.register(Counter(
+    f"{METRIC_PREFIX}_api_calls_total", "API requests as charged against the quota.", ("api", "quota")))
+API_QUOTA_USAGE = REGISTRY.register(Gauge(
+    f"{METRIC_PREFIX}_api_quota_calls_per_minute", "API requests over the last minute, by quota.", ("quota",)))
+API_QUOTA_BUDGET = REGISTRY.register(Gauge(
+    f"{METRIC_PREFIX}_api_quota_budget_per_minute", "Configured API requests per minute, by quota.", ("quota",)))
+API_THROTTLE_FACTOR = REGISTRY.register(Gauge(
+    f"{METRIC_PREFIX}_api_throttle_factor", "Multiplier applied to the intervals of optional reads."))
+API_QUOTA_USAGE.set_callback(lambda: {(quota,): calls for quota, calls in API_USAGE.quota_usage().items()})
+API_QUOTA_BUDGET.set_callback(lambda: {(quota,): budget for quota, budget in API_USAGE.budgets.items()})
+API_THROTTLE_FACTOR.set_callback(lambda: {(): API_USAGE.throttle_factor()})
+
+
+# Most recent call of each API: (duration seconds, outcome, wall clock time)
+_last_api_calls: Dict[str, Tuple[float, str, float]] = {}
+
+
+def last_api_calls() -> Dict[str, Dict[str, object]]:
+    """Duration and outcome of the most recent call of each API, for the admin /state endpoint."""
+    return {
+        api: {"duration_ms": int(duration * 1000), "outcome": outcome, "timestamp": timestamp}
+        for api, (duration, outcome, timestamp) in sorted(_last_api_calls.items())
+    }
+
+
+class ApiTimer:
+    """Context manager recording the duration of one API call in API_LATENCY and its quota use."""
+    __slots__ = ('api', 'calls', 'failed', '_start')
+
+    def __init__(self, api: str, calls: int = 1):
+        self.api = api
+        self.calls = calls      # Requests charged against the quota (sub-requests of a batch)
+        self.failed = False     # Set for calls that return an error instead of raising
+
+    def __enter__(self) -> "ApiTimer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        outcome = "error" if exc_type is not None or self.failed else "success"
+        duration = time.perf_counter() - self._start
+        API_LATENCY.labels(self.api, outcome).observe(duration)
+        _last_api_calls[self.api] = (duration, outcome, time.time())
+        API_CALLS.labels(self.api, quota_for(self.api)).inc(self.calls)
+        API_USAGE.record(self.api, self.calls)
+        return False
+
+
+def time_api_call(api: str, calls: int = 1) -> ApiTimer:
+    """
+    Time an API call and count it against its quota; an exception marks it as an error.
+
+    Args:
+        api (str): Call name, e.g. "compute.routers.patch" or "cloudflare.get"
+        calls (int): Requests charged against the quota, e.g. the size of a batch
+    """
+    return ApiTimer(api, calls)
+
+
+# (status code, content type, body) returned by an EndpointServer route
+Response = Tuple[int, str, bytes]
+
+
+class EndpointServer:
+    """
+    Threaded HTTP server answering GET requests from a route map.
+
+    Each route is called on the request's server thread and returns the
+    response; other paths get a 404. Query strings are ignored when matching.
+
+    Attributes:
+        host (str): Bind address
+        port (int): Bound port (the actual port when constructed with 0)
+        name (str): Short endpoint name used in log messages and the thread name
+        routes (dict): Path -> callable returning a Response
+    """
+
+    def __init__(self, host: str, port: int, name: str, routes: Dict[str, Callable[[], Response]]):
+        self.name = name
+        self.routes = routes
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                route = server.routes.get(self.path.split("?", 1)[0])
+                if route is None:
+                    self.send_error(404)
+                    return
+                status, content_type, body = route()
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(f"{server.name.capitalize()} request from {self.address_string()}: {format % args}")
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        self.host = host
+        self.port = self._httpd.server_address[1]
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Serve on a background daemon thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name=f"{self.name}-server", daemon=True)
+        self._thread.start()
+        logger.info(f"{self.name.capitalize()} endpoint available at http://{self.host}:{self.port} ({', '.join(self.routes)})")
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._httpd.server_close()
+
+
+class MetricsServer(EndpointServer):
+    """
+    Threaded HTTP server exposing a registry at /metrics.
+
+    Attributes:
+        registry (MetricsRegistry): Registry rendered on each scrape
+    """
+
+    def __init__(self, host: str, port: int, registry: MetricsRegistry = REGISTRY):
+        self.registry = registry
+        super().__init__(host, port, "metrics", {"/metrics": self._metrics})
+
+    def _metrics(self) -> Response:
+        return 200, CONTENT_TYPE, self.registry.render().encode("utf-8")
@@ -0,0 +1,349 @@
+"""
+Background Tracking of GCP Router Operations
+
+This module follows the regional operations returned by routers().patch to
+completion without blocking the control loop. Submitting a patch only starts an
+operation; the router's advertised ranges change when the operation reaches
+DONE. The tracker polls regionOperations().get on a background thread and
+queues the final outcome so the next health check cycle can report it.
+
+Operation Outcomes:
+    - completed: The operation reached DONE without errors
+    - failed: The operation reached DONE with an error, or polling hit a
+      permanent API error (403, 404)
+    - timed_out: The operation was not DONE within the operation timeout
+      (GCP_BGP_OPERATION_TIMEOUT); it may still complete later, and the next
+      router read will show whether it did
+
+Propagation Time:
+    propagation_ms is measured from patch submission to the poll that observed
+    DONE, so it is accurate to within one poll interval
+    (GCP_OPERATION_POLL_INTERVAL). When the operation carries insertTime and
+    endTime, the server-side duration is reported as operation_duration_ms.
+
+Usage Example:
+    from .operations import OperationTracker
+
+    tracker = OperationTracker(compute, poll_interval=5, timeout=60)
+    reconciler = reconcile_bgp_advertisements(..., operation_tracker=tracker)
+    reconciler()                       # returns once the patch is submitted
+
+    # Next cycle
+    for result in tracker.drain():
+        structured_logger.log_bgp_operation_result(...)
+    tracker.close()
+
+Thread Safety:
+    track(), drain(), stats() and close() may be called from any thread. Polls
+    run on a single daemon thread started on first use; each poll borrows a
+    client when the compute client is a ComputeClientPool.
+
+Author: Nathan Bray
+Version: 1.0
+Last Modified: 2025
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from googleapiclient.errors import HttpError
+from .client_pool import ComputeClientPool
+from .metrics import time_api_call
+
+# Logger for operation tracking - uses environment variable for consistency
+logger = logging.getLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
+
+# Default tracking configuration
+DEFAULT_OPERATION_POLL_INTERVAL = 5       # Seconds between operation status polls
+DEFAULT_OPERATION_TIMEOUT = 60            # Seconds before an operation is reported as timed out
+
+# Operation outcomes reported by the tracker
+OPERATION_COMPLETED = "completed"
+OPERATION_FAILED = "failed"
+OPERATION_TIMED_OUT = "timed_out"
+
+# Poll errors that end tracking immediately (the operation cannot be followed)
+PERMANENT_POLL_ERRORS = (403, 404)
+
+
+@dataclass
+class TrackedOperation:
+    """An operation being polled in the background"""
+    project: str
+    region: str
+    operation_id: str
+    resource: str
+    prefixes: Tuple[str, ...] = ()
+    correlation_id: Optional[str] = None
+    submitted_at: float = 0.0
+    next_poll_at: float = 0.0
+    polls: int = 0
+
+
+@dataclass
+class OperationResult:
+    """Final outcome of a tracked operation"""
+    operation_id: str
+    project: str
+    region: str
+    resource: str
+    status: str
+    prefixes: Tuple[str, ...] = ()
+    propagation_ms: int = 0
+    operation_duration_ms: Optional[int] = None
+    polls: int = 0
+    error_message: Optional[str] = None
+    correlation_id: Optional[str] = None
+
+
+def _operation_error_message(operation: Dict[str, Any]) -> Optional[str]:
+    """Join the error messages of a DONE operation, or None if it succeeded."""
+    errors = operation.get('error', {}).get('errors', [])
+    if not errors:
+        return None
+    return "; ".join(error.get('message') or error.get('code', 'unknown error') for error in errors)
+
+
+def _operation_duration_ms(operation: Dict[str, Any]) -> Optional[int]:
+    """Server-side duration from insertTime to endTime, if both are present."""
+    try:
+        inserted = datetime.fromisoformat(operation['insertTime'])
+        ended = datetime.fromisoformat(operation['endTime'])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return max(0, int((ended - inserted).total_seconds() * 1000))
+
+
+class OperationTracker:
+    """
+    Polls regional operations to completion on a background thread.
+
+    Attributes:
+        poll_interval (float): Seconds between polls of one operation
+        timeout (float): Seconds after submission before an operation is
+            reported as timed out
+    """
+
+    def __init__(self,
+                 compute_client,
+                 poll_interval: float = DEFAULT_OPERATION_POLL_INTERVAL,
+                 timeout: float = DEFAULT_OPERATION_TIMEOUT,
+                 clock: Callable[[], float] = time.monotonic):
+        if poll_interval <= 0:
+            raise ValueError("poll_interval must be > 0")
+        if timeout <= 0:
+            raise ValueError("timeout must be > 0")
+
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+
+        self._compute = compute_client
+        self._clock = clock
+        self._pending: List[TrackedOperation] = []
+        self._results: Deque[OperationResult] = deque()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        self._tracked = 0
+        self._outcomes = {OPERATION_COMPLETED: 0, OPERATION_FAILED: 0, OPERATION_TIMED_OUT: 0}
+        self._last_propagation_ms: Optional[int] = None
+
+    def track(self,
+              project: str,
+              region: str,
+              operation: Dict[str, Any],
+              resource: str,
+              prefixes: Tuple[str, ...] = (),
+              correlation_id: Optional[str] = None) -> None:
+        """
+        Start following an operation returned by a mutating API call.
+
+        Returns immediately. An operation that is already DONE is resolved
+        without polling.
+
+        Args:
+            project (str): GCP project ID
+            region (str): Region of the operation
+            operation (Dict[str, Any]): Operation resource returned by the call
+            resource (str): Name of the resource being changed (e.g. the router)
+            prefixes (Tuple[str, ...]): Prefixes changed by the operation
+            correlation_id (str, optional): Correlation ID of the submitting cycle
+        """
+        now = self._clock()
+        tracked = TrackedOperation(
+            project=project,
+            region=region,
+            operation_id=operation.get('name', 'unknown'),
+            resource=resource,
+            prefixes=tuple(prefixes),
+            correlation_id=correlation_id,
+            submitted_at=now,
+            next_poll_at=now + min(self.poll_interval, self.timeout)
+        )
+
+        with self._condition:
+            if self._closed:
+                logger.warning(f"Operation tracker closed, not tracking {tracked.operation_id}")
+                return
+            self._tracked += 1
+
+            if operation.get('status') == 'DONE':
+                self._finish(tracked, operation)
+                return
+
+            self._pending.append(tracked)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="operation-tracker", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+        logger.debug(f"Tracking operation {tracked.operation_id} on {resource} [{project}/{region}]")
+
+    def drain(self) -> List[OperationResult]:
+        """Return and clear the outcomes resolved since the last call."""
+        with self._condition:
+            results = list(self._results)
+            self._results.clear()
+            return results
+
+    def pending(self) -> int:
+        """Number of operations still being polled."""
+        with self._condition:
+            return len(self._pending)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of tracker counters.
+
+        Returns:
+            Dict[str, Any]: tracked, pending, completed, failed, timed_out and
+                last_propagation_ms
+        """
+        with self._condition:
+            return {
+                "tracked": self._tracked,
+                "pending": len(self._pending),
+                "completed": self._outcomes[OPERATION_COMPLETED],
+                "failed": self._outcomes[OPERATION_FAILED],
+                "timed_out": self._outcomes[OPERATION_TIMED_OUT],
+                "last_propagation_ms": self._last_propagation_ms
+            }
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop polling. Operations still pending are abandoned."""
+        with self._condition:
+            self._closed = True
+            thread = self._thread
+            abandoned = len(self._pending)
+            self._condition.notify_all()
+        if thread is not None:
+            thread.join(timeout)
+        if abandoned:
+            logger.info(f"Operation tracker stopped with {abandoned} operations still pending")
+
+    def _finish(self,
+                tracked: TrackedOperation,
+                operation: Optional[Dict[str, Any]],
+                status: Optional[str] = None,
+                error_message: Optional[str] = None) -> None:
+        """Record the outcome of an operation. Caller holds the condition."""
+        if status is None:
+            error_message = _operation_error_message(operation)
+            status = OPERATION_FAILED if error_message else OPERATION_COMPLETED
+
+        propagation_ms = int((self._clock() - tracked.submitted_at) * 1000)
+        result = OperationResult(
+            operation_id=tracked.operation_id,
+            project=tracked.project,
+            region=tracked.region,
+            resource=tracked.resource,
+            status=status,
+            prefixes=tracked.prefixes,
+            propagation_ms=propagation_ms,
+            operation_duration_ms=_operation_duration_ms(operation) if operation else None,
+            polls=tracked.polls,
+            error_message=error_message,
+            correlation_id=tracked.correlation_id
+        )
+
+        self._results.append(result)
+        self._outcomes[status] += 1
+        if status == OPERATION_COMPLETED:
+            self._last_propagation_ms = propagation_ms
+            logger.info(f"Operation {tracked.operation_id} on {tracked.resource} completed "
+                       f"after {propagation_ms}ms")
+        else:
+            logger.warning(f"Operation {tracked.operation_id} on {tracked.resource} {status} "
+                          f"after {propagation_ms}ms: {error_message}")
+
+    def _poll(self, tracked: TrackedOperation) -> Dict[str, Any]:
+        """Fetch the current state of one operation."""
+        if isinstance(self._compute, ComputeClientPool):
+            with self._compute.client() as compute:
+                return self._get(compute, tracked)
+        return self._get(self._compute, tracked)
+
+    @staticmethod
+    def _get(compute, tracked: TrackedOperation) -> Dict[str, Any]:
+        with time_api_call("compute.regionOperations.get"):
+            return compute.regionOperations().get(
+                project=tracked.project,
+                region=tracked.region,
+                operation=tracked.operation_id
+            ).execute()
+
+    def _run(self) -> None:
+        """Background loop: poll due operations, then sleep until the next one is due."""
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._pending:
+                        wait = min(op.next_poll_at for op in self._pending) - self._clock()
+                        if wait <= 0:
+                            break
+                        self._condition.wait(wait)
+                    else:
+                        self._condition.wait()
+                if self._closed:
+                    return
+                now = self._clock()
+                due = [op for op in self._pending if op.next_poll_at <= now]
+
+            # Poll outside the lock so track()/drain() never wait on the API
+            for tracked in due:
+                operation = None
+                status = None
+                error_message = None
+                tracked.polls += 1
+                try:
+                    operation = self._poll(tracked)
+                    done = operation.get('status') == 'DONE'
+                except HttpError as e:
+                    done = e.resp.status in PERMANENT_POLL_ERRORS
+                    if done:
+                        status, error_message = OPERATION_FAILED, f"Operation poll failed: {e}"
+                    else:
+                        logger.debug(f"Transient error polling operation {tracked.operation_id}: {e}")
+                except Exception as e:
+                    done = False
+                    logger.debug(f"Error polling operation {tracked.operation_id}: {e}")
+
+                with self._condition:
+                    if done:
+                        self._finish(tracked, operation, status, error_message)
+                    elif self._clock() - tracked.submitted_at >= self.timeout:
+                        done = True
+                        self._finish(tracked, operation, OPERATION_TIMED_OUT,
+                                     f"Operation not DONE within {self.timeout}s")
+                    else:
+                        # Never sleep past the deadline, so timeouts are reported on time
+                        tracked.next_poll_at = min(self._clock() + self.poll_interval,
+                                                   tracked.submitted_at + self.timeout)
+                    if done:
+                        self._pending.remove(tracked)
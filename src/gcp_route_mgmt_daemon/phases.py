@@ -0,0 +1,154 @@
+"""
+Per-Phase Timing of Health Check Cycles
+
+This module provides PhaseTimer, a lap timer that splits each health check
+cycle into its phases (probe stage, state evaluation, BGP actuation,
+Cloudflare actuation, ...) and accounts them against the cycle budget
+(CHECK_INTERVAL_SECONDS). When a cycle overruns, the daemon names the phase
+that used up the budget instead of reporting a single duration.
+
+Timing Model:
+    begin(name) ends the running phase and starts the next one, so the control
+    loop marks phase boundaries without wrapping its code in blocks. Probes run
+    concurrently inside the probe stage; their individual durations are
+    recorded with record_probe() and reported next to, not added to, the
+    sequential phases.
+
+Backoff Sleep:
+    circuit.exponential_backoff_retry counts the seconds it sleeps before a
+    retry in metrics.BACKOFF_SLEEP, labelled with the retried operation. The
+    daemon names its retried operations after the phase (or probe) they run
+    in, and the breakdown reports the sleep added during the cycle per name.
+
+Usage Example:
+    from .phases import PhaseTimer
+
+    timer = PhaseTimer(budget_seconds=60)
+    timer.reset()
+    timer.begin("probe_stage")
+    ...
+    timer.begin("bgp_actuation")
+    ...
+    timer.stop()
+    breakdown = timer.breakdown()      # added to the health_check_cycle details
+    timer.describe_slowest()           # "probe_stage 41.20s (probe_remote 41.18s, 30.00s backoff sleep)"
+
+Thread Safety:
+    A PhaseTimer belongs to the control loop thread. Backoff sleep is read
+    from the thread-safe metrics counter, so retries on probe threads are
+    included.
+
+Author: Nathan Bray
+Version: 1.0
+Last Modified: 2025
+"""
+
+import time
+from typing import Any, Callable, Dict, Optional
+from . import metrics
+
+
+def _backoff_totals() -> Dict[str, float]:
+    """Seconds slept before retries so far, by operation name."""
+    return {labels[0]: value for labels, value in metrics.BACKOFF_SLEEP.values().items()}
+
+
+class PhaseTimer:
+    """
+    Lap timer splitting one cycle into named phases.
+
+    Attributes:
+        budget_seconds (float): Time available per cycle (the check interval)
+    """
+
+    def __init__(self, budget_seconds: float, clock: Callable[[], float] = time.perf_counter):
+        self.budget_seconds = budget_seconds
+        self._clock = clock
+        self.reset()
+
+    def reset(self) -> None:
+        """Start timing a new cycle."""
+        self._cycle_start = self._clock()
+        self._cycle_end: Optional[float] = None
+        self._phases: Dict[str, float] = {}
+        self._probes: Dict[str, float] = {}
+        self._current: Optional[str] = None
+        self._current_start = self._cycle_start
+        self._backoff_start = _backoff_totals()
+
+    def begin(self, name: str) -> None:
+        """End the running phase (if any) and start `name`."""
+        now = self._clock()
+        self._end_current(now)
+        self._current = name
+        self._current_start = now
+
+    def _end_current(self, now: float) -> None:
+        if self._current is not None:
+            elapsed = now - self._current_start
+            self._phases[self._current] = self._phases.get(self._current, 0.0) + elapsed
+            metrics.CYCLE_PHASE_DURATION.labels(self._current).observe(elapsed)
+            self._current = None
+
+    @property
+    def current_phase(self) -> Optional[str]:
+        """Name of the running phase, e.g. where an exception interrupted the cycle."""
+        return self._current
+
+    def record_probe(self, name: str, duration_ms: Optional[int]) -> None:
+        """Record the duration of one concurrent probe within the probe stage."""
+        if duration_ms is not None:
+            self._probes[name] = duration_ms / 1000.0
+
+    def stop(self) -> None:
+        """End the running phase and the cycle."""
+        now = self._clock()
+        self._end_current(now)
+        self._cycle_end = now
+
+    def _elapsed(self) -> float:
+        end = self._cycle_end if self._cycle_end is not None else self._clock()
+        return end - self._cycle_start
+
+    def backoff_sleep(self) -> Dict[str, float]:
+        """Seconds slept before retries since reset(), by operation name."""
+        totals = _backoff_totals()
+        slept = {name: value - self._backoff_start.get(name, 0.0) for name, value in totals.items()}
+        return {name: value for name, value in slept.items() if value > 0}
+
+    def breakdown(self) -> Dict[str, Any]:
+        """
+        Phase durations and budget use for the cycle details.
+
+        Returns:
+            dict: phases_ms (sequential phases in order), probes_ms (concurrent
+                probes), backoff_sleep_ms (by phase or probe), unaccounted_ms,
+                total_ms, budget_ms and budget_used_pct
+        """
+        total = self._elapsed()
+        return {
+            "phases_ms": {name: int(seconds * 1000) for name, seconds in self._phases.items()},
+            "probes_ms": {name: int(seconds * 1000) for name, seconds in self._probes.items()},
+            "backoff_sleep_ms": {name: int(seconds * 1000) for name, seconds in self.backoff_sleep().items()},
+            "unaccounted_ms": max(0, int((total - sum(self._phases.values())) * 1000)),
+            "total_ms": int(total * 1000),
+            "budget_ms": int(self.budget_seconds * 1000),
+            "budget_used_pct": round(100.0 * total / self.budget_seconds, 1) if self.budget_seconds else None
+        }
+
+    def describe_slowest(self) -> str:
+        """Name the phase that took the most time, with its slowest probe and backoff sleep."""
+        if not self._phases:
+            return "no phase recorded"
+        name, seconds = max(self._phases.items(), key=lambda item: item[1])
+        backoff = self.backoff_sleep()
+        notes = []
+        if name == "probe_stage" and self._probes:
+            probe, probe_seconds = max(self._probes.items(), key=lambda item: item[1])
+            notes.append(f"{probe} {probe_seconds:.2f}s")
+            slept = backoff.get(probe, 0.0)
+        else:
+            slept = backoff.get(name, 0.0)
+        if slept:
+            notes.append(f"{slept:.2f}s backoff sleep")
+        return f"{name} {seconds:.2f}s" + (f" ({', '.join(notes)})" if notes else "")
@@ -0,0 +1,188 @@
+"""
+Concurrent Probe Stage for Health Check Cycles
+
+This module runs the independent health probes of a health check cycle (local
+backend services, remote backend services and remote BGP sessions) at the same
+time on a bounded thread pool. The detection latency of a cycle becomes the
+duration of the slowest probe rather than the sum of all probes.
+
+Probe Semantics:
+    - Every probe is submitted at the start of the stage and must finish within
+      the stage deadline (PROBE_TIMEOUT_SECONDS)
+    - A probe that misses the deadline is reported as timed out; callers treat
+      the result as unknown, which maps to State 0 (no routing changes)
+    - Exceptions raised by a probe are captured and re-raised by
+      ProbeOutcome.result() in the caller's thread, preserving the sequential
+      error behaviour of the main loop
+    - A probe still running from an earlier cycle is not submitted again, so a
+      hung API call can never pile up work on the bounded pool
+
+Correlation Tracking:
+    Worker threads bind the cycle's correlation ID through
+    StructuredEventLogger.correlation_scope(), so structured events emitted by a
+    probe that finishes after its deadline still carry the ID of the cycle that
+    started it.
+
+Usage Example:
+    from .probes import ProbeRunner
+
+    runner = ProbeRunner(max_workers=3, timeout=50, structured_logger=logger)
+    outcomes = runner.run({
+        "local_health": local_check,
+        "remote_health": remote_check,
+    })
+    local_healthy = outcomes["local_health"].result()   # None if timed out
+    runner.shutdown()
+
+Thread Safety:
+    run() is intended to be called from a single control thread. The probe
+    callables themselves must be thread-safe (the GCP client uses a per-thread
+    transport and circuit breakers lock their accounting).
+
+Author: Nathan Bray
+Version: 1.0
+Last Modified: 2025
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from .profiling import run_profiled
+from .structured_events import StructuredEventLogger
+
+# Logger for probe stage operations - uses environment variable for consistency
+logger = logging.getLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
+
+# Default probe stage configuration
+DEFAULT_PROBE_WORKERS = 3                 # One worker per standard probe
+DEFAULT_PROBE_TIMEOUT = 50                # Seconds; kept below the default check interval
+
+
+@dataclass
+class ProbeOutcome:
+    """Result of a single probe within a probe stage"""
+    name: str
+    value: Any = None
+    error: Optional[BaseException] = None
+    timed_out: bool = False
+    skipped: bool = False
+    duration_ms: int = 0
+
+    def result(self, default: Any = None) -> Any:
+        """
+        Return the probe value, re-raising the probe's exception if it failed.
+
+        Args:
+            default: Value returned when the probe timed out or was skipped
+                because a previous run of the same probe is still in flight.
+        """
+        if self.error is not None:
+            raise self.error
+        if self.timed_out or self.skipped:
+            return default
+        return self.value
+
+
+class ProbeRunner:
+    """
+    Runs named probe callables concurrently on a bounded thread pool.
+
+    Attributes:
+        max_workers (int): Upper bound on concurrently running probes
+        timeout (float): Stage deadline in seconds applied to every probe
+        structured_logger (StructuredEventLogger): Logger whose correlation ID
+            is propagated into the worker threads
+    """
+
+    def __init__(self,
+                 max_workers: int = DEFAULT_PROBE_WORKERS,
+                 timeout: float = DEFAULT_PROBE_TIMEOUT,
+                 structured_logger: Optional[StructuredEventLogger] = None):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if timeout <= 0:
+            raise ValueError("timeout must be > 0")
+
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.structured_logger = structured_logger
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="probe")
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def _invoke(self, name: str, probe: Callable[[], Any], correlation_id: Optional[str]) -> ProbeOutcome:
+        """Execute one probe in a worker thread and capture its outcome."""
+        start_time = time.monotonic()
+        outcome = ProbeOutcome(name=name)
+
+        try:
+            if self.structured_logger:
+                with self.structured_logger.correlation_scope(correlation_id):
+                    outcome.value = run_profiled(probe)
+            else:
+                outcome.value = run_profiled(probe)
+        except Exception as e:
+            outcome.error = e
+
+        outcome.duration_ms = int((time.monotonic() - start_time) * 1000)
+        return outcome
+
+    def run(self, probes: Dict[str, Callable[[], Any]]) -> Dict[str, ProbeOutcome]:
+        """
+        Run all probes concurrently and wait for them up to the stage deadline.
+
+        Args:
+            probes (Dict[str, Callable]): Probe callables keyed by name. The
+                returned mapping preserves this order.
+
+        Returns:
+            Dict[str, ProbeOutcome]: Outcome for every probe, keyed by name
+        """
+        correlation_id = self.structured_logger.current_correlation_id() if self.structured_logger else None
+        deadline = time.monotonic() + self.timeout
+        futures: Dict[str, Future] = {}
+        outcomes: Dict[str, ProbeOutcome] = {}
+
+        with self._lock:
+            for name, probe in probes.items():
+                previous = self._in_flight.get(name)
+                if previous is not None and not previous.done():
+                    logger.warning(f"Probe {name} is still running from a previous cycle, "
+                                   f"skipping it this cycle")
+                    outcomes[name] = ProbeOutcome(name=name, skipped=True)
+                    continue
+
+                future = self._executor.submit(self._invoke, name, probe, correlation_id)
+                self._in_flight[name] = future
+                futures[name] = future
+
+        for name, future in futures.items():
+            remaining = max(0.0, deadline - time.monotonic())
+            try:
+                outcomes[name] = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                logger.warning(f"Probe {name} exceeded its {self.timeout}s deadline, "
+                               f"treating result as unknown")
+                outcomes[name] = ProbeOutcome(name=name, timed_out=True,
+                                              duration_ms=int(self.timeout * 1000))
+                future.add_done_callback(self._log_late_completion)
+
+        return {name: outcomes[name] for name in probes}
+
+    @staticmethod
+    def _log_late_completion(future: Future) -> None:
+        """Record when a probe that missed its deadline eventually finishes."""
+        if future.cancelled():
+            return
+        outcome = future.result()
+        logger.info(f"Probe {outcome.name} completed after its deadline "
+                    f"({outcome.duration_ms}ms, failed={outcome.error is not None})")
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting probes and cancel any that have not started."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
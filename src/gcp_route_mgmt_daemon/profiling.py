@@ -0,0 +1,283 @@
+"""
+Opt-In Profiling of Health Check Cycles
+
+This module profiles selected cycles of the running daemon so hot spots and
+slow leaks (growing details dicts, handler buffers, caches) can be diagnosed
+in production without restarting the process under a profiler.
+
+Controls:
+    - PROFILE_EVERY_N_CYCLES: run every Nth cycle under cProfile and write its
+      statistics as a .pstats file (0 disables)
+    - TRACEMALLOC_EVERY_N_CYCLES: every Nth cycle, take a tracemalloc snapshot
+      and write the top allocation growth since the previous snapshot as text
+      (0 disables; tracing starts at the first sampled cycle, so the first
+      report compares two cycles N apart)
+    - SIGUSR2: profile the next cycle once, whatever PROFILE_EVERY_N_CYCLES is
+
+    kill -USR2 $(pidof python)
+    python -m pstats /var/log/radius_healthcheck_daemon_profiles/profile-<time>-cycle<N>.pstats
+
+Output and Rotation:
+    Files are written to PROFILE_DIR as profile-<time>-cycle<N>.pstats and
+    tracemalloc-<time>-cycle<N>.txt. Only the newest PROFILE_KEEP files of
+    each kind are kept.
+
+Overhead:
+    Cycles that are not sampled pay one integer check. tracemalloc slows
+    allocations down while it is tracing, so keep TRACEMALLOC_EVERY_N_CYCLES
+    for investigations.
+
+Worker Threads:
+    cProfile only follows the thread that enables it. Work the cycle hands
+    to executor threads (the probes in ProbeRunner and the concurrent
+    getHealth calls) is run through run_profiled(), which profiles it on its
+    own thread while a cycle is sampled and adds it to the cycle's .pstats
+    file. Worker calls still running when the cycle ends are left out. On
+    Python 3.12 and later cProfile already receives the events of every
+    thread, and run_profiled() just calls the function.
+
+Usage Example:
+    from .profiling import CycleProfiler
+
+    profiler = CycleProfiler("/var/log/profiles", profile_every=100, tracemalloc_every=0)
+    profiler.start_cycle(cycle_number)
+    ...                                   # the cycle
+    profiler.end_cycle()                  # writes the files of a sampled cycle
+
+    executor.submit(run_profiled, probe)  # worker thread work in the profile
+
+Author: Nathan Bray
+Version: 1.0
+Last Modified: 2025
+"""
+
+import cProfile
+import linecache
+import logging
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+# Logger for profiling operations - uses environment variable for consistency
+logger = logging.getLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
+
+# Defaults (PROFILE_DIR, PROFILE_KEEP)
+DEFAULT_PROFILE_DIR = "/var/log/radius_healthcheck_daemon_profiles"
+DEFAULT_PROFILE_KEEP = 10
+
+# Allocation sites listed per tracemalloc report, and frames kept per allocation
+TRACEMALLOC_TOP = 25
+TRACEMALLOC_FRAMES = 10
+
+# Allocations by the profiler and the tracing machinery (report formatting
+# fills linecache) are left out of the reports
+_TRACEMALLOC_FILTERS = [
+    tracemalloc.Filter(False, __file__, all_frames=True),
+    tracemalloc.Filter(False, linecache.__file__, all_frames=True),
+    tracemalloc.Filter(False, tracemalloc.__file__, all_frames=True),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+# Set by SIGUSR2 (request_profile) and consumed by the next sampled cycle
+_profile_requested = threading.Event()
+
+
+# Profiler of the cycle being profiled, collecting worker thread profiles
+_active: Optional["CycleProfiler"] = None
+
+
+def request_profile() -> None:
+    """Profile the next cycle once (safe to call from a signal handler)."""
+    _profile_requested.set()
+
+
+def run_profiled(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Call func, profiling it on the calling worker thread while a cycle is profiled.
+
+    Returns:
+        The return value of func; its exceptions propagate unchanged
+    """
+    profiler = _active
+    if profiler is None:
+        return func(*args, **kwargs)
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError:
+        # Python 3.12+: the cycle's profiler already sees every thread
+        return func(*args, **kwargs)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profile.disable()
+        profiler._add_worker_profile(profile)
+
+
+class CycleProfiler:
+    """
+    Runs selected cycles under cProfile and tracks allocation growth with tracemalloc.
+
+    Attributes:
+        output_dir (str): Directory the reports are written to
+        profile_every (int): Profile every Nth cycle (0 disables)
+        tracemalloc_every (int): Snapshot allocations every Nth cycle (0 disables)
+        keep (int): Newest reports kept per kind
+    """
+
+    def __init__(self,
+                 output_dir: str = DEFAULT_PROFILE_DIR,
+                 profile_every: int = 0,
+                 tracemalloc_every: int = 0,
+                 keep: int = DEFAULT_PROFILE_KEEP):
+        self.output_dir = output_dir
+        self.profile_every = profile_every
+        self.tracemalloc_every = tracemalloc_every
+        self.keep = keep
+        self._cycle: Optional[int] = None
+        self._profile: Optional[cProfile.Profile] = None
+        self._worker_profiles: List[cProfile.Profile] = []
+        self._worker_lock = threading.Lock()
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._started_tracemalloc = False
+        self._profiles_written = 0
+        self._tracemalloc_reports = 0
+        self._last_report: Optional[str] = None
+
+    @staticmethod
+    def _due(every: int, cycle_number: int) -> bool:
+        return every > 0 and cycle_number % every == 0
+
+    def start_cycle(self, cycle_number: int) -> None:
+        """Start profiling if this cycle is sampled or a profile was requested."""
+        global _active
+        self._cycle = cycle_number
+        if _profile_requested.is_set() or self._due(self.profile_every, cycle_number):
+            _profile_requested.clear()
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+            _active = self
+
+    def _add_worker_profile(self, profile: cProfile.Profile) -> None:
+        with self._worker_lock:
+            if self._profile is not None:
+                self._worker_profiles.append(profile)
+
+    def _stop_profile(self) -> List[cProfile.Profile]:
+        """Stop profiling; returns the cycle's profile followed by the worker profiles."""
+        global _active
+        if _active is self:
+            _active = None
+        with self._worker_lock:
+            profile, self._profile = self._profile, None
+            workers, self._worker_profiles = self._worker_profiles, []
+        if profile is None:
+            return []
+        profile.disable()
+        return [profile] + workers
+
+    def end_cycle(self) -> None:
+        """
+        Stop profiling and write the reports of a sampled cycle.
+
+        Only the first call after start_cycle() acts, so a cycle interrupted by
+        an exception can be ended from the error path. Write errors are logged,
+        not raised.
+        """
+        cycle_number, self._cycle = self._cycle, None
+        if cycle_number is None:
+            return
+        profiles = self._stop_profile()
+        if profiles:
+            try:
+                self._write_profile(profiles, cycle_number)
+            except Exception as e:
+                logger.warning(f"Failed to write cycle profile: {e}")
+        if self._due(self.tracemalloc_every, cycle_number):
+            try:
+                self._tracemalloc_sample(cycle_number)
+            except Exception as e:
+                logger.warning(f"Failed to write tracemalloc report: {e}")
+
+    def _path(self, kind: str, cycle_number: int, extension: str) -> str:
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        return os.path.join(self.output_dir, f"{kind}-{stamp}-cycle{cycle_number}{extension}")
+
+    def _write_profile(self, profiles: List[cProfile.Profile], cycle_number: int) -> None:
+        path = self._path("profile", cycle_number, ".pstats")
+        stats = pstats.Stats(profiles[0])
+        for worker in profiles[1:]:
+            stats.add(worker)
+        stats.dump_stats(path)
+        self._profiles_written += 1
+        self._last_report = path
+        self._rotate("profile-", ".pstats")
+        logger.info(f"Cycle {cycle_number} profile written to {path} "
+                    f"({len(profiles) - 1} worker thread calls included)")
+
+    def _tracemalloc_sample(self, cycle_number: int) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._started_tracemalloc = True
+            self._snapshot = None
+        snapshot = tracemalloc.take_snapshot().filter_traces(_TRACEMALLOC_FILTERS)
+        previous, self._snapshot = self._snapshot, snapshot
+        if previous is None:
+            logger.info(f"tracemalloc baseline taken at cycle {cycle_number}")
+            return
+
+        stats = snapshot.compare_to(previous, "traceback")
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [
+            f"tracemalloc allocation growth at cycle {cycle_number} "
+            f"(since the snapshot {self.tracemalloc_every} cycles earlier)",
+            f"traced memory: {current / 1024:.1f} KiB current, {peak / 1024:.1f} KiB peak",
+            f"net growth: {sum(s.size_diff for s in stats) / 1024:+.1f} KiB "
+            f"in {sum(s.count_diff for s in stats):+d} blocks",
+            "",
+        ]
+        for index, stat in enumerate(stats[:TRACEMALLOC_TOP], 1):
+            lines.append(f"#{index}: {stat.size_diff / 1024:+.1f} KiB ({stat.count_diff:+d} blocks), "
+                         f"now {stat.size / 1024:.1f} KiB in {stat.count} blocks")
+            lines.extend(f"    {line}" for line in stat.traceback.format())
+        path = self._path("tracemalloc", cycle_number, ".txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        self._tracemalloc_reports += 1
+        self._last_report = path
+        self._rotate("tracemalloc-", ".txt")
+        logger.info(f"Cycle {cycle_number} allocation report written to {path}")
+
+    def _rotate(self, prefix: str, extension: str) -> None:
+        """Delete all but the newest `keep` reports of one kind."""
+        reports = sorted((os.path.join(self.output_dir, name) for name in os.listdir(self.output_dir)
+                          if name.startswith(prefix) and name.endswith(extension)),
+                         key=os.path.getmtime)
+        for path in reports[:-self.keep] if self.keep > 0 else reports:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Stop tracing started by this profiler."""
+        self._stop_profile()
+        if self._started_tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracemalloc = False
+        self._snapshot = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Reports written so far."""
+        return {
+            "profiles_written": self._profiles_written,
+            "tracemalloc_reports": self._tracemalloc_reports,
+            "tracemalloc_tracing": tracemalloc.is_tracing(),
+            "last_report": self._last_report
+        }
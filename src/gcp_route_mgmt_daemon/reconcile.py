@@ -0,0 +1,165 @@
+"""
+Desired-State Reconciliation Cache
+
+This module remembers the last state the daemon confirmed as applied on each
+managed resource (the local Cloud Router's advertised ranges and the Cloudflare
+route priorities) so that steady-state cycles do not have to read the resource
+again just to find that nothing has changed.
+
+Reconciliation Semantics:
+    - A resource is "confirmed" when a read showed it already matched the
+      desired state (NO_CHANGE). Writes are not treated as confirmation; the
+      next cycle reads the resource again and confirms it
+    - While the desired state is unchanged and the confirmation is younger than
+      the drift-check interval, callers skip the read entirely
+    - When the desired state changes, the confirmation expires, or an operation
+      fails, the next cycle reads the resource again
+    - A read that finds changes needed for a desired state that had been
+      confirmed is out-of-band drift; it is counted and logged by the caller
+
+Cache Keys:
+    Callers build keys from the resource identity, e.g.
+    "bgp:{project}/{region}/{router}" or "cloudflare:{account_id}:{filter}".
+    The desired value must support equality (tuples, ints).
+
+Drift Check Interval:
+    DRIFT_CHECK_INTERVAL_SECONDS bounds how long an out-of-band change (made in
+    the console or by another tool) can go unnoticed. 0 disables skipping, so
+    every cycle reads the resource as before.
+
+Usage Example:
+    from .reconcile import ReconciliationCache
+
+    cache = ReconciliationCache(drift_check_interval=300)
+    reconciler = reconcile_bgp_advertisements(..., cache=cache)
+    reconciler()          # reads the router, confirms if already correct
+    reconciler()          # skipped: desired state unchanged and confirmed recently
+    print(cache.stats())
+
+Thread Safety:
+    All methods are protected by an internal lock.
+
+Author: Nathan Bray
+Version: 1.0
+Last Modified: 2025
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# Logger for reconciliation operations - uses environment variable for consistency
+logger = logging.getLogger(os.getenv("LOGGER_NAME", "HEALTH_CHECK_DAEMON"))
+
+# Default drift-check interval (seconds) - 5 cycles at the default check interval
+DEFAULT_DRIFT_CHECK_INTERVAL = 300
+
+
+@dataclass
+class ConfirmedState:
+    """Last state confirmed as applied for one resource"""
+    desired: Any
+    observed: Any = None
+    confirmed_at: float = 0.0
+
+
+class ReconciliationCache:
+    """
+    Remembers confirmed desired state per resource to skip redundant reads.
+
+    Attributes:
+        drift_check_interval (float): Maximum age in seconds of a confirmation
+            that still allows a read to be skipped; 0 disables skipping
+    """
+
+    def __init__(self,
+                 drift_check_interval: float = DEFAULT_DRIFT_CHECK_INTERVAL,
+                 clock: Callable[[], float] = time.monotonic):
+        if drift_check_interval < 0:
+            raise ValueError("drift_check_interval must be >= 0")
+
+        self.drift_check_interval = drift_check_interval
+        self._clock = clock
+        self._entries: Dict[Hashable, ConfirmedState] = {}
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._drift_detected = 0
+
+    def should_skip(self, key: Hashable, desired: Any) -> bool:
+        """
+        Decide whether the read for `key` can be skipped this cycle.
+
+        Args:
+            key: Resource identity
+            desired: Desired state the caller is about to apply
+
+        Returns:
+            bool: True if `desired` matches the last confirmed state and the
+                confirmation is newer than the drift-check interval
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            skip = (
+                self.drift_check_interval > 0
+                and entry is not None
+                and entry.desired == desired
+                and self._clock() - entry.confirmed_at < self.drift_check_interval
+            )
+            if skip:
+                self._hits += 1
+            else:
+                self._misses += 1
+            return skip
+
+    def was_confirmed(self, key: Hashable, desired: Any) -> bool:
+        """Return True if `desired` was the last confirmed state, regardless of age."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry.desired == desired
+
+    def confirm(self, key: Hashable, desired: Any, observed: Any = None) -> None:
+        """Record that a read showed the resource already in the desired state."""
+        with self._lock:
+            self._entries[key] = ConfirmedState(desired=desired, observed=observed,
+                                                confirmed_at=self._clock())
+
+    def record_drift(self, key: Hashable) -> None:
+        """Count out-of-band drift found for a previously confirmed resource."""
+        with self._lock:
+            self._drift_detected += 1
+            self._entries.pop(key, None)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Forget the confirmation for `key`, or for every resource if omitted."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def get(self, key: Hashable) -> Optional[ConfirmedState]:
+        """Return the confirmed state for `key`, if any."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of cache counters.
+
+        Returns:
+            Dict[str, Any]: drift_check_interval, entries, hits (reads skipped),
+                misses (reads performed) and drift_detected
+        """
+        with self._lock:
+            return {
+                "drift_check_interval": self.drift_check_interval,
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "drift_detected": self._drift_detected
+            }
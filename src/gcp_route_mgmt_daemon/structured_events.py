@@ -1,13 +1,19 @@
 import logging
 import json
+import sys
 import time
-from typing import Dict, Any, Optional
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Union, Callable
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from .logging_setup import accepts_structured_events
+from .flight_recorder import FlightRecord, get_flight_recorder
 
 class EventType(Enum):
     """Standard event types for structured logging"""
     BGP_ADVERTISEMENT_CHANGE = "bgp_advertisement_change"
+    BGP_OPERATION_RESULT = "bgp_operation_result"
     CLOUDFLARE_ROUTE_UPDATE = "cloudflare_route_update"
     HEALTH_CHECK_RESULT = "health_check_result"
     STATE_TRANSITION = "state_transition"
@@ -21,78 +27,150 @@ class ActionResult(Enum):
     NO_CHANGE = "no_change"
     SKIPPED = "skipped"
 
-@dataclass
+# Log level for each result value; anything else logs at INFO
+# (skipped operations are informational, not errors)
+_RESULT_LEVELS = {
+    ActionResult.FAILURE.value: logging.ERROR,
+    ActionResult.NO_CHANGE.value: logging.DEBUG,
+}
+
+@dataclass(slots=True)
 class StructuredEvent:
-    """Base structure for all structured log events"""
+    """
+    Base structure for all structured log events.
+
+    Slotted (no per-instance __dict__), and component/operation are interned
+    so events held by the flight recorder or a buffering handler share one
+    copy of each name.
+    """
     event_type: str
     timestamp: float
     result: str
     component: str
     operation: str
-    details: Dict[str, Any]
+    details: Union[Dict[str, Any], Callable[[], Dict[str, Any]]]
     duration_ms: Optional[int] = None
     error_message: Optional[str] = None
     correlation_id: Optional[str] = None
 
+    def __post_init__(self):
+        if type(self.component) is str:
+            self.component = sys.intern(self.component)
+        if type(self.operation) is str:
+            self.operation = sys.intern(self.operation)
+
+    def to_log_dict(self) -> Dict[str, Any]:
+        """
+        Build the json_fields payload handed to the formatters.
+
+        Fields are referenced, not copied (asdict() would deep-copy details),
+        and the dict is built in one step so every handler shares it.
+        """
+        return {
+            "structured_event": True,
+            "event_type": self.event_type,
+            "timestamp": self.timestamp,
+            "result": self.result,
+            "component": self.component,
+            "operation": self.operation,
+            "details": self.details,
+            "duration_ms": self.duration_ms,
+            "error_message": self.error_message,
+            "correlation_id": self.correlation_id
+        }
+
 class StructuredEventLogger:
     """Handles structured logging for daemon events with GCP Cloud Logging optimization"""
     
     def __init__(self, logger_name: str):
         self.logger = logging.getLogger(logger_name)
         self.correlation_id = None
+        # Per-thread correlation override used by probe worker threads so that
+        # events emitted after the cycle has moved on keep their original ID
+        self._thread_state = threading.local()
     
     def set_correlation_id(self, correlation_id: str):
         """Set correlation ID for tracking related events across a health check cycle"""
         self.correlation_id = correlation_id
+
+    @contextmanager
+    def correlation_scope(self, correlation_id: Optional[str]):
+        """Bind a correlation ID to the calling thread for the duration of the block"""
+        previous = getattr(self._thread_state, "correlation_id", None)
+        self._thread_state.correlation_id = correlation_id
+        try:
+            yield
+        finally:
+            self._thread_state.correlation_id = previous
+
+    def current_correlation_id(self) -> Optional[str]:
+        """Return the thread-bound correlation ID, falling back to the shared one"""
+        return getattr(self._thread_state, "correlation_id", None) or self.correlation_id
     
     def log_event(self, event) -> None:
-        """Log a structured event with consistent schema"""
+        """
+        Log a structured event with consistent schema.
+
+        The payload is only built when a handler will receive it: nothing is
+        copied when the level is disabled or every handler filters structured
+        events out. "details" may be a zero-argument callable returning the
+        details dict, so large per-cycle payloads are not even constructed in
+        that case.
+
+        When a flight recorder is installed, every event is recorded first,
+        regardless of level or handlers. Lazy details are then built right
+        away, so the record holds this moment's values, and the same dict is
+        passed to the handlers.
+        """
+        if not isinstance(event, (StructuredEvent, dict)):
+            raise TypeError(f"Event must be StructuredEvent dataclass or dict, got {type(event)}")
+
+        # Log at appropriate level based on result
+        if isinstance(event, dict):
+            result = event.get("result")
+        else:
+            result = event.result
+        level = _RESULT_LEVELS.get(result, logging.INFO) if isinstance(result, str) else logging.INFO
+
+        details = event.details if isinstance(event, StructuredEvent) else event.get("details")
+        recorder = get_flight_recorder()
+        if recorder is not None:
+            if callable(details):
+                details = details()
+            self._record(recorder, event, level, details)
+
+        if not self.logger.isEnabledFor(level) or not accepts_structured_events(self.logger, level):
+            return
+
         # Handle both StructuredEvent dataclass instances and raw dictionaries
+        correlation_id = self.current_correlation_id()
         if isinstance(event, StructuredEvent):
             # It's a dataclass instance
-            if self.correlation_id:
-                event.correlation_id = self.correlation_id
-            log_data = {
-                "structured_event": True,
-                **asdict(event)
-            }
-        elif isinstance(event, dict):
+            if correlation_id:
+                event.correlation_id = correlation_id
+            log_data = event.to_log_dict()
+            component = event.component
+            operation = event.operation
+            result_str = event.result
+            error_message = event.error_message
+        else:
             # It's a raw dictionary (legacy usage)
             log_data = {
                 "structured_event": True,
                 **event
             }
-            if self.correlation_id:
-                log_data["correlation_id"] = self.correlation_id
-        else:
-            raise TypeError(f"Event must be StructuredEvent dataclass or dict, got {type(event)}")
-        
-        # Log at appropriate level based on result
-        level = logging.INFO
-        if isinstance(event, dict):
-            result = event.get("result")
-        else:
-            result = event.result
-
-        if result == ActionResult.FAILURE.value:
-            level = logging.ERROR
-        elif result == ActionResult.NO_CHANGE.value:
-            level = logging.DEBUG
-        elif result == ActionResult.SKIPPED.value:
-            level = logging.INFO  # Skipped operations are informational, not errors
-            
-        # Format message for human readability while preserving structure
-        if isinstance(event, dict):
+            if correlation_id:
+                log_data["correlation_id"] = correlation_id
             component = event.get("component", "unknown")
             operation = event.get("operation", "unknown")
             result_str = event.get("result", "unknown")
             error_message = event.get("error_message")
-        else:
-            component = event.component
-            operation = event.operation
-            result_str = event.result
-            error_message = event.error_message
-            
+
+        # Materialize lazily built details now that a handler will format them
+        if callable(log_data.get("details")):
+            log_data["details"] = details() if callable(details) else details
+
+        # Format message for human readability while preserving structure
         message = f"{component}.{operation}: {result_str}"
         if error_message:
             message += f" - {error_message}"
@@ -100,6 +178,21 @@ class StructuredEventLogger:
         # Use extra parameter for structured data in GCP Cloud Logging
         self.logger.log(level, message, extra={"json_fields": log_data})
     
+    def _record(self, recorder, event, level, details) -> None:
+        """Store an event in the flight recorder with its already built details."""
+        correlation_id = self.current_correlation_id()
+        if isinstance(event, StructuredEvent):
+            record = FlightRecord(event.timestamp, level, event.event_type, event.result,
+                                  event.component, event.operation, details,
+                                  event.duration_ms, event.error_message,
+                                  correlation_id or event.correlation_id)
+        else:
+            record = FlightRecord(event.get("timestamp", time.time()), level, event.get("event_type"),
+                                  event.get("result"), event.get("component"), event.get("operation"),
+                                  details, event.get("duration_ms"),
+                                  event.get("error_message"), correlation_id or event.get("correlation_id"))
+        recorder.record(record)
+
     def log_bgp_advertisement(self,
                             project: str,
                             region: str,
@@ -132,6 +225,45 @@ class StructuredEventLogger:
         
         self.log_event(event)
     
+    def log_bgp_operation_result(self,
+                                 project: str,
+                                 region: str,
+                                 router: str,
+                                 operation_id: str,
+                                 status: str,  # "completed", "failed" or "timed_out"
+                                 prefixes: tuple = (),
+                                 propagation_ms: int = None,
+                                 operation_duration_ms: int = None,
+                                 polls: int = None,
+                                 submitted_correlation_id: str = None,
+                                 error_message: str = None) -> None:
+        """Log the final outcome of a router operation tracked in the background"""
+        
+        result = ActionResult.SUCCESS if status == "completed" else ActionResult.FAILURE
+        
+        event = StructuredEvent(
+            event_type=EventType.BGP_OPERATION_RESULT.value,
+            timestamp=time.time(),
+            result=result.value,
+            component="gcp_bgp",
+            operation="router_operation",
+            details={
+                "gcp_project": project,
+                "gcp_region": region,
+                "router_name": router,
+                "operation_id": operation_id,
+                "status": status,
+                "ip_prefixes": list(prefixes),
+                "operation_duration_ms": operation_duration_ms,
+                "polls": polls,
+                "submitted_correlation_id": submitted_correlation_id
+            },
+            duration_ms=propagation_ms,
+            error_message=error_message
+        )
+        
+        self.log_event(event)
+    
     def log_cloudflare_update(self,
                             account_id: str,
                             description_filter: str,
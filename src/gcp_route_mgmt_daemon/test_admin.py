@@ -0,0 +1,167 @@
+"""
+Unit Tests for the Admin and Health HTTP Endpoint
+
+This test module validates DaemonStatus, the snapshot the control loop
+publishes after each cycle, and the /healthz, /readyz and /state endpoints
+served from it.
+
+Test Coverage:
+    - Liveness during startup, after cycles and failed iterations, and when stale
+    - Readiness before the first cycle, after it and during shutdown
+    - Snapshot age and time in state computed at read time
+    - HTTP status codes and JSON bodies, 404 elsewhere
+    - get_daemon_info including the published status
+    - Endpoint started from configuration, unavailable port tolerated
+    - Latency of the most recent call of each API
+
+Author: Nathan Bray
+Created: 2025-11-01
+"""
+
+import unittest
+from unittest.mock import Mock
+import json
+import socket
+import urllib.error
+import urllib.request
+
+try:
+    from .admin import AdminServer, DaemonStatus
+    from . import admin
+    from . import daemon
+    from . import metrics
+except ImportError:
+    from admin import AdminServer, DaemonStatus
+    import admin
+    import daemon
+    import metrics
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDaemonStatus(unittest.TestCase):
+    """Test suite for liveness, readiness and the published snapshot."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.status = DaemonStatus(clock=self.clock)
+
+    def test_liveness(self):
+        """Test the startup grace period, heartbeats from cycles and errors, and staleness."""
+        self.clock.now += 100
+        self.assertEqual(self.status.liveness(180), (True, {"status": "ok", "starting_for_seconds": 100.0}))
+
+        self.status.publish({"state_code": 1})
+        self.clock.now += 150
+        self.status.record_error("boom", 1)
+        self.clock.now += 100
+        self.assertTrue(self.status.liveness(180)[0])
+
+        self.clock.now += 81
+        live, body = self.status.liveness(180)
+        self.assertFalse(live)
+        self.assertEqual(body["status"], "stale")
+
+    def test_readiness(self):
+        """Test not ready before the first cycle or during shutdown, ready after a cycle."""
+        self.assertEqual(self.status.readiness(180)[1]["status"], "starting")
+
+        self.status.publish({"state_code": 3})
+        self.clock.now += 5
+
+        self.assertEqual(self.status.readiness(180),
+                         (True, {"status": "ok", "state_code": 3, "last_cycle_age_seconds": 5.0}))
+        self.assertEqual(self.status.readiness(180, shutting_down=True)[1]["status"], "shutting_down")
+        self.clock.now += 200
+        self.assertEqual(self.status.readiness(180)[1]["status"], "stale")
+
+    def test_snapshot(self):
+        """Test that age and time in state are computed when read and errors keep the last cycle."""
+        self.assertIsNone(self.status.snapshot()["last_cycle"])
+
+        cycle = {"state_code": 2, "state_since": self.clock.now - 60}
+        self.status.publish(cycle)
+        self.clock.now += 10
+        self.status.record_error("timeout", 2)
+        snapshot = self.status.snapshot()
+
+        self.assertIs(snapshot["last_cycle"], cycle)
+        self.assertEqual((snapshot["last_cycle_age_seconds"], snapshot["time_in_state_seconds"]), (10.0, 70.0))
+        self.assertEqual(snapshot["last_error"]["consecutive_errors"], 2)
+
+
+class TestAdminServer(unittest.TestCase):
+    """Test suite for the HTTP endpoints."""
+
+    def _get(self, server, path):
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.port}{path}", timeout=5) as response:
+                return response.status, response.headers["Content-Type"], json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            body = e.read()
+            return e.code, e.headers["Content-Type"], json.loads(body) if e.code != 404 else None
+
+    def test_endpoints(self):
+        """Test status codes and bodies of /healthz, /readyz, /state and unknown paths."""
+        status = DaemonStatus()
+        server = AdminServer("127.0.0.1", 0, stale_after=60, status=status,
+                             info=lambda: {"name": "test", "status": status.snapshot()})
+        server.start()
+        try:
+            before = [self._get(server, path)[0] for path in ("/healthz", "/readyz")]
+            status.publish({"state_code": 1, "circuit_breakers": {"cloudflare": {"state": "CLOSED"}}})
+            healthz = self._get(server, "/healthz")
+            readyz = self._get(server, "/readyz?verbose=1")
+            state = self._get(server, "/state")
+            missing = self._get(server, "/")
+        finally:
+            server.stop()
+
+        self.assertEqual(before, [200, 503])
+        self.assertEqual((healthz[0], healthz[1]), (200, admin.CONTENT_TYPE))
+        self.assertEqual((readyz[0], readyz[2]["state_code"]), (200, 1))
+        self.assertEqual(state[2]["status"]["last_cycle"]["circuit_breakers"]["cloudflare"]["state"], "CLOSED")
+        self.assertEqual(missing[0], 404)
+
+    def test_get_daemon_info_includes_status(self):
+        """Test that get_daemon_info reports uptime and the process-wide status."""
+        info = daemon.get_daemon_info()
+
+        self.assertIn("uptime_seconds", info)
+        self.assertEqual(set(info["status"]), {"last_cycle", "last_cycle_age_seconds", "time_in_state_seconds",
+                                               "last_error"})
+
+    def test_start_from_config(self):
+        """Test that port 0 disables the endpoint and a port in use is logged, not raised."""
+        self.assertIsNone(daemon.start_admin_server(Mock(admin_port=0)))
+
+        with socket.socket() as busy:
+            busy.bind(("127.0.0.1", 0))
+            busy.listen()
+            cfg = Mock(admin_port=busy.getsockname()[1], admin_bind_address="127.0.0.1",
+                       admin_stale_after=0, check_interval=60)
+            with self.assertLogs(level="ERROR"):
+                self.assertIsNone(daemon.start_admin_server(cfg))
+
+    def test_last_api_calls(self):
+        """Test that the most recent call of each API is kept with its outcome."""
+        with metrics.time_api_call("test.admin.latency"):
+            pass
+        with metrics.time_api_call("test.admin.latency") as timer:
+            timer.failed = True
+
+        last = metrics.last_api_calls()["test.admin.latency"]
+        self.assertEqual(last["outcome"], "error")
+        self.assertGreaterEqual(last["duration_ms"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
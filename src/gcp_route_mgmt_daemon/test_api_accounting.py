@@ -0,0 +1,132 @@
+"""
+Unit Tests for API Call Accounting and Quota Budgets
+
+This test module validates ApiUsageTracker, which counts Compute and
+Cloudflare API calls per minute and throttles optional reads as usage
+approaches the configured budgets.
+
+Test Coverage:
+    - Read, write and Cloudflare quota classification of API names
+    - Sliding one-minute window per API, totals since start
+    - Throttle factor from the throttle threshold to the budget, read quotas only
+    - Over-budget quotas and usage figures for the cycle details
+    - Calls recorded through metrics.time_api_call, batches as their sub-requests
+    - Quota gauges in the metrics exposition
+
+Author: Nathan Bray
+Created: 2025-11-01
+"""
+
+import unittest
+
+try:
+    from .api_accounting import ApiUsageTracker, API_USAGE, MAX_THROTTLE_FACTOR, quota_for
+    from . import metrics
+except ImportError:
+    from api_accounting import ApiUsageTracker, API_USAGE, MAX_THROTTLE_FACTOR, quota_for
+    import metrics
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 5000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestApiUsageTracker(unittest.TestCase):
+    """Test suite for per-minute accounting and budgets."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.tracker = ApiUsageTracker(clock=self.clock)
+
+    def test_quota_for(self):
+        """Test that API names map to the quota they are charged against."""
+        self.assertEqual(quota_for("compute.regionBackendServices.getHealth"), "compute_read")
+        self.assertEqual(quota_for("compute.batch.getHealth"), "compute_read")
+        self.assertEqual(quota_for("compute.regionOperations.get"), "compute_read")
+        self.assertEqual(quota_for("compute.routers.patch"), "compute_write")
+        self.assertEqual(quota_for("cloudflare.put"), "cloudflare")
+        self.assertEqual(quota_for("dns.lookup"), "other")
+
+    def test_sliding_window(self):
+        """Test that calls leave the per-minute counts after 60 seconds but stay in the totals."""
+        self.tracker.record("compute.routers.get")
+        self.clock.now += 30
+        self.tracker.record("compute.routers.get", calls=3)
+        self.tracker.record("cloudflare.get")
+        self.assertEqual(self.tracker.calls_per_minute(), {"compute.routers.get": 4, "cloudflare.get": 1})
+
+        self.clock.now += 30
+        self.assertEqual(self.tracker.calls_per_minute(), {"compute.routers.get": 3, "cloudflare.get": 1})
+        self.clock.now += 30
+        self.assertEqual(self.tracker.calls_per_minute(), {})
+        self.assertEqual(self.tracker.stats()["total_calls"], {"cloudflare.get": 1, "compute.routers.get": 4})
+
+    def test_throttle_factor(self):
+        """Test that throttling starts at the threshold, peaks at the budget and ignores writes."""
+        self.tracker.configure({"compute_read": 100, "compute_write": 10, "cloudflare": 0}, throttle_pct=80)
+        self.tracker.record("compute.routers.patch", calls=50)
+        self.tracker.record("cloudflare.get", calls=1000)
+        self.assertEqual(self.tracker.throttle_factor(), 1.0)
+
+        for reads, factor in ((79, 1.0), (90, 2.5), (150, MAX_THROTTLE_FACTOR)):
+            with self.subTest(reads=reads):
+                self.assertEqual(self.tracker.throttle_factor({"compute_read": reads}), factor)
+
+        self.tracker.configure({"compute_read": 100}, throttle_pct=100)
+        self.assertEqual(self.tracker.throttle_factor({"compute_read": 99}), 1.0)
+        self.assertEqual(self.tracker.throttle_factor({"compute_read": 100}), MAX_THROTTLE_FACTOR)
+
+    def test_over_budget_and_stats(self):
+        """Test over-budget quotas and the figures reported in the cycle details."""
+        self.tracker.configure({"compute_read": 100, "compute_write": 10}, throttle_pct=80)
+        self.tracker.record("compute.batch.getHealth", calls=85)
+        self.tracker.record("compute.routers.patch", calls=12)
+
+        stats = self.tracker.stats()
+
+        self.assertEqual(self.tracker.over_budget(), {"compute_write": 12})
+        self.assertEqual(stats["calls_per_minute"], {"compute.batch.getHealth": 85, "compute.routers.patch": 12})
+        self.assertEqual(stats["quotas"]["compute_read"], {"calls_per_minute": 85, "budget": 100, "usage_pct": 85.0})
+        self.assertEqual(stats["quotas"]["cloudflare"], {"calls_per_minute": 0, "budget": None, "usage_pct": None})
+        self.assertEqual(stats["throttle_factor"], 1.75)
+
+
+class TestApiCallRecording(unittest.TestCase):
+    """Test suite for calls recorded by metrics.time_api_call."""
+
+    def test_time_api_call_counts_batches(self):
+        """Test that timed calls are counted, a batch as its sub-requests, also on errors."""
+        before = API_USAGE.stats()["total_calls"].get("compute.batch.getHealth", 0)
+        counter = metrics.API_CALLS.labels("compute.batch.getHealth", "compute_read").value
+
+        with metrics.time_api_call("compute.batch.getHealth", calls=40):
+            pass
+        with self.assertRaises(TimeoutError):
+            with metrics.time_api_call("compute.batch.getHealth", calls=2):
+                raise TimeoutError("slow")
+
+        self.assertEqual(API_USAGE.stats()["total_calls"]["compute.batch.getHealth"] - before, 42)
+        self.assertEqual(metrics.API_CALLS.labels("compute.batch.getHealth", "compute_read").value - counter, 42)
+
+    def test_quota_gauges_rendered(self):
+        """Test that usage, budgets and the throttle factor are exposed as gauges."""
+        budgets = dict(API_USAGE.budgets)
+        API_USAGE.configure({"compute_read": 1000000})
+        try:
+            text = metrics.REGISTRY.render()
+        finally:
+            API_USAGE.configure(budgets)
+
+        self.assertIn('gcp_route_mgmt_api_quota_budget_per_minute{quota="compute_read"} 1000000\n', text)
+        self.assertIn('gcp_route_mgmt_api_quota_calls_per_minute{quota="compute_write"}', text)
+        self.assertIn("gcp_route_mgmt_api_throttle_factor 1\n", text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,222 @@
+"""
+Unit Tests for the Compute Client Pool
+
+This test module validates the ComputeClientPool used to hand out per-worker
+Compute Engine clients for concurrent GCP calls.
+
+Test Coverage:
+    - Parameter validation
+    - Lazy client creation bounded by pool size
+    - Exclusive checkout (no client shared by two threads at once)
+    - Blocking checkout and checkout timeout
+    - Checkout/return metrics
+    - Shared credentials refreshed once across concurrent checkouts
+    - Failed token refresh returning the client to the pool
+    - Factory failure releasing the reserved slot
+
+Author: Nathan Bray
+Created: 2025-11-01
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import threading
+import time
+
+try:
+    from .client_pool import ComputeClientPool
+except ImportError:
+    from client_pool import ComputeClientPool
+
+
+class _Counter:
+    """Factory that produces numbered fake clients."""
+
+    def __init__(self):
+        self.created = 0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.created += 1
+            return Mock(name=f"client-{self.created}")
+
+
+class TestComputeClientPoolInitialization(unittest.TestCase):
+    """Test suite for ComputeClientPool parameter validation."""
+
+    def test_invalid_size(self):
+        """Test that a pool size below 1 is rejected."""
+        with self.assertRaises(ValueError):
+            ComputeClientPool(Mock, size=0)
+
+    def test_invalid_checkout_timeout(self):
+        """Test that a non-positive checkout timeout is rejected."""
+        with self.assertRaises(ValueError):
+            ComputeClientPool(Mock, size=1, checkout_timeout=0)
+
+
+class TestComputeClientPoolCheckout(unittest.TestCase):
+    """Test suite for checkout/checkin behaviour."""
+
+    def test_clients_created_lazily_and_reused(self):
+        """Test that clients are built on demand and returned clients are reused."""
+        factory = _Counter()
+        pool = ComputeClientPool(factory, size=4)
+
+        with pool.client() as first:
+            pass
+        with pool.client() as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertEqual(factory.created, 1)
+
+    def test_concurrent_workers_get_distinct_clients(self):
+        """Test that no client is handed to two threads at the same time."""
+        pool = ComputeClientPool(_Counter(), size=4)
+        barrier = threading.Barrier(4)
+        held = []
+        lock = threading.Lock()
+
+        def worker():
+            with pool.client() as client:
+                with lock:
+                    held.append(client)
+                barrier.wait(timeout=5)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(set(map(id, held))), 4)
+        self.assertEqual(pool.stats()["peak_in_use"], 4)
+
+    def test_checkout_blocks_until_return(self):
+        """Test that checkout waits for a client when the pool is exhausted."""
+        pool = ComputeClientPool(_Counter(), size=1)
+        client = pool.checkout()
+
+        def release():
+            time.sleep(0.1)
+            pool.checkin(client)
+
+        threading.Thread(target=release).start()
+        start = time.monotonic()
+        second = pool.checkout(timeout=5)
+        waited = time.monotonic() - start
+
+        self.assertIs(second, client)
+        self.assertGreaterEqual(waited, 0.05)
+        stats = pool.stats()
+        self.assertEqual(stats["waits"], 1)
+        self.assertGreater(stats["wait_time_ms"], 0)
+        pool.checkin(second)
+
+    def test_checkout_timeout(self):
+        """Test that an exhausted pool raises TimeoutError after the timeout."""
+        pool = ComputeClientPool(_Counter(), size=1)
+        held = pool.checkout()
+
+        with self.assertRaises(TimeoutError):
+            pool.checkout(timeout=0.05)
+
+        self.assertEqual(pool.stats()["timeouts"], 1)
+        pool.checkin(held)
+
+    def test_factory_failure_releases_slot(self):
+        """Test that a failed client build does not leak pool capacity."""
+        factory = Mock(side_effect=[RuntimeError("discovery failed"), Mock()])
+        pool = ComputeClientPool(factory, size=1)
+
+        with self.assertRaises(RuntimeError):
+            pool.checkout()
+
+        stats = pool.stats()
+        self.assertEqual(stats["created"], 0)
+        self.assertEqual(stats["in_use"], 0)
+        with pool.client(timeout=0.1):
+            pass
+
+
+class TestComputeClientPoolMetrics(unittest.TestCase):
+    """Test suite for checkout/return metrics."""
+
+    def test_stats_track_checkouts_and_returns(self):
+        """Test that counters reflect checkouts, returns and idle clients."""
+        pool = ComputeClientPool(_Counter(), size=3)
+        a = pool.checkout()
+        b = pool.checkout()
+        pool.checkin(a)
+
+        stats = pool.stats()
+        self.assertEqual(stats["size"], 3)
+        self.assertEqual(stats["created"], 2)
+        self.assertEqual(stats["in_use"], 1)
+        self.assertEqual(stats["idle"], 1)
+        self.assertEqual(stats["checkouts"], 2)
+        self.assertEqual(stats["returns"], 1)
+        self.assertEqual(stats["timeouts"], 0)
+        pool.checkin(b)
+
+
+class TestComputeClientPoolCredentials(unittest.TestCase):
+    """Test suite for the shared credentials refresh."""
+
+    def test_expired_token_refreshed_once(self):
+        """Test that concurrent checkouts refresh the shared token only once."""
+        credentials = Mock()
+        credentials.valid = False
+
+        def refresh(request):
+            time.sleep(0.05)
+            credentials.valid = True
+
+        credentials.refresh.side_effect = refresh
+        pool = ComputeClientPool(_Counter(), size=4, credentials=credentials)
+
+        def worker():
+            with pool.client():
+                pass
+
+        with patch('google.auth.transport.requests.Request'):
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        self.assertEqual(credentials.refresh.call_count, 1)
+
+    def test_refresh_failure_returns_client(self):
+        """Test that a failed token refresh returns the client and the next checkout succeeds."""
+        credentials = Mock()
+        credentials.valid = False
+        credentials.refresh.side_effect = [OSError("metadata server unavailable"), None]
+        pool = ComputeClientPool(_Counter(), size=1, credentials=credentials)
+
+        with patch('google.auth.transport.requests.Request'):
+            with self.assertRaises(OSError):
+                pool.checkout(timeout=0.1)
+            self.assertEqual(pool.stats()["in_use"], 0)
+            with pool.client(timeout=0.1):
+                pass
+
+        self.assertEqual(pool.stats()["created"], 1)
+
+    def test_valid_token_not_refreshed(self):
+        """Test that a valid token is left alone."""
+        credentials = Mock()
+        credentials.valid = True
+        pool = ComputeClientPool(_Counter(), size=1, credentials=credentials)
+
+        with pool.client():
+            pass
+
+        credentials.refresh.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
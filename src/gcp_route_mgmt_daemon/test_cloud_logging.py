@@ -0,0 +1,264 @@
+"""
+Unit Tests for the Cloud Logging Exporter
+
+This test module validates batched export of log records against a local fake
+Cloud Logging entries.write endpoint.
+
+Test Coverage:
+    - Batches sent by size and by flush interval, with the entries.write body
+    - Structured events as jsonPayload, other records as textPayload
+    - Logging calls not waiting on a slow API
+    - Bounded buffer dropping the oldest entries, with counters
+    - Retry of failed batches, rejected batches, circuit breaker
+    - Final flush on close
+    - Payloads encoded with the static event fields, non-ASCII text
+    - gce_instance resource from configuration or the metadata server, global fallback
+
+Author: Nathan Bray
+Created: 2025-11-01
+"""
+
+import unittest
+from unittest.mock import patch
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+try:
+    from .cloud_logging import CloudLoggingExporter, detect_resource
+    from .circuit import CircuitBreaker
+    from . import cloud_logging
+    from . import encoding
+except ImportError:
+    from cloud_logging import CloudLoggingExporter, detect_resource
+    from circuit import CircuitBreaker
+    import cloud_logging
+    import encoding
+
+
+class FakeLoggingAPI:
+    """Local HTTP server recording entries.write requests."""
+
+    def __init__(self):
+        self.requests = []
+        self.statuses = []      # Status for each upcoming request; 200 once exhausted
+        self.delay = 0.0
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                if api.delay:
+                    time.sleep(api.delay)
+                api.requests.append(body)
+                status = api.statuses.pop(0) if api.statuses else 200
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.end_headers()
+                self.wfile.write(b'{}')
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.endpoint = f"http://127.0.0.1:{self.server.server_address[1]}/v2/entries:write"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def entries(self):
+        return [entry for body in self.requests for entry in body['entries']]
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class ExporterTestCase(unittest.TestCase):
+    """Fake API, exporter factory and a logger feeding the exporter."""
+
+    def setUp(self):
+        self.api = FakeLoggingAPI()
+        self.session = requests.Session()
+        self.exporters = []
+        self.logger = logging.getLogger(f"test_cloud_{self.id()}")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+
+    def tearDown(self):
+        for exporter in self.exporters:
+            self.logger.removeHandler(exporter)
+            exporter.close()
+        self.session.close()
+        self.api.close()
+
+    def _exporter(self, **kwargs):
+        kwargs.setdefault('flush_interval', 60)
+        kwargs.setdefault('circuit_breaker', CircuitBreaker(threshold=5, timeout=60, service_name="cloud_logging"))
+        exporter = CloudLoggingExporter("test-project", log_name="daemon/test", endpoint=self.api.endpoint,
+                                        session=self.session, **kwargs)
+        self.logger.addHandler(exporter)
+        self.exporters.append(exporter)
+        return exporter
+
+    def _wait_for(self, condition, timeout=5):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return condition()
+
+
+class TestBatching(ExporterTestCase):
+    """Test suite for batch composition and timing."""
+
+    def test_batches_by_size(self):
+        """Test that full batches are sent by the exporter thread and the rest on flush."""
+        exporter = self._exporter(batch_size=5)
+        self.logger.info("plain message")
+        self.logger.warning("event", extra={'json_fields': {'event_type': 'state_transition', 'result': 'success'}})
+        for i in range(10):
+            self.logger.debug(f"message {i}")
+
+        self.assertTrue(self._wait_for(lambda: len(self.api.requests) == 2))
+        self.assertTrue(exporter.flush())
+
+        self.assertEqual([len(body['entries']) for body in self.api.requests], [5, 5, 2])
+        body = self.api.requests[0]
+        self.assertEqual(body['logName'], "projects/test-project/logs/daemon%2Ftest")
+        self.assertEqual(body['resource'], {"type": "global"})
+        first, second = body['entries'][:2]
+        self.assertEqual((first['severity'], first['textPayload']), ("INFO", "plain message"))
+        self.assertEqual((second['severity'], second['jsonPayload']['event_type']), ("WARNING", "state_transition"))
+        self.assertTrue(first['timestamp'].endswith('Z'))
+        self.assertEqual(exporter.stats()['sent'], 12)
+
+    def test_payload_encoding(self):
+        """Test that structured payloads carry the static event fields and text is sent as UTF-8."""
+        saved = (encoding._encoder, encoding._static)
+        encoding.set_static_fields({"daemon": {"version": "0.5.1"}})
+        try:
+            exporter = self._exporter(resource={"type": "gce_instance", "labels": {"zone": "us-central1-a"}})
+            self.logger.info("routeur-é")
+            self.logger.info("event", extra={'json_fields': {'event_type': 'state_transition', 'router': 'é'}})
+            self.assertTrue(exporter.flush())
+        finally:
+            encoding._encoder, encoding._static = saved
+
+        body = self.api.requests[0]
+        text, event = body['entries']
+        self.assertEqual(body['resource']['type'], "gce_instance")
+        self.assertEqual(text['textPayload'], "routeur-é")
+        self.assertNotIn('daemon', text)
+        self.assertEqual(event['jsonPayload'], {'event_type': 'state_transition', 'router': 'é',
+                                                'daemon': {'version': '0.5.1'}})
+
+    def test_flush_interval(self):
+        """Test that a partial batch is sent once the flush interval passes."""
+        self._exporter(batch_size=100, flush_interval=0.05)
+        self.logger.info("lonely message")
+
+        self.assertTrue(self._wait_for(lambda: len(self.api.entries()) == 1))
+
+    def test_slow_api_does_not_block_logging(self):
+        """Test that logging calls return while the API is slow to respond."""
+        self.api.delay = 0.3
+        exporter = self._exporter(batch_size=50)
+
+        start = time.monotonic()
+        for i in range(200):
+            self.logger.info(f"message {i}")
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.2)
+        self.assertTrue(exporter.flush(timeout=20))
+        self.assertEqual([e['textPayload'] for e in self.api.entries()], [f"message {i}" for i in range(200)])
+
+
+class TestBackpressure(ExporterTestCase):
+    """Test suite for the bounded buffer, retries and the circuit breaker."""
+
+    def test_buffer_drops_oldest(self):
+        """Test that a full buffer keeps the newest entries and counts the dropped ones."""
+        self.api.statuses = [503] * 100
+        exporter = self._exporter(batch_size=10, buffer_size=10)
+        for i in range(25):
+            self.logger.info(f"message {i}")
+        self.assertFalse(exporter.flush(timeout=1))
+
+        stats = exporter.stats()
+        self.assertEqual((stats['buffered'], stats['dropped'], stats['sent']), (10, 15, 0))
+        self.api.statuses = []
+        exporter.circuit_breaker.reset()
+        self.assertTrue(exporter.flush())
+        self.assertEqual([e['textPayload'] for e in self.api.requests[-1]['entries']],
+                         [f"message {i}" for i in range(15, 25)])
+
+    def test_retry_and_rejection(self):
+        """Test that 503 batches are retried in order and 400 batches are dropped and counted."""
+        exporter = self._exporter(batch_size=2)
+        self.api.statuses = [503]
+        self.logger.info("a")
+        self.logger.info("b")
+        self.assertTrue(self._wait_for(lambda: exporter.stats()['failed_batches'] == 1))
+
+        self.api.statuses = [400]
+        self.logger.info("c")
+        self.assertTrue(exporter.flush())
+
+        stats = exporter.stats()
+        self.assertEqual((stats['sent'], stats['rejected'], stats['buffered']), (1, 2, 0))
+        self.assertEqual([[e['textPayload'] for e in body['entries']] for body in self.api.requests],
+                         [["a", "b"], ["a", "b"], ["c"]])
+
+    def test_circuit_breaker_stops_requests(self):
+        """Test that the circuit opens after repeated failures and no requests are made while open."""
+        self.api.statuses = [500, 500, 500]
+        exporter = self._exporter(batch_size=1,
+                                  circuit_breaker=CircuitBreaker(threshold=2, timeout=60, service_name="cloud_logging"))
+        self.logger.info("a")
+        self._wait_for(lambda: exporter.stats()['failed_batches'] >= 1)
+        exporter.flush()
+        exporter.flush()
+        exporter.flush()
+
+        self.assertEqual(exporter.stats()['circuit_breaker'], "OPEN")
+        self.assertEqual(len(self.api.requests), 2)
+        self.assertEqual(exporter.stats()['buffered'], 1)
+
+    def test_close_flushes(self):
+        """Test that closing the exporter sends the buffered entries."""
+        exporter = self._exporter(batch_size=50)
+        for i in range(3):
+            self.logger.info(f"message {i}")
+        self.logger.removeHandler(exporter)
+        self.exporters.remove(exporter)
+        exporter.close()
+
+        self.assertEqual(len(self.api.entries()), 3)
+
+    def test_detect_resource(self):
+        """Test configured labels, labels from the metadata server and the global fallback."""
+        metadata = {"instance/id": "42", "instance/zone": "projects/123/zones/europe-west1-b"}
+        with patch.object(cloud_logging, '_read_metadata', side_effect=lambda path, timeout: metadata[path]) as read:
+            configured = detect_resource("p", instance_id="7", zone="us-central1-a")
+            self.assertEqual(read.call_count, 0)
+            detected = detect_resource("p")
+        with patch.object(cloud_logging, '_read_metadata', side_effect=OSError("unreachable")):
+            fallback = detect_resource("p")
+
+        self.assertEqual(configured, {"type": "gce_instance",
+                                      "labels": {"project_id": "p", "instance_id": "7", "zone": "us-central1-a"}})
+        self.assertEqual(detected["labels"], {"project_id": "p", "instance_id": "42", "zone": "europe-west1-b"})
+        self.assertEqual(fallback, {"type": "global", "labels": {"project_id": "p"}})
+
+    def test_invalid_parameters(self):
+        """Test that a buffer smaller than a batch is rejected."""
+        with self.assertRaises(ValueError):
+            CloudLoggingExporter("p", batch_size=10, buffer_size=5, session=self.session)
+
+
+if __name__ == '__main__':
+    unittest.main()
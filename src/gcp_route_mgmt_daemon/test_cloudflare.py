@@ -14,6 +14,10 @@ Test Coverage:
     - Network error handling (timeouts, connection errors)
     - Structured logging integration
     - Input validation
+    - Pooled CloudflareClient (session headers, adapter pool/retry policy)
+    - Pooled client keeping one connection open against a local server
+    - Keep-alive benchmark of the per-cycle cost (RUN_BENCHMARKS=true)
+    - Reconciliation cache: skipped route list reads in steady state, drift detection
 
 Author: Nathan Bray
 Created: 2025-11-01
@@ -21,6 +25,10 @@ Created: 2025-11-01
 
 import unittest
 from unittest.mock import Mock, MagicMock, patch, call
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import requests
 from requests.exceptions import HTTPError, Timeout, ConnectionError
 
@@ -30,15 +38,25 @@ try:
         validate_cloudflare_connectivity,
         update_routes_by_description_bulk,
         get_routes_by_description,
-        CLOUDFLARE_API_BASE
+        CloudflareClient,
+        CLOUDFLARE_API_BASE,
+        RETRY_STATUS_CODES
     )
+    from .reconcile import ReconciliationCache
+    from .structured_events import ActionResult
+    from .testing_support import benchmark
 except ImportError:
     from cloudflare import (
         validate_cloudflare_connectivity,
         update_routes_by_description_bulk,
         get_routes_by_description,
-        CLOUDFLARE_API_BASE
+        CloudflareClient,
+        CLOUDFLARE_API_BASE,
+        RETRY_STATUS_CODES
     )
+    from reconcile import ReconciliationCache
+    from structured_events import ActionResult
+    from testing_support import benchmark
 
 
 class TestValidateCloudflareConnectivity(unittest.TestCase):
@@ -560,6 +578,229 @@ class TestGetRoutesByDescription(unittest.TestCase):
             get_routes_by_description('account', 'token', 'primary')
 
 
+class TestCloudflareClient(unittest.TestCase):
+    """Test suite for the pooled CloudflareClient."""
+
+    def test_invalid_parameters(self):
+        """Test that invalid token, pool size and retry settings are rejected."""
+        with self.assertRaises(ValueError):
+            CloudflareClient('')
+        with self.assertRaises(ValueError):
+            CloudflareClient('token', pool_maxsize=0)
+        with self.assertRaises(ValueError):
+            CloudflareClient('token', max_retries=-1)
+
+    def test_session_carries_auth_headers(self):
+        """Test that auth headers are prebuilt on the session."""
+        with CloudflareClient('token123') as client:
+            self.assertEqual(client.session.headers['Authorization'], 'Bearer token123')
+            self.assertEqual(client.session.headers['Content-Type'], 'application/json')
+
+    def test_adapter_pool_and_retry_policy(self):
+        """Test that the mounted adapter uses the configured pool size and retry policy."""
+        with CloudflareClient('token', pool_maxsize=6, max_retries=2, backoff_factor=0.25) as client:
+            adapter = client.session.get_adapter(CLOUDFLARE_API_BASE)
+
+            self.assertEqual(adapter._pool_maxsize, 6)
+            self.assertEqual(adapter.max_retries.total, 2)
+            self.assertEqual(adapter.max_retries.backoff_factor, 0.25)
+            self.assertEqual(set(adapter.max_retries.status_forcelist), set(RETRY_STATUS_CODES))
+            self.assertFalse(adapter.max_retries.raise_on_status)
+            self.assertIn('PUT', adapter.max_retries.allowed_methods)
+
+    def test_functions_use_client_session(self):
+        """Test that module functions send requests through the client, not requests.get/put."""
+        client = CloudflareClient('token')
+        get_response = Mock()
+        get_response.json.return_value = {
+            'success': True,
+            'result': {'routes': [{'id': '1', 'prefix': '10.0.0.0/24', 'nexthop': '192.168.1.1',
+                                   'description': 'primary-dc-route', 'priority': 200}]}
+        }
+        put_response = Mock()
+        put_response.json.return_value = {'success': True, 'result': {'modified': 1}}
+
+        with patch.object(client.session, 'get', return_value=get_response) as session_get, \
+             patch.object(client.session, 'put', return_value=put_response) as session_put, \
+             patch('gcp_route_mgmt_daemon.cloudflare.requests.get') as module_get, \
+             patch('gcp_route_mgmt_daemon.cloudflare.requests.put') as module_put:
+            result = update_routes_by_description_bulk('account', 'token', 'primary-dc', 100,
+                                                       client=client)
+
+        self.assertTrue(result)
+        session_get.assert_called_once()
+        session_put.assert_called_once()
+        self.assertEqual(session_put.call_args[1]['json']['routes'][0]['priority'], 100)
+        module_get.assert_not_called()
+        module_put.assert_not_called()
+        client.close()
+
+
+class _FakeCloudflareHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive Magic Transit routes endpoint."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # Avoid delayed-ACK stalls on reused connections
+
+    def _send_json(self, body):
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        self._send_json({'success': True, 'result': {'routes': [
+            {'id': '1', 'prefix': '10.0.0.0/24', 'nexthop': '192.168.1.1',
+             'description': 'primary-dc-route', 'priority': 200}
+        ]}})
+
+    def do_PUT(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self._send_json({'success': True, 'result': {'modified': 1}})
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _HandshakeCostServer(ThreadingHTTPServer):
+    """Local server that charges a fixed setup cost for every new connection."""
+
+    daemon_threads = True
+
+    def __init__(self, handshake_delay):
+        super().__init__(("127.0.0.1", 0), _FakeCloudflareHandler)
+        self.handshake_delay = handshake_delay
+        self.connections = 0
+
+    def verify_request(self, request, client_address):
+        # Stands in for TCP + TLS setup to api.cloudflare.com
+        self.connections += 1
+        time.sleep(self.handshake_delay)
+        return True
+
+
+class CloudflareServerTestCase(unittest.TestCase):
+    """Local Cloudflare API server counting new connections."""
+
+    HANDSHAKE_DELAY = 0.0    # Simulated connection setup (seconds)
+    CYCLES = 10
+
+    def setUp(self):
+        self.server = _HandshakeCostServer(self.HANDSHAKE_DELAY)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _run_cycles(self, client=None):
+        self.server.connections = 0
+        start = time.perf_counter()
+        for _ in range(self.CYCLES):
+            self.assertTrue(update_routes_by_description_bulk('account', 'token', 'primary-dc', 100,
+                                                              client=client))
+        return (time.perf_counter() - start) / self.CYCLES, self.server.connections
+
+    def _run_pooled_and_unpooled(self):
+        with patch('gcp_route_mgmt_daemon.cloudflare.CLOUDFLARE_API_BASE', self.base_url):
+            unpooled = self._run_cycles()
+        with CloudflareClient('token', base_url=self.base_url) as client:
+            pooled = self._run_cycles(client)
+        return unpooled, pooled
+
+
+class TestCloudflareConnectionReuse(CloudflareServerTestCase):
+    """Test suite for keep-alive connections of the pooled client."""
+
+    def test_pooled_client_opens_one_connection(self):
+        """Test that unpooled cycles connect per request and the pooled client connects once."""
+        (_, unpooled_connections), (_, pooled_connections) = self._run_pooled_and_unpooled()
+
+        self.assertEqual(unpooled_connections, 2 * self.CYCLES)
+        self.assertEqual(pooled_connections, 1)
+
+
+@benchmark
+class TestCloudflareSessionBenchmark(CloudflareServerTestCase):
+    """Benchmark (RUN_BENCHMARKS=true): per-cycle cost of one-shot requests vs the pooled client."""
+
+    HANDSHAKE_DELAY = 0.02
+
+    def test_pooled_client_removes_handshake_from_cycle(self):
+        """Unpooled cycles pay two handshakes each; the pooled client pays one for the whole run."""
+        (unpooled, unpooled_connections), (pooled, pooled_connections) = self._run_pooled_and_unpooled()
+
+        print(f"\nCloudflare session benchmark ({self.HANDSHAKE_DELAY * 1000:.0f}ms per new connection, "
+              f"{self.CYCLES} cycles, GET + PUT per cycle)")
+        print(f"  unpooled: {unpooled * 1000:6.1f}ms/cycle  connections={unpooled_connections}")
+        print(f"  pooled:   {pooled * 1000:6.1f}ms/cycle  connections={pooled_connections}")
+
+        self.assertGreaterEqual(unpooled, 2 * self.HANDSHAKE_DELAY)
+        self.assertLess(pooled, unpooled / 3)
+
+
+class TestUpdateRoutesWithCache(unittest.TestCase):
+    """Test suite for update_routes_by_description_bulk with a ReconciliationCache."""
+
+    def setUp(self):
+        self.now = [1000.0]
+        self.cache = ReconciliationCache(drift_check_interval=600, clock=lambda: self.now[0])
+        self.priority = [100]
+
+    def _routes_response(self):
+        response = Mock()
+        response.json.return_value = {'success': True, 'result': {'routes': [
+            {'id': '1', 'prefix': '10.0.0.0/24', 'nexthop': '192.168.1.1',
+             'description': 'primary-dc-route', 'priority': self.priority[0]}
+        ]}}
+        return response
+
+    @patch('gcp_route_mgmt_daemon.cloudflare.requests.put')
+    @patch('gcp_route_mgmt_daemon.cloudflare.requests.get')
+    def test_steady_state_skips_route_read(self, mock_get, mock_put):
+        """Test that a confirmed priority skips the GET and logs NO_CHANGE."""
+        mock_get.side_effect = lambda *a, **k: self._routes_response()
+        mock_logger = Mock()
+
+        for _ in range(3):
+            self.assertTrue(update_routes_by_description_bulk('account', 'token', 'primary-dc', 100,
+                                                              structured_logger=mock_logger,
+                                                              cache=self.cache))
+
+        self.assertEqual(mock_get.call_count, 1)
+        mock_put.assert_not_called()
+        results = [c[1]['result'] for c in mock_logger.log_cloudflare_update.call_args_list]
+        self.assertEqual(results, [ActionResult.NO_CHANGE] * 3)
+        self.assertEqual(self.cache.get('cloudflare:account:primary-dc').observed, {'1': 100})
+
+    @patch('gcp_route_mgmt_daemon.cloudflare.requests.put')
+    @patch('gcp_route_mgmt_daemon.cloudflare.requests.get')
+    def test_priority_change_and_drift_force_read(self, mock_get, mock_put):
+        """Test that a new priority reads again and expired confirmations catch drift."""
+        mock_get.side_effect = lambda *a, **k: self._routes_response()
+        put_response = Mock()
+        put_response.json.return_value = {'success': True, 'result': {'modified': 1}}
+        mock_put.return_value = put_response
+
+        update_routes_by_description_bulk('account', 'token', 'primary-dc', 100, cache=self.cache)
+        update_routes_by_description_bulk('account', 'token', 'primary-dc', 200, cache=self.cache)
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_put.call_count, 1)
+
+        # Confirm 100 again, then drift out-of-band to 300
+        update_routes_by_description_bulk('account', 'token', 'primary-dc', 100, cache=self.cache)
+        self.priority[0] = 300
+        self.now[0] += 600
+        update_routes_by_description_bulk('account', 'token', 'primary-dc', 100, cache=self.cache)
+
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(mock_put.call_count, 2)
+        self.assertEqual(self.cache.stats()["drift_detected"], 1)
+
+
 class TestEdgeCases(unittest.TestCase):
     """Test suite for edge cases and boundary conditions."""
 
@@ -439,6 +439,562 @@ class TestRouteFlapProtectionConfig(unittest.TestCase):
                                f"Should accept valid value {value}")
 
 
+class TestProbeStageConfig(unittest.TestCase):
+    """Test configuration for the concurrent probe stage."""
+
+    def setUp(self):
+        """Save original environment."""
+        self.original_env = os.environ.copy()
+
+    def tearDown(self):
+        """Restore original environment."""
+        os.environ.clear()
+        os.environ.update(self.original_env)
+
+    def test_probe_stage_defaults(self):
+        """Test probe stage settings have correct defaults."""
+        reload(config_module)
+        cfg = config_module.Config()
+        self.assertEqual(cfg.probe_max_workers, 3,
+                        "Default probe workers should be 3")
+        self.assertEqual(cfg.probe_timeout, 50,
+                        "Default probe timeout should be 50s")
+
+    def test_probe_stage_validation_invalid(self):
+        """Test probe stage validation rejects out-of-range values."""
+        invalid_values = [('PROBE_MAX_WORKERS', '0'), ('PROBE_MAX_WORKERS', '17'),
+                          ('PROBE_TIMEOUT_SECONDS', '0'), ('PROBE_TIMEOUT_SECONDS', '4000')]
+
+        for var, value_str in invalid_values:
+            with self.subTest(var=var, value=value_str):
+                os.environ[var] = value_str
+                reload(config_module)
+                cfg = config_module.Config()
+                errors = config_module.validate_configuration(cfg)
+
+                probe_errors = [e for e in errors if var in e]
+                self.assertGreater(len(probe_errors), 0,
+                                 f"Should reject {var}={value_str}")
+                del os.environ[var]
+
+    def test_probe_timeout_below_check_interval(self):
+        """Test probe timeout must be less than the check interval."""
+        for timeout, interval, valid in [('50', '60', True), ('60', '60', False), ('90', '60', False)]:
+            with self.subTest(timeout=timeout, interval=interval):
+                os.environ['PROBE_TIMEOUT_SECONDS'] = timeout
+                os.environ['CHECK_INTERVAL_SECONDS'] = interval
+                reload(config_module)
+                errors = config_module.validate_configuration(config_module.Config())
+
+                cross_errors = [e for e in errors if 'must be less than CHECK_INTERVAL_SECONDS' in e]
+                self.assertEqual(len(cross_errors) == 0, valid,
+                               f"Unexpected validation result for {timeout}s/{interval}s")
+
+
+class TestBackendHealthFetchConfig(unittest.TestCase):
+    """Test configuration for backend health getHealth fan-out."""
+
+    def setUp(self):
+        """Save original environment."""
+        self.original_env = os.environ.copy()
+
+    def tearDown(self):
+        """Restore original environment."""
+        os.environ.clear()
+        os.environ.update(self.original_env)
+
+    def test_fetch_mode_defaults(self):
+        """Test fan-out settings have correct defaults."""
+        reload(config_module)
+        cfg = config_module.Config()
+        self.assertEqual(cfg.backend_health_fetch_mode, 'concurrent')
+        self.assertEqual(cfg.backend_health_max_concurrency, 8)
+        self.assertEqual(cfg.backend_health_batch_size, 100)
+
+    def test_fetch_mode_validation(self):
+        """Test that unknown fetch modes are rejected and known ones accepted."""
+        for mode, valid in [('sequential', True), ('CONCURRENT', True), ('batch', True), ('parallel', False)]:
+            with self.subTest(mode=mode):
+                os.environ['BACKEND_HEALTH_FETCH_MODE'] = mode
+                reload(config_module)
+                cfg = config_module.Config()
+                errors = config_module.validate_configuration(cfg)
+
+                mode_errors = [e for e in errors if 'BACKEND_HEALTH_FETCH_MODE' in e]
+                self.assertEqual(len(mode_errors) == 0, valid,
+                               f"Unexpected validation result for {mode}")
+
+
+class TestStructuredLogFormatConfig(unittest.TestCase):
+    """Test configuration for the structured log file format."""
+
+    def setUp(self):
+        """Save original environment."""
+        self.original_env = os.environ.copy()
+
+    def tearDown(self):
+        """Restore original environment."""
+        os.environ.clear()
+        os.environ.update(self.original_env)
+
+    def test_format_default_and_validation(self):
+        """Test the format defaults to array and only array/jsonl are accepted."""
+        os.environ.pop('STRUCTURED_LOG_FORMAT', None)
+        reload(config_module)
+        self.assertEqual(config_module.Config().structured_log_format, 'array')
+
+        for fmt, valid in [('array', True), ('JSONL', True), ('ndjson', False)]:
+            with self.subTest(format=fmt):
+                os.environ['STRUCTURED_LOG_FORMAT'] = fmt
+                reload(config_module)
+                errors = config_module.validate_configuration(config_module.Config())
+
+                format_errors = [e for e in errors if 'STRUCTURED_LOG_FORMAT' in e]
+                self.assertEqual(len(format_errors) == 0, valid,
+                               f"Unexpected validation result for {fmt}")
+
+
+class TestAsyncLoggingConfig(unittest.TestCase):
+    """Test configuration for the asynchronous logging pipeline."""
+
+    def setUp(self):
+        """Save original environment."""
+        self.original_env = os.environ.copy()
+
+    def tearDown(self):
+        """Restore original environment."""
+        os.environ.clear()
+        os.environ.update(self.original_env)
+
+    def test_defaults(self):
+        """Test async logging is on by default with a 10000 record drop-debug queue."""
+        for var in ('LOG_ASYNC', 'LOG_QUEUE_SIZE', 'LOG_QUEUE_OVERFLOW'):
+            os.environ.pop(var, None)
+        reload(config_module)
+        cfg = config_module.Config()
+
+        self.assertTrue(cfg.log_async)
+        self.assertEqual(cfg.log_queue_size, 10000)
+        self.assertEqual(cfg.log_queue_overflow, 'drop-debug')
+
+    def test_queue_validation(self):
+        """Test queue size range and overflow policy validation."""
+        cases = [
+            ({'LOG_QUEUE_SIZE': '100', 'LOG_QUEUE_OVERFLOW': 'BLOCK'}, True),
+            ({'LOG_QUEUE_SIZE': '50'}, False),
+            ({'LOG_QUEUE_OVERFLOW': 'drop-oldest'}, False),
+        ]
+        for env, valid in cases:
+            with self.subTest(env=env):
+                os.environ.pop('LOG_QUEUE_SIZE', None)
+                os.environ.pop('LOG_QUEUE_OVERFLOW', None)
+                os.environ.update(env)
+                reload(config_module)
+                errors = config_module.validate_configuration(config_module.Config())
+
+                queue_errors = [e for e in errors if 'LOG_QUEUE' in e]
+                self.assertEqual(len(queue_errors) == 0, valid,
+                               f"Unexpected validation result for {env}")
+
+    def test_log_compression(self):
+        """Test rotated logs are not compressed by default and only known codecs are accepted."""
+        os.environ.pop('LOG_COMPRESSION', None)
+        reload(config_module)
+        self.assertEqual(config_module.Config().log_compression, 'none')
+
+        for codec, valid in [('gzip', True), ('ZSTD', True), ('bzip2', False)]:
+            with self.subTest(codec=codec):
+                os.environ['LOG_COMPRESSION'] = codec
+                reload(config_module)
+                errors = config_module.validate_configuration(config_module.Config())
+
+                codec_errors = [e for e in errors if 'LOG_COMPRESSION' in e]
+                self.assertEqual(len(codec_errors) == 0, valid,
+                               f"Unexpected validation result for {codec}")
+
+    def test_cloud_logging_export(self):
+        """Test Cloud Logging export defaults and that the buffer must hold a batch."""
+        for var in ('GCP_LOGGING_BATCH_SIZE', 'GCP_LOGGING_FLUSH_INTERVAL', 'GCP_LOGGING_BUFFER_SIZE'):
+            os.environ.pop(var, None)
+        reload(config_module)
+        cfg = config_module.Config()
+        self.assertEqual((cfg.gcp_logging_batch_size, cfg.gcp_logging_flush_interval,
+                          cfg.gcp_logging_buffer_size), (100, 5, 10000))
+
+        cases = [
+            ({'GCP_LOGGING_BATCH_SIZE': '500', 'GCP_LOGGING_BUFFER_SIZE': '1000'}, True),
+            ({'GCP_LOGGING_BATCH_SIZE': '500', 'GCP_LOGGING_BUFFER_SIZE': '200'}, False),
+            ({'GCP_LOGGING_FLUSH_INTERVAL': '0'}, False),
+        ]
+        for env, valid in cases:
+            with self.subTest(env=env):
+                for var in ('GCP_LOGGING_BATCH_SIZE', 'GCP_LOGGING_FLUSH_INTERVAL', 'GCP_LOGGING_BUFFER_SIZE'):
+                    os.environ.pop(var, None)
+                os.environ.update(env)
+                reload(config_module)
+                errors = config_module.validate_configuration(config_module.Config())
+
+                export_errors = [e for e in errors if 'GCP_LOGGING' in e]
+                self.assertEqual(len(export_errors) == 0, valid,
+                               f"Unexpected validation result for {env}")
+
+
+class TestFlightRecorderConfig(unittest.TestCase):
+    """Test configuration for the structured event flight recorder."""
+
+    def setUp(self):
+        """Save original environment."""
+        self.original_env = os.environ.copy()
+
+    def tearDown(self):
+        """Restore original environment."""
+        os.environ.clear()
+        os.environ.update(self.original_env)
+
+    def test_size_default_and_validation(self):
+        """Test the recorder keeps 1000 events by default and accepts 0 to disable it."""
+        os.environ.pop('FLIGHT_RECORDER_SIZE', None)
+        reload(config_module)
+        self.assertEqual(config_module.Config().flight_recorder_size, 1000)
+
+        for size, valid in [('0', True), ('100000', True), ('-1', False), ('100001', False)]:
+            with self.subTest(size=size):
+                os.environ['FLIGHT_RECORDER_SIZE'] = size
+                reload(config_module)
+                errors = config_module.validate_configuration(config_module.Config())
+
+                size_errors = [e for e in errors if 'FLIGHT_RECORDER_SIZE' in e]
+                self.assertEqual(len(size_errors) == 0, valid,
+                               f"Unexpected validation result for {size}")
+
+
+class TestBackendHealthBatchConfig(unittest.TestCase):
+    """Test configuration for batched getHealth requests."""
+
+    def setUp(self):
+        """Save original environment."""
+        self.original_env = os.environ.copy()
+
+    def tearDown(self):
+        """Restore original environment."""
+        os.environ.clear()
+        os.environ.update(self.original_env)
+
+    def test_batch_size_validation(self):
+        """Test batch size must stay within the API's 1-1000 calls per batch."""
+        for value_str, valid in [('0', False), ('1', True), ('1000', True), ('1001', False)]:
+            with self.subTest(value=value_str):
+                os.environ['BACKEND_HEALTH_BATCH_SIZE'] = value_str
+                reload(config_module)
+                cfg = config_module.Config()
+                errors = config_module.validate_configuration(cfg)
+
+                batch_errors = [e for e in errors if 'BACKEND_HEALTH_BATCH_SIZE' in e]
+                self.assertEqual(len(batch_errors) == 0, valid,
+                               f"Unexpected validation result for {value_str}")
+
+
+class TestUnhealthyLogModeConfig(unittest.TestCase):
+    """Test configuration for unhealthy instance logging."""
+
+    def setUp(self):
+        """Save original environment."""
+        self.original_env = os.environ.copy()
+
+    def tearDown(self):
+        """Restore original environment."""
+        os.environ.clear()
+        os.environ.update(self.original_env)
+
+    def test_mode_default_and_validation(self):
+        """Test the mode defaults to per_instance and only per_instance/summary are accepted."""
+        os.environ.pop('BACKEND_UNHEALTHY_LOG_MODE', None)
+        reload(config_module)
+        self.assertEqual(config_module.Config().backend_unhealthy_log_mode, 'per_instance')
+
+        for mode, valid in [('summary', True), ('PER_INSTANCE', True), ('sampled', False)]:
+            with self.subTest(mode=mode):
+                os.environ['BACKEND_UNHEALTHY_LOG_MODE'] = mode
+                reload(config_module)
+                errors = config_module.validate_configuration(config_module.Config())
+
+                mode_errors = [e for e in errors if 'BACKEND_UNHEALTHY_LOG_MODE' in e]
+                self.assertEqual(len(mode_errors) == 0, valid,
+                               f"Unexpected validation result for {mode}")
+
+
+class TestDriftCheckConfig(unittest.TestCase):
+    """Test configuration for the reconciliation cache drift check."""
+
+    def setUp(self):
+        """Save original environment."""
+        self.original_env = os.environ.copy()
+
+    def tearDown(self):
+        """Restore original environment."""
+        os.environ.clear()
+        os.environ.update(self.original_env)
+
+    def test_drift_check_interval_default_and_range(self):
+        """Test drift check interval defaults to 300s and accepts 0 (disabled)."""
+        os.environ.pop('DRIFT_CHECK_INTERVAL_SECONDS', None)
+        reload(config_module)
+        self.assertEqual(config_module.Config().drift_check_interval, 300)
+
+        for value_str, valid in [('-1', False), ('0', True), ('86400', True), ('86401', False)]:
+            with self.subTest(value=value_str):
+                os.environ['DRIFT_CHECK_INTERVAL_SECONDS'] = value_str
+                reload(config_module)
+                errors = config_module.validate_configuration(config_module.Config())
+
+                drift_errors = [e for e in errors if 'DRIFT_CHECK_INTERVAL_SECONDS' in e]
+                self.assertEqual(len(drift_errors) == 0, valid,
+                               f"Unexpected validation result for {value_str}")
+
+
+class TestGCPClientPoolConfig(unittest.TestCase):
+    """Test configuration for the GCP compute client pool."""
+
+    def setUp(self):
+        """Save original environment."""
+        self.original_env = os.environ.copy()
+
+    def tearDown(self):
+        """Restore original environment."""
+        os.environ.clear()
+        os.environ.update(self.original_env)
+
+    def test_pool_size_default_and_range(self):
+        """Test pool size defaults to 8 and accepts 0 (disabled) through 64."""
+        os.environ.pop('GCP_CLIENT_POOL_SIZE', None)
+        reload(config_module)
+        self.assertEqual(config_module.Config().gcp_client_pool_size, 8)
+
+        for value_str, valid in [('-1', False), ('0', True), ('64', True), ('65', False)]:
+            with self.subTest(value=value_str):
+                os.environ['GCP_CLIENT_POOL_SIZE'] = value_str
+                reload(config_module)
+                errors = config_module.validate_configuration(config_module.Config())
+
+                pool_errors = [e for e in errors if 'GCP_CLIENT_POOL_SIZE' in e]
+                self.assertEqual(len(pool_errors) == 0, valid,
+                               f"Unexpected validation result for {value_str}")
+
+
+class TestOperationTrackingConfig(unittest.TestCase):
+    """Test configuration for background BGP operation tracking."""
+
+    def setUp(self):
+        """Save original environment."""
+        self.original_env = os.environ.copy()
+
+    def tearDown(self):
+        """Restore original environment."""
+        os.environ.clear()
+        os.environ.update(self.original_env)
+
+    def test_poll_interval_default_and_range(self):
+        """Test poll interval defaults to 5 and accepts 1 through 60."""
+        os.environ.pop('GCP_OPERATION_POLL_INTERVAL', None)
+        reload(config_module)
+        self.assertEqual(config_module.Config().gcp_operation_poll_interval, 5)
+
+        for value_str, valid in [('0', False), ('1', True), ('60', True), ('61', False)]:
+            with self.subTest(value=value_str):
+                os.environ['GCP_OPERATION_POLL_INTERVAL'] = value_str
+                reload(config_module)
+                errors = config_module.validate_configuration(config_module.Config())
+
+                poll_errors = [e for e in errors if 'GCP_OPERATION_POLL_INTERVAL' in e]
+                self.assertEqual(len(poll_errors) == 0, valid,
+                               f"Unexpected validation result for {value_str}")
+
+
+class TestCloudflareSessionConfig(unittest.TestCase):
+    """Test configuration for the pooled Cloudflare HTTP session."""
+
+    def setUp(self):
+        """Save original environment."""
+        self.original_env = os.environ.copy()
+
+    def tearDown(self):
+        """Restore original environment."""
+        os.environ.clear()
+        os.environ.update(self.original_env)
+
+    def test_session_defaults(self):
+        """Test pool size and adapter retry defaults."""
+        for var in ('CLOUDFLARE_POOL_MAXSIZE', 'CLOUDFLARE_HTTP_RETRIES', 'CLOUDFLARE_HTTP_BACKOFF_FACTOR'):
+            os.environ.pop(var, None)
+        reload(config_module)
+        cfg = config_module.Config()
+
+        self.assertEqual(cfg.cloudflare_pool_maxsize, 4)
+        self.assertEqual(cfg.cloudflare_http_retries, 0)
+        self.assertEqual(cfg.cloudflare_http_backoff_factor, 0.5)
+
+    def test_session_range_validation(self):
+        """Test pool size and adapter retry ranges."""
+        cases = [
+            ('CLOUDFLARE_POOL_MAXSIZE', '0', False),
+            ('CLOUDFLARE_POOL_MAXSIZE', '64', True),
+            ('CLOUDFLARE_HTTP_RETRIES', '0', True),
+            ('CLOUDFLARE_HTTP_RETRIES', '11', False),
+            ('CLOUDFLARE_HTTP_BACKOFF_FACTOR', '31', False),
+        ]
+        for var, value_str, valid in cases:
+            with self.subTest(var=var, value=value_str):
+                os.environ[var] = value_str
+                reload(config_module)
+                cfg = config_module.Config()
+                errors = config_module.validate_configuration(cfg)
+
+                var_errors = [e for e in errors if var in e]
+                self.assertEqual(len(var_errors) == 0, valid,
+                               f"Unexpected validation result for {var}={value_str}")
+                os.environ.pop(var)
+
+
+class TestMetricsConfig(unittest.TestCase):
+    """Test configuration for the Prometheus metrics endpoint."""
+
+    def setUp(self):
+        """Save original environment."""
+        self.original_env = os.environ.copy()
+
+    def tearDown(self):
+        """Restore original environment."""
+        os.environ.clear()
+        os.environ.update(self.original_env)
+
+    def test_metrics_port_default_and_range(self):
+        """Test the endpoint is disabled by default and the port accepts 0 through 65535."""
+        os.environ.pop('METRICS_PORT', None)
+        os.environ.pop('METRICS_BIND_ADDRESS', None)
+        reload(config_module)
+        cfg = config_module.Config()
+        self.assertEqual((cfg.metrics_port, cfg.metrics_bind_address), (0, '0.0.0.0'))
+
+        for value_str, valid in [('-1', False), ('0', True), ('9464', True), ('65536', False)]:
+            with self.subTest(value=value_str):
+                os.environ['METRICS_PORT'] = value_str
+                reload(config_module)
+                errors = config_module.validate_configuration(config_module.Config())
+
+                port_errors = [e for e in errors if 'METRICS_PORT' in e]
+                self.assertEqual(len(port_errors) == 0, valid,
+                               f"Unexpected validation result for {value_str}")
+
+
+class TestAdminConfig(unittest.TestCase):
+    """Test configuration for the admin health endpoint."""
+
+    def setUp(self):
+        """Save original environment."""
+        self.original_env = os.environ.copy()
+
+    def tearDown(self):
+        """Restore original environment."""
+        os.environ.clear()
+        os.environ.update(self.original_env)
+
+    def test_admin_defaults_and_ranges(self):
+        """Test the endpoint is disabled by default and the port and stale timeout are range-checked."""
+        for var in ('ADMIN_PORT', 'ADMIN_BIND_ADDRESS', 'ADMIN_STALE_AFTER_SECONDS'):
+            os.environ.pop(var, None)
+        reload(config_module)
+        cfg = config_module.Config()
+        self.assertEqual((cfg.admin_port, cfg.admin_bind_address, cfg.admin_stale_after), (0, '0.0.0.0', 0))
+
+        for var, value_str, valid in [('ADMIN_PORT', '8080', True),
+                                      ('ADMIN_PORT', '65536', False),
+                                      ('ADMIN_STALE_AFTER_SECONDS', '180', True),
+                                      ('ADMIN_STALE_AFTER_SECONDS', '-1', False)]:
+            with self.subTest(var=var, value=value_str):
+                os.environ[var] = value_str
+                reload(config_module)
+                errors = config_module.validate_configuration(config_module.Config())
+                os.environ.pop(var)
+
+                var_errors = [e for e in errors if var in e]
+                self.assertEqual(len(var_errors) == 0, valid,
+                               f"Unexpected validation result for {var}={value_str}")
+
+
+class TestApiBudgetConfig(unittest.TestCase):
+    """Test configuration for API quota budgets."""
+
+    def setUp(self):
+        """Save original environment."""
+        self.original_env = os.environ.copy()
+
+    def tearDown(self):
+        """Restore original environment."""
+        os.environ.clear()
+        os.environ.update(self.original_env)
+
+    def test_budget_defaults_and_ranges(self):
+        """Test budgets are off by default and budgets and the throttle threshold are range-checked."""
+        for var in ('COMPUTE_READ_BUDGET_PER_MINUTE', 'COMPUTE_WRITE_BUDGET_PER_MINUTE',
+                    'CLOUDFLARE_BUDGET_PER_MINUTE', 'API_BUDGET_THROTTLE_PCT'):
+            os.environ.pop(var, None)
+        reload(config_module)
+        cfg = config_module.Config()
+        self.assertEqual((cfg.compute_read_budget_per_minute, cfg.compute_write_budget_per_minute,
+                          cfg.cloudflare_budget_per_minute, cfg.api_budget_throttle_pct), (0, 0, 0, 80))
+
+        for var, value_str, valid in [('COMPUTE_READ_BUDGET_PER_MINUTE', '1500', True),
+                                      ('COMPUTE_WRITE_BUDGET_PER_MINUTE', '-1', False),
+                                      ('API_BUDGET_THROTTLE_PCT', '0', False),
+                                      ('API_BUDGET_THROTTLE_PCT', '100', True)]:
+            with self.subTest(var=var, value=value_str):
+                os.environ[var] = value_str
+                reload(config_module)
+                errors = config_module.validate_configuration(config_module.Config())
+                os.environ.pop(var)
+
+                var_errors = [e for e in errors if var in e]
+                self.assertEqual(len(var_errors) == 0, valid,
+                               f"Unexpected validation result for {var}={value_str}")
+
+
+class TestProfilingConfig(unittest.TestCase):
+    """Test configuration for opt-in cycle profiling."""
+
+    def setUp(self):
+        """Save original environment."""
+        self.original_env = os.environ.copy()
+
+    def tearDown(self):
+        """Restore original environment."""
+        os.environ.clear()
+        os.environ.update(self.original_env)
+
+    def test_profiling_defaults_and_ranges(self):
+        """Test profiling is off by default and the sampling and rotation settings are range-checked."""
+        for var in ('PROFILE_EVERY_N_CYCLES', 'TRACEMALLOC_EVERY_N_CYCLES', 'PROFILE_DIR', 'PROFILE_KEEP'):
+            os.environ.pop(var, None)
+        reload(config_module)
+        cfg = config_module.Config()
+        self.assertEqual((cfg.profile_every_n_cycles, cfg.tracemalloc_every_n_cycles, cfg.profile_keep), (0, 0, 10))
+        self.assertEqual(cfg.profile_dir, '/var/log/radius_healthcheck_daemon_profiles')
+
+        for var, value_str, valid in [('PROFILE_EVERY_N_CYCLES', '-1', False),
+                                      ('PROFILE_EVERY_N_CYCLES', '100', True),
+                                      ('TRACEMALLOC_EVERY_N_CYCLES', '60', True),
+                                      ('PROFILE_KEEP', '0', False),
+                                      ('PROFILE_KEEP', '1001', False)]:
+            with self.subTest(var=var, value=value_str):
+                os.environ[var] = value_str
+                reload(config_module)
+                errors = config_module.validate_configuration(config_module.Config())
+                os.environ.pop(var)
+
+                var_errors = [e for e in errors if var in e]
+                self.assertEqual(len(var_errors) == 0, valid,
+                               f"Unexpected validation result for {var}={value_str}")
+
+
 class TestConfigurationTypes(unittest.TestCase):
     """Test configuration value types and conversions."""
 
@@ -0,0 +1,259 @@
+"""
+Unit Tests for Structured Event JSON Encoding
+
+This test module validates the pluggable JSON encoder used by the structured
+log formatters.
+
+Test Coverage:
+    - orjson and standard library encoders producing identical output
+    - Fallback to the standard library when orjson is missing or rejects a payload
+    - Static fields pre-serialized and appended in compact and pretty form
+    - Events overriding a static key
+    - Formatters using the module encoder
+    - Static fields encoded once, each event encoded by a single encoder call
+    - Benchmark of health_check_cycle and health_check payload shapes (RUN_BENCHMARKS=true)
+
+Author: Nathan Bray
+Created: 2025-11-01
+"""
+
+import unittest
+from unittest.mock import patch
+import json
+import logging
+import time
+
+try:
+    from . import encoding
+    from .logging_setup import StructuredFormatter, StructuredJSONFormatter
+    from .testing_support import benchmark
+except ImportError:
+    import encoding
+    from logging_setup import StructuredFormatter, StructuredJSONFormatter
+    from testing_support import benchmark
+
+
+def _health_check_cycle_payload():
+    """Payload shaped like the daemon's health_check_cycle event."""
+    return {
+        "structured_event": True,
+        "event_type": "health_check_cycle",
+        "timestamp": 1761998400.123456,
+        "result": "success",
+        "component": "daemon",
+        "operation": "health_check_cycle",
+        "duration_ms": 812,
+        "correlation_id": "hc-1761998400-3f2a9c1e",
+        "details": {
+            "correlation_id": "hc-1761998400-3f2a9c1e",
+            "cycle_duration_ms": 812,
+            "state_code": 1,
+            "time_in_state_seconds": 3600.5,
+            "local_router_only_mode": True,
+            "state_verification": {"state_2": None, "state_3": None, "state_4": None,
+                                   "updates_skipped": False, "skip_reason": None},
+            "health_check_hysteresis": {"local_history_size": 5, "local_healthy_count": 5,
+                                        "remote_history_size": 5, "remote_healthy_count": 5,
+                                        "window_size": 5, "threshold": 3, "asymmetric": False},
+            "health_status": {"local_healthy": True, "remote_healthy": True, "remote_bgp_up": True,
+                              "raw_local_healthy": True, "raw_remote_healthy": True},
+            "probe_stage": {name: {"duration_ms": 120, "timed_out": False, "still_running": False}
+                            for name in ("local_health", "remote_health", "remote_bgp")},
+            "gcp_client_pool": {"size": 8, "created": 3, "in_use": 0, "peak_in_use": 3,
+                                "checkouts": 42, "returns": 42, "waits": 0, "wait_time_ms": 0},
+            "reconciliation_cache": {"drift_check_interval": 300, "entries": 3, "hits": 2,
+                                     "misses": 1, "drift_detected": 0},
+            "bgp_operations": {"tracked": 2, "pending": 0, "completed": 2, "failed": 0,
+                               "timed_out": 0, "last_propagation_ms": 5230},
+            "operation_results": {"local_primary_advertisement_success": True,
+                                  "local_secondary_advertisement_success": True,
+                                  "cloudflare_update_success": True,
+                                  "remote_advertisement_skipped": True,
+                                  "bgp_updates_skipped": False,
+                                  "cloudflare_updates_skipped": False},
+            "error_tracking": {"consecutive_errors": 0, "max_consecutive_errors": 10},
+            "configuration": {"desired_cloudflare_priority": 100,
+                              "planned_primary_advertisement": True,
+                              "planned_secondary_advertisement": False,
+                              "local_router_manages_both_prefixes": True,
+                              "remote_advertisement_managed": False}
+        }
+    }
+
+
+def _health_check_payload():
+    """Payload shaped like log_health_check's health_check_result event."""
+    return {
+        "structured_event": True,
+        "event_type": "health_check_result",
+        "timestamp": 1761998400.5,
+        "result": "success",
+        "component": "gcp_health",
+        "operation": "backend_health_check",
+        "duration_ms": 95,
+        "error_message": None,
+        "correlation_id": "hc-1761998400-3f2a9c1e",
+        "details": {
+            "gcp_project": "my-project",
+            "gcp_region": "us-central1",
+            "healthy": True,
+            "backend_services": ["radius-auth", "radius-acct"],
+            "unhealthy_instances": []
+        }
+    }
+
+
+class CountingEncoder(encoding.JSONEncoder):
+    """Standard library encoder keeping the objects it is asked to encode."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def dumps(self, obj):
+        self.encoded.append(obj)
+        return super().dumps(obj)
+
+    def dumps_pretty(self, obj):
+        self.encoded.append(obj)
+        return super().dumps_pretty(obj)
+
+
+class EncodingTestCase(unittest.TestCase):
+    """Restore the module encoder and static fields after each test."""
+
+    def setUp(self):
+        self._saved = (encoding._encoder, encoding._static)
+
+    def tearDown(self):
+        encoding._encoder, encoding._static = self._saved
+
+
+class TestEncoders(EncodingTestCase):
+    """Test suite for encoder selection and output."""
+
+    def test_orjson_output_matches_stdlib(self):
+        """Test that orjson produces byte-identical compact and pretty output."""
+        if encoding.orjson is None:
+            self.skipTest("orjson not installed")
+        fast, stdlib = encoding.OrjsonEncoder(), encoding.JSONEncoder()
+        for payload in (_health_check_cycle_payload(), _health_check_payload()):
+            self.assertEqual(fast.dumps(payload), stdlib.dumps(payload))
+            self.assertEqual(fast.dumps_pretty(payload), stdlib.dumps_pretty(payload))
+
+    def test_stdlib_used_without_orjson(self):
+        """Test that the standard library encoder is selected when orjson is missing."""
+        with patch.object(encoding, 'orjson', None):
+            self.assertEqual(encoding.build_encoder().name, encoding.ENCODER_STDLIB)
+        self.assertEqual(encoding.build_encoder(prefer_orjson=False).name, encoding.ENCODER_STDLIB)
+
+    def test_rejected_payload_falls_back(self):
+        """Test that payloads orjson cannot encode are encoded by the standard library."""
+        if encoding.orjson is None:
+            self.skipTest("orjson not installed")
+        payload = {"value": 2 ** 70}
+        self.assertEqual(encoding.OrjsonEncoder().dumps(payload), '{"value":1180591620717411303424}')
+
+
+class TestStaticFields(EncodingTestCase):
+    """Test suite for pre-serialized static fields."""
+
+    STATIC = {"daemon": {"version": "0.5.1", "local_region": "us-central1", "regions": ["a", "b"]}}
+
+    def test_static_fields_appended(self):
+        """Test that static fields are appended to compact and pretty output for every encoder."""
+        for encoder in (encoding.build_encoder(), encoding.JSONEncoder()):
+            with self.subTest(encoder=encoder.name):
+                encoding.set_encoder(encoder)
+                encoding.set_static_fields(self.STATIC)
+                payload = _health_check_payload()
+                expected = {**payload, **self.STATIC}
+
+                compact = encoding.encode_event(payload)
+                pretty = encoding.encode_event(payload, pretty=True)
+
+                self.assertEqual(json.loads(compact), expected)
+                self.assertEqual(compact, encoder.dumps(expected))
+                self.assertEqual(pretty, encoder.dumps_pretty(expected))
+                self.assertEqual(json.loads(encoding.encode_event({})), self.STATIC)
+                self.assertEqual(json.loads(encoding.encode_event({}, pretty=True)), self.STATIC)
+
+    def test_event_key_overrides_static(self):
+        """Test that an event carrying a static key is encoded with its own value."""
+        encoding.set_static_fields(self.STATIC)
+
+        encoded = json.loads(encoding.encode_event({"daemon": "override", "x": 1}))
+
+        self.assertEqual(encoded, {"daemon": "override", "x": 1})
+
+    def test_clearing_static_fields(self):
+        """Test that None removes the static fields."""
+        encoding.set_static_fields(self.STATIC)
+        encoding.set_static_fields(None)
+
+        self.assertEqual(encoding.encode_event({"x": 1}), '{"x":1}')
+
+    def test_static_fields_encoded_once(self):
+        """Test that static fields are encoded when set and each event costs one encoder call."""
+        encoder = CountingEncoder()
+        encoding.set_encoder(encoder)
+        encoding.set_static_fields(self.STATIC)
+        self.assertEqual(encoder.encoded, [self.STATIC, self.STATIC])
+        encoder.encoded.clear()
+
+        payload = _health_check_cycle_payload()
+        for _ in range(5):
+            encoding.encode_event(payload)
+            encoding.encode_event(payload, pretty=True)
+
+        self.assertEqual(len(encoder.encoded), 10)
+        self.assertTrue(all(obj is payload for obj in encoder.encoded))
+
+    def test_formatters_use_encoder(self):
+        """Test that both structured formatters include the static fields."""
+        encoding.set_static_fields(self.STATIC)
+        record = logging.LogRecord('test', logging.INFO, __file__, 1, 'event', None, None)
+        record.json_fields = _health_check_payload()
+
+        for formatter in (StructuredFormatter(), StructuredJSONFormatter()):
+            with self.subTest(formatter=type(formatter).__name__):
+                self.assertEqual(json.loads(formatter.format(record))["daemon"]["version"], "0.5.1")
+
+
+@benchmark
+class TestEncodingBenchmark(EncodingTestCase):
+    """Benchmark (RUN_BENCHMARKS=true): per-event encoding cost for typical payload shapes."""
+
+    ITERATIONS = 2000
+
+    def _time(self, func, payload):
+        start = time.perf_counter()
+        for _ in range(self.ITERATIONS):
+            func(payload)
+        return (time.perf_counter() - start) / self.ITERATIONS
+
+    def test_encoder_benchmark(self):
+        """The selected encoder is not slower than the standard library on event payloads."""
+        encoding.set_static_fields(TestStaticFields.STATIC)
+        stdlib = encoding.JSONEncoder()
+        rows = []
+        for name, payload in (("health_check_cycle", _health_check_cycle_payload()),
+                              ("health_check", _health_check_payload())):
+            for pretty in (False, True):
+                encoding.set_encoder(stdlib)
+                baseline = self._time(lambda p: encoding.encode_event(p, pretty), payload)
+                encoding.set_encoder(encoding.build_encoder())
+                selected = self._time(lambda p: encoding.encode_event(p, pretty), payload)
+                rows.append((name, pretty, baseline, selected))
+
+        print(f"\nStructured event encoding benchmark ({encoding.build_encoder().name} vs json, "
+              f"{self.ITERATIONS} events)")
+        for name, pretty, baseline, selected in rows:
+            print(f"  {name:<19} {'pretty ' if pretty else 'compact'}  json={baseline * 1e6:6.1f}us  "
+                  f"selected={selected * 1e6:6.1f}us  speedup={baseline / selected:4.1f}x")
+
+        for name, pretty, baseline, selected in rows:
+            self.assertLess(selected, baseline * 1.5 + 5e-6, f"{name} pretty={pretty}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,257 @@
+"""
+Unit Tests for the Structured Event Flight Recorder
+
+This test module validates the in-memory ring buffer of recent structured
+events and its integration with StructuredEventLogger.
+
+Test Coverage:
+    - Ring buffer ordering, overwrite of the oldest events and statistics
+    - Slots-based records
+    - Events recorded below the logger level and without structured handlers
+    - Lazy details snapshotted when recorded, built once for recorder and handlers, caller's event untouched
+    - JSON Lines dump readable by the log reader
+    - SIGUSR1 dump through setup_signal_handlers
+    - Recorder installation from configuration
+
+Author: Nathan Bray
+Created: 2025-11-01
+"""
+
+import unittest
+from unittest.mock import Mock
+import logging
+import os
+import shutil
+import signal
+import tempfile
+import time
+from collections import deque
+
+try:
+    from .flight_recorder import (
+        FlightRecord,
+        FlightRecorder,
+        get_flight_recorder,
+        set_flight_recorder,
+        dump_flight_recorder
+    )
+    from .structured_events import StructuredEventLogger, ActionResult
+    from .log_reader import iter_file_events
+    from . import daemon
+except ImportError:
+    from flight_recorder import (
+        FlightRecord,
+        FlightRecorder,
+        get_flight_recorder,
+        set_flight_recorder,
+        dump_flight_recorder
+    )
+    from structured_events import StructuredEventLogger, ActionResult
+    from log_reader import iter_file_events
+    import daemon
+
+
+class CaptureHandler(logging.Handler):
+    """Handler that keeps the records it receives."""
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _record(index, level=logging.INFO):
+    return FlightRecord(1000.0 + index, level, 'health_check_cycle', 'success',
+                        'daemon', 'health_check_cycle', {'index': index})
+
+
+class FlightRecorderTestCase(unittest.TestCase):
+    """Restore the process-wide recorder and provide a temporary directory."""
+
+    def setUp(self):
+        self._saved_recorder = get_flight_recorder()
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        set_flight_recorder(self._saved_recorder)
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+
+class TestFlightRecorderBuffer(FlightRecorderTestCase):
+    """Test suite for the ring buffer."""
+
+    def test_invalid_capacity(self):
+        """Test that a capacity below one is rejected."""
+        with self.assertRaises(ValueError):
+            FlightRecorder(0)
+
+    def test_keeps_last_events_in_order(self):
+        """Test that the buffer keeps the newest events, oldest first, and counts overwrites."""
+        recorder = FlightRecorder(3)
+        for i in range(2):
+            recorder.record(_record(i))
+        self.assertEqual([r.details['index'] for r in recorder.snapshot()], [0, 1])
+
+        for i in range(2, 7):
+            recorder.record(_record(i))
+
+        self.assertEqual([r.details['index'] for r in recorder.snapshot()], [4, 5, 6])
+        self.assertEqual(len(recorder), 3)
+        stats = recorder.stats()
+        self.assertEqual(stats['recorded'], 7)
+        self.assertEqual(stats['overwritten'], 4)
+
+        recorder.clear()
+        self.assertEqual(recorder.snapshot(), [])
+
+    def test_records_use_slots(self):
+        """Test that records carry no per-instance dict."""
+        self.assertFalse(hasattr(_record(0), '__dict__'))
+
+    def test_dump_is_json_lines(self):
+        """Test that a dump writes every buffered event readable by the log reader."""
+        recorder = FlightRecorder(5)
+        for i in range(7):
+            recorder.record(_record(i, logging.DEBUG))
+        path = os.path.join(self.tmpdir, 'flight.jsonl')
+
+        self.assertEqual(recorder.dump(path), 5)
+
+        events = list(iter_file_events(path))
+        self.assertEqual([e['details']['index'] for e in events], [2, 3, 4, 5, 6])
+        self.assertEqual(events[0]['level'], 'DEBUG')
+        self.assertFalse(os.path.exists(f"{path}.tmp"))
+        self.assertEqual(recorder.stats()['dumps'], 1)
+
+    def test_dump_without_recorder(self):
+        """Test that a dump request with the recorder disabled writes nothing."""
+        set_flight_recorder(None)
+
+        self.assertIsNone(dump_flight_recorder(os.path.join(self.tmpdir, 'flight.jsonl')))
+        self.assertEqual(os.listdir(self.tmpdir), [])
+
+
+class TestStructuredEventLoggerRecording(FlightRecorderTestCase):
+    """Test suite for recording from StructuredEventLogger."""
+
+    def setUp(self):
+        super().setUp()
+        self.recorder = FlightRecorder(10)
+        set_flight_recorder(self.recorder)
+        self.logger = logging.getLogger(f"test_flight_{self.id()}")
+        self.logger.setLevel(logging.WARNING)
+        self.logger.propagate = False
+        self.event_logger = StructuredEventLogger(self.logger.name)
+        self.builds = 0
+
+    def _details(self):
+        self.builds += 1
+        return {"state_code": 1}
+
+    def test_records_events_below_log_level(self):
+        """Test that DEBUG and INFO events are recorded while the logger is at WARNING."""
+        self.event_logger.set_correlation_id("hc-1")
+        for result in (ActionResult.NO_CHANGE, ActionResult.SUCCESS, ActionResult.FAILURE):
+            self.event_logger.log_event({
+                "event_type": "health_check_cycle", "timestamp": time.time(),
+                "result": result.value, "component": "daemon",
+                "operation": "health_check_cycle", "details": self._details
+            })
+
+        records = self.recorder.snapshot()
+        self.assertEqual([r.level for r in records], [logging.DEBUG, logging.INFO, logging.ERROR])
+        self.assertEqual(records[0].to_dict()["details"], {"state_code": 1})
+        self.assertEqual(records[0].correlation_id, "hc-1")
+
+    def test_lazy_details_snapshot_at_record(self):
+        """Test that each record keeps the values of its own cycle, not those at dump time."""
+        history = deque(maxlen=5)
+        events = []
+        for healthy in (True, False, True):
+            history.append(healthy)
+
+            def cycle_details():
+                self.builds += 1
+                return {"history_size": len(history), "healthy_count": sum(history)}
+            event = {
+                "event_type": "health_check_cycle", "timestamp": time.time(),
+                "result": "success", "component": "daemon",
+                "operation": "health_check_cycle", "details": cycle_details
+            }
+            self.event_logger.log_event(event)
+            events.append(event)
+        history.clear()
+
+        self.assertEqual(self.builds, 3)
+        self.assertTrue(all(callable(event["details"]) for event in events))
+        self.assertEqual([r.to_dict()["details"] for r in self.recorder.snapshot()],
+                         [{"history_size": 1, "healthy_count": 1},
+                          {"history_size": 2, "healthy_count": 1},
+                          {"history_size": 3, "healthy_count": 2}])
+
+    def test_handler_builds_details_once(self):
+        """Test that the recorder and a writing handler share one build of the details."""
+        handler = CaptureHandler()
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.addHandler(handler)
+        try:
+            self.event_logger.log_bgp_advertisement('project', 'us-central1', 'router-1',
+                                                    '10.0.0.0/24', 'advertise', ActionResult.SUCCESS)
+            self.event_logger.log_event({
+                "event_type": "health_check_cycle", "timestamp": time.time(),
+                "result": "success", "component": "daemon",
+                "operation": "health_check_cycle", "details": self._details
+            })
+        finally:
+            self.logger.removeHandler(handler)
+
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(len(self.recorder), 2)
+        self.assertEqual(self.recorder.snapshot()[0].details['router_name'], 'router-1')
+        self.assertEqual(handler.records[-1].json_fields['details'], {"state_code": 1})
+
+
+class TestDaemonFlightRecorder(FlightRecorderTestCase):
+    """Test suite for daemon wiring."""
+
+    def test_install_from_config(self):
+        """Test that the recorder is installed, kept across calls and disabled by size 0."""
+        cfg = Mock(flight_recorder_size=50)
+        recorder = daemon.install_flight_recorder(cfg)
+
+        self.assertEqual(recorder.capacity, 50)
+        self.assertIs(daemon.install_flight_recorder(cfg), recorder)
+
+        cfg.flight_recorder_size = 0
+        self.assertIsNone(daemon.install_flight_recorder(cfg))
+        self.assertIsNone(get_flight_recorder())
+
+    @unittest.skipUnless(hasattr(signal, 'SIGUSR1'), "SIGUSR1 not available")
+    def test_sigusr1_dumps_recorder(self):
+        """Test that SIGUSR1 writes a timestamped dump of the recorder."""
+        saved = {sig: signal.getsignal(sig) for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGUSR1)}
+        recorder = FlightRecorder(5)
+        recorder.record(_record(0))
+        set_flight_recorder(recorder)
+        base = os.path.join(self.tmpdir, 'flight.jsonl')
+        try:
+            daemon.setup_signal_handlers(base)
+            os.kill(os.getpid(), signal.SIGUSR1)
+
+            deadline = time.monotonic() + 5
+            while recorder.stats()['dumps'] == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            for sig, handler in saved.items():
+                signal.signal(sig, handler)
+
+        dumps = [name for name in os.listdir(self.tmpdir) if name.startswith('flight.jsonl.')]
+        self.assertEqual(len(dumps), 1)
+        events = list(iter_file_events(os.path.join(self.tmpdir, dumps[0])))
+        self.assertEqual(events[0]['details'], {'index': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
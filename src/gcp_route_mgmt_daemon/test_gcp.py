@@ -11,10 +11,16 @@ Test Coverage:
     - Backend service health checks (all scenarios)
     - BGP session health monitoring
     - BGP route advertisement updates
+    - Multi-prefix BGP advertisement reconcile (single get, at most one patch)
     - HTTP error handling (permanent and transient)
     - Incomplete API responses
     - Structured logging integration
     - Closure pattern validation
+    - Backend health fetch modes (sequential, concurrent, batch); fan-out benchmark (RUN_BENCHMARKS=true)
+    - Compute client pool accepted wherever a bare client is
+    - Reconciliation cache: skipped router reads in steady state, drift detection
+    - Paginated backend service listing (nextPageToken, fields projection, overlap)
+    - Patch operations handed to an OperationTracker instead of being awaited
 
 Author: Nathan Bray
 Created: 2025-11-01
@@ -23,32 +29,54 @@ Created: 2025-11-01
 import unittest
 from unittest.mock import Mock, MagicMock, patch, call
 import os
+import threading
+import time
 from googleapiclient.errors import HttpError
 from google.auth.exceptions import RefreshError
 
 # Import GCP integration functions
 try:
+    from .structured_events import ActionResult
     from .gcp import (
         build_compute_client,
         validate_gcp_connectivity,
         backend_services_healthy,
+        iter_region_backend_service_pages,
+        get_backend_service_summary,
+        BACKEND_SERVICE_LIST_FIELDS,
         router_bgp_sessions_healthy,
         update_bgp_advertisement,
+        reconcile_bgp_advertisements,
+        ComputeClientPool,
+        ReconciliationCache,
         HEALTHY_STATE,
+        UNHEALTHY_LOG_SUMMARY,
+        logger as gcp_logger,
         PERMANENT_HTTP_ERRORS,
         TRANSIENT_HTTP_ERRORS
     )
+    from .testing_support import benchmark
 except ImportError:
+    from structured_events import ActionResult
     from gcp import (
         build_compute_client,
         validate_gcp_connectivity,
         backend_services_healthy,
+        iter_region_backend_service_pages,
+        get_backend_service_summary,
+        BACKEND_SERVICE_LIST_FIELDS,
         router_bgp_sessions_healthy,
         update_bgp_advertisement,
+        reconcile_bgp_advertisements,
+        ComputeClientPool,
+        ReconciliationCache,
         HEALTHY_STATE,
+        UNHEALTHY_LOG_SUMMARY,
+        logger as gcp_logger,
         PERMANENT_HTTP_ERRORS,
         TRANSIENT_HTTP_ERRORS
     )
+    from testing_support import benchmark
 
 
 class TestBuildComputeClient(unittest.TestCase):
@@ -113,6 +141,27 @@ class TestBuildComputeClient(unittest.TestCase):
         with self.assertRaises(ValueError):
             build_compute_client('/path/to/invalid.json')
 
+    def test_request_builder_uses_per_thread_transport(self):
+        """Test that each thread gets its own HTTP transport from the request builder."""
+        from gcp_route_mgmt_daemon import gcp as gcp_module
+        import threading
+
+        request_builder = gcp_module._thread_local_request_builder(Mock(), timeout=10)
+
+        def build():
+            return request_builder(None, Mock(), 'https://compute.googleapis.com/', method='GET')
+
+        main_first = build()
+        main_second = build()
+        worker_requests = []
+        worker = threading.Thread(target=lambda: worker_requests.append(build()))
+        worker.start()
+        worker.join()
+
+        self.assertIs(main_first.http, main_second.http)
+        self.assertIsNot(main_first.http, worker_requests[0].http)
+        self.assertEqual(main_first.http.http.timeout, 10)
+
 
 class TestValidateGCPConnectivity(unittest.TestCase):
     """Test suite for validate_gcp_connectivity function."""
@@ -438,6 +487,499 @@ class TestBackendServicesHealthy(unittest.TestCase):
         self.assertEqual(call_args[1]['service_type'], 'backend_services')
 
 
+class FakeLatencyCompute:
+    """
+    Minimal thread-safe stand-in for the Compute client used by fan-out tests.
+
+    regionBackendServices().list() returns `services`, split into pages of
+    `page_size` with nextPageToken when set; each list call sleeps for
+    `list_latency`. Every getHealth call sleeps for `latency` seconds and
+    returns the response produced by `health_for(service, group)`. Batch
+    requests pay the latency once per batch, like a single HTTP exchange.
+    """
+
+    def __init__(self, services, latency=0.0, health_for=None, page_size=None, list_latency=0.0):
+        self.services = services
+        self.latency = latency
+        self.page_size = page_size
+        self.list_latency = list_latency
+        self.list_calls = []
+        self.health_for = health_for or (lambda service, group: {
+            'kind': 'compute#backendServiceGroupHealth',
+            'healthStatus': [{'instance': f'{group}-vm', 'healthState': 'HEALTHY'}]
+        })
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.get_health_calls = 0
+        self.batches_executed = []
+
+    def regionBackendServices(self):
+        return self
+
+    def new_batch_http_request(self, callback=None):
+        return _FakeBatch(self, callback)
+
+    def list(self, **kwargs):
+        return _FakeRequest(lambda: self._list_page(kwargs))
+
+    def _list_page(self, kwargs):
+        with self.lock:
+            self.list_calls.append(dict(kwargs, get_health_calls_before=self.get_health_calls))
+        if self.list_latency:
+            time.sleep(self.list_latency)
+        if not self.page_size:
+            return {'items': self.services}
+        start = int(kwargs.get('pageToken') or 0)
+        end = start + self.page_size
+        response = {'items': self.services[start:end]}
+        if end < len(self.services):
+            response['nextPageToken'] = str(end)
+        return response
+
+    def getHealth(self, project, region, backendService, body):
+        return _FakeRequest(lambda: self._get_health(backendService, body['group']),
+                            batch_fn=lambda: self.health_for(backendService, body['group']))
+
+    def _get_health(self, service, group):
+        with self.lock:
+            self.get_health_calls += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            result = self.health_for(service, group)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class _FakeRequest:
+    """Request object exposing execute() like googleapiclient HttpRequest."""
+
+    def __init__(self, fn, batch_fn=None):
+        self._fn = fn
+        self.batch_fn = batch_fn
+
+    def execute(self, **kwargs):
+        return self._fn()
+
+
+class _FakeBatch:
+    """BatchHttpRequest stand-in: one simulated round trip, per-request callbacks."""
+
+    def __init__(self, compute, callback):
+        self.compute = compute
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, callback=None, request_id=None):
+        self.requests.append((request_id, request))
+
+    def execute(self, http=None):
+        self.compute.batches_executed.append(len(self.requests))
+        if self.compute.latency:
+            time.sleep(self.compute.latency)
+        for request_id, request in self.requests:
+            result = request.batch_fn()
+            if isinstance(result, Exception):
+                self.callback(request_id, None, result)
+            else:
+                self.callback(request_id, result, None)
+
+
+def _make_services(service_count, groups_per_service=3):
+    """Build a backend service list with the given shape."""
+    return [
+        {'name': f'service-{i}',
+         'backends': [{'group': f'zones/z/instanceGroups/ig-{i}-{g}'} for g in range(groups_per_service)]}
+        for i in range(service_count)
+    ]
+
+
+class TestBackendHealthFetchModes(unittest.TestCase):
+    """Test suite for sequential, concurrent and batch getHealth fetching."""
+
+    UNAVAILABLE = HttpError(resp=Mock(status=503), content=b'Service Unavailable')
+
+    def _mixed_health(self, service, group):
+        """Deterministic mix of healthy, unhealthy, incomplete and failing backends."""
+        if group.endswith('-0'):
+            return {'kind': 'compute#backendServiceGroupHealth',
+                    'healthStatus': [{'instance': f'{group}-vm', 'healthState': 'HEALTHY'}]}
+        if group.endswith('-1') and service.endswith(('1', '3')):
+            return {'kind': 'compute#backendServiceGroupHealth',
+                    'healthStatus': [{'instance': f'{group}-vm', 'healthState': 'UNHEALTHY'}]}
+        if group.endswith('-2') and service.endswith('2'):
+            return {'kind': 'compute#backendServiceGroupHealth'}
+        if group.endswith('-2') and service.endswith('4'):
+            return self.UNAVAILABLE
+        return {'kind': 'compute#backendServiceGroupHealth',
+                'healthStatus': [{'instance': f'{group}-vm', 'healthState': 'HEALTHY'}]}
+
+    def _run(self, fetch_mode):
+        compute = FakeLatencyCompute(_make_services(6), health_for=self._mixed_health)
+        mock_logger = Mock()
+        checker = backend_services_healthy('project', 'us-central1', compute, mock_logger,
+                                           fetch_mode=fetch_mode, max_concurrency=4)
+        result = checker()
+        details = mock_logger.log_health_check.call_args[1]['details']
+        return result, details
+
+    def test_invalid_fetch_mode_raises(self):
+        """Test that an unknown fetch mode is rejected when the closure is built."""
+        with self.assertRaises(ValueError):
+            backend_services_healthy('project', 'us-central1', Mock(), fetch_mode='bogus')
+
+    def test_invalid_max_concurrency_raises(self):
+        """Test that max_concurrency below 1 is rejected."""
+        with self.assertRaises(ValueError):
+            backend_services_healthy('project', 'us-central1', Mock(),
+                                     fetch_mode='concurrent', max_concurrency=0)
+
+    def test_concurrent_details_match_sequential(self):
+        """Test that concurrent mode merges results into the same details structure."""
+        seq_result, seq_details = self._run('sequential')
+        con_result, con_details = self._run('concurrent')
+
+        self.assertFalse(seq_result)
+        self.assertEqual(seq_result, con_result)
+        for key in ('backend_services_checked', 'total_backends', 'healthy_backends',
+                    'unhealthy_backends', 'services_with_issues'):
+            self.assertEqual(seq_details[key], con_details[key], key)
+        self.assertEqual(con_details['fetch_mode'], 'concurrent')
+        self.assertEqual(con_details['total_backends'], 18)
+        reasons = {b['reason'] for b in con_details['unhealthy_backends']}
+        self.assertEqual(reasons, {'unhealthy_instance', 'incomplete_health_response', 'api_error_http_503'})
+
+    def test_concurrent_respects_max_in_flight(self):
+        """Test that no more than max_concurrency getHealth calls run at once."""
+        compute = FakeLatencyCompute(_make_services(10), latency=0.01)
+        checker = backend_services_healthy('project', 'us-central1', compute,
+                                           fetch_mode='concurrent', max_concurrency=3)
+
+        self.assertTrue(checker())
+        self.assertEqual(compute.get_health_calls, 30)
+        self.assertLessEqual(compute.peak_in_flight, 3)
+        self.assertGreater(compute.peak_in_flight, 1)
+
+    def test_concurrent_mode_with_mock_client(self):
+        """Test that concurrent mode works with the Mock-based client used elsewhere."""
+        mock_compute = Mock()
+        mock_compute.regionBackendServices().list().execute.return_value = {
+            'items': [{'name': 'test-service', 'backends': [{'group': 'g1'}, {'group': 'g2'}]}]
+        }
+        mock_compute.regionBackendServices().getHealth().execute.return_value = {
+            'kind': 'compute#backendServiceGroupHealth',
+            'healthStatus': [{'instance': 'instance-1', 'healthState': 'HEALTHY'}]
+        }
+
+        checker = backend_services_healthy('project', 'us-central1', mock_compute,
+                                           fetch_mode='concurrent')
+        self.assertTrue(checker())
+
+    def test_invalid_batch_size_raises(self):
+        """Test that batch sizes outside 1-1000 are rejected."""
+        for size in (0, 1001):
+            with self.subTest(batch_size=size):
+                with self.assertRaises(ValueError):
+                    backend_services_healthy('project', 'us-central1', Mock(),
+                                             fetch_mode='batch', batch_size=size)
+
+    def test_batch_packs_requests_by_batch_size(self):
+        """Test that batch mode sends ceil(backends / batch_size) batch requests."""
+        compute = FakeLatencyCompute(_make_services(40))
+        checker = backend_services_healthy('project', 'us-central1', compute,
+                                           fetch_mode='batch', batch_size=50)
+
+        self.assertTrue(checker())
+        self.assertEqual(compute.batches_executed, [50, 50, 20])
+        self.assertEqual(compute.get_health_calls, 0)
+
+    def test_batch_details_match_sequential(self):
+        """Test that batch mode fills the same details as sequential mode."""
+        def health(service, group):
+            if group.endswith('-1') and service.endswith('1'):
+                return {'kind': 'compute#backendServiceGroupHealth',
+                        'healthStatus': [{'instance': f'{group}-vm', 'healthState': 'DRAINING'}]}
+            if group.endswith('-2') and service.endswith('2'):
+                return {'kind': 'compute#backendServiceGroupHealth'}
+            return {'kind': 'compute#backendServiceGroupHealth',
+                    'healthStatus': [{'instance': f'{group}-vm', 'healthState': 'HEALTHY'}]}
+
+        outputs = {}
+        for mode in ('sequential', 'batch'):
+            mock_logger = Mock()
+            compute = FakeLatencyCompute(_make_services(5), health_for=health)
+            checker = backend_services_healthy('project', 'us-central1', compute, mock_logger,
+                                               fetch_mode=mode, batch_size=4)
+            outputs[mode] = (checker(), mock_logger.log_health_check.call_args[1]['details'])
+
+        self.assertFalse(outputs['batch'][0])
+        self.assertEqual(outputs['sequential'][0], outputs['batch'][0])
+        for key in ('total_backends', 'healthy_backends', 'unhealthy_backends', 'services_with_issues'):
+            self.assertEqual(outputs['sequential'][1][key], outputs['batch'][1][key], key)
+
+    def test_batch_permanent_error_reraised(self):
+        """Test that a per-request 403 inside a batch is re-raised."""
+        forbidden = HttpError(resp=Mock(status=403), content=b'Forbidden')
+        compute = FakeLatencyCompute(
+            _make_services(2),
+            health_for=lambda service, group: forbidden if group.endswith('1-2') else
+            {'kind': 'compute#backendServiceGroupHealth',
+             'healthStatus': [{'instance': 'vm', 'healthState': 'HEALTHY'}]}
+        )
+        checker = backend_services_healthy('project', 'us-central1', compute, fetch_mode='batch')
+
+        with self.assertRaises(HttpError) as context:
+            checker()
+        self.assertEqual(context.exception.resp.status, 403)
+
+    def test_batch_transient_error_returns_none(self):
+        """Test that a per-request 5xx/429 inside a batch makes health unknown."""
+        for status in (429, 503, 418):
+            with self.subTest(status=status):
+                error = HttpError(resp=Mock(status=status), content=b'error')
+                mock_logger = Mock()
+                compute = FakeLatencyCompute(
+                    _make_services(2),
+                    health_for=lambda service, group: error if group.endswith('0-0') else
+                    {'kind': 'compute#backendServiceGroupHealth',
+                     'healthStatus': [{'instance': 'vm', 'healthState': 'UNHEALTHY'}]}
+                )
+                checker = backend_services_healthy('project', 'us-central1', compute,
+                                                   mock_logger, fetch_mode='batch')
+
+                self.assertIsNone(checker())
+                details = mock_logger.log_health_check.call_args[1]['details']
+                self.assertTrue(details['monitoring_unavailable'])
+                self.assertEqual(details['error_code'], status)
+
+    def test_batch_missing_response_counts_unhealthy(self):
+        """Test that a request with no batch response is treated as unhealthy."""
+        mock_compute = Mock()
+        mock_compute.regionBackendServices().list().execute.return_value = {
+            'items': [{'name': 'test-service', 'backends': [{'group': 'g1'}]}]
+        }
+        # Mock batch never invokes the callback
+        checker = backend_services_healthy('project', 'us-central1', mock_compute,
+                                           fetch_mode='batch')
+
+        self.assertFalse(checker())
+        mock_compute.new_batch_http_request().execute.assert_called_once()
+
+
+class TestBackendServicePagination(unittest.TestCase):
+    """Test suite for paginated, projected backend service enumeration."""
+
+    def test_pager_follows_next_page_token(self):
+        """Test that every page is requested with the previous nextPageToken."""
+        compute = FakeLatencyCompute(_make_services(5), page_size=2)
+
+        pages = list(iter_region_backend_service_pages('project', 'us-central1', compute))
+
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual([call.get('pageToken') for call in compute.list_calls], [None, '2', '4'])
+        for call in compute.list_calls:
+            self.assertEqual(call['fields'], BACKEND_SERVICE_LIST_FIELDS)
+            self.assertEqual(call['project'], 'project')
+            self.assertEqual(call['region'], 'us-central1')
+
+    def test_pager_without_projection(self):
+        """Test that fields=None requests full resources and max_results sets the page size."""
+        compute = FakeLatencyCompute(_make_services(1))
+
+        list(iter_region_backend_service_pages('project', 'us-central1', compute,
+                                               fields=None, max_results=50))
+
+        self.assertNotIn('fields', compute.list_calls[0])
+        self.assertEqual(compute.list_calls[0]['maxResults'], 50)
+
+    def test_health_check_evaluates_every_page(self):
+        """Test that services on later pages are checked, in every fetch mode."""
+        unhealthy_group = 'zones/z/instanceGroups/ig-6-1'
+
+        def health(service, group):
+            state = 'UNHEALTHY' if group == unhealthy_group else 'HEALTHY'
+            return {'kind': 'compute#backendServiceGroupHealth',
+                    'healthStatus': [{'instance': f'{group}-vm', 'healthState': state}]}
+
+        for mode in ('sequential', 'concurrent', 'batch'):
+            compute = FakeLatencyCompute(_make_services(7), health_for=health, page_size=3)
+            mock_logger = Mock()
+            checker = backend_services_healthy('project', 'us-central1', compute, mock_logger,
+                                               fetch_mode=mode)
+
+            self.assertFalse(checker(), mode)
+            details = mock_logger.log_health_check.call_args[1]['details']
+            self.assertEqual(details['backend_service_pages'], 3, mode)
+            self.assertEqual(details['backend_services_checked'], 7, mode)
+            self.assertEqual(details['total_backends'], 21, mode)
+            self.assertEqual(details['services_with_issues'],
+                             [{'service': 'service-6', 'backend_count': 3}], mode)
+
+    def test_concurrent_fetch_overlaps_listing(self):
+        """Test that getHealth for earlier pages runs while later pages are listed."""
+        compute = FakeLatencyCompute(_make_services(6), page_size=2, list_latency=0.05)
+        checker = backend_services_healthy('project', 'us-central1', compute,
+                                           fetch_mode='concurrent', max_concurrency=4)
+
+        self.assertTrue(checker())
+
+        # The last page is requested only after page 1's getHealth calls have run
+        self.assertEqual(len(compute.list_calls), 3)
+        self.assertEqual(compute.get_health_calls, 18)
+        self.assertGreater(compute.list_calls[-1]['get_health_calls_before'], 0)
+
+    def test_transient_error_on_later_page(self):
+        """Test that a 503 listing a later page makes health unknown."""
+        mock_compute = Mock()
+        mock_compute.regionBackendServices().list().execute.side_effect = [
+            {'items': [], 'nextPageToken': 'page-2'},
+            HttpError(resp=Mock(status=503), content=b'Service Unavailable')
+        ]
+        checker = backend_services_healthy('project', 'us-central1', mock_compute)
+
+        self.assertIsNone(checker())
+
+    def test_summary_counts_all_pages(self):
+        """Test that get_backend_service_summary aggregates every page."""
+        compute = FakeLatencyCompute(_make_services(5, groups_per_service=2), page_size=2)
+
+        summary = get_backend_service_summary('project', 'us-central1', compute)
+
+        self.assertEqual(summary['service_count'], 5)
+        self.assertEqual(summary['total_backends'], 10)
+        self.assertEqual(summary['services'], [f'service-{i}' for i in range(5)])
+        self.assertEqual(len(compute.list_calls), 3)
+
+
+class TestUnhealthyInstanceSummary(unittest.TestCase):
+    """Test suite for summarized logging of unhealthy instances."""
+
+    def setUp(self):
+        self.states = {f'vm-{i}': 'UNHEALTHY' for i in range(12)}
+        self.states.update({f'vm-{i}': 'DRAINING' for i in range(12, 15)})
+        self.states.update({f'vm-{i}': 'HEALTHY' for i in range(15, 20)})
+
+    def _health(self, service, group):
+        if not group.endswith('-0'):
+            return {'kind': 'compute#backendServiceGroupHealth',
+                    'healthStatus': [{'instance': f'{group}-vm', 'healthState': 'HEALTHY'}]}
+        return {'kind': 'compute#backendServiceGroupHealth',
+                'healthStatus': [{'instance': name, 'healthState': state}
+                                 for name, state in self.states.items()]}
+
+    def _checker(self, structured_logger=None):
+        compute = FakeLatencyCompute(_make_services(1, groups_per_service=2), health_for=self._health)
+        return backend_services_healthy('project', 'us-central1', compute, structured_logger,
+                                        unhealthy_log_mode=UNHEALTHY_LOG_SUMMARY, unhealthy_sample_size=5)
+
+    def _instance_warnings(self, checker):
+        with self.assertLogs(gcp_logger, level='DEBUG') as logs:
+            self.assertFalse(checker())
+        return [r for r in logs.records if r.levelname == 'WARNING' and 'instances in backend' in r.getMessage()]
+
+    def test_invalid_mode_raises(self):
+        """Test that an unknown mode or sample size is rejected."""
+        with self.assertRaises(ValueError):
+            backend_services_healthy('project', 'us-central1', Mock(), unhealthy_log_mode='bogus')
+        with self.assertRaises(ValueError):
+            backend_services_healthy('project', 'us-central1', Mock(), unhealthy_sample_size=0)
+
+    def test_entries_grouped_by_state_with_samples(self):
+        """Test one backward compatible entry per (service, backend, state) with counts and samples."""
+        structured_logger = Mock()
+        self._checker(structured_logger)()
+
+        details = structured_logger.log_health_check.call_args[1]['details']
+        entries = details['unhealthy_backends']
+        self.assertEqual([(e['health_state'], e['instance_count']) for e in entries],
+                         [('UNHEALTHY', 12), ('DRAINING', 3)])
+        unhealthy = entries[0]
+        self.assertEqual(unhealthy['sample_instances'], [f'vm-{i}' for i in range(5)])
+        self.assertEqual(unhealthy['instance'], 'vm-0')
+        self.assertEqual(unhealthy['reason'], 'unhealthy_instance')
+        self.assertEqual(unhealthy['service'], 'service-0')
+        self.assertEqual(details['unhealthy_instances'], 15)
+        self.assertEqual(details['total_backends'], 2)
+        self.assertEqual(details['healthy_backends'], 1)
+
+    def test_warnings_only_when_set_changes(self):
+        """Test that per-entry warnings are logged on change and suppressed while the set is stable."""
+        checker = self._checker()
+
+        self.assertEqual(len(self._instance_warnings(checker)), 2)
+        self.assertEqual(self._instance_warnings(checker), [])
+
+        self.states['vm-15'] = 'UNHEALTHY'
+        warnings = self._instance_warnings(checker)
+        self.assertEqual(len(warnings), 2)
+        self.assertIn('13 UNHEALTHY instances', warnings[0].getMessage())
+        self.assertIn('and 8 more', warnings[0].getMessage())
+
+    def test_recovery_reported_once(self):
+        """Test that the set becoming empty is reported once as a change."""
+        structured_logger = Mock()
+        checker = self._checker(structured_logger)
+        checker()
+
+        self.states = {name: 'HEALTHY' for name in self.states}
+        self.assertTrue(checker())
+        self.assertTrue(structured_logger.log_health_check.call_args[1]['details']['unhealthy_set_changed'])
+        self.assertTrue(checker())
+        self.assertFalse(structured_logger.log_health_check.call_args[1]['details']['unhealthy_set_changed'])
+
+
+@benchmark
+class TestBackendHealthFanOutBenchmark(unittest.TestCase):
+    """Benchmark (RUN_BENCHMARKS=true): wall time of a region health check against backend count."""
+
+    LATENCY = 0.005          # Simulated getHealth round trip (seconds)
+    MAX_CONCURRENCY = 8
+    BATCH_SIZE = 100
+
+    def _time_check(self, service_count, fetch_mode):
+        compute = FakeLatencyCompute(_make_services(service_count), latency=self.LATENCY)
+        checker = backend_services_healthy('project', 'us-central1', compute,
+                                           fetch_mode=fetch_mode,
+                                           max_concurrency=self.MAX_CONCURRENCY,
+                                           batch_size=self.BATCH_SIZE)
+        start = time.perf_counter()
+        self.assertTrue(checker())
+        return time.perf_counter() - start
+
+    def test_wall_time_vs_backend_count(self):
+        """Concurrent fan-out wall time grows ~backends/max_concurrency, sequential ~backends."""
+        rows = []
+        for service_count in (4, 16, 40):
+            backends = service_count * 3
+            sequential = self._time_check(service_count, 'sequential')
+            concurrent = self._time_check(service_count, 'concurrent')
+            batch = self._time_check(service_count, 'batch')
+            rows.append((backends, sequential, concurrent, batch))
+
+            # Sequential pays one round trip per backend
+            self.assertGreaterEqual(sequential, backends * self.LATENCY * 0.9)
+
+        print("\nbackend_services_healthy fan-out benchmark "
+              f"({self.LATENCY * 1000:.0f}ms per round trip, max_concurrency={self.MAX_CONCURRENCY}, "
+              f"batch_size={self.BATCH_SIZE})")
+        for backends, sequential, concurrent, batch in rows:
+            print(f"  backends={backends:4d}  sequential={sequential * 1000:7.1f}ms  "
+                  f"concurrent={concurrent * 1000:7.1f}ms  batch={batch * 1000:7.1f}ms")
+
+        # At 120 backends (40 services x 3 groups) the fan-out must be several times faster,
+        # and batching (2 round trips) faster still
+        backends, sequential, concurrent, batch = rows[-1]
+        self.assertLess(concurrent, sequential / 3)
+        self.assertLess(batch, sequential / 10)
+
+
 class TestRouterBGPSessionsHealthy(unittest.TestCase):
     """Test suite for router_bgp_sessions_healthy function and closure."""
 
@@ -735,6 +1277,330 @@ class TestUpdateBGPAdvertisement(unittest.TestCase):
         mock_compute.routers().patch.assert_not_called()
 
 
+class TestReconcileBGPAdvertisements(unittest.TestCase):
+    """Test suite for multi-prefix reconcile_bgp_advertisements."""
+
+    def _compute_with_ranges(self, ranges):
+        """Build a mock compute client whose router advertises the given ranges."""
+        mock_compute = Mock()
+        mock_compute.routers().get().execute.return_value = {
+            'bgp': {'advertisedIpRanges': [{'range': r} for r in ranges]}
+        }
+        mock_compute.routers().patch().execute.return_value = {
+            'name': 'operation-123', 'status': 'RUNNING'
+        }
+        mock_compute.routers.reset_mock()
+        return mock_compute
+
+    def test_single_get_and_patch_for_multiple_prefixes(self):
+        """Test that two changed prefixes are applied with one get and one patch."""
+        mock_compute = self._compute_with_ranges(['10.0.1.0/24', '192.168.0.0/24'])
+
+        reconciler = reconcile_bgp_advertisements(
+            'project', 'region', 'router',
+            {'10.0.0.0/24': True, '10.0.1.0/24': False}, mock_compute
+        )
+
+        self.assertTrue(reconciler())
+        self.assertEqual(mock_compute.routers().get.call_count, 1)
+        self.assertEqual(mock_compute.routers().patch.call_count, 1)
+
+        body = mock_compute.routers().patch.call_args[1]['body']
+        advertised = [r['range'] for r in body['bgp']['advertisedIpRanges']]
+        self.assertEqual(advertised, ['192.168.0.0/24', '10.0.0.0/24'])
+
+    def test_no_patch_when_already_in_desired_state(self):
+        """Test that no patch is issued when every prefix is already correct."""
+        mock_compute = self._compute_with_ranges(['10.0.0.0/24'])
+
+        reconciler = reconcile_bgp_advertisements(
+            'project', 'region', 'router',
+            {'10.0.0.0/24': True, '10.0.1.0/24': False}, mock_compute
+        )
+
+        self.assertTrue(reconciler())
+        self.assertEqual(mock_compute.routers().get.call_count, 1)
+        mock_compute.routers().patch.assert_not_called()
+
+    def test_one_event_per_prefix(self):
+        """Test that a BGP advertisement event is logged for every prefix."""
+        mock_compute = self._compute_with_ranges(['10.0.0.0/24'])
+        mock_logger = Mock()
+
+        reconciler = reconcile_bgp_advertisements(
+            'project', 'region', 'router',
+            {'10.0.0.0/24': True, '10.0.1.0/24': True}, mock_compute,
+            structured_logger=mock_logger
+        )
+        reconciler()
+
+        events = {c[1]['prefix']: c[1] for c in mock_logger.log_bgp_advertisement.call_args_list}
+        self.assertEqual(len(events), 2)
+        self.assertEqual(events['10.0.0.0/24']['result'], ActionResult.NO_CHANGE)
+        self.assertIsNone(events['10.0.0.0/24']['operation_id'])
+        self.assertEqual(events['10.0.1.0/24']['result'], ActionResult.SUCCESS)
+        self.assertEqual(events['10.0.1.0/24']['operation_id'], 'operation-123')
+
+    def test_none_entries_are_ignored(self):
+        """Test that prefixes with advertise=None are neither changed nor logged."""
+        mock_compute = self._compute_with_ranges(['10.0.1.0/24'])
+        mock_logger = Mock()
+
+        reconciler = reconcile_bgp_advertisements(
+            'project', 'region', 'router',
+            {'10.0.0.0/24': True, '10.0.1.0/24': None}, mock_compute,
+            structured_logger=mock_logger
+        )
+        self.assertTrue(reconciler())
+
+        body = mock_compute.routers().patch.call_args[1]['body']
+        advertised = [r['range'] for r in body['bgp']['advertisedIpRanges']]
+        self.assertEqual(advertised, ['10.0.1.0/24', '10.0.0.0/24'])
+        self.assertEqual(mock_logger.log_bgp_advertisement.call_count, 1)
+
+    def test_all_none_makes_no_api_calls(self):
+        """Test that an all-None desired map is a no-op success (State 0 behavior)."""
+        mock_compute = Mock()
+
+        reconciler = reconcile_bgp_advertisements(
+            'project', 'region', 'router',
+            {'10.0.0.0/24': None, '10.0.1.0/24': None}, mock_compute
+        )
+
+        self.assertTrue(reconciler())
+        mock_compute.routers().get.assert_not_called()
+        mock_compute.routers().patch.assert_not_called()
+
+    def test_transient_error_fails_every_prefix(self):
+        """Test that a transient patch failure returns False and logs FAILURE per prefix."""
+        mock_compute = self._compute_with_ranges([])
+        mock_compute.routers().patch().execute.side_effect = HttpError(Mock(status=503), b'Unavailable')
+        mock_logger = Mock()
+
+        reconciler = reconcile_bgp_advertisements(
+            'project', 'region', 'router',
+            {'10.0.0.0/24': True, '10.0.1.0/24': True}, mock_compute,
+            structured_logger=mock_logger
+        )
+
+        self.assertFalse(reconciler())
+        results = [c[1]['result'] for c in mock_logger.log_bgp_advertisement.call_args_list]
+        self.assertEqual(results, [ActionResult.FAILURE, ActionResult.FAILURE])
+
+    def test_permanent_error_reraised(self):
+        """Test that permanent HTTP errors are re-raised."""
+        mock_compute = Mock()
+        mock_compute.routers().get().execute.side_effect = HttpError(Mock(status=403), b'Forbidden')
+
+        reconciler = reconcile_bgp_advertisements(
+            'project', 'region', 'router', {'10.0.0.0/24': True}, mock_compute
+        )
+
+        with self.assertRaises(HttpError):
+            reconciler()
+
+    def test_invalid_desired_map(self):
+        """Test that an empty map or non-CIDR prefix raises ValueError."""
+        mock_compute = Mock()
+
+        with self.assertRaises(ValueError):
+            reconcile_bgp_advertisements('project', 'region', 'router', {}, mock_compute)
+
+        with self.assertRaises(ValueError) as context:
+            reconcile_bgp_advertisements('project', 'region', 'router',
+                                         {'10.0.0.0/24': True, '10.0.1.0': True}, mock_compute)
+        self.assertIn('CIDR format', str(context.exception))
+
+    def test_single_prefix_update_delegates(self):
+        """Test that update_bgp_advertisement performs the same single get/patch."""
+        mock_compute = self._compute_with_ranges([])
+
+        advertiser = update_bgp_advertisement('project', 'region', 'router',
+                                             '10.0.0.0/24', mock_compute, advertise=True)
+
+        self.assertTrue(advertiser())
+        self.assertEqual(mock_compute.routers().get.call_count, 1)
+        body = mock_compute.routers().patch.call_args[1]['body']
+        self.assertEqual(body, {'bgp': {'advertisedIpRanges': [{'range': '10.0.0.0/24'}]}})
+
+    def test_patch_operation_handed_to_tracker(self):
+        """Test that the patch operation is tracked in the background, not awaited."""
+        mock_compute = self._compute_with_ranges([])
+        tracker = Mock()
+        mock_logger = Mock()
+        mock_logger.current_correlation_id.return_value = 'hc-1'
+
+        reconciler = reconcile_bgp_advertisements(
+            'project', 'region', 'router',
+            {'10.0.0.0/24': True, '10.0.1.0/24': False}, mock_compute,
+            structured_logger=mock_logger, operation_tracker=tracker
+        )
+
+        self.assertTrue(reconciler())
+        tracker.track.assert_called_once_with(
+            project='project',
+            region='region',
+            operation={'name': 'operation-123', 'status': 'RUNNING'},
+            resource='router',
+            prefixes=('10.0.0.0/24',),
+            correlation_id='hc-1'
+        )
+        mock_compute.regionOperations.assert_not_called()
+
+    def test_no_tracking_without_patch(self):
+        """Test that nothing is tracked when no change is needed."""
+        mock_compute = self._compute_with_ranges(['10.0.0.0/24'])
+        tracker = Mock()
+
+        reconciler = reconcile_bgp_advertisements(
+            'project', 'region', 'router', {'10.0.0.0/24': True}, mock_compute,
+            operation_tracker=tracker
+        )
+
+        self.assertTrue(reconciler())
+        tracker.track.assert_not_called()
+
+
+class TestComputeClientPoolIntegration(unittest.TestCase):
+    """Test suite for passing a ComputeClientPool instead of a bare client."""
+
+    def test_pool_clients_share_credentials(self):
+        """Test that pooled clients get their own transport around one credentials object."""
+        from gcp_route_mgmt_daemon import gcp as gcp_module
+
+        with patch.object(gcp_module, 'build') as mock_build, \
+             patch.object(gcp_module.service_account.Credentials, 'from_service_account_file') as mock_creds, \
+             patch.object(gcp_module.os.path, 'exists', return_value=True), \
+             patch.object(gcp_module.os, 'access', return_value=True):
+            credentials = Mock()
+            credentials.valid = True
+            mock_creds.return_value = credentials
+            mock_build.side_effect = lambda **kwargs: Mock()
+
+            pool = gcp_module.build_compute_client_pool('/path/to/credentials.json', size=2)
+            first = pool.checkout()
+            second = pool.checkout()
+
+        self.assertIsNot(first, second)
+        mock_creds.assert_called_once()
+        transports = [c[1]['http'] for c in mock_build.call_args_list]
+        self.assertEqual(len(transports), 2)
+        self.assertIsNot(transports[0], transports[1])
+        self.assertTrue(all(t.credentials is credentials for t in transports))
+
+    def test_concurrent_fan_out_uses_one_client_per_call(self):
+        """Test that each getHealth call in the fan-out borrows its own pooled client."""
+        services = _make_services(4)
+        clients = []
+
+        def factory():
+            clients.append(FakeLatencyCompute(services, latency=0.01))
+            return clients[-1]
+
+        pool = ComputeClientPool(factory, size=4)
+        checker = backend_services_healthy('project', 'us-central1', pool,
+                                           fetch_mode='concurrent', max_concurrency=8)
+
+        self.assertTrue(checker())
+
+        # No pooled client ever served two requests at once
+        self.assertTrue(all(c.peak_in_flight <= 1 for c in clients))
+        self.assertEqual(sum(c.get_health_calls for c in clients), 12)
+        stats = pool.stats()
+        self.assertLessEqual(stats["created"], 4)
+        self.assertEqual(stats["checkouts"], 1 + 12)  # list + one per backend group
+        self.assertEqual(stats["returns"], stats["checkouts"])
+        self.assertEqual(stats["in_use"], 0)
+
+    def test_reconcile_accepts_pool(self):
+        """Test that BGP reconcile borrows a client for the get and the patch."""
+        mock_compute = Mock()
+        mock_compute.routers().get().execute.return_value = {'bgp': {'advertisedIpRanges': []}}
+        mock_compute.routers().patch().execute.return_value = {'name': 'operation-1'}
+        pool = ComputeClientPool(lambda: mock_compute, size=1)
+
+        reconciler = reconcile_bgp_advertisements('project', 'region', 'router',
+                                                  {'10.0.0.0/24': True}, pool)
+
+        self.assertTrue(reconciler())
+        self.assertEqual(pool.stats()["checkouts"], 2)
+        self.assertEqual(pool.stats()["in_use"], 0)
+
+
+class TestReconcileWithCache(unittest.TestCase):
+    """Test suite for reconcile_bgp_advertisements with a ReconciliationCache."""
+
+    DESIRED = {'10.0.0.0/24': True, '10.0.1.0/24': False}
+
+    def setUp(self):
+        self.now = [1000.0]
+        self.cache = ReconciliationCache(drift_check_interval=600, clock=lambda: self.now[0])
+        self.compute = Mock()
+        self.ranges = [{'range': '10.0.0.0/24'}]
+        self.compute.routers().get().execute.side_effect = \
+            lambda: {'bgp': {'advertisedIpRanges': list(self.ranges)}}
+        self.compute.routers().patch().execute.return_value = {'name': 'operation-1'}
+        self.compute.routers.reset_mock()
+
+    def _reconciler(self, structured_logger=None):
+        return reconcile_bgp_advertisements('project', 'region', 'router', self.DESIRED,
+                                            self.compute, structured_logger=structured_logger,
+                                            cache=self.cache)
+
+    def test_steady_state_skips_router_read(self):
+        """Test that a confirmed state skips the get and still logs NO_CHANGE per prefix."""
+        mock_logger = Mock()
+        reconciler = self._reconciler(mock_logger)
+
+        self.assertTrue(reconciler())
+        self.assertTrue(reconciler())
+
+        self.assertEqual(self.compute.routers().get.call_count, 1)
+        results = [c[1]['result'] for c in mock_logger.log_bgp_advertisement.call_args_list]
+        self.assertEqual(results, [ActionResult.NO_CHANGE] * 4)
+
+    def test_patch_is_not_confirmation(self):
+        """Test that the call after a patch reads the router again."""
+        self.ranges = []
+        reconciler = self._reconciler()
+
+        self.assertTrue(reconciler())          # read + patch
+        self.ranges = [{'range': '10.0.0.0/24'}]
+        self.assertTrue(reconciler())          # read, confirms
+        self.assertTrue(reconciler())          # skipped
+
+        self.assertEqual(self.compute.routers().get.call_count, 2)
+        self.assertEqual(self.compute.routers().patch.call_count, 1)
+
+    def test_out_of_band_drift_detected_after_interval(self):
+        """Test that drift is detected and repaired at the next drift check."""
+        reconciler = self._reconciler()
+        reconciler()
+
+        # Someone removes the prefix out-of-band; cached cycles do not see it
+        self.ranges = []
+        self.now[0] += 300
+        reconciler()
+        self.compute.routers().patch.assert_not_called()
+
+        # Once the interval elapses the read finds and repairs the drift
+        self.now[0] += 300
+        reconciler()
+        self.assertEqual(self.compute.routers().patch.call_count, 1)
+        self.assertEqual(self.cache.stats()["drift_detected"], 1)
+
+    def test_read_reduction_over_steady_state_cycles(self):
+        """Test that 60s cycles with a 600s drift check read the router once per 10 cycles."""
+        reconciler = self._reconciler()
+
+        for _ in range(30):
+            self.assertTrue(reconciler())
+            self.now[0] += 60
+
+        self.assertEqual(self.compute.routers().get.call_count, 3)
+        self.assertEqual(self.cache.stats()["hits"], 27)
+
+
 class TestEdgeCases(unittest.TestCase):
     """Test suite for edge cases and error scenarios."""
 
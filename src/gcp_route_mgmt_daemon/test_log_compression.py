@@ -0,0 +1,223 @@
+"""
+Unit Tests for Background Compression of Rotated Logs
+
+This test module validates the rotating handlers that compress their backups
+on the background compressor thread, and reading the compressed history back.
+
+Test Coverage:
+    - JSON Lines, JSON array and text logs rotated into compressed backups
+    - Rotation returning before compression has run
+    - Backups shifted or deleted while waiting for compression
+    - Reader preferring the uncompressed backup while both forms exist
+    - zstd falling back to gzip without the zstandard package
+    - setup_logger and shutdown_logging finishing pending compression
+
+Author: Nathan Bray
+Created: 2025-11-01
+"""
+
+import unittest
+from unittest.mock import patch
+import gzip
+import os
+import shutil
+import tempfile
+
+try:
+    from . import log_compression
+    from .log_compression import BackgroundCompressor, get_log_compressor
+    from .log_reader import iter_events, rotated_log_files
+    from .logging_setup import (
+        CompressingRotatingFileHandler,
+        JsonLinesHandler,
+        StructuredArrayHandler,
+        StructuredFormatter,
+        StructuredJSONFormatter,
+        setup_logger,
+        shutdown_logging
+    )
+    from .testing_support import structured_record
+except ImportError:
+    import log_compression
+    from log_compression import BackgroundCompressor, get_log_compressor
+    from log_reader import iter_events, rotated_log_files
+    from logging_setup import (
+        CompressingRotatingFileHandler,
+        JsonLinesHandler,
+        StructuredArrayHandler,
+        StructuredFormatter,
+        StructuredJSONFormatter,
+        setup_logger,
+        shutdown_logging
+    )
+    from testing_support import structured_record
+
+
+class ManualCompressor:
+    """Compressor that holds jobs until the test runs them."""
+
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, job):
+        self.jobs.append(job)
+
+    def run_all(self):
+        jobs, self.jobs = self.jobs, []
+        for job in jobs:
+            job()
+
+
+class CompressionTestCase(unittest.TestCase):
+    """Shared temporary directory."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'structured.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _jsonl_handler(self, backup_count=20, compressor=None):
+        handler = JsonLinesHandler(self.path, maxBytes=1024, backupCount=backup_count,
+                                   compression='gzip', compressor=compressor)
+        handler.setFormatter(StructuredFormatter())
+        return handler
+
+    def _leftovers(self):
+        return [name for name in os.listdir(self.tmpdir) if name.endswith('.tmp')]
+
+
+class TestCompressedRotation(CompressionTestCase):
+    """Test suite for rotation into compressed backups."""
+
+    def test_jsonl_backups_compressed(self):
+        """Test that every rotated JSON Lines backup is gzipped and read back in order."""
+        handler = self._jsonl_handler()
+        for i in range(30):
+            handler.emit(structured_record(i))
+        handler.close()
+        self.assertTrue(get_log_compressor().flush(timeout=10))
+
+        backups = rotated_log_files(self.path)[:-1]
+        self.assertGreater(len(backups), 1)
+        self.assertTrue(all(name.endswith('.gz') for name in backups))
+        self.assertEqual([e['index'] for e in iter_events(self.path)], list(range(30)))
+        self.assertEqual(self._leftovers(), [])
+
+    def test_array_backups_compressed(self):
+        """Test that rotated JSON array backups are closed arrays and compressed."""
+        handler = StructuredArrayHandler(self.path, maxBytes=1024, backupCount=20, compression='gzip')
+        handler.setFormatter(StructuredJSONFormatter())
+        for i in range(20):
+            handler.emit(structured_record(i))
+        handler.close()
+        self.assertTrue(get_log_compressor().flush(timeout=10))
+
+        with gzip.open(f"{self.path}.1.gz", 'rt') as f:
+            self.assertTrue(f.read().rstrip().endswith(']'))
+        self.assertEqual([e['index'] for e in iter_events(self.path)], list(range(20)))
+
+    def test_rotation_does_not_wait_for_compression(self):
+        """Test that rotation only renames and leaves compression to the compressor."""
+        compressor = ManualCompressor()
+        handler = self._jsonl_handler(compressor=compressor)
+        for i in range(10):
+            handler.emit(structured_record(i))
+
+        self.assertGreater(len(compressor.jobs), 0)
+        self.assertTrue(os.path.exists(f"{self.path}.1"))
+        self.assertFalse(os.path.exists(f"{self.path}.1.gz"))
+
+        compressor.run_all()
+        handler.close()
+        self.assertFalse(os.path.exists(f"{self.path}.1"))
+        self.assertEqual([e['index'] for e in iter_events(self.path)], list(range(10)))
+
+    def test_backups_shifted_before_compression(self):
+        """Test that backups rotated again before compression are compressed at their new index."""
+        compressor = ManualCompressor()
+        handler = self._jsonl_handler(compressor=compressor)
+        for i in range(15):
+            handler.emit(structured_record(i))
+        pending = len(compressor.jobs)
+
+        compressor.run_all()
+        handler.close()
+
+        backups = rotated_log_files(self.path)[:-1]
+        self.assertEqual(len(backups), pending)
+        self.assertTrue(all(name.endswith('.gz') for name in backups))
+        self.assertEqual([e['index'] for e in iter_events(self.path)], list(range(15)))
+        self.assertEqual(self._leftovers(), [])
+
+    def test_deleted_backup_skipped(self):
+        """Test that a backup removed by rotation before its job runs is not recreated."""
+        compressor = ManualCompressor()
+        handler = self._jsonl_handler(backup_count=1, compressor=compressor)
+        for i in range(15):
+            handler.emit(structured_record(i))
+
+        compressor.run_all()
+        handler.close()
+
+        self.assertEqual(rotated_log_files(self.path), [f"{self.path}.1.gz", self.path])
+        self.assertEqual(self._leftovers(), [])
+
+    def test_text_log_compressed(self):
+        """Test that setup_logger compresses the regular log and shutdown_logging finishes the work."""
+        log_file = os.path.join(self.tmpdir, 'daemon.log')
+        name = f"test_compress_{self.id()}"
+        logger = setup_logger(name, 'INFO', log_file, 512, 3, compression='gzip')
+        logger.propagate = False
+        self.assertTrue(any(isinstance(h, CompressingRotatingFileHandler) for h in logger.handlers))
+        try:
+            for i in range(40):
+                logger.info(f"message {i:03d} " + 'y' * 40)
+            shutdown_logging(name)
+        finally:
+            for handler in list(logger.handlers):
+                handler.close()
+                logger.removeHandler(handler)
+
+        self.assertTrue(os.path.exists(f"{log_file}.1.gz"))
+        self.assertFalse(os.path.exists(f"{log_file}.1"))
+        with gzip.open(f"{log_file}.1.gz", 'rt') as f:
+            self.assertIn("message", f.read())
+
+
+class TestCompressionSupport(CompressionTestCase):
+    """Test suite for codec selection and reading."""
+
+    def test_reader_prefers_uncompressed_backup(self):
+        """Test that a backup present in both forms is read once, from the uncompressed file."""
+        with open(f"{self.path}.1", 'w') as f:
+            f.write('{"index": 1}\n')
+        with gzip.open(f"{self.path}.1.gz", 'wt') as f:
+            f.write('{"index": 1}\n')
+        with gzip.open(f"{self.path}.2.gz", 'wt') as f:
+            f.write('{"index": 0}\n')
+
+        self.assertEqual(rotated_log_files(self.path), [f"{self.path}.2.gz", f"{self.path}.1"])
+        self.assertEqual([e['index'] for e in iter_events(self.path)], [0, 1])
+
+    def test_zstd_falls_back_to_gzip(self):
+        """Test that zstd is replaced by gzip when zstandard is missing and unknown codecs are rejected."""
+        with patch.object(log_compression, 'zstandard', None):
+            self.assertEqual(log_compression.resolve_codec('zstd'), 'gzip')
+        with self.assertRaises(ValueError):
+            log_compression.resolve_codec('bzip2')
+
+    def test_failed_job_counted(self):
+        """Test that a failing job is counted and does not stop the compressor thread."""
+        compressor = BackgroundCompressor()
+        with self.assertLogs(log_compression.logger, level='WARNING'):
+            compressor.submit(lambda: 1 / 0)
+            compressor.submit(lambda: None)
+            self.assertTrue(compressor.flush(timeout=5))
+        stats = compressor.stats()
+        self.assertEqual((stats['failed'], stats['completed'], stats['pending']), (1, 1, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+Unit Tests for the Structured Event Log Index
+
+This test module validates the sidecar index that answers correlation ID,
+event type and time range queries without scanning the structured logs.
+
+Test Coverage:
+    - Correlation ID, event type and time range queries in write order
+    - JSON Lines and indented JSON array segments, plain and gzip-compressed
+    - Non-ASCII event content (byte offsets)
+    - Incremental updates: appended events, rotation and compression without re-indexing
+    - Incomplete trailing events left for the next update
+    - Index persisted, stale segments dropped, rebuild
+    - `gcp-route-mgmt logs` command line
+
+Author: Nathan Bray
+Created: 2025-11-01
+"""
+
+import unittest
+from unittest.mock import patch
+import gzip
+import io
+import json
+import os
+import shutil
+import tempfile
+
+try:
+    from .log_index import LogIndex, main as logs_main
+    from .logging_setup import JsonLinesHandler, StructuredArrayHandler, StructuredFormatter, StructuredJSONFormatter
+    from .testing_support import structured_record
+    from . import __main__ as entry_point
+except ImportError:
+    from log_index import LogIndex, main as logs_main
+    from logging_setup import JsonLinesHandler, StructuredArrayHandler, StructuredFormatter, StructuredJSONFormatter
+    from testing_support import structured_record
+    import __main__ as entry_point
+
+
+def _event(index, event_type='bgp_operation_result'):
+    """Structured record 100 s after the previous one, three per correlation ID."""
+    return structured_record(index, event_type=event_type, timestamp=1000.0 + index * 100,
+                             correlation_id=f"hc-{index // 3}")
+
+
+class LogIndexTestCase(unittest.TestCase):
+    """Shared temporary directory and log writers."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'structured.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _write(self, records, handler_class=JsonLinesHandler, max_bytes=0):
+        if handler_class is JsonLinesHandler:
+            handler = JsonLinesHandler(self.path, maxBytes=max_bytes, backupCount=20)
+            handler.setFormatter(StructuredFormatter())
+        else:
+            handler = StructuredArrayHandler(self.path, maxBytes=max_bytes, backupCount=20)
+            handler.setFormatter(StructuredJSONFormatter())
+        for record in records:
+            handler.emit(record)
+        handler.close()
+
+    def _gzip_backup(self, name):
+        with open(name, 'rb') as src, gzip.open(f"{name}.gz", 'wb') as dst:
+            dst.write(src.read())
+        os.remove(name)
+
+
+class TestLogIndexQueries(LogIndexTestCase):
+    """Test suite for index queries."""
+
+    def test_queries_across_formats_and_compression(self):
+        """Test correlation ID and event type queries over rotated, compressed segments in both formats."""
+        for handler_class in (JsonLinesHandler, StructuredArrayHandler):
+            with self.subTest(format=handler_class.__name__):
+                self.tearDown()
+                self.setUp()
+                records = [_event(i, event_type='health_check_cycle' if i % 3 == 0 else 'bgp_operation_result')
+                           for i in range(30)]
+                self._write(records, handler_class, max_bytes=2048)
+                self._gzip_backup(f"{self.path}.2")
+
+                index = LogIndex(self.path)
+                events = list(index.query(correlation_id='hc-4'))
+
+                self.assertEqual([e['index'] for e in events], [12, 13, 14])
+                self.assertEqual(events[0]['details']['router'], 'routeur-é')
+                cycles = list(index.query(event_type='health_check_cycle', update=False))
+                self.assertEqual([e['index'] for e in cycles], list(range(0, 30, 3)))
+                self.assertGreater(len(index.stats()['segments']), 2)
+
+    def test_time_range_and_combined_filters(self):
+        """Test since/until across time buckets, alone and combined with the event type."""
+        self._write([_event(i, event_type='health_check_cycle' if i % 2 else 'state_transition')
+                     for i in range(20)])
+        index = LogIndex(self.path, bucket_seconds=250)
+
+        in_range = [e['index'] for e in index.query(since=1350.0, until=1900.0)]
+        cycles = [e['index'] for e in index.query(event_type='health_check_cycle', since=1350.0)]
+
+        self.assertEqual(in_range, [4, 5, 6, 7, 8])
+        self.assertEqual(cycles, [5, 7, 9, 11, 13, 15, 17, 19])
+        self.assertEqual(list(index.query(correlation_id='hc-missing')), [])
+
+
+class TestLogIndexUpdates(LogIndexTestCase):
+    """Test suite for incremental index maintenance."""
+
+    def test_incremental_update(self):
+        """Test that only appended events are indexed and rotation plus compression keeps the index."""
+        self._write([_event(i) for i in range(5)])
+        index = LogIndex(self.path)
+        self.assertEqual(index.update()['events_added'], 5)
+
+        self._write([_event(i) for i in range(5, 8)])
+        self.assertEqual(index.update()['events_added'], 3)
+
+        os.replace(self.path, f"{self.path}.1")
+        self._gzip_backup(f"{self.path}.1")
+        self._write([_event(8)])
+        result = LogIndex(self.path).update()
+
+        self.assertEqual(result['events_added'], 1)
+        self.assertEqual([e['index'] for e in LogIndex(self.path).query(correlation_id='hc-2')], [6, 7, 8])
+
+    def test_incomplete_trailing_event(self):
+        """Test that a partially written last event is indexed only once it is complete."""
+        self._write([_event(0)])
+        line = json.dumps(_event(1).json_fields)
+        with open(self.path, 'a') as f:
+            f.write(line[:40])
+        index = LogIndex(self.path)
+        self.assertEqual(index.update()['events_added'], 1)
+
+        with open(self.path, 'a') as f:
+            f.write(line[40:] + "\n")
+
+        self.assertEqual(index.update()['events_added'], 1)
+        self.assertEqual([e['index'] for e in index.query(correlation_id='hc-0')], [0, 1])
+
+    def test_stale_segments_dropped_and_rebuild(self):
+        """Test that segments that rotated out are dropped and rebuild re-indexes everything."""
+        self._write([_event(i) for i in range(4)])
+        LogIndex(self.path).update()
+        os.remove(self.path)
+        self._write([_event(10)])
+
+        index = LogIndex(self.path)
+        result = index.update()
+
+        self.assertEqual((result['events_added'], result['segments_dropped']), (1, 1))
+        self.assertEqual(index.rebuild()['events_added'], 1)
+        self.assertEqual(index.stats()['events'], 1)
+
+
+class TestLogsCommand(LogIndexTestCase):
+    """Test suite for the `gcp-route-mgmt logs` command line."""
+
+    def test_logs_subcommand(self):
+        """Test that the entry point dispatches `logs` and prints matching events as JSON Lines."""
+        self._write([_event(i) for i in range(9)])
+        out = io.StringIO()
+        with patch('sys.argv', ['gcp-route-mgmt', 'logs', self.path, '--correlation-id', 'hc-1', '--tail', '2']), \
+                patch('sys.stdout', out):
+            with self.assertRaises(SystemExit) as ctx:
+                entry_point.main()
+
+        self.assertEqual(ctx.exception.code, 0)
+        self.assertEqual([json.loads(line)['index'] for line in out.getvalue().splitlines()], [4, 5])
+
+        out = io.StringIO()
+        with patch('sys.stdout', out):
+            self.assertEqual(logs_main([self.path, '--stats']), 0)
+        self.assertEqual(json.loads(out.getvalue())['correlation_ids'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
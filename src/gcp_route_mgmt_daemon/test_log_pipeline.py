@@ -0,0 +1,205 @@
+"""
+Unit Tests for the Asynchronous Logging Pipeline
+
+This test module validates the queue-based pipeline that moves log handler
+I/O onto a dedicated writer thread.
+
+Test Coverage:
+    - Logging calls returning without waiting on a slow handler
+    - drop-debug overflow policy: DEBUG dropped, INFO kept
+    - block overflow policy: no record lost
+    - flush() and shutdown_logging() draining queued records
+    - setup_logger installing a single queue handler and replacing a previous pipeline
+    - Handlers added after setup running behind the pipeline
+
+Author: Nathan Bray
+Created: 2025-11-01
+"""
+
+import unittest
+import logging
+import threading
+import time
+
+try:
+    from .logging_setup import (
+        AsyncLogPipeline,
+        BoundedQueueHandler,
+        add_log_handler,
+        get_log_pipeline,
+        setup_logger,
+        shutdown_logging,
+        LOG_OVERFLOW_BLOCK,
+        LOG_OVERFLOW_DROP_DEBUG
+    )
+except ImportError:
+    from logging_setup import (
+        AsyncLogPipeline,
+        BoundedQueueHandler,
+        add_log_handler,
+        get_log_pipeline,
+        setup_logger,
+        shutdown_logging,
+        LOG_OVERFLOW_BLOCK,
+        LOG_OVERFLOW_DROP_DEBUG
+    )
+
+
+class SlowHandler(logging.Handler):
+    """Handler that records messages after an optional delay or gate."""
+
+    def __init__(self, delay=0.0, gate=None):
+        super().__init__(logging.DEBUG)
+        self.delay = delay
+        self.gate = gate
+        self.messages = []
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.delay:
+            time.sleep(self.delay)
+        self.messages.append(record.getMessage())
+
+
+class PipelineTestCase(unittest.TestCase):
+    """Shared logger and pipeline cleanup."""
+
+    def setUp(self):
+        self.pipelines = []
+        self.logger = logging.getLogger(f"test_pipeline_{self.id()}")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+
+    def tearDown(self):
+        for pipeline in self.pipelines:
+            pipeline.stop()
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+
+    def _pipeline(self, handler, queue_size=100, overflow=LOG_OVERFLOW_DROP_DEBUG):
+        pipeline = AsyncLogPipeline([handler], queue_size=queue_size, overflow=overflow)
+        pipeline.start()
+        self.logger.addHandler(pipeline.handler)
+        self.pipelines.append(pipeline)
+        return pipeline
+
+
+class TestAsyncLogPipeline(PipelineTestCase):
+    """Test suite for AsyncLogPipeline behaviour."""
+
+    def test_invalid_parameters(self):
+        """Test that an unknown overflow policy or empty queue is rejected."""
+        with self.assertRaises(ValueError):
+            AsyncLogPipeline([], overflow='discard')
+        with self.assertRaises(ValueError):
+            AsyncLogPipeline([], queue_size=0)
+
+    def test_logging_does_not_wait_for_slow_handler(self):
+        """Test that log calls return while a slow handler is still writing."""
+        handler = SlowHandler(delay=0.02)
+        pipeline = self._pipeline(handler)
+
+        start = time.monotonic()
+        for i in range(20):
+            self.logger.info(f"message {i}")
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.1)  # 20 x 20ms if written inline
+        self.assertTrue(pipeline.flush(timeout=5))
+        self.assertEqual(handler.messages, [f"message {i}" for i in range(20)])
+
+    def test_drop_debug_policy(self):
+        """Test that a full queue drops DEBUG records but keeps INFO records."""
+        gate = threading.Event()
+        handler = SlowHandler(gate=gate)
+        pipeline = self._pipeline(handler, queue_size=2, overflow=LOG_OVERFLOW_DROP_DEBUG)
+
+        self.logger.info("first")          # Taken by the writer, held at the gate
+        time.sleep(0.05)
+        self.logger.info("second")
+        self.logger.info("third")          # Queue now full
+        self.logger.debug("dropped")
+        threading.Timer(0.05, gate.set).start()
+        self.logger.info("fourth")         # Waits for space instead of being dropped
+
+        self.assertTrue(pipeline.flush(timeout=5))
+        self.assertEqual(handler.messages, ["first", "second", "third", "fourth"])
+        stats = pipeline.stats()
+        self.assertEqual(stats['dropped'], 1)
+        self.assertEqual(stats['blocked'], 1)
+        self.assertGreater(stats['blocked_time_ms'], 0)
+
+    def test_block_policy_loses_nothing(self):
+        """Test that the block policy waits for space for every record, including DEBUG."""
+        handler = SlowHandler(delay=0.001)
+        pipeline = self._pipeline(handler, queue_size=2, overflow=LOG_OVERFLOW_BLOCK)
+
+        for i in range(30):
+            self.logger.debug(f"debug {i}")
+
+        self.assertTrue(pipeline.flush(timeout=5))
+        self.assertEqual(len(handler.messages), 30)
+        self.assertEqual(pipeline.stats()['dropped'], 0)
+        self.assertLessEqual(pipeline.stats()['max_depth'], 2)
+
+    def test_stop_drains_queue(self):
+        """Test that stop() writes every queued record before returning."""
+        handler = SlowHandler(delay=0.005)
+        pipeline = self._pipeline(handler)
+
+        for i in range(10):
+            self.logger.warning(f"message {i}")
+        pipeline.stop()
+
+        self.assertEqual(len(handler.messages), 10)
+
+
+class TestSetupLoggerAsync(PipelineTestCase):
+    """Test suite for setup_logger with async_logging enabled."""
+
+    def setUp(self):
+        super().setUp()
+        self.name = self.logger.name
+
+    def tearDown(self):
+        shutdown_logging(self.name)
+        super().tearDown()
+
+    def test_single_queue_handler_installed(self):
+        """Test that the logger gets one queue handler and the console handler runs behind it."""
+        logger = setup_logger(self.name, 'INFO', None, 0, 1, async_logging=True, queue_size=500)
+
+        self.assertEqual(len(logger.handlers), 1)
+        self.assertIsInstance(logger.handlers[0], BoundedQueueHandler)
+        pipeline = get_log_pipeline(self.name)
+        self.assertEqual(pipeline.stats()['queue_size'], 500)
+        self.assertTrue(any(isinstance(h, logging.StreamHandler) for h in pipeline.handlers))
+
+    def test_repeated_setup_replaces_pipeline(self):
+        """Test that calling setup_logger again stops the previous pipeline."""
+        setup_logger(self.name, 'INFO', None, 0, 1, async_logging=True)
+        first = get_log_pipeline(self.name)
+        logger = setup_logger(self.name, 'INFO', None, 0, 1, async_logging=True)
+
+        self.assertIsNot(get_log_pipeline(self.name), first)
+        self.assertFalse(first.listener._thread)
+        self.assertEqual(len(logger.handlers), 1)
+
+    def test_added_handler_runs_behind_pipeline(self):
+        """Test that add_log_handler attaches to the pipeline and shutdown_logging drains it."""
+        logger = setup_logger(self.name, 'INFO', None, 0, 1, async_logging=True)
+        handler = SlowHandler(delay=0.01)
+        add_log_handler(logger, handler)
+
+        logger.info("to cloud")
+        self.assertNotIn(handler, logger.handlers)
+        shutdown_logging(self.name)
+
+        self.assertIn("to cloud", handler.messages)
+        self.assertIsNone(get_log_pipeline(self.name))
+        self.assertEqual(logger.handlers[1:], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
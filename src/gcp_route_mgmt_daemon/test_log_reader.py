@@ -0,0 +1,198 @@
+"""
+Unit Tests for the Structured Event Log Reader
+
+This test module validates the streaming reader for structured event logs and
+the JSON Lines handler that writes them.
+
+Test Coverage:
+    - JSON Lines handler: one event per line, rotation, partial line after a crash
+    - Reading JSON Lines, JSON array and gzip-compressed files
+    - Rotated backups read oldest first
+    - Unterminated arrays and damaged lines tolerated
+    - Event type, time range and predicate filters
+    - Tail of the last N events
+    - setup_logger selecting the handler from the structured log format
+
+Author: Nathan Bray
+Created: 2025-11-01
+"""
+
+import unittest
+import gzip
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+try:
+    from .log_reader import iter_events, iter_file_events, rotated_log_files, tail_events
+    from .logging_setup import (
+        JsonLinesHandler,
+        StructuredArrayHandler,
+        StructuredFormatter,
+        StructuredJSONFormatter,
+        setup_logger
+    )
+    from .testing_support import structured_record
+except ImportError:
+    from log_reader import iter_events, iter_file_events, rotated_log_files, tail_events
+    from logging_setup import (
+        JsonLinesHandler,
+        StructuredArrayHandler,
+        StructuredFormatter,
+        StructuredJSONFormatter,
+        setup_logger
+    )
+    from testing_support import structured_record
+
+
+class LogReaderTestCase(unittest.TestCase):
+    """Shared temporary directory."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'structured.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _jsonl_handler(self, max_bytes=0, backup_count=0):
+        handler = JsonLinesHandler(self.path, maxBytes=max_bytes, backupCount=backup_count)
+        handler.setFormatter(StructuredFormatter())
+        return handler
+
+
+class TestJsonLinesHandler(LogReaderTestCase):
+    """Test suite for the JSON Lines structured log handler."""
+
+    def test_one_event_per_line(self):
+        """Test that each event is a single compact JSON line, including embedded newlines."""
+        handler = self._jsonl_handler()
+        for i in range(3):
+            handler.emit(structured_record(i))
+        handler.close()
+
+        with open(self.path) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(json.loads(lines[2])['details']['note'], 'line one\nline two')
+
+    def test_partial_line_terminated_on_reopen(self):
+        """Test that a line cut short by a crash does not swallow the next event."""
+        handler = self._jsonl_handler()
+        handler.emit(structured_record(0))
+        handler.close()
+        with open(self.path, 'a') as f:
+            f.write('{"event_type": "health_check_cy')
+
+        handler = self._jsonl_handler()
+        handler.emit(structured_record(1))
+        handler.close()
+
+        self.assertEqual([e['index'] for e in iter_file_events(self.path)], [0, 1])
+
+    def test_rotation_keeps_every_event(self):
+        """Test that rotated JSON Lines files are read back oldest first without loss."""
+        handler = self._jsonl_handler(max_bytes=1024, backup_count=20)
+        for i in range(30):
+            handler.emit(structured_record(i))
+        handler.close()
+
+        self.assertGreater(len(rotated_log_files(self.path)), 1)
+        self.assertEqual([e['index'] for e in iter_events(self.path)], list(range(30)))
+
+
+class TestLogReaderFormats(LogReaderTestCase):
+    """Test suite for reading each supported file format."""
+
+    def test_reads_json_array(self):
+        """Test that a closed JSON array file is read incrementally."""
+        handler = StructuredArrayHandler(self.path)
+        handler.setFormatter(StructuredJSONFormatter())
+        for i in range(3):
+            handler.emit(structured_record(i))
+        handler.close()
+
+        self.assertEqual([e['index'] for e in iter_file_events(self.path)], [0, 1, 2])
+
+    def test_reads_unterminated_array(self):
+        """Test that an array still being written (no closing bracket) is read to its last event."""
+        with open(self.path, 'w') as f:
+            f.write('[\n{"index": 0},\n{"index": 1},\n{"index": 2, "trunc')
+
+        self.assertEqual([e['index'] for e in iter_file_events(self.path)], [0, 1])
+
+    def test_reads_gzip_backups_in_order(self):
+        """Test that gzip-compressed rotated backups are read oldest first, then the live file."""
+        with gzip.open(f"{self.path}.2.gz", 'wt') as f:
+            f.write('{"index": 0}\n{"index": 1}\n')
+        with gzip.open(f"{self.path}.1.gz", 'wt') as f:
+            f.write('[\n{"index": 2}\n]')
+        with open(self.path, 'w') as f:
+            f.write('{"index": 3}\n')
+
+        self.assertEqual([e['index'] for e in iter_events(self.path)], [0, 1, 2, 3])
+        self.assertEqual([e['index'] for e in iter_events(self.path, include_rotated=False)], [3])
+
+    def test_damaged_lines_skipped(self):
+        """Test that lines that are not valid JSON are skipped."""
+        with open(self.path, 'w') as f:
+            f.write('{"index": 0}\nnot json\n\n{"index": 1}\n')
+
+        self.assertEqual([e['index'] for e in iter_file_events(self.path)], [0, 1])
+
+    def test_missing_and_empty_files(self):
+        """Test that a missing log yields nothing and an empty file yields no events."""
+        self.assertEqual(list(iter_events(self.path)), [])
+        open(self.path, 'w').close()
+        self.assertEqual(list(iter_events(self.path)), [])
+
+
+class TestLogReaderFilters(LogReaderTestCase):
+    """Test suite for filtering and tailing."""
+
+    def setUp(self):
+        super().setUp()
+        handler = self._jsonl_handler()
+        for i in range(10):
+            handler.emit(structured_record(i, event_type='state_transition' if i % 3 == 0 else 'health_check_cycle'))
+        handler.close()
+
+    def test_event_type_and_time_filters(self):
+        """Test that event type, since/until and predicate filters combine."""
+        events = iter_events(self.path, event_type='state_transition', since=1001.0, until=1009.0)
+        self.assertEqual([e['index'] for e in events], [3, 6])
+
+        events = iter_events(self.path, predicate=lambda e: e['index'] > 7)
+        self.assertEqual([e['index'] for e in events], [8, 9])
+
+    def test_tail_events(self):
+        """Test that tail_events returns the last N matching events in order."""
+        self.assertEqual([e['index'] for e in tail_events(self.path, 3)], [7, 8, 9])
+        self.assertEqual([e['index'] for e in tail_events(self.path, 2, event_type='state_transition')],
+                         [6, 9])
+
+
+class TestSetupLoggerStructuredFormat(LogReaderTestCase):
+    """Test suite for selecting the structured log handler."""
+
+    def test_handler_selected_by_format(self):
+        """Test that setup_logger installs the handler matching the structured log format."""
+        for fmt, handler_class in (('jsonl', JsonLinesHandler), ('array', StructuredArrayHandler)):
+            with self.subTest(format=fmt):
+                logger = setup_logger(f'test_reader_{fmt}', 'INFO', None, 0, 1,
+                                      enable_structured_file=True,
+                                      structured_log_file=os.path.join(self.tmpdir, f'{fmt}.log'),
+                                      structured_log_format=fmt)
+                try:
+                    file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+                    self.assertEqual([type(h) for h in file_handlers], [handler_class])
+                finally:
+                    for handler in list(logger.handlers):
+                        handler.close()
+                        logger.removeHandler(handler)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+"""
+Unit Tests for Structured Log File Handling
+
+This test module validates the StructuredArrayHandler that writes structured
+events to a JSON array file.
+
+Test Coverage:
+    - New, reopened, empty and non-array files
+    - Array terminated exactly once on close
+    - Rotation closing every file as a valid JSON array without losing records
+    - Non-JSON messages ignored
+    - One write per record on the open stream, however large the file
+    - Benchmark of the per-record cost up to LOG_MAX_BYTES (RUN_BENCHMARKS=true)
+
+Author: Nathan Bray
+Created: 2025-11-01
+"""
+
+import unittest
+import glob
+import json
+import logging
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from unittest.mock import patch
+
+try:
+    from .logging_setup import StructuredArrayHandler, StructuredJSONFormatter
+    from .testing_support import structured_record, benchmark
+except ImportError:
+    from logging_setup import StructuredArrayHandler, StructuredJSONFormatter
+    from testing_support import structured_record, benchmark
+
+
+class StructuredArrayHandlerTestCase(unittest.TestCase):
+    """Shared temporary directory and handler factory."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'structured.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _handler(self, max_bytes=0, backup_count=0):
+        handler = StructuredArrayHandler(self.path, maxBytes=max_bytes, backupCount=backup_count)
+        handler.setFormatter(StructuredJSONFormatter())
+        return handler
+
+    def _load(self, path=None):
+        with open(path or self.path) as f:
+            return json.load(f)
+
+
+class TestStructuredArrayHandlerFiles(StructuredArrayHandlerTestCase):
+    """Test suite for array structure across open, close and reopen."""
+
+    def test_new_file_is_valid_array(self):
+        """Test that records written to a new file form a JSON array after close."""
+        handler = self._handler()
+        for i in range(3):
+            handler.emit(structured_record(i))
+        handler.close()
+
+        self.assertEqual([r['index'] for r in self._load()], [0, 1, 2])
+
+    def test_no_records_is_empty_array(self):
+        """Test that a handler closed without records leaves an empty array."""
+        self._handler().close()
+
+        self.assertEqual(self._load(), [])
+
+    def test_reopen_closed_array_appends(self):
+        """Test that reopening a closed array removes the bracket and keeps appending."""
+        handler = self._handler()
+        handler.emit(structured_record(0))
+        handler.close()
+
+        handler = self._handler()
+        handler.emit(structured_record(1))
+        handler.close()
+
+        self.assertEqual([r['index'] for r in self._load()], [0, 1])
+
+    def test_close_twice_terminates_once(self):
+        """Test that a repeated close does not write a second bracket."""
+        handler = self._handler()
+        handler.emit(structured_record(0))
+        handler.close()
+        handler.close()
+
+        self.assertEqual(len(self._load()), 1)
+
+    def test_non_array_file_backed_up(self):
+        """Test that an existing non-array file is moved aside."""
+        with open(self.path, 'w') as f:
+            f.write('2025-11-01 plain text log line\n')
+
+        handler = self._handler()
+        handler.emit(structured_record(0))
+        handler.close()
+
+        self.assertEqual(len(self._load()), 1)
+        with open(f"{self.path}.backup") as f:
+            self.assertIn('plain text', f.read())
+
+    def test_non_json_message_ignored(self):
+        """Test that records not formatted as JSON objects are not written."""
+        handler = self._handler()
+        handler.emit(logging.LogRecord('test', logging.INFO, __file__, 1, 'plain message', None, None))
+        handler.emit(structured_record(0))
+        handler.close()
+
+        self.assertEqual(len(self._load()), 1)
+
+    def test_emit_is_one_write(self):
+        """Test that a record on a large file is one write without reopening or reading the file."""
+        handler = self._handler()
+        for i in range(200):
+            handler.emit(structured_record(i))
+
+        with patch.object(handler, '_prepare_file') as prepare, \
+                patch.object(handler.stream, 'write', wraps=handler.stream.write) as write, \
+                patch.object(handler.stream, 'read') as read:
+            for i in range(200, 210):
+                handler.emit(structured_record(i))
+        handler.close()
+
+        self.assertEqual(write.call_count, 10)
+        prepare.assert_not_called()
+        read.assert_not_called()
+        self.assertEqual(len(self._load()), 210)
+
+
+class TestStructuredArrayHandlerRotation(StructuredArrayHandlerTestCase):
+    """Test suite for rotation."""
+
+    def test_rotated_files_are_valid_arrays(self):
+        """Test that every rotated file is a closed array within maxBytes and no record is lost."""
+        max_bytes = 2048
+        handler = self._handler(max_bytes=max_bytes, backup_count=10)
+        for i in range(40):
+            handler.emit(structured_record(i))
+        handler.close()
+
+        files = sorted(glob.glob(f"{self.path}*"))
+        self.assertGreater(len(files), 1)
+
+        indexes = []
+        for path in files:
+            self.assertLessEqual(os.path.getsize(path), max_bytes, path)
+            indexes.extend(r['index'] for r in self._load(path))
+        self.assertEqual(sorted(indexes), list(range(40)))
+
+
+@benchmark
+class TestStructuredArrayHandlerBenchmark(StructuredArrayHandlerTestCase):
+    """Benchmark (RUN_BENCHMARKS=true): per-record emit cost as the file grows to LOG_MAX_BYTES."""
+
+    MAX_BYTES = 10 * 1024 * 1024      # LOG_MAX_BYTES default
+    SAMPLE = 500                      # Records timed at each checkpoint
+
+    def _time_sample(self, handler, start_index):
+        timings = []
+        for i in range(start_index, start_index + self.SAMPLE):
+            record = structured_record(i, padding=400)
+            begin = time.perf_counter()
+            handler.emit(record)
+            timings.append(time.perf_counter() - begin)
+        return statistics.median(timings)
+
+    def test_constant_cost_up_to_max_bytes(self):
+        """Per-record cost at a full file stays within a small factor of an empty file."""
+        handler = self._handler(max_bytes=self.MAX_BYTES, backup_count=1)
+        rows = []
+        index = 0
+
+        for target_fraction in (0.0, 0.25, 0.5, 0.75, 0.95):
+            # Fill the file untimed up to the checkpoint
+            while handler.stream.tell() < self.MAX_BYTES * target_fraction:
+                handler.emit(structured_record(index, padding=400))
+                index += 1
+            size = handler.stream.tell()
+            rows.append((size, self._time_sample(handler, index)))
+            index += self.SAMPLE
+
+        handler.close()
+        self.assertFalse(os.path.exists(f"{self.path}.1"), "benchmark must not rotate")
+
+        print(f"\nStructuredArrayHandler emit benchmark (median of {self.SAMPLE} records per checkpoint)")
+        for size, median in rows:
+            print(f"  file_size={size / 1024 / 1024:6.2f}MB  per_record={median * 1e6:7.1f}us")
+
+        empty_cost = rows[0][1]
+        full_cost = rows[-1][1]
+        self.assertLess(full_cost, empty_cost * 3 + 20e-6)
+        self.assertEqual(len(self._load()), index)
+
+
+if __name__ == '__main__':
+    unittest.main()
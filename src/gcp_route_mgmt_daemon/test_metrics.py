@@ -0,0 +1,198 @@
+"""
+Unit Tests for Prometheus Metrics
+
+This test module validates the in-process metrics and the embedded /metrics
+HTTP endpoint.
+
+Test Coverage:
+    - Histogram, counter and gauge exposition format, label escaping
+    - Gauges read from a callback at scrape time
+    - API call timing with success and error outcomes
+    - Compute and Cloudflare calls and backoff retries recorded
+    - HTTP endpoint serving /metrics, 404 elsewhere
+    - Endpoint started from configuration, unavailable port tolerated
+    - Label children created once and reused by every recording
+
+Author: Nathan Bray
+Created: 2025-11-01
+"""
+
+import unittest
+from unittest.mock import Mock
+import socket
+import urllib.error
+import urllib.request
+
+try:
+    from . import metrics
+    from .metrics import Counter, Gauge, Histogram, MetricsRegistry, MetricsServer, time_api_call
+    from .circuit import exponential_backoff_retry
+    from .cloudflare import CloudflareClient
+    from . import gcp
+    from . import daemon
+except ImportError:
+    import metrics
+    from metrics import Counter, Gauge, Histogram, MetricsRegistry, MetricsServer, time_api_call
+    from circuit import exponential_backoff_retry
+    from cloudflare import CloudflareClient
+    import gcp
+    import daemon
+
+
+def _count(api, outcome):
+    """Number of calls recorded for an API and outcome."""
+    return sum(metrics.API_LATENCY.labels(api, outcome).counts)
+
+
+class TestExposition(unittest.TestCase):
+    """Test suite for the text exposition format."""
+
+    def test_histogram(self):
+        """Test cumulative buckets, +Inf, sum and count."""
+        registry = MetricsRegistry()
+        histogram = registry.register(Histogram("test_seconds", "Test histogram.", ("api",), (0.1, 1.0)))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.labels("list").observe(value)
+
+        lines = registry.render().splitlines()
+
+        self.assertEqual(lines, [
+            "# HELP test_seconds Test histogram.",
+            "# TYPE test_seconds histogram",
+            'test_seconds_bucket{api="list",le="0.1"} 2',
+            'test_seconds_bucket{api="list",le="1"} 3',
+            'test_seconds_bucket{api="list",le="+Inf"} 4',
+            'test_seconds_sum{api="list"} 3.65',
+            'test_seconds_count{api="list"} 4',
+        ])
+
+    def test_counter_and_gauge(self):
+        """Test counters, unlabelled gauges and escaped label values."""
+        registry = MetricsRegistry()
+        counter = registry.register(Counter("test_total", "Test counter.", ("operation",)))
+        gauge = registry.register(Gauge("test_state", "Test gauge."))
+        counter.labels('say "hi"\\now').inc()
+        counter.labels('say "hi"\\now').inc(2)
+        gauge.set(3)
+
+        text = registry.render()
+
+        self.assertIn('test_total{operation="say \\"hi\\"\\\\now"} 3\n', text)
+        self.assertIn("# TYPE test_state gauge\ntest_state 3\n", text)
+        with self.assertRaises(ValueError):
+            counter.labels("a", "b")
+        with self.assertRaises(ValueError):
+            registry.register(Counter("test_total", "Duplicate."))
+
+    def test_gauge_callback(self):
+        """Test that callback gauges are read when rendered and a failing callback is skipped."""
+        registry = MetricsRegistry()
+        gauge = registry.register(Gauge("test_breaker", "Test breaker.", ("service",)))
+        states = {"gcp": "OPEN"}
+        gauge.set_callback(lambda: {(name,): metrics.CIRCUIT_BREAKER_STATE_VALUES[state]
+                                    for name, state in states.items()})
+
+        self.assertIn('test_breaker{service="gcp"} 2', registry.render())
+        states["gcp"] = "CLOSED"
+        self.assertIn('test_breaker{service="gcp"} 0', registry.render())
+
+        gauge.set_callback(lambda: 1 / 0)
+        self.assertNotIn("test_breaker{", registry.render())
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test suite for the metrics recorded by API calls and retries."""
+
+    def test_api_timer_outcomes(self):
+        """Test that exceptions and flagged responses are recorded as errors."""
+        with time_api_call("test.timer"):
+            pass
+        with time_api_call("test.timer") as timer:
+            timer.failed = True
+        with self.assertRaises(RuntimeError):
+            with time_api_call("test.timer"):
+                raise RuntimeError("boom")
+
+        self.assertEqual((_count("test.timer", "success"), _count("test.timer", "error")), (1, 2))
+
+    def test_compute_and_cloudflare_calls(self):
+        """Test that Compute list calls and Cloudflare requests are timed."""
+        compute = Mock()
+        compute.regionBackendServices().list().execute.return_value = {"items": [{"name": "svc"}]}
+        lists = _count("compute.regionBackendServices.list", "success")
+        list(gcp.iter_region_backend_service_pages("p", "us-central1", compute))
+
+        client = CloudflareClient("token")
+        client.session = Mock()
+        client.session.get.return_value = Mock(ok=True)
+        client.session.put.return_value = Mock(ok=False)
+        gets = _count("cloudflare.get", "success")
+        put_errors = _count("cloudflare.put", "error")
+        client.get("https://api.cloudflare.com/x")
+        client.put("https://api.cloudflare.com/x", json={})
+
+        self.assertEqual(_count("compute.regionBackendServices.list", "success"), lists + 1)
+        self.assertEqual(_count("cloudflare.get", "success"), gets + 1)
+        self.assertEqual(_count("cloudflare.put", "error"), put_errors + 1)
+
+    def test_label_children_cached(self):
+        """Test that a label child is created once and reused, so recording does no per-call setup."""
+        child = metrics.API_LATENCY.labels("test.cached", "success")
+        for _ in range(3):
+            with time_api_call("test.cached"):
+                pass
+
+        self.assertIs(metrics.API_LATENCY.labels("test.cached", "success"), child)
+        self.assertEqual(sum(child.counts), 3)
+
+    def test_retries_counted(self):
+        """Test that each retry of exponential_backoff_retry is counted under its name."""
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ConnectionError("transient")
+            return "ok"
+
+        before = metrics.RETRIES.labels("test_flaky").value
+        self.assertEqual(exponential_backoff_retry(flaky, initial_delay=0.01, name="test_flaky"), "ok")
+        self.assertEqual(metrics.RETRIES.labels("test_flaky").value - before, 2)
+
+
+class TestMetricsServer(unittest.TestCase):
+    """Test suite for the /metrics HTTP endpoint."""
+
+    def test_serves_metrics(self):
+        """Test that /metrics returns the registry and other paths return 404."""
+        registry = MetricsRegistry()
+        registry.register(Gauge("test_up", "Test gauge.")).set(1)
+        server = MetricsServer("127.0.0.1", 0, registry)
+        server.start()
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+                body = response.read().decode()
+                content_type = response.headers["Content-Type"]
+            with self.assertRaises(urllib.error.HTTPError) as ctx:
+                urllib.request.urlopen(f"http://127.0.0.1:{server.port}/", timeout=5)
+        finally:
+            server.stop()
+
+        self.assertIn("test_up 1\n", body)
+        self.assertEqual(content_type, metrics.CONTENT_TYPE)
+        self.assertEqual(ctx.exception.code, 404)
+
+    def test_start_from_config(self):
+        """Test that port 0 disables the endpoint and a port in use is logged, not raised."""
+        self.assertIsNone(daemon.start_metrics_server(Mock(metrics_port=0)))
+
+        with socket.socket() as busy:
+            busy.bind(("127.0.0.1", 0))
+            busy.listen()
+            cfg = Mock(metrics_port=busy.getsockname()[1], metrics_bind_address="127.0.0.1")
+            with self.assertLogs(level="ERROR"):
+                self.assertIsNone(daemon.start_metrics_server(cfg))
+
+
+if __name__ == '__main__':
+    unittest.main()
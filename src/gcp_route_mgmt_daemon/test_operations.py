@@ -0,0 +1,254 @@
+"""
+Unit Tests for Background Router Operation Tracking
+
+This test module validates the OperationTracker used to follow router patch
+operations to completion without blocking the control loop.
+
+Test Coverage:
+    - Parameter validation
+    - Operations already DONE at submission
+    - Background polling to completion, failure and timeout
+    - Permanent and transient poll errors
+    - track() returning without waiting for the operation
+    - Draining outcomes and tracker statistics
+    - Pooled compute clients borrowed per poll
+
+Author: Nathan Bray
+Created: 2025-11-01
+"""
+
+import unittest
+from unittest.mock import Mock
+import threading
+import time
+from googleapiclient.errors import HttpError
+
+try:
+    from .operations import (
+        OperationTracker,
+        OPERATION_COMPLETED,
+        OPERATION_FAILED,
+        OPERATION_TIMED_OUT
+    )
+    from .client_pool import ComputeClientPool
+except ImportError:
+    from operations import (
+        OperationTracker,
+        OPERATION_COMPLETED,
+        OPERATION_FAILED,
+        OPERATION_TIMED_OUT
+    )
+    from client_pool import ComputeClientPool
+
+
+class FakeOperationsCompute:
+    """
+    Compute stand-in whose regionOperations().get() walks a scripted sequence.
+
+    Each entry in `responses` is an operation dict or an exception to raise;
+    the last entry repeats once the sequence is exhausted.
+    """
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def regionOperations(self):
+        return self
+
+    def get(self, project, region, operation):
+        request = Mock()
+        request.execute.side_effect = lambda: self._next(project, region, operation)
+        return request
+
+    def _next(self, project, region, operation):
+        with self.lock:
+            self.calls.append((project, region, operation))
+            response = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _wait_for_results(tracker, count=1, timeout=5):
+    """Drain the tracker until `count` outcomes have been collected."""
+    results = []
+    deadline = time.monotonic() + timeout
+    while len(results) < count and time.monotonic() < deadline:
+        results.extend(tracker.drain())
+        time.sleep(0.005)
+    return results
+
+
+class TestOperationTrackerInitialization(unittest.TestCase):
+    """Test suite for OperationTracker parameter validation."""
+
+    def test_invalid_poll_interval(self):
+        """Test that a non-positive poll interval is rejected."""
+        with self.assertRaises(ValueError):
+            OperationTracker(Mock(), poll_interval=0)
+
+    def test_invalid_timeout(self):
+        """Test that a non-positive timeout is rejected."""
+        with self.assertRaises(ValueError):
+            OperationTracker(Mock(), timeout=0)
+
+
+class TestOperationTrackerOutcomes(unittest.TestCase):
+    """Test suite for completed, failed and timed-out operations."""
+
+    def setUp(self):
+        self.trackers = []
+
+    def tearDown(self):
+        for tracker in self.trackers:
+            tracker.close(timeout=1)
+
+    def _tracker(self, compute, poll_interval=0.01, timeout=5):
+        tracker = OperationTracker(compute, poll_interval=poll_interval, timeout=timeout)
+        self.trackers.append(tracker)
+        return tracker
+
+    def test_done_at_submission_resolved_without_polling(self):
+        """Test that an operation returned as DONE is resolved immediately."""
+        compute = FakeOperationsCompute([{}])
+        tracker = self._tracker(compute)
+
+        tracker.track('project', 'us-central1', {'name': 'op-1', 'status': 'DONE'}, 'router-1')
+
+        results = tracker.drain()
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].status, OPERATION_COMPLETED)
+        self.assertEqual(compute.calls, [])
+
+    def test_polls_until_done(self):
+        """Test that a running operation is polled until DONE and reports propagation time."""
+        compute = FakeOperationsCompute([
+            {'name': 'op-1', 'status': 'RUNNING'},
+            {'name': 'op-1', 'status': 'RUNNING'},
+            {'name': 'op-1', 'status': 'DONE',
+             'insertTime': '2025-11-01T10:00:00.000-07:00', 'endTime': '2025-11-01T10:00:02.500-07:00'}
+        ])
+        tracker = self._tracker(compute)
+
+        tracker.track('project', 'us-central1', {'name': 'op-1', 'status': 'PENDING'}, 'router-1',
+                      prefixes=('10.0.0.0/24',), correlation_id='hc-1')
+        results = _wait_for_results(tracker)
+
+        self.assertEqual(len(results), 1)
+        result = results[0]
+        self.assertEqual(result.status, OPERATION_COMPLETED)
+        self.assertEqual(result.polls, 3)
+        self.assertEqual(result.prefixes, ('10.0.0.0/24',))
+        self.assertEqual(result.correlation_id, 'hc-1')
+        self.assertEqual(result.operation_duration_ms, 2500)
+        self.assertGreater(result.propagation_ms, 0)
+        self.assertEqual(compute.calls[0], ('project', 'us-central1', 'op-1'))
+        self.assertEqual(tracker.stats()['last_propagation_ms'], result.propagation_ms)
+
+    def test_done_with_error_is_failed(self):
+        """Test that a DONE operation carrying errors is reported as failed."""
+        compute = FakeOperationsCompute([
+            {'name': 'op-1', 'status': 'DONE',
+             'error': {'errors': [{'code': 'RESOURCE_NOT_READY', 'message': 'Router is being updated'}]}}
+        ])
+        tracker = self._tracker(compute)
+
+        tracker.track('project', 'us-central1', {'name': 'op-1', 'status': 'RUNNING'}, 'router-1')
+        results = _wait_for_results(tracker)
+
+        self.assertEqual(results[0].status, OPERATION_FAILED)
+        self.assertEqual(results[0].error_message, 'Router is being updated')
+
+    def test_timeout(self):
+        """Test that an operation not DONE before the timeout is reported as timed out."""
+        compute = FakeOperationsCompute([{'name': 'op-1', 'status': 'RUNNING'}])
+        tracker = self._tracker(compute, poll_interval=0.01, timeout=0.05)
+
+        tracker.track('project', 'us-central1', {'name': 'op-1', 'status': 'RUNNING'}, 'router-1')
+        results = _wait_for_results(tracker)
+
+        self.assertEqual(results[0].status, OPERATION_TIMED_OUT)
+        self.assertEqual(tracker.pending(), 0)
+        self.assertEqual(tracker.stats()['timed_out'], 1)
+
+    def test_transient_poll_error_retried(self):
+        """Test that a 503 while polling is retried on the next interval."""
+        compute = FakeOperationsCompute([
+            HttpError(resp=Mock(status=503), content=b'Service Unavailable'),
+            {'name': 'op-1', 'status': 'DONE'}
+        ])
+        tracker = self._tracker(compute)
+
+        tracker.track('project', 'us-central1', {'name': 'op-1', 'status': 'RUNNING'}, 'router-1')
+        results = _wait_for_results(tracker)
+
+        self.assertEqual(results[0].status, OPERATION_COMPLETED)
+        self.assertEqual(results[0].polls, 2)
+
+    def test_permanent_poll_error_fails(self):
+        """Test that a 404 while polling ends tracking as failed."""
+        compute = FakeOperationsCompute([HttpError(resp=Mock(status=404), content=b'Not Found')])
+        tracker = self._tracker(compute)
+
+        tracker.track('project', 'us-central1', {'name': 'op-1', 'status': 'RUNNING'}, 'router-1')
+        results = _wait_for_results(tracker)
+
+        self.assertEqual(results[0].status, OPERATION_FAILED)
+        self.assertIn('Operation poll failed', results[0].error_message)
+
+
+class TestOperationTrackerNonBlocking(unittest.TestCase):
+    """Test suite for the non-blocking contract with the control loop."""
+
+    def test_track_returns_before_operation_completes(self):
+        """Test that track() returns immediately and the outcome is drained later."""
+        compute = FakeOperationsCompute([{'name': 'op-1', 'status': 'RUNNING'},
+                                         {'name': 'op-1', 'status': 'DONE'}])
+        tracker = OperationTracker(compute, poll_interval=0.1, timeout=5)
+
+        start = time.monotonic()
+        tracker.track('project', 'us-central1', {'name': 'op-1', 'status': 'RUNNING'}, 'router-1')
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.05)
+        self.assertEqual(tracker.drain(), [])
+        self.assertEqual(tracker.pending(), 1)
+
+        results = _wait_for_results(tracker)
+        self.assertEqual(results[0].status, OPERATION_COMPLETED)
+        stats = tracker.stats()
+        self.assertEqual(stats['tracked'], 1)
+        self.assertEqual(stats['completed'], 1)
+        self.assertEqual(stats['pending'], 0)
+        tracker.close(timeout=1)
+
+    def test_pool_client_borrowed_per_poll(self):
+        """Test that polls borrow a client from a ComputeClientPool and return it."""
+        compute = FakeOperationsCompute([{'name': 'op-1', 'status': 'DONE'}])
+        pool = ComputeClientPool(lambda: compute, size=2)
+        tracker = OperationTracker(pool, poll_interval=0.01, timeout=5)
+
+        tracker.track('project', 'us-central1', {'name': 'op-1', 'status': 'RUNNING'}, 'router-1')
+        results = _wait_for_results(tracker)
+        tracker.close(timeout=1)
+
+        self.assertEqual(results[0].status, OPERATION_COMPLETED)
+        stats = pool.stats()
+        self.assertEqual(stats['checkouts'], 1)
+        self.assertEqual(stats['in_use'], 0)
+
+    def test_closed_tracker_ignores_new_operations(self):
+        """Test that operations submitted after close() are not tracked."""
+        tracker = OperationTracker(FakeOperationsCompute([{}]), poll_interval=0.01)
+        tracker.close()
+
+        tracker.track('project', 'us-central1', {'name': 'op-1', 'status': 'RUNNING'}, 'router-1')
+
+        self.assertEqual(tracker.pending(), 0)
+        self.assertEqual(tracker.stats()['tracked'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
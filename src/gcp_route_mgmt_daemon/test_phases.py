@@ -0,0 +1,114 @@
+"""
+Unit Tests for Per-Phase Cycle Timing
+
+This test module validates PhaseTimer, which splits health check cycles into
+phases and accounts them against the check interval.
+
+Test Coverage:
+    - Lap timing of sequential phases, repeated phases accumulated
+    - Concurrent probe durations reported beside the phases
+    - Budget accounting: total, unaccounted time, budget use
+    - Backoff sleep from exponential_backoff_retry attributed by name, per cycle
+    - Slowest phase description used in the overrun warning
+    - Running phase reported when a cycle is interrupted
+
+Author: Nathan Bray
+Created: 2025-11-01
+"""
+
+import unittest
+
+try:
+    from .phases import PhaseTimer
+    from .circuit import exponential_backoff_retry
+    from . import metrics
+except ImportError:
+    from phases import PhaseTimer
+    from circuit import exponential_backoff_retry
+    import metrics
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class TestPhaseTimer(unittest.TestCase):
+    """Test suite for phase timing and budget accounting."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.timer = PhaseTimer(budget_seconds=60, clock=self.clock)
+
+    def _cycle(self):
+        self.timer.reset()
+        self.clock.advance(0.5)                 # Before the first phase: unaccounted
+        self.timer.begin("probe_stage")
+        self.clock.advance(40)
+        self.timer.record_probe("probe_local", 1200)
+        self.timer.record_probe("probe_remote", 39900)
+        self.timer.record_probe("probe_bgp", None)
+        self.timer.begin("state_evaluation")
+        self.clock.advance(0.01)
+        self.timer.begin("bgp_actuation")
+        self.clock.advance(25)
+        self.timer.begin("state_evaluation")
+        self.clock.advance(0.02)
+        self.timer.stop()
+        self.clock.advance(5)                   # After stop: not counted
+
+    def test_breakdown(self):
+        """Test phase durations in order, probes beside them and budget use."""
+        self._cycle()
+
+        breakdown = self.timer.breakdown()
+
+        self.assertEqual(breakdown["phases_ms"], {"probe_stage": 40000, "state_evaluation": 30, "bgp_actuation": 25000})
+        self.assertEqual(list(breakdown["phases_ms"]), ["probe_stage", "state_evaluation", "bgp_actuation"])
+        self.assertEqual(breakdown["probes_ms"], {"probe_local": 1200, "probe_remote": 39900})
+        self.assertEqual((breakdown["total_ms"], breakdown["unaccounted_ms"]), (65530, 500))
+        self.assertEqual((breakdown["budget_ms"], breakdown["budget_used_pct"]), (60000, 109.2))
+        self.assertIsNone(self.timer.current_phase)
+        self.assertEqual(self.timer.describe_slowest(), "probe_stage 40.00s (probe_remote 39.90s)")
+
+    def test_reset_and_current_phase(self):
+        """Test that reset() starts an empty cycle and the running phase is reported."""
+        self._cycle()
+        self.timer.reset()
+        self.timer.begin("cloudflare_actuation")
+
+        self.assertEqual(self.timer.current_phase, "cloudflare_actuation")
+        self.assertEqual(self.timer.breakdown()["phases_ms"], {})
+        self.assertEqual(PhaseTimer(60).describe_slowest(), "no phase recorded")
+
+    def test_backoff_sleep_attributed(self):
+        """Test that retry sleep is reported under the retried phase, only for the current cycle."""
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) % 2:
+                raise ConnectionError("transient")
+            return True
+
+        exponential_backoff_retry(flaky, initial_delay=0.02, name="test_phase_actuation")
+        timer = PhaseTimer(budget_seconds=1)
+        timer.begin("test_phase_actuation")
+        exponential_backoff_retry(flaky, initial_delay=0.05, name="test_phase_actuation")
+        timer.stop()
+
+        self.assertEqual(timer.breakdown()["backoff_sleep_ms"], {"test_phase_actuation": 50})
+        self.assertRegex(timer.describe_slowest(), r"^test_phase_actuation 0\.\d\ds \(0\.05s backoff sleep\)$")
+        self.assertGreater(metrics.BACKOFF_SLEEP.labels("test_phase_actuation").value, 0.069)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,239 @@
+"""
+Unit Tests for the Concurrent Probe Stage
+
+This test module validates the ProbeRunner used by the daemon to run the local,
+remote and BGP health probes concurrently.
+
+Test Coverage:
+    - Probes run in parallel (stage latency ~ slowest probe)
+    - Per-probe deadline handling and unknown results
+    - Exception capture and re-raise in the caller's thread
+    - Worker pool bounding and in-flight probe skipping
+    - Correlation ID propagation into worker threads
+    - Circuit breaker accounting under concurrent probes
+
+Author: Nathan Bray
+Created: 2025-11-01
+"""
+
+import unittest
+from unittest.mock import Mock
+import threading
+import time
+
+try:
+    from .probes import ProbeRunner, ProbeOutcome
+    from .circuit import CircuitBreaker
+    from .structured_events import StructuredEventLogger
+except ImportError:
+    from probes import ProbeRunner, ProbeOutcome
+    from circuit import CircuitBreaker
+    from structured_events import StructuredEventLogger
+
+
+class TestProbeRunnerInitialization(unittest.TestCase):
+    """Test suite for ProbeRunner parameter validation."""
+
+    def test_invalid_max_workers(self):
+        """Test that max_workers below 1 is rejected."""
+        with self.assertRaises(ValueError):
+            ProbeRunner(max_workers=0, timeout=5)
+
+    def test_invalid_timeout(self):
+        """Test that a non-positive timeout is rejected."""
+        with self.assertRaises(ValueError):
+            ProbeRunner(max_workers=1, timeout=0)
+
+
+class TestProbeRunnerExecution(unittest.TestCase):
+    """Test suite for concurrent probe execution."""
+
+    def setUp(self):
+        self.runner = ProbeRunner(max_workers=3, timeout=5)
+
+    def tearDown(self):
+        self.runner.shutdown(wait=True)
+
+    def test_probes_run_concurrently(self):
+        """Test that stage latency is the slowest probe, not the sum."""
+        def slow_probe(value):
+            time.sleep(0.3)
+            return value
+
+        start = time.monotonic()
+        outcomes = self.runner.run({
+            "local_health": lambda: slow_probe(True),
+            "remote_health": lambda: slow_probe(False),
+            "remote_bgp": lambda: slow_probe((True, {})),
+        })
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.8)
+        self.assertTrue(outcomes["local_health"].result())
+        self.assertFalse(outcomes["remote_health"].result())
+        self.assertEqual(outcomes["remote_bgp"].result(), (True, {}))
+        self.assertGreaterEqual(outcomes["local_health"].duration_ms, 250)
+
+    def test_outcomes_preserve_probe_order(self):
+        """Test that outcomes are returned in the order probes were given."""
+        outcomes = self.runner.run({"b": lambda: 2, "a": lambda: 1, "c": lambda: 3})
+        self.assertEqual(list(outcomes), ["b", "a", "c"])
+
+    def test_probe_exception_reraised_by_result(self):
+        """Test that a probe's exception is captured and re-raised by result()."""
+        def failing_probe():
+            raise PermissionError("403 Forbidden")
+
+        outcomes = self.runner.run({"local_health": failing_probe, "remote_health": lambda: True})
+
+        self.assertIsInstance(outcomes["local_health"].error, PermissionError)
+        with self.assertRaises(PermissionError):
+            outcomes["local_health"].result()
+        self.assertTrue(outcomes["remote_health"].result())
+
+
+class TestProbeDeadlines(unittest.TestCase):
+    """Test suite for per-probe deadlines."""
+
+    def test_timed_out_probe_returns_default(self):
+        """Test that a probe missing the deadline yields an unknown result."""
+        runner = ProbeRunner(max_workers=2, timeout=0.2)
+        release = threading.Event()
+
+        try:
+            start = time.monotonic()
+            outcomes = runner.run({
+                "local_health": lambda: release.wait(5),
+                "remote_health": lambda: True,
+            })
+            elapsed = time.monotonic() - start
+
+            self.assertLess(elapsed, 1.0)
+            self.assertTrue(outcomes["local_health"].timed_out)
+            self.assertIsNone(outcomes["local_health"].result())
+            self.assertEqual(outcomes["local_health"].result(default=(None, {})), (None, {}))
+            self.assertTrue(outcomes["remote_health"].result())
+        finally:
+            release.set()
+            runner.shutdown(wait=True)
+
+    def test_in_flight_probe_not_resubmitted(self):
+        """Test that a probe still running from a previous cycle is skipped."""
+        runner = ProbeRunner(max_workers=2, timeout=0.1)
+        release = threading.Event()
+        calls = []
+
+        def hung_probe():
+            calls.append(1)
+            release.wait(5)
+            return True
+
+        try:
+            first = runner.run({"local_health": hung_probe})
+            second = runner.run({"local_health": hung_probe})
+
+            self.assertTrue(first["local_health"].timed_out)
+            self.assertTrue(second["local_health"].skipped)
+            self.assertIsNone(second["local_health"].result())
+            self.assertEqual(len(calls), 1)
+        finally:
+            release.set()
+            runner.shutdown(wait=True)
+
+    def test_worker_pool_is_bounded(self):
+        """Test that no more than max_workers probes run at once."""
+        runner = ProbeRunner(max_workers=2, timeout=5)
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def probe():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return True
+
+        try:
+            runner.run({f"probe_{i}": probe for i in range(6)})
+            self.assertEqual(peak[0], 2)
+        finally:
+            runner.shutdown(wait=True)
+
+
+class TestProbeCorrelation(unittest.TestCase):
+    """Test suite for correlation ID propagation into probe threads."""
+
+    def test_late_events_keep_cycle_correlation_id(self):
+        """Test that a probe finishing after its deadline logs with its own cycle's ID."""
+        structured_logger = StructuredEventLogger("test_probes")
+        structured_logger.logger = Mock()
+        release = threading.Event()
+        finished = threading.Event()
+
+        def slow_probe():
+            release.wait(5)
+            structured_logger.log_health_check(region="us-central1",
+                                               service_type="backend_services",
+                                               healthy=True)
+            finished.set()
+            return True
+
+        runner = ProbeRunner(max_workers=2, timeout=0.1, structured_logger=structured_logger)
+        try:
+            structured_logger.set_correlation_id("hc-cycle-1")
+            outcomes = runner.run({"local_health": slow_probe})
+            self.assertTrue(outcomes["local_health"].timed_out)
+
+            # Next cycle starts before the slow probe completes
+            structured_logger.set_correlation_id("hc-cycle-2")
+            release.set()
+            self.assertTrue(finished.wait(5))
+
+            json_fields = structured_logger.logger.log.call_args[1]["extra"]["json_fields"]
+            self.assertEqual(json_fields["correlation_id"], "hc-cycle-1")
+        finally:
+            release.set()
+            runner.shutdown(wait=True)
+
+
+class TestConcurrentCircuitBreakerAccounting(unittest.TestCase):
+    """Test suite for breaker accounting when probes share a breaker."""
+
+    def test_shared_breaker_counts_every_failure(self):
+        """Test that concurrent probe failures are all recorded."""
+        cb = CircuitBreaker(threshold=100, timeout=60, service_name="gcp_health_check")
+        barrier = threading.Barrier(8)
+
+        def failing_probe():
+            barrier.wait()
+            raise ConnectionError("backend unavailable")
+
+        runner = ProbeRunner(max_workers=8, timeout=5)
+        try:
+            outcomes = runner.run({
+                f"probe_{i}": (lambda: cb.call(failing_probe)) for i in range(8)
+            })
+        finally:
+            runner.shutdown(wait=True)
+
+        self.assertTrue(all(isinstance(o.error, ConnectionError) for o in outcomes.values()))
+        self.assertEqual(cb.failure_count, 8)
+
+
+class TestProbeOutcome(unittest.TestCase):
+    """Test suite for ProbeOutcome result semantics."""
+
+    def test_result_returns_value(self):
+        """Test that a completed probe returns its value."""
+        self.assertFalse(ProbeOutcome(name="x", value=False).result(default=True))
+
+    def test_skipped_outcome_returns_default(self):
+        """Test that a skipped probe returns the provided default."""
+        self.assertEqual(ProbeOutcome(name="x", skipped=True).result(default="unknown"), "unknown")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Unit Tests for Opt-In Cycle Profiling
+
+This test module validates CycleProfiler, which runs selected health check
+cycles under cProfile and reports allocation growth with tracemalloc.
+
+Test Coverage:
+    - Every Nth cycle profiled to a loadable .pstats file, others untouched
+    - SIGUSR2 request profiling the next cycle once
+    - Rotation keeping the newest PROFILE_KEEP reports
+    - tracemalloc baseline, then growth reports naming the leaking line
+    - Interrupted cycles ended once from the error path, write errors logged
+    - Probe worker thread calls merged into the cycle profile
+
+Author: Nathan Bray
+Created: 2025-11-01
+"""
+
+import unittest
+import os
+import pstats
+import shutil
+import tempfile
+import tracemalloc
+
+try:
+    from .profiling import CycleProfiler, request_profile, run_profiled
+    from .probes import ProbeRunner
+except ImportError:
+    from profiling import CycleProfiler, request_profile, run_profiled
+    from probes import ProbeRunner
+
+
+def _busy_cycle():
+    """Work worth profiling."""
+    return sorted(str(i) for i in range(2000))
+
+
+def _busy_probe():
+    """Work done on a probe worker thread."""
+    return sum(i * i for i in range(5000))
+
+
+class TestCycleProfiler(unittest.TestCase):
+    """Test suite for cycle sampling, reports and rotation."""
+
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def _run(self, profiler, cycles, work=_busy_cycle):
+        for cycle_number in cycles:
+            profiler.start_cycle(cycle_number)
+            work()
+            profiler.end_cycle()
+
+    def _reports(self, prefix):
+        return sorted(name for name in os.listdir(self.output_dir) if name.startswith(prefix))
+
+    def test_profiles_every_nth_cycle(self):
+        """Test that only sampled cycles are profiled and the output loads in pstats."""
+        profiler = CycleProfiler(self.output_dir, profile_every=3)
+        self._run(profiler, range(1, 8))
+
+        reports = self._reports("profile-")
+        self.assertEqual([name.rsplit("-", 1)[1] for name in reports], ["cycle3.pstats", "cycle6.pstats"])
+        stats = pstats.Stats(os.path.join(self.output_dir, reports[0]))
+        self.assertTrue(any(func[2] == "_busy_cycle" for func in stats.stats))
+        self.assertEqual(profiler.stats()["profiles_written"], 2)
+
+    def test_signal_request_and_rotation(self):
+        """Test that a request profiles the next cycle once and old reports are deleted."""
+        profiler = CycleProfiler(self.output_dir, keep=2)
+        self._run(profiler, [1])
+        self.assertEqual(self._reports("profile-"), [])
+
+        for cycle_number in (2, 3, 4):
+            request_profile()
+            self._run(profiler, [cycle_number])
+        self._run(profiler, [5])
+
+        self.assertEqual([name.rsplit("-", 1)[1] for name in self._reports("profile-")],
+                         ["cycle3.pstats", "cycle4.pstats"])
+
+    def test_tracemalloc_growth_report(self):
+        """Test that the first sample is a baseline and later reports name the growing line."""
+        leak = []
+        profiler = CycleProfiler(self.output_dir, tracemalloc_every=2)
+        try:
+            self._run(profiler, range(1, 7), work=lambda: leak.append(bytearray(64 * 1024)))
+        finally:
+            profiler.close()
+
+        reports = self._reports("tracemalloc-")
+        self.assertEqual([name.rsplit("-", 1)[1] for name in reports], ["cycle4.txt", "cycle6.txt"])
+        with open(os.path.join(self.output_dir, reports[-1]), encoding="utf-8") as f:
+            report = f.read()
+        self.assertIn("#1: +128.", report)
+        self.assertIn("test_profiling.py", report.split("#2:")[0])
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_end_cycle_once_and_write_errors(self):
+        """Test that a second end_cycle() is a no-op and an unwritable directory is only logged."""
+        blocker = os.path.join(self.output_dir, "not-a-directory")
+        open(blocker, "w").close()
+        profiler = CycleProfiler(blocker, profile_every=1)
+        profiler.start_cycle(1)
+
+        with self.assertLogs(level="WARNING"):
+            profiler.end_cycle()
+        profiler.end_cycle()
+
+        self.assertEqual(profiler.stats()["profiles_written"], 0)
+
+    def test_worker_threads_profiled(self):
+        """Test that probe thread work lands in the cycle profile, and only in sampled cycles."""
+        runner = ProbeRunner(max_workers=2, timeout=5)
+        profiler = CycleProfiler(self.output_dir, profile_every=2)
+        try:
+            self._run(profiler, [1, 2], work=lambda: runner.run({"a": _busy_probe, "b": _busy_probe}))
+        finally:
+            runner.shutdown(wait=True)
+
+        reports = self._reports("profile-")
+        self.assertEqual(len(reports), 1)
+        stats = pstats.Stats(os.path.join(self.output_dir, reports[0]))
+        calls = [stat[1] for func, stat in stats.stats.items() if func[2] == "_busy_probe"]
+        self.assertEqual(calls, [2])
+        self.assertEqual(run_profiled(_busy_probe), sum(i * i for i in range(5000)))
+
+
+if __name__ == '__main__':
+    unittest.main()
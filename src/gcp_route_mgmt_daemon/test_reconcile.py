@@ -0,0 +1,107 @@
+"""
+Unit Tests for the Desired-State Reconciliation Cache
+
+This test module validates the ReconciliationCache used to skip redundant
+router and Cloudflare reads in steady state.
+
+Test Coverage:
+    - Parameter validation
+    - Skipping only for a confirmed, unchanged desired state
+    - Expiry after the drift-check interval
+    - Disabled skipping with a zero interval
+    - Invalidation and drift accounting
+    - Cache statistics
+
+Author: Nathan Bray
+Created: 2025-11-01
+"""
+
+import unittest
+
+try:
+    from .reconcile import ReconciliationCache
+except ImportError:
+    from reconcile import ReconciliationCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestReconciliationCache(unittest.TestCase):
+    """Test suite for ReconciliationCache skip decisions."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ReconciliationCache(drift_check_interval=300, clock=self.clock)
+
+    def test_invalid_interval(self):
+        """Test that a negative drift-check interval is rejected."""
+        with self.assertRaises(ValueError):
+            ReconciliationCache(drift_check_interval=-1)
+
+    def test_unconfirmed_state_is_read(self):
+        """Test that an unknown resource is never skipped."""
+        self.assertFalse(self.cache.should_skip("bgp:r", (("10.0.0.0/24", True),)))
+
+    def test_confirmed_state_skipped_until_interval(self):
+        """Test that a confirmed state is skipped until the drift-check interval elapses."""
+        desired = (("10.0.0.0/24", True),)
+        self.cache.confirm("bgp:r", desired, observed=("10.0.0.0/24",))
+
+        self.clock.now += 299
+        self.assertTrue(self.cache.should_skip("bgp:r", desired))
+
+        self.clock.now += 1
+        self.assertFalse(self.cache.should_skip("bgp:r", desired))
+
+    def test_changed_desired_state_is_read(self):
+        """Test that a different desired state forces a read."""
+        self.cache.confirm("cloudflare:a:dc", 100)
+
+        self.assertFalse(self.cache.should_skip("cloudflare:a:dc", 200))
+        self.assertTrue(self.cache.was_confirmed("cloudflare:a:dc", 100))
+        self.assertFalse(self.cache.was_confirmed("cloudflare:a:dc", 200))
+
+    def test_zero_interval_disables_skipping(self):
+        """Test that drift_check_interval=0 reads every time."""
+        cache = ReconciliationCache(drift_check_interval=0, clock=self.clock)
+        cache.confirm("bgp:r", 1)
+
+        self.assertFalse(cache.should_skip("bgp:r", 1))
+
+    def test_invalidate_and_drift(self):
+        """Test that invalidation and drift both drop the confirmation."""
+        self.cache.confirm("bgp:r", 1)
+        self.cache.confirm("cloudflare:a:dc", 100)
+
+        self.cache.invalidate("bgp:r")
+        self.assertIsNone(self.cache.get("bgp:r"))
+
+        self.cache.record_drift("cloudflare:a:dc")
+        self.assertIsNone(self.cache.get("cloudflare:a:dc"))
+        self.assertEqual(self.cache.stats()["drift_detected"], 1)
+
+    def test_stats(self):
+        """Test that hits and misses count skipped and performed reads."""
+        self.cache.should_skip("bgp:r", 1)
+        self.cache.confirm("bgp:r", 1, observed=("10.0.0.0/24",))
+        self.cache.should_skip("bgp:r", 1)
+        self.cache.should_skip("bgp:r", 1)
+
+        stats = self.cache.stats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["entries"], 1)
+        self.assertEqual(stats["drift_check_interval"], 300)
+        self.assertEqual(self.cache.get("bgp:r").observed, ("10.0.0.0/24",))
+
+
+if __name__ == '__main__':
+    unittest.main()
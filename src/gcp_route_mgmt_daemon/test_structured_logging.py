@@ -14,6 +14,9 @@ Test Coverage:
     - Health check cycle result determination
     - Correlation ID tracking
     - Event field validation
+    - Slotted StructuredEvent with interned names and its log payload
+    - Slotted event smaller than the equivalent __dict__-backed dataclass
+    - Memory benchmark of per-event footprint and allocations per cycle (RUN_BENCHMARKS=true)
 
 Author: Nathan Bray
 Created: 2025-11-01
@@ -22,7 +25,10 @@ Created: 2025-11-01
 import unittest
 from unittest.mock import Mock, MagicMock, patch, call
 import logging
+import sys
 import time
+import tracemalloc
+from dataclasses import fields, make_dataclass
 from typing import Dict, Any
 
 try:
@@ -32,6 +38,8 @@ try:
         EventType,
         ActionResult
     )
+    from .logging_setup import AsyncLogPipeline, NonStructuredFilter, StructuredFilter
+    from .testing_support import benchmark
 except ImportError:
     from structured_events import (
         StructuredEventLogger,
@@ -39,6 +47,21 @@ except ImportError:
         EventType,
         ActionResult
     )
+    from logging_setup import AsyncLogPipeline, NonStructuredFilter, StructuredFilter
+    from testing_support import benchmark
+
+
+class CaptureHandler(logging.Handler):
+    """Handler that keeps the records it receives."""
+
+    def __init__(self, *filters):
+        super().__init__(logging.DEBUG)
+        self.records = []
+        for record_filter in filters:
+            self.addFilter(record_filter)
+
+    def emit(self, record):
+        self.records.append(record)
 
 
 class TestActionResultEnum(unittest.TestCase):
@@ -191,6 +214,25 @@ class TestStructuredEventLogging(unittest.TestCase):
         # Verify logging was called
         self.mock_logger.log.assert_called_once()
 
+    def test_log_bgp_operation_result(self):
+        """Test that a tracked operation outcome is logged with its propagation time."""
+        self.event_logger.log_bgp_operation_result(
+            project='project', region='us-central1', router='router-1',
+            operation_id='op-1', status='timed_out', prefixes=('10.0.0.0/24',),
+            propagation_ms=60000, polls=12, submitted_correlation_id='hc-1',
+            error_message='Operation not DONE within 60s'
+        )
+
+        level, _ = self.mock_logger.log.call_args[0]
+        json_fields = self.mock_logger.log.call_args[1]['extra']['json_fields']
+        self.assertEqual(level, logging.ERROR)
+        self.assertEqual(json_fields['event_type'], 'bgp_operation_result')
+        self.assertEqual(json_fields['result'], ActionResult.FAILURE.value)
+        self.assertEqual(json_fields['duration_ms'], 60000)
+        self.assertEqual(json_fields['details']['status'], 'timed_out')
+        self.assertEqual(json_fields['details']['ip_prefixes'], ['10.0.0.0/24'])
+        self.assertEqual(json_fields['details']['submitted_correlation_id'], 'hc-1')
+
     def test_log_event_includes_correlation_id(self):
         """Test that correlation ID is included in logged events."""
         correlation_id = "test-correlation-123"
@@ -212,6 +254,37 @@ class TestStructuredEventLogging(unittest.TestCase):
         json_fields = call_args[1]['extra']['json_fields']
         self.assertEqual(json_fields['correlation_id'], correlation_id)
 
+    def test_correlation_scope_overrides_shared_id_per_thread(self):
+        """Test that a thread-bound correlation ID takes precedence and is restored."""
+        import threading
+
+        self.event_logger.set_correlation_id("hc-shared")
+        seen = {}
+
+        def worker():
+            with self.event_logger.correlation_scope("hc-probe"):
+                seen["worker"] = self.event_logger.current_correlation_id()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(seen["worker"], "hc-probe")
+        self.assertEqual(self.event_logger.current_correlation_id(), "hc-shared")
+
+        with self.event_logger.correlation_scope("hc-scoped"):
+            self.event_logger.log_event({
+                "event_type": "test_event",
+                "timestamp": time.time(),
+                "result": ActionResult.SUCCESS.value,
+                "component": "test",
+                "operation": "test_op",
+                "details": {}
+            })
+        json_fields = self.mock_logger.log.call_args[1]['extra']['json_fields']
+        self.assertEqual(json_fields['correlation_id'], "hc-scoped")
+        self.assertEqual(self.event_logger.current_correlation_id(), "hc-shared")
+
     def test_log_event_invalid_type_raises_error(self):
         """Test that logging an invalid event type raises TypeError."""
         with self.assertRaises(TypeError):
@@ -449,6 +522,7 @@ class TestEventTypeEnum(unittest.TestCase):
     def test_event_type_values_defined(self):
         """Test that all expected EventType values are defined."""
         self.assertEqual(EventType.BGP_ADVERTISEMENT_CHANGE.value, "bgp_advertisement_change")
+        self.assertEqual(EventType.BGP_OPERATION_RESULT.value, "bgp_operation_result")
         self.assertEqual(EventType.CLOUDFLARE_ROUTE_UPDATE.value, "cloudflare_route_update")
         self.assertEqual(EventType.HEALTH_CHECK_RESULT.value, "health_check_result")
         self.assertEqual(EventType.STATE_TRANSITION.value, "state_transition")
@@ -510,6 +584,214 @@ class TestStructuredEventDataclass(unittest.TestCase):
         self.assertEqual(event.error_message, "Test error")
         self.assertEqual(event.correlation_id, "test-123")
 
+    def test_structured_event_slotted_and_interned(self):
+        """Test that events have no __dict__ and share interned component/operation strings."""
+        action = "".join(["adver", "tise"])
+        first = StructuredEvent("e", 1.0, "success", "gcp_bgp", f"{action}_prefix", {})
+        second = StructuredEvent("e", 2.0, "success", "gcp_bgp", f"{action}_prefix", {})
+
+        self.assertFalse(hasattr(first, '__dict__'))
+        with self.assertRaises(AttributeError):
+            first.unknown_field = 1
+        self.assertIs(first.operation, second.operation)
+        self.assertIs(first.component, second.component)
+
+    def test_structured_event_smaller_than_dict_dataclass(self):
+        """Test that a slotted event is smaller than the same dataclass with a per-instance __dict__."""
+        DictEvent = make_dataclass("DictEvent", [(f.name, f.type, f) for f in fields(StructuredEvent)])
+        slotted = StructuredEvent("e", 1.0, "success", "gcp_bgp", "advertise_prefix", {})
+        unslotted = DictEvent("e", 1.0, "success", "gcp_bgp", "advertise_prefix", {})
+
+        self.assertLess(sys.getsizeof(slotted), sys.getsizeof(unslotted) + sys.getsizeof(unslotted.__dict__))
+
+    def test_to_log_dict(self):
+        """Test that the log payload holds every field by reference plus the structured marker."""
+        details = {"key": "value"}
+        event = StructuredEvent("test_event", 1.0, "success", "test", "op", details, correlation_id="hc-1")
+
+        payload = event.to_log_dict()
+
+        self.assertTrue(payload.pop("structured_event"))
+        self.assertEqual(list(payload), [f.name for f in fields(StructuredEvent)])
+        self.assertIs(payload["details"], details)
+        self.assertEqual(payload["correlation_id"], "hc-1")
+
+
+class TestLazyEventPayloads(unittest.TestCase):
+    """Test suite for building event payloads only when a handler will format them."""
+
+    def setUp(self):
+        self.logger = logging.getLogger(f"test_lazy_{self.id()}")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.event_logger = StructuredEventLogger(self.logger.name)
+        self.builds = 0
+
+    def tearDown(self):
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+
+    def _details(self):
+        self.builds += 1
+        return {"state_code": 1, "nested": {"values": list(range(10))}}
+
+    def _event(self, result=ActionResult.SUCCESS.value):
+        return {
+            "event_type": "health_check_cycle",
+            "timestamp": time.time(),
+            "result": result,
+            "component": "daemon",
+            "operation": "health_check_cycle",
+            "details": self._details
+        }
+
+    def test_disabled_level_builds_nothing(self):
+        """Test that an event below the logger level never calls its details builder."""
+        capture = CaptureHandler(StructuredFilter())
+        self.logger.addHandler(capture)
+
+        self.event_logger.log_event(self._event(ActionResult.NO_CHANGE.value))  # DEBUG
+
+        self.assertEqual(self.builds, 0)
+        self.assertEqual(capture.records, [])
+
+    def test_no_structured_handler_builds_nothing(self):
+        """Test that events are skipped when every handler filters structured events out."""
+        self.logger.addHandler(CaptureHandler(NonStructuredFilter()))
+
+        self.event_logger.log_event(self._event())
+
+        self.assertEqual(self.builds, 0)
+
+    def test_structured_handler_materializes_details(self):
+        """Test that a structured handler receives the built details dict once."""
+        capture = CaptureHandler(StructuredFilter())
+        self.logger.addHandler(capture)
+        self.event_logger.set_correlation_id("hc-1")
+
+        self.event_logger.log_event(self._event())
+
+        self.assertEqual(self.builds, 1)
+        fields = capture.records[0].json_fields
+        self.assertEqual(fields["details"]["state_code"], 1)
+        self.assertEqual(fields["correlation_id"], "hc-1")
+
+    def test_handlers_behind_pipeline_inspected(self):
+        """Test that handlers behind an AsyncLogPipeline decide whether to build the payload."""
+        plain = CaptureHandler(NonStructuredFilter())
+        pipeline = AsyncLogPipeline([plain])
+        pipeline.start()
+        self.logger.addHandler(pipeline.handler)
+        try:
+            self.event_logger.log_event(self._event())
+            self.assertEqual(self.builds, 0)
+
+            structured = CaptureHandler(StructuredFilter())
+            pipeline.add_handler(structured)
+            self.event_logger.log_event(self._event())
+            pipeline.flush()
+            self.assertEqual(self.builds, 1)
+            self.assertEqual(len(structured.records), 1)
+        finally:
+            pipeline.stop()
+
+    def test_dataclass_details_not_deep_copied(self):
+        """Test that StructuredEvent payloads reference details instead of deep-copying them."""
+        capture = CaptureHandler(StructuredFilter())
+        self.logger.addHandler(capture)
+        details = {"nested": {"values": [1, 2, 3]}}
+
+        self.event_logger.log_event(StructuredEvent(
+            event_type="test_event", timestamp=1.0, result="success",
+            component="test", operation="op", details=details))
+
+        self.assertIs(capture.records[0].json_fields["details"], details)
+
+    def test_skipped_event_allocates_little(self):
+        """Test that a skipped cycle-sized event allocates far less than building its details."""
+        self.logger.addHandler(CaptureHandler(NonStructuredFilter()))
+
+        def big_details():
+            return {f"key_{i}": {"value": i, "items": list(range(20))} for i in range(200)}
+
+        event = self._event()
+        event["details"] = big_details
+        tracemalloc.start()
+        try:
+            self.event_logger.log_event(event)
+            _, skipped_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            big_details()
+            _, built_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertLess(skipped_peak * 10, built_peak)
+
+
+@benchmark
+class TestStructuredEventMemoryBenchmark(unittest.TestCase):
+    """Benchmark (RUN_BENCHMARKS=true): per-event footprint and allocations per health check cycle."""
+
+    EVENTS = 10000
+    CYCLES = 500
+
+    def setUp(self):
+        self.logger = logging.getLogger(f"test_memory_{self.id()}")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.capture = CaptureHandler(StructuredFilter())
+        self.logger.addHandler(self.capture)
+        self.event_logger = StructuredEventLogger(self.logger.name)
+
+    def tearDown(self):
+        self.logger.removeHandler(self.capture)
+
+    def _retained(self, func, count):
+        """Bytes and memory blocks still allocated per call after `count` calls."""
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            kept = [func() for _ in range(count)]
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        stats = after.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)]).compare_to(
+            before.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)]), 'filename')
+        del kept
+        return (sum(s.size_diff for s in stats) / count, sum(s.count_diff for s in stats) / count)
+
+    def _cycle(self):
+        self.event_logger.log_health_check("us-central1", "backend_services", True, {"unhealthy": []}, 12)
+        self.event_logger.log_health_check("us-east4", "bgp_sessions", True, {"sessions_up": 2}, 9)
+        for prefix in ("10.0.0.0/24", "10.0.1.0/24"):
+            self.event_logger.log_bgp_advertisement("p", "us-central1", "router", prefix, "advertise",
+                                                    ActionResult.NO_CHANGE)
+        self.event_logger.log_cloudflare_update("account", "radius", 100, 0, ActionResult.NO_CHANGE)
+
+    def test_event_memory_benchmark(self):
+        """Slotted events take less memory than the equivalent __dict__-backed dataclass."""
+        DictEvent = make_dataclass("DictEvent", [(f.name, f.type, f) for f in fields(StructuredEvent)])
+        details = {"key": "value"}
+        dict_size, dict_blocks = self._retained(
+            lambda: DictEvent("e", 1.0, "success", "gcp_bgp", "advertise_prefix", details), self.EVENTS)
+        slot_size, slot_blocks = self._retained(
+            lambda: StructuredEvent("e", 1.0, "success", "gcp_bgp", "advertise_prefix", details), self.EVENTS)
+
+        self.capture.records.clear()
+        self._cycle()
+        events = len(self.capture.records)
+        cycle_size, cycle_blocks = self._retained(self._cycle, self.CYCLES)
+
+        print(f"\nStructured event memory benchmark")
+        print(f"  per event  dataclass={dict_size:5.0f} B ({dict_blocks:.1f} blocks)  "
+              f"slotted={slot_size:5.0f} B ({slot_blocks:.1f} blocks)")
+        print(f"  per cycle  {events} events, {cycle_size:.0f} B retained in {cycle_blocks:.0f} blocks "
+              f"by a handler keeping the records")
+
+        self.assertLess(slot_size, dict_size)
+        self.assertLessEqual(slot_blocks, dict_blocks)
+
 
 if __name__ == '__main__':
     # Run tests with verbose output
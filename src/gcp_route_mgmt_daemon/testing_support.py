@@ -0,0 +1,74 @@
+"""
+Shared Helpers for the Unit Tests
+
+This module holds factories used by several test modules, so the structured
+log tests build their records in one place.
+
+Helpers:
+    - structured_record: a logging.LogRecord carrying json_fields the way
+      StructuredEventLogger emits it, for the structured log handlers,
+      readers and index
+    - benchmark: class decorator for benchmarks, which print timing tables
+      and compare wall times; they are skipped unless RUN_BENCHMARKS=true, so
+      the default unit run stays silent and independent of machine load
+
+    RUN_BENCHMARKS=true python run_tests.py test_gcp
+
+Usage Example:
+    try:
+        from .testing_support import structured_record
+    except ImportError:
+        from testing_support import structured_record
+
+    handler.emit(structured_record(0))
+    handler.emit(structured_record(1, event_type='state_transition', padding=400))
+
+Author: Nathan Bray
+Version: 1.0
+Last Modified: 2025
+"""
+
+import logging
+import os
+import unittest
+from typing import Optional
+
+# Benchmarks only run on request (RUN_BENCHMARKS=true)
+RUN_BENCHMARKS = os.getenv('RUN_BENCHMARKS', 'false').lower() == 'true'
+
+
+def benchmark(test_class: type) -> type:
+    """Skip a benchmark test class unless RUN_BENCHMARKS=true."""
+    return unittest.skipUnless(RUN_BENCHMARKS, "benchmark, set RUN_BENCHMARKS=true to run")(test_class)
+
+
+def structured_record(index: int,
+                      event_type: str = 'health_check_cycle',
+                      timestamp: Optional[float] = None,
+                      correlation_id: Optional[str] = None,
+                      padding: int = 100) -> logging.LogRecord:
+    """
+    Build a structured log record like StructuredEventLogger emits.
+
+    Args:
+        index: Sequence number stored in the event as 'index'
+        event_type: Event type of the record
+        timestamp: Event timestamp (default: 1000.0 + index)
+        correlation_id: Correlation ID of the event (omitted when None)
+        padding: Filler characters in the details, to size records for rotation tests
+
+    Returns:
+        logging.LogRecord: INFO record whose json_fields hold the event; the
+            details contain a multi-line and a non-ASCII value
+    """
+    record = logging.LogRecord('test', logging.INFO, __file__, 1, 'event', None, None)
+    record.json_fields = {
+        'structured_event': True,
+        'event_type': event_type,
+        'timestamp': 1000.0 + index if timestamp is None else timestamp,
+        'index': index,
+        'details': {'router': 'routeur-é', 'note': 'line one\nline two', 'padding': 'x' * padding}
+    }
+    if correlation_id is not None:
+        record.json_fields['correlation_id'] = correlation_id
+    return record